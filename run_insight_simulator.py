@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+In-Sight Native Mode 시뮬레이터 실행 스크립트
+
+예) python run_insight_simulator.py --port 2323 --latency 5 --jitter 2 --fragment 3
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+current_dir = os.path.dirname(os.path.abspath(__file__))
+src_dir = os.path.join(current_dir, 'src')
+sys.path.insert(0, src_dir)
+
+from utils.insight_simulator import InSightSimulator, SimulatorConfig, DEFAULT_JOBS
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="In-Sight Native Mode 시뮬레이터")
+    parser.add_argument("--host", default="127.0.0.1", help="수신 대기 주소")
+    parser.add_argument("--port", type=int, default=2323, help="수신 대기 포트 (0이면 빈 포트)")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="응답 지연 변동 ±(ms)")
+    parser.add_argument("--fragment", type=int, default=0, help="응답을 최대 N 바이트씩 나누어 송신")
+    parser.add_argument("--fragment-delay", type=float, default=0.0, help="분할 송신 간격(ms)")
+    parser.add_argument("--load-time", type=float, default=200.0, help="LF 처리 시간(ms)")
+    parser.add_argument("--username", default="admin")
+    parser.add_argument("--password", default="")
+    parser.add_argument("--jobs", default=",".join(DEFAULT_JOBS), help="JOB 파일 목록 (쉼표 구분)")
+    parser.add_argument("--allow-online-load", action="store_true", help="온라인 상태에서도 LF 허용")
+    parser.add_argument("--ng-rate", type=float, default=0.05, help="트리거 결과 NG 확률")
+    parser.add_argument("--max-sessions", type=int, default=0, help="최대 동시 세션 수 (0이면 제한 없음)")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
+    config = SimulatorConfig(
+        latency_ms=args.latency, jitter_ms=args.jitter, fragment_size=args.fragment,
+        fragment_delay_ms=args.fragment_delay, load_time_ms=args.load_time,
+        username=args.username, password=args.password,
+        jobs=[job.strip() for job in args.jobs.split(",") if job.strip()],
+        require_offline=not args.allow_online_load, ng_rate=args.ng_rate,
+        max_sessions=args.max_sessions)
+    simulator = InSightSimulator(args.host, args.port, config)
+    port = simulator.start()
+    print(f"In-Sight 시뮬레이터 실행 중: {args.host}:{port} (Ctrl+C로 종료)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        simulator.stop()
+        print(f"세션 {simulator.session_count}개, 명령 {simulator.camera.command_count}개 처리")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Telnet 클라이언트 벤치마크
+
+로컬 In-Sight 시뮬레이터(별도 프로세스)를 상대로 다음 경로의 호출별 지연과
+처리량을 측정하고 결과를 JSON으로 저장합니다.
+
+    - TelnetManager.connect_and_receive_initial
+    - TelnetManager.login
+    - TelnetManager.send_command (GF)
+    - JOB 로드 (JobPanel.load_job_file과 같은 LF 명령)
+    - 파라미터 전송 (ParamPanel.send_parameters와 같은 send_batch, 테이블 크기별)
+    - 다중 카메라 fan-out (CameraSessionManager.send_all, 카메라 수별)
+
+각 항목은 p50/p95/p99 지연(ms), 초당 명령 수, 명령당 CPU 시간(us)을 보고합니다.
+CPU 시간은 시뮬레이터를 제외한 클라이언트 프로세스만 측정합니다.
+성공하지 못한 응답은 항목별 errors로 집계하며, 오류가 있으면 종료 코드 1로 끝납니다.
+
+    python scripts/benchmark_telnet.py --output bench.json
+    python scripts/benchmark_telnet.py --baseline bench.json --latency 2
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import socket
+import statistics
+import sys
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+# src 디렉토리를 sys.path에 추가
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+from utils.camera_sessions import CameraSessionManager
+from utils.insight_simulator import InSightSimulator, SimulatorConfig
+from utils.native_protocol import STATUS_SUCCESS, format_set_command
+from utils.telnet_manager import TelnetManager, DEFAULT_BATCH_WINDOW
+
+# 비교 시 변화로 표시할 기준 (%)
+REGRESSION_THRESHOLD = 10.0
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _serve(ports: List[int], config: SimulatorConfig, ready, stop) -> None:
+    """시뮬레이터 프로세스 본체: 포트마다 시뮬레이터 하나를 실행"""
+    simulators = [InSightSimulator("127.0.0.1", port, config) for port in ports]
+    for simulator in simulators:
+        simulator.start()
+    ready.set()
+    stop.wait()
+    for simulator in simulators:
+        simulator.stop()
+
+
+class SimulatorProcess:
+    """
+    시뮬레이터를 별도 프로세스로 실행 (클라이언트 CPU 측정과 분리)
+    """
+
+    def __init__(self, count: int, config: SimulatorConfig):
+        self.ports = [_free_port() for _ in range(count)]
+        self._ready = multiprocessing.Event()
+        self._stop = multiprocessing.Event()
+        self._process = multiprocessing.Process(
+            target=_serve, args=(self.ports, config, self._ready, self._stop), daemon=True)
+
+    def __enter__(self) -> "SimulatorProcess":
+        self._process.start()
+        if not self._ready.wait(10.0):
+            raise RuntimeError("시뮬레이터 시작 실패")
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        self._process.join(5.0)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """정렬된 값의 백분위수 (선형 보간)"""
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * pct / 100.0
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+def _format_params(params: Dict) -> str:
+    return " ".join(f"{key}={value}" for key, value in params.items())
+
+
+def _text_failures(text: str) -> int:
+    """send_command 응답 원문이 성공 상태 코드로 시작하지 않으면 1"""
+    return 0 if text.split("\r\n", 1)[0].strip() == str(STATUS_SUCCESS) else 1
+
+
+def _reply_failures(replies) -> int:
+    """NativeReply 목록 또는 DeviceResult 사전에서 성공하지 못한 응답 수"""
+    if isinstance(replies, dict):
+        replies = replies.values()
+    return sum(1 for reply in replies if not reply.ok)
+
+
+def measure(name: str, calls: int, commands_per_call: int, fn: Callable[[int], int],
+            params: Optional[Dict] = None) -> Dict:
+    """
+    fn(i)를 calls번 실행하며 호출별 지연, 처리량, CPU 시간을 측정합니다.
+
+    Args:
+        name (str): 항목 이름
+        calls (int): 호출 횟수
+        commands_per_call (int): 호출 한 번에 보내는 명령 수 (처리량 계산용)
+        fn (Callable[[int], int]): 측정할 함수 (인자는 호출 순번, 반환값은 실패한 명령 수)
+        params (Optional[Dict]): 결과에 함께 기록할 조건
+    """
+    latencies: List[float] = []
+    errors = 0
+    cpu_start = time.process_time()
+    wall_start = time.perf_counter()
+    for i in range(calls):
+        start = time.perf_counter()
+        errors += fn(i)
+        latencies.append((time.perf_counter() - start) * 1000.0)
+    wall = time.perf_counter() - wall_start
+    cpu = time.process_time() - cpu_start
+    commands = calls * commands_per_call
+    latencies.sort()
+    result = {
+        "name": name,
+        "params": params or {},
+        "calls": calls,
+        "commands": commands,
+        "errors": errors,
+        "latency_ms": {
+            "mean": statistics.fmean(latencies) if latencies else 0.0,
+            "p50": percentile(latencies, 50),
+            "p95": percentile(latencies, 95),
+            "p99": percentile(latencies, 99),
+            "max": latencies[-1] if latencies else 0.0,
+        },
+        "commands_per_sec": commands / wall if wall else 0.0,
+        "cpu_us_per_command": cpu * 1e6 / commands if commands else 0.0,
+        "wall_s": wall,
+    }
+    print(f"  {name:<30} {_format_params(result['params']):<20} p50 {result['latency_ms']['p50']:8.2f} ms  "
+          f"p95 {result['latency_ms']['p95']:8.2f} ms  p99 {result['latency_ms']['p99']:8.2f} ms  "
+          f"{result['commands_per_sec']:9.1f} cmd/s  {result['cpu_us_per_command']:7.1f} us CPU/cmd"
+          f"{f'  오류 {errors}' if errors else ''}")
+    return result
+
+
+def _connected_manager(port: int, login: bool = True) -> TelnetManager:
+    manager = TelnetManager()
+    manager.connect_and_receive_initial("127.0.0.1", port)
+    if login and not manager.login("admin", ""):
+        raise RuntimeError("로그인 실패")
+    return manager
+
+
+def bench_single_camera(port: int, args: argparse.Namespace) -> List[Dict]:
+    results = []
+
+    managers: List[TelnetManager] = []
+
+    def connect(i: int) -> int:
+        manager = TelnetManager()
+        manager.connect_and_receive_initial("127.0.0.1", port)
+        managers.append(manager)
+        return 0 if manager.connected else 1
+    results.append(measure("connect_and_receive_initial", args.session_calls, 1, connect))
+
+    def login(i: int) -> int:
+        return 0 if managers[i].login("admin", "") else 1
+    results.append(measure("login", args.session_calls, 1, login))
+    for manager in managers:
+        manager.disconnect()
+
+    manager = _connected_manager(port)
+    results.append(measure("send_command(GF)", args.iterations, 1,
+                           lambda i: _text_failures(manager.send_command("GF"))))
+
+    jobs = SimulatorConfig().jobs
+    results.append(measure("load_job_file(LF)", args.job_calls, 1,
+                           lambda i: _text_failures(manager.send_command(f"LF{jobs[i % len(jobs)]}",
+                                                                         wait_time=2.0))))
+
+    for rows in args.table_sizes:
+        commands = [format_set_command(f"A{row % 1000:03d}", str(row)) for row in range(rows)]
+        calls = max(1, min(args.iterations, args.batch_commands // rows))
+        results.append(measure("send_parameters(send_batch)", calls, rows,
+                               lambda i: _reply_failures(manager.send_batch(commands, args.window)),
+                               {"rows": rows, "window": args.window}))
+    manager.disconnect()
+    return results
+
+
+def bench_fan_out(ports: List[int], args: argparse.Namespace) -> List[Dict]:
+    results = []
+    for count in args.camera_counts:
+        sessions = CameraSessionManager()
+        keys = [sessions.add_camera("127.0.0.1", port) for port in ports[:count]]
+        sessions.connect_all(keys).result(timeout=30.0)
+        results.append(measure("fan_out send_all(GF)", args.iterations, count,
+                               lambda i: _reply_failures(sessions.send_all("GF", keys).result(timeout=30.0)),
+                               {"cameras": count}))
+        sessions.shutdown()
+    return results
+
+
+def compare(results: List[Dict], baseline_path: str) -> None:
+    """기준 결과 파일과 p50/p95 지연 및 처리량을 비교해 출력합니다."""
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+
+    def key(result: Dict) -> str:
+        return result["name"] + json.dumps(result["params"], sort_keys=True)
+
+    previous = {key(result): result for result in baseline.get("results", [])}
+    print(f"\n기준 결과와 비교: {baseline_path}")
+    for result in results:
+        old = previous.get(key(result))
+        if old is None:
+            continue
+        changes = []
+        for metric in ("p50", "p95"):
+            before, after = old["latency_ms"][metric], result["latency_ms"][metric]
+            if before:
+                changes.append((metric, (after - before) * 100.0 / before, True))
+        before, after = old["commands_per_sec"], result["commands_per_sec"]
+        if before:
+            changes.append(("cmd/s", (after - before) * 100.0 / before, False))
+        text = "  ".join(
+            f"{metric} {change:+6.1f}%{' !' if (change > REGRESSION_THRESHOLD if lower_is_better else change < -REGRESSION_THRESHOLD) else '  '}"
+            for metric, change, lower_is_better in changes)
+        print(f"  {result['name']:<30} {_format_params(result['params']):<20} {text}")
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Telnet 클라이언트 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="항목별 반복 횟수")
+    parser.add_argument("--session-calls", type=int, default=5, help="연결/로그인 반복 횟수")
+    parser.add_argument("--job-calls", type=int, default=20, help="JOB 로드 반복 횟수")
+    parser.add_argument("--table-sizes", type=int, nargs="+", default=[10, 100, 1000],
+                        help="파라미터 전송 테이블 크기")
+    parser.add_argument("--batch-commands", type=int, default=5000,
+                        help="테이블 크기별 최대 총 명령 수")
+    parser.add_argument("--window", type=int, default=DEFAULT_BATCH_WINDOW, help="일괄 전송 창 크기")
+    parser.add_argument("--camera-counts", type=int, nargs="+", default=[1, 4, 16],
+                        help="fan-out 카메라 수")
+    parser.add_argument("--latency", type=float, default=0.0, help="시뮬레이터 응답 지연(ms)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="시뮬레이터 응답 지연 변동(ms)")
+    parser.add_argument("--fragment", type=int, default=0, help="시뮬레이터 응답 분할 크기(바이트)")
+    parser.add_argument("--load-time", type=float, default=50.0, help="시뮬레이터 LF 처리 시간(ms)")
+    parser.add_argument("--output", default="", help="결과 JSON 경로 (기본: bench_<시각>.json)")
+    parser.add_argument("--baseline", default="", help="비교할 기준 결과 JSON")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    config = SimulatorConfig(latency_ms=args.latency, jitter_ms=args.jitter,
+                             fragment_size=args.fragment, load_time_ms=args.load_time,
+                             require_offline=False)
+    results: List[Dict] = []
+    with SimulatorProcess(max(args.camera_counts + [1]), config) as simulator:
+        print(f"시뮬레이터 {len(simulator.ports)}대 (지연 {args.latency} ms, 지터 {args.jitter} ms, "
+              f"분할 {args.fragment} B)")
+        results.extend(bench_single_camera(simulator.ports[0], args))
+        results.extend(bench_fan_out(simulator.ports, args))
+
+    report = {
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+        },
+        "simulator": {
+            "latency_ms": args.latency,
+            "jitter_ms": args.jitter,
+            "fragment_size": args.fragment,
+            "load_time_ms": args.load_time,
+        },
+        "results": results,
+    }
+    output = args.output or f"bench_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+    with open(output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"\n결과 저장: {output}")
+    if args.baseline:
+        compare(results, args.baseline)
+    failed = [result["name"] for result in results if result["errors"]]
+    if failed:
+        print(f"\n[오류] 실패한 응답이 있는 항목: {', '.join(failed)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
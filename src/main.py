@@ -1,34 +1,29 @@
 import sys
-import logging
-import os
 from PyQt5.QtWidgets import QApplication
 from ui.main_window import MainWindow
 from utils.config import ConfigManager
+from utils.logging_pipeline import LoggingPipeline
 
-def setup_logging() -> None:
+def setup_logging(config: ConfigManager) -> LoggingPipeline:
     """
-    파일 및 콘솔 로그 설정
+    파일 및 콘솔 로그 설정 (큐 기반 비동기 기록, 크기/날짜 회전)
     """
-    os.makedirs('logs', exist_ok=True)
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s [%(levelname)s] %(message)s',
-        handlers=[
-            logging.FileHandler('logs/app.log', encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    pipeline = LoggingPipeline(config)
+    pipeline.install()
+    return pipeline
 
 def main() -> None:
     """
     애플리케이션 진입점
     """
-    setup_logging()
     config = ConfigManager()
+    log_pipeline = setup_logging(config)
     app = QApplication(sys.argv)
     window = MainWindow()
     window.show()
-    sys.exit(app.exec_())
+    exit_code = app.exec_()
+    log_pipeline.shutdown()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
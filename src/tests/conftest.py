@@ -0,0 +1,27 @@
+"""
+테스트 공용 fixture (InSightSimulator와 로그인한 TelnetManager)
+"""
+
+import pytest
+
+from utils.insight_simulator import InSightSimulator, SimulatorConfig
+from utils.telnet_manager import TelnetManager
+
+
+@pytest.fixture
+def simulator():
+    """빈 포트에서 실행 중인 시뮬레이터 (JOB 로드 시간 단축)"""
+    sim = InSightSimulator(config=SimulatorConfig(load_time_ms=20.0, ng_rate=0.0))
+    sim.start()
+    yield sim
+    sim.stop()
+
+
+@pytest.fixture
+def telnet(simulator):
+    """시뮬레이터에 로그인한 TelnetManager"""
+    manager = TelnetManager()
+    manager.connect_and_receive_initial(simulator.host, simulator.port)
+    assert manager.login("admin", "")
+    yield manager
+    manager.disconnect()
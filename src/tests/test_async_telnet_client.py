@@ -0,0 +1,36 @@
+"""
+AsyncTelnetClient 테스트 (InSightSimulator 사용)
+"""
+
+import asyncio
+
+from utils.async_telnet_client import AsyncTelnetClient
+from utils.insight_simulator import InSightSimulator, SimulatorConfig
+
+
+def test_late_reply_is_discarded():
+    """시간 초과된 명령의 늦은 응답이 다음 명령의 응답으로 읽히지 않아야 함"""
+    simulator = InSightSimulator(config=SimulatorConfig(load_time_ms=100.0, ng_rate=0.0))
+    simulator.start()
+    job = simulator.config.jobs[-1]
+
+    async def scenario():
+        client = AsyncTelnetClient(simulator.host, simulator.port)
+        await client.connect()
+        assert await client.login("admin", "")
+        try:
+            assert (await client.send_command("SO0")).ok
+            late = await client.send_command(f"LF{job}", timeout=0.02)
+            assert not late.complete
+            # LF 응답이 도착해 StreamReader에 쌓일 때까지 대기
+            await asyncio.sleep(0.3)
+            reply = await client.send_command("GF")
+            assert reply.ok
+            assert reply.value == job
+        finally:
+            await client.close()
+
+    try:
+        asyncio.run(scenario())
+    finally:
+        simulator.stop()
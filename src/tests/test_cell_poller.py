@@ -0,0 +1,59 @@
+"""
+셀 폴링 스케줄러(PollScheduler) 테스트
+"""
+
+import pytest
+
+from utils.cell_poller import MIN_POLL_INTERVAL_MS, PollScheduler
+
+
+def test_due_groups_entries_by_interval():
+    scheduler = PollScheduler()
+    scheduler.add("A003", "GVA003", 100)
+    scheduler.add("A004", "GVA004", 1000)
+    start = scheduler.entry("A004").next_due
+    entries = scheduler.due(start)
+    assert [entry.key for entry in entries] == ["A003", "A004"]
+    scheduler.complete(entries, elapsed=0.0, now=start)
+    assert scheduler.due(start + 0.05) == []
+    assert [entry.key for entry in scheduler.due(start + 0.1)] == ["A003"]
+    assert [entry.key for entry in scheduler.due(start + 1.0)] == ["A003", "A004"]
+
+
+def test_interval_has_lower_bound():
+    scheduler = PollScheduler()
+    scheduler.add("A003", "GVA003", 1)
+    assert scheduler.entry("A003").interval == pytest.approx(MIN_POLL_INTERVAL_MS / 1000.0)
+
+
+def test_backoff_grows_when_slow_and_recovers():
+    scheduler = PollScheduler(backoff_factor=2.0, max_backoff=4.0, slow_ratio=0.5)
+    scheduler.add("A003", "GVA003", 100)
+    entries = scheduler.due(scheduler.entry("A003").next_due)
+    for expected in (2.0, 4.0, 4.0):
+        scheduler.complete(entries, elapsed=0.08, now=0.0)
+        assert scheduler.backoff == expected
+    assert entries[0].next_due == pytest.approx(0.4)
+    scheduler.complete(entries, elapsed=0.01, now=0.0)
+    scheduler.complete(entries, elapsed=0.01, now=0.0)
+    assert scheduler.backoff == 1.0
+
+
+def test_update_value_reports_changes():
+    scheduler = PollScheduler()
+    scheduler.add("A003", "GVA003")
+    assert scheduler.update_value("A003", "1")
+    assert not scheduler.update_value("A003", "1")
+    assert scheduler.update_value("A003", "2")
+    assert not scheduler.update_value("missing", "1")
+
+
+def test_remove_and_clear():
+    scheduler = PollScheduler()
+    scheduler.add("A003", "GVA003")
+    scheduler.add("A004", "GVA004")
+    scheduler.remove("A003")
+    assert "A003" not in scheduler and len(scheduler) == 1
+    scheduler.backoff = 4.0
+    scheduler.clear()
+    assert len(scheduler) == 0 and scheduler.backoff == 1.0
@@ -0,0 +1,84 @@
+"""
+JOB 전환 절차(changeover_steps) 테스트
+"""
+
+from utils.changeover import (
+    PHASE_CHECK, PHASE_LOAD, PHASE_OFFLINE, PHASE_ONLINE, PHASE_VERIFY, ChangeoverOptions, ChangeoverReport,
+    Send, Wait, changeover_steps, run_changeover
+)
+from utils.native_protocol import STATUS_FILE_NOT_FOUND, STATUS_SUCCESS, NativeReply
+
+OPTIONS = ChangeoverOptions(verify_timeout=1.0, poll_interval=0.01)
+
+
+def reply(command: str, status: int = STATUS_SUCCESS, *lines: str) -> NativeReply:
+    return NativeReply(command, status, list(lines), b"")
+
+
+def drive(job_file: str, answers: dict) -> tuple:
+    """제너레이터를 응답표(명령 -> 응답 목록)로 실행하고 (보낸 명령, 보고서)를 반환합니다."""
+    report = ChangeoverReport("test", job_file)
+    steps = changeover_steps(job_file, report, OPTIONS)
+    sent = []
+    try:
+        request = next(steps)
+        while True:
+            if isinstance(request, Wait):
+                request = steps.send(None)
+                continue
+            assert isinstance(request, Send)
+            sent.append(request.command)
+            request = steps.send(answers[request.command].pop(0))
+    except StopIteration:
+        pass
+    return sent, report
+
+
+def test_online_camera_sequence():
+    sent, report = drive("b.job", {
+        "GO": [reply("GO", STATUS_SUCCESS, "1")],
+        "SO0": [reply("SO0")],
+        "LFb.job": [reply("LFb.job")],
+        "GF": [reply("GF", STATUS_SUCCESS, "a.job"), reply("GF", STATUS_SUCCESS, "/jobs/B.JOB")],
+        "SO1": [reply("SO1")],
+    })
+    assert sent == ["GO", "SO0", "LFb.job", "GF", "GF", "SO1"]
+    assert report.ok
+    assert [phase.name for phase in report.phases] == [
+        PHASE_CHECK, PHASE_OFFLINE, PHASE_LOAD, PHASE_VERIFY, PHASE_ONLINE]
+
+
+def test_offline_camera_is_not_brought_online():
+    sent, report = drive("b.job", {
+        "GO": [reply("GO", STATUS_SUCCESS, "0")],
+        "LFb.job": [reply("LFb.job")],
+        "GF": [reply("GF", STATUS_SUCCESS, "b.job")],
+    })
+    assert sent == ["GO", "LFb.job", "GF"]
+    assert report.ok
+
+
+def test_load_failure_restores_online():
+    sent, report = drive("x.job", {
+        "GO": [reply("GO", STATUS_SUCCESS, "1")],
+        "SO0": [reply("SO0")],
+        "LFx.job": [reply("LFx.job", STATUS_FILE_NOT_FOUND)],
+        "SO1": [reply("SO1")],
+    })
+    assert sent == ["GO", "SO0", "LFx.job", "SO1"]
+    assert not report.ok
+    assert "JOB 로드 실패" in report.error
+
+
+def test_run_against_simulator(simulator, telnet):
+    report = run_changeover(telnet, "inspection_B.job", OPTIONS)
+    assert report.ok, report.error
+    assert simulator.camera.current_job == "inspection_B.job"
+    assert simulator.camera.online
+
+
+def test_run_missing_job_against_simulator(simulator, telnet):
+    report = run_changeover(telnet, "missing.job", OPTIONS)
+    assert not report.ok
+    assert simulator.camera.current_job == "default.job"
+    assert simulator.camera.online
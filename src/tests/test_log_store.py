@@ -0,0 +1,90 @@
+"""
+로그 링 버퍼(RingBuffer)와 레코드 저장소(LogStore) 테스트
+"""
+
+import pytest
+
+from utils.log_store import LEVEL_ALL, LogRecord, LogStore, RingBuffer, make_record
+
+
+class TestRingBuffer:
+    def test_overwrites_oldest(self):
+        buffer = RingBuffer(3)
+        buffer.extend([1, 2])
+        assert buffer.overflow(2) == 1
+        buffer.extend([3, 4])
+        assert list(buffer) == [2, 3, 4]
+        assert buffer.to_list() == [2, 3, 4]
+        assert buffer[0] == 2 and buffer[2] == 4
+        with pytest.raises(IndexError):
+            buffer[3]
+
+    def test_extend_larger_than_capacity(self):
+        buffer = RingBuffer(3)
+        buffer.extend(list(range(10)))
+        assert buffer.to_list() == [7, 8, 9]
+
+    def test_drop_front(self):
+        buffer = RingBuffer(4)
+        buffer.extend([1, 2, 3, 4, 5])
+        buffer.drop_front(2)
+        assert buffer.to_list() == [4, 5]
+        buffer.extend([6, 7])
+        assert buffer.to_list() == [4, 5, 6, 7]
+        buffer.drop_front(10)
+        assert len(buffer) == 0
+
+
+def make_store(capacity: int, levels) -> LogStore:
+    store = LogStore(capacity)
+    store.extend([LogRecord(f"message {index}", level) for index, level in enumerate(levels)])
+    return store
+
+
+class TestLogStore:
+    def test_sequence_numbers_survive_drop(self):
+        store = make_store(4, ["INFO"] * 4)
+        store.drop_front(store.records.overflow(2))
+        store.extend([LogRecord("message 4"), LogRecord("message 5")])
+        assert store.first_seq == 2
+        assert store.get(5).text == "message 5"
+        assert list(store.seqs()) == [2, 3, 4, 5]
+
+    def test_level_filter(self):
+        store = make_store(10, ["INFO", "ERROR", "DEBUG", "WARNING", "ERROR"])
+        assert list(store.seqs("WARNING")) == [1, 3, 4]
+        assert list(store.seqs("ERROR")) == [1, 4]
+        assert list(store.seqs(LEVEL_ALL)) == [0, 1, 2, 3, 4]
+
+    def test_level_index_drops_with_records(self):
+        store = make_store(3, ["ERROR", "INFO", "ERROR"])
+        store.drop_front(1)
+        assert list(store.seqs("ERROR")) == [2]
+
+    def test_search(self):
+        store = make_store(10, ["INFO", "ERROR", "INFO"])
+        store.extend([LogRecord("GVA003 timeout", "ERROR", source="Telnet")])
+        assert store.search("message 1") == [1]
+        assert store.search("telnet") == [3]
+        assert store.search("message", "ERROR") == [1]
+        store.clear()
+        assert len(store) == 0 and store.search("message") == []
+
+
+class TestMakeRecord:
+    @pytest.mark.parametrize("message, level, text", [
+        ("[10:00:00.123] [오류] 연결 실패", "ERROR", "[오류] 연결 실패"),
+        ("[2026-10-18 10:00:00] [에러] x", "ERROR", "[에러] x"),
+        ("[2026-10-18 10:00:00] [경고] 재연결", "WARNING", "[경고] 재연결"),
+        ("[2026-10-18 10:00:00] 연결됨", "INFO", "연결됨"),
+        ("일반 메시지", "INFO", "일반 메시지"),
+    ])
+    def test_timestamp_and_level(self, message, level, text):
+        record = make_record(message)
+        assert record.level == level
+        assert record.text == text
+
+    def test_direction(self):
+        record = make_record("[10:00:00] TX: GVA003")
+        assert record.direction == "TX"
+        assert record.text == "GVA003"
@@ -0,0 +1,54 @@
+"""
+로그인 상태 기계(LoginSession) 테스트
+"""
+
+import socket
+
+import pytest
+
+from utils.native_protocol import LOGIN_DONE, LOGIN_FAILED, LOGIN_WAIT_CREDENTIALS, LoginSession
+
+
+class TestLoginSession:
+    def test_prompts_drive_credentials(self):
+        session = LoginSession()
+        assert session.feed(b"Welcome to In-Sight(R) 2000 Session 0\r\nUs") == b""
+        assert session.feed(b"er: ") == b""
+        assert session.state == LOGIN_WAIT_CREDENTIALS
+        assert session.start("admin", "secret") == b"admin\r\n"
+        assert session.feed(b"Pass") == b""
+        assert session.feed(b"word: ") == b"secret\r\n"
+        assert session.feed(b"User Logged In\r\n1\r\n") == b""
+        assert session.state == LOGIN_DONE
+        assert session.take_remaining() == b"1\r\n"
+
+    def test_credentials_before_banner(self):
+        session = LoginSession()
+        session.start("admin", "")
+        assert session.feed(b"Welcome\r\nUser: ") == b"admin\r\n"
+
+    def test_rejection_waits_for_end_of_line(self):
+        session = LoginSession(banner_received=True)
+        session.start("admin", "wrong")
+        session.feed(b"Password: ")
+        session.feed(b"Invalid Pass")
+        assert not session.finished
+        session.feed(b"word\r\nUser: ")
+        assert session.state == LOGIN_FAILED
+        assert "Invalid Password" in session.error
+
+    @pytest.mark.parametrize("password, expected", [("", True), ("wrong", False)])
+    def test_against_simulator(self, simulator, password, expected):
+        session = LoginSession()
+        session.start("admin", password)
+        with socket.create_connection((simulator.host, simulator.port), timeout=5.0) as sock:
+            while not session.finished:
+                data = sock.recv(4096)
+                if not data:
+                    session.fail("연결 종료")
+                    break
+                out = session.feed(data)
+                if out:
+                    sock.sendall(out)
+        assert session.logged_in is expected
+        assert session.banner.startswith("Welcome to In-Sight")
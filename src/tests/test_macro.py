@@ -0,0 +1,100 @@
+"""
+매크로 컴파일(compile_macro)과 실행(run_macro) 테스트
+"""
+
+import threading
+import time
+
+import pytest
+
+from utils.macro import MacroError, MacroStep, MacroWait, compile_macro, parse_param_overrides, run_macro
+
+LOOP_MACRO = """
+param count = 3
+param cell = A00
+repeat {count} as i
+    SI{cell}{i} {i}
+    GV{cell}{i} => "{i}"
+    GV{cell}{i} => /^{i}$/
+end
+"""
+
+
+class TestCompile:
+    def test_count_and_expand(self):
+        plan = compile_macro("loop", LOOP_MACRO)
+        values = plan.resolve({"count": "2"})
+        assert plan.count(values) == 6
+        steps = list(plan.expand(values))
+        assert [step.command for step in steps] == [
+            "SIA000 0", "GVA000", "GVA000", "SIA001 1", "GVA001", "GVA001"]
+        # 기대값의 자리표시자도 회차마다 대입됨
+        assert steps[4].expect.text == "1"
+        assert steps[5].expect.pattern.pattern == "^1$"
+
+    def test_wait_and_nested_repeat(self):
+        plan = compile_macro("nested", "repeat 2 as i\n  repeat {i}\n    SW8\n  end\n  wait 10\nend\n")
+        items = list(plan.expand(plan.resolve()))
+        assert [type(item) for item in items] == [MacroWait, MacroStep, MacroWait]
+        assert items[0].seconds == pytest.approx(0.01)
+        assert plan.count(plan.resolve()) == 1
+
+    @pytest.mark.parametrize("source, line", [
+        ("SW8\nrepeat 2\nSW8\n", 2),                 # end 없음
+        ("end\n", 1),                                 # 짝 없는 end
+        ("GV{missing}\n", 1),                         # 선언되지 않은 파라미터
+        ('GVA001 => "{missing}"\n', 1),               # 기대값의 선언되지 않은 파라미터
+        ("SW8\nGVA001 => /(/\n", 2),                  # 정규식 오류
+        ("SW8\nparam x = 1\n", 2),                    # 명령 뒤의 param
+        ("SW8 => maybe\n", 1),                        # 알 수 없는 기대값
+    ])
+    def test_errors_report_line(self, source, line):
+        with pytest.raises(MacroError) as info:
+            compile_macro("bad", source)
+        assert info.value.line == line
+
+    def test_undeclared_override(self):
+        plan = compile_macro("loop", LOOP_MACRO)
+        with pytest.raises(MacroError):
+            plan.resolve({"nope": "1"})
+
+    def test_too_many_steps(self):
+        plan = compile_macro("huge", "param n = 10\nrepeat {n}\n  SW8\nend\n")
+        with pytest.raises(MacroError):
+            plan.count(plan.resolve({"n": "1000000000"}))
+
+    def test_parse_overrides(self):
+        assert parse_param_overrides("count=10, cell = A003") == {"count": "10", "cell": "A003"}
+        with pytest.raises(MacroError):
+            parse_param_overrides("count")
+
+
+class TestRun:
+    def test_pipelined_run(self, telnet):
+        plan = compile_macro("loop", LOOP_MACRO)
+        progress = []
+        result = run_macro(telnet, plan, {"count": "10"}, chunk_size=8,
+                           progress=lambda done, total: progress.append((done, total)))
+        assert result.ok, [failure.error for failure in result.failures]
+        assert len(result.steps) == 30
+        assert progress[-1] == (30, 30)
+
+    def test_expectation_mismatch_stops(self, telnet):
+        plan = compile_macro("mismatch", 'SIA001 1\nGVA001 => "2"\nSW8\n')
+        result = run_macro(telnet, plan, chunk_size=1)
+        assert not result.ok
+        assert result.stopped
+        assert [failure.line for failure in result.failures] == [2]
+        assert len(result.steps) == 2
+
+    def test_cancel_during_wait(self, telnet):
+        plan = compile_macro("wait", "SW8\nwait 5000\nSW8\n")
+        cancel = threading.Event()
+        timer = threading.Timer(0.1, cancel.set)
+        timer.start()
+        started = time.monotonic()
+        result = run_macro(telnet, plan, cancel=cancel)
+        timer.join()
+        assert result.cancelled
+        assert len(result.steps) == 1
+        assert time.monotonic() - started < 2.0
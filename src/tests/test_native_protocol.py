@@ -0,0 +1,75 @@
+"""
+Native Mode 프레임 파서(NativeFrameReader)와 셀 쓰기 명령 형식 테스트
+"""
+
+import pytest
+
+from utils.native_protocol import (
+    STATUS_FILE_NOT_FOUND, STATUS_SUCCESS, NativeFrameReader, format_set_command, set_command_type
+)
+
+
+def feed_bytewise(reader: NativeFrameReader, data: bytes, command: str):
+    """한 바이트씩 넣으면서 프레임이 완성되는 시점을 확인합니다."""
+    reply = None
+    for index in range(len(data)):
+        assert reply is None, "프레임이 일찍 완성됨"
+        reader.feed(data[index:index + 1])
+        reply = reader.read_frame(command)
+    return reply
+
+
+class TestNativeFrameReader:
+    def test_status_and_payload(self):
+        reader = NativeFrameReader()
+        reply = feed_bytewise(reader, b"1\r\ninspection_A.job\r\n", "GF")
+        assert reply.ok
+        assert reply.value == "inspection_A.job"
+        assert len(reader) == 0
+
+    def test_counted_payload(self):
+        reader = NativeFrameReader()
+        reply = feed_bytewise(reader, b"1\r\n2\r\na.job\r\nb.job\r\n", "Get FileList")
+        assert reply.status == STATUS_SUCCESS
+        assert reply.lines == ["2", "a.job", "b.job"]
+
+    def test_error_status_has_no_payload(self):
+        reader = NativeFrameReader()
+        reader.feed(b"-3\r\n1\r\n")
+        reply = reader.read_frame("LFmissing.job")
+        assert reply.status == STATUS_FILE_NOT_FOUND
+        assert not reply.ok
+        assert reply.lines == []
+        # 다음 프레임은 버퍼에 남아 있어야 함
+        assert reader.read_frame("SO1").status == STATUS_SUCCESS
+
+    def test_pipelined_frames_and_leading_blank_lines(self):
+        reader = NativeFrameReader()
+        reader.feed(b"\r\n1\r\n42\r\n1\r\n")
+        assert reader.read_frame("GVA003").value == "42"
+        assert reader.read_frame("SW8").ok
+        assert reader.read_frame("SW8") is None
+
+    def test_take_partial(self):
+        reader = NativeFrameReader()
+        reader.feed(b"1\r\n")
+        assert reader.read_frame("GVA003") is None
+        reply = reader.take_partial("GVA003")
+        assert not reply.complete
+        assert reply.status == STATUS_SUCCESS
+        assert not reply.ok
+        assert len(reader) == 0
+
+
+class TestSetCommand:
+    @pytest.mark.parametrize("value, kind", [("5", "SI"), ("-12", "SI"), ("1.5", "SF"), ("abc", "SS")])
+    def test_command_type(self, value, kind):
+        assert set_command_type(value) == kind
+
+    def test_format(self):
+        assert format_set_command(" A003 ", " 5 ") == "SIA003 5"
+
+    def test_simulator_accepts_format(self, telnet):
+        for cell, value in (("A003", "5"), ("B010", "2.5"), ("C001", "text")):
+            assert telnet.send_native(format_set_command(cell, value)).ok
+            assert telnet.send_native(f"GV{cell}").value == value
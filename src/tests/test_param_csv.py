@@ -0,0 +1,52 @@
+"""
+파라미터 CSV 청크 입출력(param_csv) 테스트
+"""
+
+from utils.param_csv import detect_columns, iter_param_chunks, write_param_csv
+
+
+def test_detect_columns():
+    columns, has_header = detect_columns(["\ufeffNo", "Cell", "항목", "값", "명령유형", "시간"])
+    assert has_header
+    assert columns["cell"] == 1 and columns["value"] == 3 and columns["time"] == 5
+    columns, has_header = detect_columns(["1", "A003", "Vision.Result", "1"])
+    assert not has_header and columns["cell"] == 1
+
+
+def test_round_trip_in_chunks(tmp_path):
+    path = str(tmp_path / "params.csv")
+    count = 25
+    cells = [f"A{index:03d}" for index in range(count)]
+    items = [f"Item{index}" for index in range(count)]
+    values = [str(index * 2) for index in range(count)]
+    reports = []
+    assert write_param_csv(path, cells, items, values, chunk_size=10,
+                           progress=lambda done, total: reports.append((done, total)))
+    assert reports == [(10, 25), (20, 25), (25, 25)]
+    with open(path, "rb") as csvfile:
+        assert csvfile.read(3) == b"\xef\xbb\xbf"
+
+    chunks = list(iter_param_chunks(path, chunk_size=10))
+    assert [len(chunk) for chunk in chunks] == [10, 10, 5]
+    rows = [row for chunk in chunks for row in chunk]
+    assert rows[0] == ("A000", "Item0", "0", "GET Item0")
+    assert [row[0] for row in rows] == cells
+
+
+def test_headerless_and_blank_cells(tmp_path):
+    path = tmp_path / "params.csv"
+    path.write_text("1, A001 ,Vision.Result,1\n2,,skip,0\n3,A002,Job.Name\n", encoding="utf-8")
+    rows = [row for chunk in iter_param_chunks(str(path)) for row in chunk]
+    assert rows == [("A001", "Vision.Result", "1", "GET Vision.Result"),
+                    ("A002", "Job.Name", "", "GET Job.Name")]
+
+
+def test_stop(tmp_path):
+    path = str(tmp_path / "params.csv")
+    cells = [f"A{index:03d}" for index in range(30)]
+    assert not write_param_csv(path, cells, cells, cells, chunk_size=10, should_stop=lambda: True)
+    write_param_csv(path, cells, cells, cells)
+    chunks = []
+    for chunk in iter_param_chunks(path, chunk_size=10, should_stop=lambda: len(chunks) >= 1):
+        chunks.append(chunk)
+    assert len(chunks) == 1
@@ -0,0 +1,73 @@
+"""
+검사 결과 저장소(ResultStore) 테스트
+"""
+
+import pytest
+
+from utils.result_store import JUDGE_NG, JUDGE_OK, ResultStore, judge
+
+HOST = "127.0.0.1:23"
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1", JUDGE_OK), (" Pass ", JUDGE_OK), ("0", JUDGE_NG), ("fail", JUDGE_NG), ("warn", "WARN"),
+])
+def test_judge(value, expected):
+    assert judge(value) == expected
+
+
+def _reopen(path):
+    """기록을 모두 마친 저장소를 조회용으로 다시 엽니다."""
+    return ResultStore(path)
+
+
+def test_record_values(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path)
+    store.record_values(HOST, {"Job.Name": "a.job", "Vision.Result": "1",
+                               "Vision.ExecutionTime": "12.5", "A003": "7"}, ts=100.0)
+    # Job.Name이 없으면 장비의 마지막 JOB을 사용
+    store.record_values(HOST, {"Vision.Result": "0", "Vision.ExecutionTime": "x"}, ts=101.0)
+    store.close()
+
+    store = _reopen(path)
+    try:
+        newest, oldest = store.query()
+        assert newest[1:] == (101.0, HOST, "a.job", JUDGE_NG, None)
+        assert oldest[1:] == (100.0, HOST, "a.job", JUDGE_OK, 12.5)
+        assert dict(store.values(oldest[0]))["A003"] == "7"
+        assert store.jobs() == ["a.job"]
+    finally:
+        store.close()
+
+
+def test_query_filters_and_paging(tmp_path):
+    path = str(tmp_path / "results.db")
+    store = ResultStore(path)
+    for index in range(10):
+        store.record("cam1" if index < 6 else "cam2", "a.job" if index % 2 else "b.job",
+                     JUDGE_NG if index % 3 == 0 else JUDGE_OK, float(index), ts=1000.0 + index)
+    store.close()
+
+    store = _reopen(path)
+    try:
+        assert store.jobs() == ["a.job", "b.job"]
+        assert store.summary() == (10, 4)
+        assert store.summary(job="b.job") == (5, 2)
+        assert store.summary(start=1002.0, end=1006.0, host="cam1") == (4, 1)
+        ng = store.query(judgement=JUDGE_NG)
+        assert [row[1] for row in ng] == [1009.0, 1006.0, 1003.0, 1000.0]
+
+        # (ts, id) 키셋 페이징으로 전체를 빠짐없이 한 번씩 읽음
+        pages, before = [], None
+        while True:
+            page = store.query(before=before, limit=3)
+            if not page:
+                break
+            pages.append(page)
+            before = (page[-1][1], page[-1][0])
+        assert [len(page) for page in pages] == [3, 3, 3, 1]
+        timestamps = [row[1] for page in pages for row in page]
+        assert timestamps == sorted(timestamps, reverse=True) and len(set(timestamps)) == 10
+    finally:
+        store.close()
@@ -0,0 +1,83 @@
+"""
+롤링 통계(RollingStats/CameraStats) 테스트
+"""
+
+import datetime
+import math
+
+import pytest
+
+from utils.rolling_stats import (
+    CameraStats, RollingStats, StatsWindow, parse_shift_starts, shift_start
+)
+
+
+def _filled(capacity: int, total: int) -> RollingStats:
+    """i번째 샘플이 시각 i, 사이클 타임 i ms, 3의 배수면 NG인 버퍼"""
+    stats = RollingStats(capacity)
+    for index in range(total):
+        stats.add(float(index), index % 3 == 0, ts=float(index))
+    return stats
+
+
+class TestRollingStats:
+    def test_count_window_after_wrap(self):
+        stats = _filled(8, 12)
+        assert len(stats) == 8
+        result = stats.window_stats(StatsWindow("n", count=5), now=12.0)
+        # 7..11 (링 끝과 앞부분에 걸친 구간)
+        assert result.count == 5
+        assert result.mean == pytest.approx(9.0)
+        assert result.p50 == pytest.approx(9.0)
+        assert result.ng_rate == pytest.approx(1 / 5)
+        # 보관 수보다 큰 구간은 보관 중인 샘플 전체
+        assert stats.window_stats(StatsWindow("all", count=100), now=12.0).count == 8
+
+    def test_seconds_window(self):
+        stats = _filled(8, 12)
+        result = stats.window_stats(StatsWindow("t", seconds=3.5), now=11.0)
+        assert result.count == 4
+        assert result.mean == pytest.approx(9.5)
+        assert stats.window_stats(StatsWindow("t", seconds=1.0), now=100.0).count == 0
+
+    def test_missing_values_are_skipped(self):
+        stats = RollingStats(4)
+        stats.add(10.0, None, ts=1.0)
+        stats.add(None, True, ts=2.0)
+        stats.add(20.0, False, ts=3.0)
+        result = stats.window_stats(StatsWindow("n", count=3), now=3.0)
+        assert result.count == 3
+        assert result.mean == pytest.approx(15.0)
+        assert result.ng_rate == pytest.approx(0.5)
+
+    def test_empty(self):
+        result = RollingStats(4).window_stats(StatsWindow("n", count=10), now=0.0)
+        assert result.count == 0
+        assert math.isnan(result.mean) and math.isnan(result.ng_rate)
+
+
+def test_shift_start():
+    starts = parse_shift_starts("22:00, 06:00, bad")
+    assert starts == [(6, 0), (22, 0)]
+    now = datetime.datetime(2026, 1, 2, 3, 0).timestamp()
+    assert shift_start(now, starts) == datetime.datetime(2026, 1, 1, 22, 0).timestamp()
+    now = datetime.datetime(2026, 1, 2, 6, 0).timestamp()
+    assert shift_start(now, starts) == now
+
+
+class TestCameraStats:
+    def test_long_windows_are_cached(self):
+        windows = [StatsWindow("n", count=100), StatsWindow("a", seconds=1000, refresh=10.0),
+                   StatsWindow("b", seconds=1000, refresh=10.0)]
+        cameras = CameraStats(capacity=16, windows=windows)
+        assert [result.count for result in cameras.snapshot("cam")] == [0, 0, 0]
+
+        cameras.add("cam", 1.0, False, ts=100.0)
+        assert [result.count for result in cameras.snapshot("cam", now=100.0)] == [1, 1, 1]
+        cameras.add("cam", 2.0, False, ts=101.0)
+        # 캐시 유효: 짧은 구간만 다시 계산
+        assert [result.count for result in cameras.snapshot("cam", now=105.0)] == [2, 1, 1]
+        # 둘 다 만료: 한 번에 긴 구간 하나만 다시 계산
+        assert [result.count for result in cameras.snapshot("cam", now=111.0)] == [2, 2, 1]
+        assert [result.count for result in cameras.snapshot("cam", now=112.0)] == [2, 2, 2]
+        assert cameras.keys() == ["cam"]
@@ -0,0 +1,47 @@
+"""
+지연 히스토그램(LatencyHistogram) 테스트
+"""
+
+import random
+
+import pytest
+
+from utils.telnet_stats import SUB_BUCKET_COUNT, LatencyHistogram, _bucket_index, _bucket_upper_us
+
+
+def test_bucket_upper_bound_contains_value():
+    for value in list(range(0, 200)) + [1000, 4095, 4096, 65535, 1_000_000, 99_999_999]:
+        index = _bucket_index(value)
+        assert value <= _bucket_upper_us(index)
+        if index > 0:
+            assert value > _bucket_upper_us(index - 1)
+
+
+def test_empty_summary():
+    summary = LatencyHistogram().summary()
+    assert summary["count"] == 0
+    assert summary["p99_ms"] == 0.0
+
+
+def test_percentiles_within_bucket_error():
+    rng = random.Random(7)
+    samples = [rng.uniform(0.0005, 0.050) for _ in range(20000)]
+    histogram = LatencyHistogram()
+    for seconds in samples:
+        histogram.record(seconds)
+    ordered = sorted(samples)
+    for pct in (50, 90, 99):
+        exact_ms = ordered[int(len(ordered) * pct / 100.0)] * 1000.0
+        # 버킷 상한 기준이므로 정확한 값 이상, 상대 오차 1/SUB_BUCKET_COUNT 이내
+        assert histogram.percentile_ms(pct) == pytest.approx(exact_ms, rel=1.0 / SUB_BUCKET_COUNT + 0.01)
+    summary = histogram.summary()
+    assert summary["count"] == len(samples)
+    assert summary["max_ms"] == pytest.approx(max(samples) * 1000.0, abs=0.001)
+    assert summary["min_ms"] == pytest.approx(min(samples) * 1000.0, abs=0.001)
+
+
+def test_overflow_goes_to_last_bucket():
+    histogram = LatencyHistogram()
+    histogram.record(500.0)
+    assert histogram.counts[-1] == 1
+    assert histogram.summary()["max_ms"] == pytest.approx(500000.0)
@@ -0,0 +1,87 @@
+"""
+통신 저널(TrafficJournal) 기록/조회와 보관 제한 테스트
+"""
+
+import time
+
+from utils.config import ConfigManager
+from utils.traffic_journal import DEFAULT_MAX_ROWS, DEFAULT_RETENTION_DAYS, TrafficJournal
+
+
+def _reopen(path):
+    """정리 없이 조회만 하는 저널 (기록하지 않으면 정리도 실행되지 않음)"""
+    return TrafficJournal(path, retention_days=0, max_rows=0)
+
+
+def _record(journal, command, age=0.0):
+    journal.record("127.0.0.1:23", command, b"1\r\n", 1, 0.005, time.monotonic() - age)
+
+
+def test_query_and_count(tmp_path):
+    path = str(tmp_path / "traffic.db")
+    journal = TrafficJournal(path, retention_days=0, max_rows=0)
+    for index in range(5):
+        _record(journal, "GVA0" if index % 2 else "SW8")
+    journal.close()
+
+    journal = _reopen(path)
+    try:
+        assert journal.count() == 5
+        assert journal.count(command="SW8") == 3
+        rows = journal.query(command="GVA0")
+        assert [row[4] for row in rows] == ["GVA0", "GVA0"]
+        _, _, _, host, _, status, latency_ms, raw = rows[0]
+        assert host == "127.0.0.1:23" and status == 1 and raw == b"1\r\n"
+        assert abs(latency_ms - 5.0) < 1e-6
+        assert len(journal.query(limit=2)) == 2
+    finally:
+        journal.close()
+
+
+def test_prunes_by_age(tmp_path):
+    path = str(tmp_path / "traffic.db")
+    journal = TrafficJournal(path, retention_days=0, max_rows=0)
+    for _ in range(3):
+        _record(journal, "OLD", age=3 * 86400.0)
+    journal.close()
+
+    journal = TrafficJournal(path, retention_days=1, max_rows=0, prune_interval=0)
+    _record(journal, "NEW")
+    journal.close()
+
+    journal = _reopen(path)
+    try:
+        assert journal.commands() == ["NEW"]
+    finally:
+        journal.close()
+
+
+def test_prunes_by_row_count(tmp_path):
+    path = str(tmp_path / "traffic.db")
+    journal = TrafficJournal(path, retention_days=0, max_rows=3, prune_interval=0)
+    for index in range(10):
+        _record(journal, f"C{index}")
+    journal.close()
+
+    journal = _reopen(path)
+    try:
+        assert [row[4] for row in journal.query()] == ["C7", "C8", "C9"]
+    finally:
+        journal.close()
+
+
+def test_from_config(tmp_path):
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[journal]\nretention_days = 0\nmax_rows = abc\n")
+    journal = TrafficJournal.from_config(ConfigManager(str(config_path)), str(tmp_path / "traffic.db"))
+    try:
+        assert journal.retention_days == 0
+        assert journal.max_rows == DEFAULT_MAX_ROWS
+    finally:
+        journal.close()
+
+    journal = TrafficJournal.from_config(None, str(tmp_path / "default.db"))
+    try:
+        assert journal.retention_days == DEFAULT_RETENTION_DAYS
+    finally:
+        journal.close()
@@ -0,0 +1,72 @@
+"""
+트리거 반복 시험(run_trigger_loop) 테스트 (InSightSimulator 사용)
+"""
+
+import json
+import threading
+
+from utils.config import ConfigManager
+from utils.native_protocol import STATUS_COMMAND_FAILED, status_message
+from utils.trigger_loop import (
+    TriggerLoopOptions, TriggerLoopStats, append_result, parse_commands, run_trigger_loop
+)
+
+RESULT_COMMANDS = ["GET Vision.Result", "GET Vision.InspectionCount"]
+
+
+def _run(telnet, **kwargs):
+    options = TriggerLoopOptions(result_commands=RESULT_COMMANDS, **kwargs)
+    return options, run_trigger_loop(telnet, options, TriggerLoopStats(), threading.Event())
+
+
+def test_max_cycles(simulator, telnet):
+    _, stats = _run(telnet, max_cycles=5)
+    snapshot = stats.snapshot()
+    assert snapshot["cycles"] == 5 and snapshot["accepted"] == 5
+    assert snapshot["dropped"] == 0 and snapshot["read_errors"] == 0
+    assert snapshot["last_values"] == {"GET Vision.Result": "1", "GET Vision.InspectionCount": "5"}
+    assert simulator.camera.inspection_count == 5
+    assert snapshot["cycle"]["count"] == 5
+
+
+def test_rejected_when_offline(simulator, telnet):
+    simulator.camera.online = False
+    _, stats = _run(telnet, max_cycles=3)
+    snapshot = stats.snapshot()
+    assert snapshot["cycles"] == 3 and snapshot["rejected"] == 3 and snapshot["accepted"] == 0
+    assert snapshot["last_error"] == status_message(STATUS_COMMAND_FAILED)
+    assert simulator.camera.inspection_count == 0
+
+
+def test_stop_event(telnet):
+    options = TriggerLoopOptions(rate=50.0, result_commands=RESULT_COMMANDS)
+    stats = TriggerLoopStats()
+    stop = threading.Event()
+    worker = threading.Thread(target=run_trigger_loop, args=(telnet, options, stats, stop))
+    worker.start()
+    stop.wait(0.2)
+    stop.set()
+    worker.join(2.0)
+    assert not worker.is_alive()
+    assert stats.snapshot()["cycles"] >= 1
+    assert stats.finished
+
+
+def test_append_result(telnet, tmp_path):
+    options, stats = _run(telnet, max_cycles=2)
+    path = tmp_path / "logs" / "trigger_loop.jsonl"
+    append_result(stats, options, "127.0.0.1:23", str(path))
+    append_result(stats, options, "127.0.0.1:23", str(path))
+    records = [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+    assert len(records) == 2
+    assert records[0]["camera"] == "127.0.0.1:23"
+    assert records[0]["accepted"] == 2 and records[0]["result_commands"] == RESULT_COMMANDS
+
+
+def test_options_from_config(tmp_path):
+    assert parse_commands(" GET A, ,GET B ") == ["GET A", "GET B"]
+    config_path = tmp_path / "config.ini"
+    config_path.write_text("[trigger_loop]\nrate = fast\nresult_commands = GVA003, GVA004\n")
+    options = TriggerLoopOptions.from_config(ConfigManager(str(config_path)))
+    assert options.rate == 0.0
+    assert options.result_commands == ["GVA003", "GVA004"]
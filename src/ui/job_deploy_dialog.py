@@ -0,0 +1,361 @@
+"""
+다중 카메라 JOB 배포 다이얼로그 모듈
+
+[cameras] 설정의 카메라마다 적용할 JOB 파일을 지정하고, 모든 카메라를
+동시에(최대 동시 전환 수 제한) 전환합니다. 카메라 x 단계 표에 진행 상황과
+단계별 소요 시간을 실시간으로 표시합니다.
+"""
+
+import logging
+import time
+from concurrent.futures import Future
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QComboBox, QSpinBox,
+    QTableWidget, QTableWidgetItem, QHeaderView, QAbstractItemView, QMessageBox
+)
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor
+
+from utils.camera_sessions import CameraSessionManager, DeviceResult, DEFAULT_MAX_PARALLEL, PHASE_CONNECT
+from utils.changeover import (
+    ChangeoverOptions, ChangeoverReport, append_report,
+    PHASE_CHECK, PHASE_OFFLINE, PHASE_LOAD, PHASE_VERIFY, PHASE_ONLINE
+)
+from utils.config import ConfigManager
+from utils.job_catalog import FILE_LIST_COMMAND, JobCatalog, parse_job_files
+
+PHASES = [PHASE_CONNECT, PHASE_CHECK, PHASE_OFFLINE, PHASE_LOAD, PHASE_VERIFY, PHASE_ONLINE]
+COLUMNS = ["카메라", "JOB 파일"] + PHASES + ["합계 (ms)", "결과"]
+COL_JOB = 1
+COL_PHASE = 2
+COL_TOTAL = COL_PHASE + len(PHASES)
+COL_RESULT = COL_TOTAL + 1
+
+COLOR_RUNNING = QColor("#fff3cd")
+COLOR_OK = QColor("#d4edda")
+COLOR_FAIL = QColor("#f8d7da")
+COLOR_SKIPPED = QColor("#eeeeee")
+
+# 경과 시간 표시 갱신 주기(ms)
+ELAPSED_INTERVAL_MS = 100
+
+
+class JobDeployDialog(QDialog):
+    """
+    카메라 -> JOB 매핑을 받아 여러 카메라를 동시에 전환하는 다이얼로그
+    """
+
+    # 이벤트 루프 스레드 -> GUI 스레드
+    phase_started = pyqtSignal(str, str)
+    deploy_finished = pyqtSignal(object)
+    files_fetched = pyqtSignal(object)
+
+    def __init__(self, job_catalog: Optional[JobCatalog] = None, extra_hosts: Optional[List[str]] = None,
+                 default_job: str = "", log_callback=None, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("다중 카메라 JOB 배포")
+        self.resize(980, 420)
+        self.job_catalog = job_catalog or JobCatalog()
+        self.log_callback = log_callback
+        self.running = False
+        self.reports: Dict[str, ChangeoverReport] = {}
+        self._rows: Dict[str, int] = {}
+        self._current_phase: Dict[str, str] = {}
+        self._started_at = 0.0
+
+        config = ConfigManager()
+        self.options = ChangeoverOptions.from_config(config)
+        self.sessions = CameraSessionManager()
+        keys = self.sessions.load_from_config(config)
+        username = config.get("cameras", "username", fallback="admin")
+        password = config.get("cameras", "password", fallback="")
+        for entry in extra_hosts or []:
+            host, _, port = entry.partition(":")
+            key = self.sessions.add_camera(host, int(port or 23), username, password)
+            if key not in keys:
+                keys.append(key)
+        try:
+            parallel = int(config.get("job", "deploy_parallel", fallback=DEFAULT_MAX_PARALLEL)
+                           or DEFAULT_MAX_PARALLEL)
+        except ValueError:
+            logging.warning("[JobDeploy] 잘못된 설정값: deploy_parallel")
+            parallel = DEFAULT_MAX_PARALLEL
+
+        self.setup_ui(parallel, default_job)
+        for key in keys:
+            self._add_row(key)
+
+        self.phase_started.connect(self._on_phase_started)
+        self.deploy_finished.connect(self._on_deploy_finished)
+        self.files_fetched.connect(self._on_files_fetched)
+        self.elapsed_timer = QTimer(self)
+        self.elapsed_timer.timeout.connect(self._update_elapsed)
+
+    def setup_ui(self, parallel: int, default_job: str):
+        layout = QVBoxLayout(self)
+
+        # 카메라 추가 / 전체 JOB 지정
+        top = QHBoxLayout()
+        self.host_edit = QLineEdit()
+        self.host_edit.setPlaceholderText("카메라 주소 (예: 192.168.0.113 또는 192.168.0.113:23)")
+        self.add_button = QPushButton("카메라 추가")
+        self.all_job_edit = QLineEdit(default_job)
+        self.all_job_edit.setPlaceholderText("모든 카메라에 적용할 JOB 파일")
+        self.apply_all_button = QPushButton("전체 적용")
+        self.fetch_button = QPushButton("목록 조회")
+        top.addWidget(self.host_edit, 2)
+        top.addWidget(self.add_button)
+        top.addSpacing(20)
+        top.addWidget(self.all_job_edit, 2)
+        top.addWidget(self.apply_all_button)
+        top.addWidget(self.fetch_button)
+        layout.addLayout(top)
+
+        # 카메라 x 단계 진행 표
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(COL_JOB, QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        bottom = QHBoxLayout()
+        bottom.addWidget(QLabel("동시 전환 수"))
+        self.parallel_spin = QSpinBox()
+        self.parallel_spin.setRange(1, 64)
+        self.parallel_spin.setValue(max(1, min(parallel, 64)))
+        bottom.addWidget(self.parallel_spin)
+        self.summary_label = QLabel("카메라별 JOB 파일을 지정하세요")
+        bottom.addWidget(self.summary_label, 1)
+        self.deploy_button = QPushButton("배포 시작")
+        self.close_button = QPushButton("닫기")
+        bottom.addWidget(self.deploy_button)
+        bottom.addWidget(self.close_button)
+        layout.addLayout(bottom)
+
+        self.add_button.clicked.connect(self._on_add_camera)
+        self.host_edit.returnPressed.connect(self._on_add_camera)
+        self.apply_all_button.clicked.connect(self._on_apply_all)
+        self.fetch_button.clicked.connect(self.fetch_job_files)
+        self.deploy_button.clicked.connect(self.start_deploy)
+        self.close_button.clicked.connect(self.reject)
+
+    # --- 카메라 / 매핑 ---
+
+    def _add_row(self, key: str):
+        if key in self._rows:
+            return
+        row = self.table.rowCount()
+        self.table.insertRow(row)
+        self._rows[key] = row
+        camera_item = QTableWidgetItem(key)
+        camera_item.setTextAlignment(Qt.AlignCenter)
+        self.table.setItem(row, 0, camera_item)
+
+        combo = QComboBox()
+        combo.setEditable(True)
+        combo.addItems(self.job_catalog.files(key) or [])
+        combo.setEditText(self.all_job_edit.text().strip())
+        self.table.setCellWidget(row, COL_JOB, combo)
+        for column in range(COL_PHASE, len(COLUMNS)):
+            item = QTableWidgetItem("")
+            item.setTextAlignment(Qt.AlignCenter)
+            self.table.setItem(row, column, item)
+
+    def _on_add_camera(self):
+        entry = self.host_edit.text().strip()
+        if not entry or self.running:
+            return
+        host, _, port = entry.partition(":")
+        try:
+            config = ConfigManager()
+            key = self.sessions.add_camera(host, int(port or 23),
+                                           config.get("cameras", "username", fallback="admin"),
+                                           config.get("cameras", "password", fallback=""))
+        except ValueError:
+            QMessageBox.warning(self, "입력 오류", f"잘못된 카메라 주소입니다: {entry}")
+            return
+        self._add_row(key)
+        self.host_edit.clear()
+
+    def _on_apply_all(self):
+        job_file = self.all_job_edit.text().strip()
+        for row in self._rows.values():
+            self.table.cellWidget(row, COL_JOB).setEditText(job_file)
+
+    def mapping(self) -> Dict[str, str]:
+        """JOB 파일이 지정된 카메라의 세션 키 -> JOB 파일 매핑"""
+        result = {}
+        for key, row in self._rows.items():
+            job_file = self.table.cellWidget(row, COL_JOB).currentText().strip()
+            if job_file:
+                result[key] = job_file
+        return result
+
+    def fetch_job_files(self):
+        """모든 카메라의 JOB 파일 목록을 동시에 조회하여 선택 목록을 채웁니다."""
+        if self.running or not self._rows:
+            return
+        self.fetch_button.setEnabled(False)
+        self.summary_label.setText("JOB 파일 목록 조회 중...")
+        future = self.sessions.send_all(FILE_LIST_COMMAND, list(self._rows))
+        future.add_done_callback(self.files_fetched.emit)
+
+    def _on_files_fetched(self, future: Future):
+        self.fetch_button.setEnabled(not self.running)
+        try:
+            results: Dict[str, DeviceResult] = future.result()
+        except Exception as e:
+            self.summary_label.setText(f"목록 조회 실패: {e}")
+            return
+        failed = 0
+        for key, result in results.items():
+            try:
+                if not result.ok or result.value is None:
+                    raise ValueError(result.error)
+                files = parse_job_files(result.value)
+            except ValueError as e:
+                failed += 1
+                self._log(f"[오류] {key} 파일 목록 조회 실패: {e}")
+                continue
+            self.job_catalog.store(key, files)
+            combo: QComboBox = self.table.cellWidget(self._rows[key], COL_JOB)
+            text = combo.currentText()
+            combo.clear()
+            combo.addItems(files)
+            combo.setEditText(text)
+        self.summary_label.setText(f"목록 조회 완료 (실패 {failed}대)" if failed else "목록 조회 완료")
+
+    # --- 배포 ---
+
+    def start_deploy(self):
+        mapping = self.mapping()
+        if not mapping:
+            QMessageBox.warning(self, "배포", "JOB 파일이 지정된 카메라가 없습니다.")
+            return
+        self._set_running(True)
+        self.reports = {}
+        self._current_phase = {}
+        for key, row in self._rows.items():
+            selected = key in mapping
+            for column in range(COL_PHASE, len(COLUMNS)):
+                item = self.table.item(row, column)
+                item.setText("대기" if selected and column == COL_RESULT else "")
+                item.setToolTip("")
+                item.setBackground(QColor(Qt.white) if selected else COLOR_SKIPPED)
+
+        parallel = self.parallel_spin.value()
+        self._log(f"JOB 배포 시작: 카메라 {len(mapping)}대, 동시 전환 {parallel}대")
+        self._started_at = time.monotonic()
+        self.elapsed_timer.start(ELAPSED_INTERVAL_MS)
+        future = self.sessions.deploy_jobs(mapping, self.options, self.phase_started.emit, parallel)
+        future.add_done_callback(self.deploy_finished.emit)
+
+    def _on_phase_started(self, key: str, phase: str):
+        """카메라의 새 단계 시작 표시 (GUI 스레드)"""
+        row = self._rows.get(key)
+        if row is None or phase not in PHASES:
+            return
+        previous = self._current_phase.get(key)
+        if previous is not None:
+            # 단계별 소요 시간은 완료 후 보고서로 채움
+            self._set_cell(row, COL_PHASE + PHASES.index(previous), "완료", COLOR_OK)
+        self._current_phase[key] = phase
+        self._set_cell(row, COL_PHASE + PHASES.index(phase), "진행 중", COLOR_RUNNING)
+        self._set_cell(row, COL_RESULT, phase, COLOR_RUNNING)
+
+    def _on_deploy_finished(self, future: Future):
+        """배포 완료 처리 (GUI 스레드)"""
+        self.elapsed_timer.stop()
+        wall_ms = (time.monotonic() - self._started_at) * 1000.0
+        self._set_running(False)
+        try:
+            results: Dict[str, DeviceResult] = future.result()
+        except Exception as e:
+            self.summary_label.setText(f"배포 실패: {e}")
+            self._log(f"[오류] JOB 배포 실패: {e}")
+            return
+
+        succeeded = 0
+        for key, result in results.items():
+            row = self._rows[key]
+            report = result.value if isinstance(result.value, ChangeoverReport) else None
+            if report is not None:
+                self.reports[key] = report
+                append_report(report)
+                self.job_catalog.invalidate(key)
+                self._show_report(row, report)
+            else:
+                # 연결/로그인 실패 또는 제한 시간 초과
+                phase = self._current_phase.get(key, PHASE_CONNECT)
+                self._set_cell(row, COL_PHASE + PHASES.index(phase), "실패", COLOR_FAIL, result.error)
+            self._set_cell(row, COL_TOTAL, f"{result.elapsed * 1000.0:.0f}",
+                           COLOR_OK if result.ok else COLOR_FAIL)
+            self._set_cell(row, COL_RESULT, "성공" if result.ok else "실패",
+                           COLOR_OK if result.ok else COLOR_FAIL, result.error)
+            succeeded += result.ok
+            self._log(f"{key} JOB 전환 {'완료' if result.ok else '실패'}: "
+                      f"{report.summary() if report else result.error}")
+
+        slowest = max((result.elapsed for result in results.values()), default=0.0) * 1000.0
+        serial = sum(result.elapsed for result in results.values()) * 1000.0
+        summary = (f"성공 {succeeded}/{len(results)}대 | 전체 {wall_ms:.0f} ms "
+                   f"(가장 느린 카메라 {slowest:.0f} ms, 순차 실행 시 약 {serial:.0f} ms)")
+        self.summary_label.setText(summary)
+        self._log(f"JOB 배포 완료: {summary}")
+
+    def _show_report(self, row: int, report: ChangeoverReport):
+        """보고서의 단계별 소요 시간을 표에 채웁니다."""
+        self._set_cell(row, COL_PHASE, "완료", COLOR_OK)
+        for name in PHASES[1:]:
+            phases = [phase for phase in report.phases if phase.name == name]
+            column = COL_PHASE + PHASES.index(name)
+            if not phases:
+                self._set_cell(row, column, "-", QColor(Qt.white))
+                continue
+            ok = all(phase.ok for phase in phases)
+            detail = "; ".join(phase.detail for phase in phases if phase.detail)
+            self._set_cell(row, column, f"{report.phase_ms(name):.0f}",
+                           COLOR_OK if ok else COLOR_FAIL, detail)
+
+    def _set_cell(self, row: int, column: int, text: str, color: QColor, tooltip: str = ""):
+        item = self.table.item(row, column)
+        item.setText(text)
+        item.setBackground(color)
+        item.setToolTip(tooltip)
+
+    def _update_elapsed(self):
+        elapsed = time.monotonic() - self._started_at
+        self.summary_label.setText(f"배포 중... {elapsed:.1f}초 (진행 {len(self._current_phase)}대)")
+
+    def _set_running(self, running: bool):
+        self.running = running
+        for widget in (self.deploy_button, self.close_button, self.add_button, self.apply_all_button,
+                       self.fetch_button, self.parallel_spin):
+            widget.setEnabled(not running)
+        for row in self._rows.values():
+            self.table.cellWidget(row, COL_JOB).setEnabled(not running)
+
+    def _log(self, message: str):
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        logging.info(f"[JobDeploy] {message}")
+        if self.log_callback is not None:
+            self.log_callback(f"[{timestamp}] {message}")
+
+    # --- 종료 ---
+
+    def reject(self):
+        # 배포 중에는 닫지 않음 (카메라가 오프라인 상태로 남지 않도록)
+        if self.running:
+            return
+        super().reject()
+
+    def done(self, result: int):
+        self.sessions.shutdown()
+        super().done(result)
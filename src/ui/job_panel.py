@@ -8,20 +8,30 @@ Cognex In-Sight 비전 시스템의 JOB(내부 프로그램) 실행을 위한
 from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, 
                            QGroupBox, QPushButton, QLineEdit, QLabel,
                            QDialog, QListWidget, QListWidgetItem, 
-                           QDialogButtonBox, QMessageBox)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer
+                           QDialogButtonBox, QMessageBox, QComboBox)
+from PyQt5.QtCore import pyqtSignal, QTimer
 from PyQt5.QtGui import QFont
 import logging
+import threading
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Optional, List
+from utils.config import ConfigManager
+from utils.job_catalog import JobCatalog, fetch_job_files, DEFAULT_CATALOG_TTL
+from utils.changeover import ChangeoverOptions, ChangeoverReport, append_report, run_changeover
+from utils.macro import MacroError, MacroLibrary, MacroResult, parse_param_overrides, run_macro
+from utils.telnet_manager import DEFAULT_BATCH_WINDOW
+from .job_deploy_dialog import JobDeployDialog
+from .macro_dialog import MacroEditorDialog
 
 
 class FileSelectionDialog(QDialog):
-    """파일 선택 다이얼로그"""
+    """파일 선택 다이얼로그 (입력한 글자로 목록을 바로 거름)"""
     
     def __init__(self, file_list: List[str], parent=None):
         super().__init__(parent)
         self.selected_file = None
+        self._keys: List[str] = []     # 항목별 소문자 이름 (필터용)
         self.setup_ui(file_list)
     
     def setup_ui(self, file_list: List[str]):
@@ -36,6 +46,12 @@ class FileSelectionDialog(QDialog):
         info_label.setStyleSheet("font-weight: bold; margin-bottom: 10px;")
         layout.addWidget(info_label)
         
+        # 검색 입력 (부분 일치, 대소문자 무시)
+        self.filter_edit = QLineEdit()
+        self.filter_edit.setPlaceholderText("파일명 검색")
+        self.filter_edit.setClearButtonEnabled(True)
+        layout.addWidget(self.filter_edit)
+        
         # 파일 리스트
         self.file_list_widget = QListWidget()
         self.file_list_widget.setStyleSheet("""
@@ -70,13 +86,15 @@ class FileSelectionDialog(QDialog):
             }
         """)
         
-        for file_name in file_list:
-            item = QListWidgetItem(file_name)
-            item.setFont(QFont("Arial", 10, QFont.Normal))
-            self.file_list_widget.addItem(item)
+        self.set_files(file_list)
         
         layout.addWidget(self.file_list_widget)
         
+        # 목록 상태 (캐시 나이, 갱신 중 표시)
+        self.status_label = QLabel("")
+        self.status_label.setStyleSheet("color: #7f8c8d; font-size: 10px;")
+        layout.addWidget(self.status_label)
+        
         # 버튼
         button_box = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
         button_box.accepted.connect(self.accept_selection)
@@ -90,11 +108,59 @@ class FileSelectionDialog(QDialog):
         
         # 선택 변경 시 폰트 업데이트
         self.file_list_widget.itemSelectionChanged.connect(self.update_selection_font)
+        
+        # 검색어 입력 시 필터링, Enter로 첫 번째 표시 항목 선택
+        self.filter_edit.textChanged.connect(self.filter_files)
+        self.filter_edit.returnPressed.connect(self._accept_first_visible)
+        self.filter_edit.setFocus()
+    
+    def set_files(self, file_list: List[str]):
+        """목록을 교체합니다. (백그라운드 갱신 결과 반영, 선택과 검색어 유지)"""
+        current = self.file_list_widget.currentItem()
+        selected = current.text() if current else None
+        self.file_list_widget.setUpdatesEnabled(False)
+        self.file_list_widget.clear()
+        font = QFont("Arial", 10, QFont.Normal)
+        for file_name in file_list:
+            item = QListWidgetItem(file_name)
+            item.setFont(font)
+            self.file_list_widget.addItem(item)
+            if file_name == selected:
+                self.file_list_widget.setCurrentItem(item)
+        self._keys = [file_name.lower() for file_name in file_list]
+        self.file_list_widget.setUpdatesEnabled(True)
+        self.filter_files(self.filter_edit.text())
+    
+    def set_status(self, text: str):
+        self.status_label.setText(text)
+    
+    def filter_files(self, text: str):
+        """검색어가 포함된 항목만 표시합니다."""
+        needle = text.strip().lower()
+        widget = self.file_list_widget
+        widget.setUpdatesEnabled(False)
+        for row, key in enumerate(self._keys):
+            hidden = bool(needle) and needle not in key
+            item = widget.item(row)
+            if item.isHidden() != hidden:
+                item.setHidden(hidden)
+        widget.setUpdatesEnabled(True)
+        current = widget.currentItem()
+        if current is None or current.isHidden():
+            for row in range(widget.count()):
+                if not widget.item(row).isHidden():
+                    widget.setCurrentRow(row)
+                    break
+    
+    def _accept_first_visible(self):
+        current = self.file_list_widget.currentItem()
+        if current is not None and not current.isHidden():
+            self.accept_selection()
     
     def accept_selection(self):
         """선택 확인"""
         current_item = self.file_list_widget.currentItem()
-        if current_item:
+        if current_item and not current_item.isHidden():
             self.selected_file = current_item.text()
             self.accept()
         else:
@@ -128,29 +194,43 @@ class JobPanel(QWidget):
     
     # 로그 전송을 위한 시그널
     log_message = pyqtSignal(str)
+    # JOB 전환 진행 단계 (작업자 스레드 -> GUI 스레드)
+    changeover_progress = pyqtSignal(str)
+    # 매크로 진행 (완료 명령 수, 전체 명령 수)
+    macro_progress = pyqtSignal(int, int)
     
     def __init__(self, telnet_manager=None, log_panel=None):
         super().__init__()
         self.telnet_manager = telnet_manager
+        self.telnet_worker = None      # 소켓 I/O를 수행하는 TelnetWorker
         self.log_panel = log_panel
         self.selected_job_file = None  # 선택된 JOB 파일명
         self.current_job_file = None   # 현재 적용 중인 JOB 파일명
         
-        # 타이머 설정 (5초 버튼 비활성화용)
-        self.job_file_timer = QTimer()
-        self.job_file_timer.timeout.connect(self.enable_job_file_button)
-        self.job_file_timer.setSingleShot(True)
+        config = ConfigManager()
+        # JOB 전환 절차 (실행 중에는 버튼 비활성화)
+        self.changeover_options = ChangeoverOptions.from_config(config)
+        self.changeover_running = False
+        self.last_changeover: Optional[ChangeoverReport] = None
+        self.changeover_progress.connect(self._on_changeover_progress)
+        
+        # 사용자 매크로 (컴파일된 계획을 보관, 실행 중에는 중지 이벤트 유지)
+        self.macro_library = MacroLibrary()
+        self._macro_cancel: Optional[threading.Event] = None
+        self.macro_progress.connect(self._on_macro_progress)
         
-        self.current_job_timer = QTimer()
-        self.current_job_timer.timeout.connect(self.enable_current_job_button)
-        self.current_job_timer.setSingleShot(True)
+        # 카메라별 JOB 파일 목록 캐시
+        ttl = config.get("job", "catalog_ttl", fallback=DEFAULT_CATALOG_TTL)
+        self.job_catalog = JobCatalog(float(ttl or DEFAULT_CATALOG_TTL))
+        self._catalog_refreshing = set()   # 조회 중인 카메라 키
+        self._file_dialog: Optional[FileSelectionDialog] = None
         
         # UI 설정
         self.setup_ui()
         
         # 로그 시그널 연결
         if self.log_panel:
-            self.log_message.connect(self.log_panel.add_log)
+            self.log_message.connect(self._forward_log)
     
     def setup_ui(self):
         """UI 컴포넌트를 초기화합니다."""
@@ -274,10 +354,38 @@ class JobPanel(QWidget):
             }
         """)
         
+        # 여러 카메라 동시 JOB 배포
+        self.deploy_button = QPushButton("다중 배포")
+        self.deploy_button.setFixedSize(90, 30)
+        
         slot2_layout.addWidget(self.execute_button_2)
         slot2_layout.addWidget(self.current_job_display)
+        slot2_layout.addWidget(self.deploy_button)
         slot2_layout.addStretch()
         
+        # 세 번째 슬롯 - 사용자 매크로
+        slot3_layout = QHBoxLayout()
+        slot3_layout.setSpacing(10)
+        
+        self.macro_run_button = QPushButton("매크로 실행")
+        self.macro_run_button.setFixedSize(120, 30)
+        self.macro_run_button.setStyleSheet(self.execute_button_2.styleSheet())
+        
+        self.macro_combo = QComboBox()
+        self.macro_combo.setFixedSize(150, 30)
+        self.macro_params_edit = QLineEdit()
+        self.macro_params_edit.setFixedSize(162, 30)
+        self.macro_params_edit.setPlaceholderText("파라미터 (예: count=100)")
+        self.macro_edit_button = QPushButton("편집")
+        self.macro_edit_button.setFixedSize(90, 30)
+        
+        slot3_layout.addWidget(self.macro_run_button)
+        slot3_layout.addWidget(self.macro_combo)
+        slot3_layout.addWidget(self.macro_params_edit)
+        slot3_layout.addWidget(self.macro_edit_button)
+        slot3_layout.addStretch()
+        self._reload_macros()
+        
         # 상태 표시 레이블
         self.status_label = QLabel("연결 상태를 확인하세요")
         self.status_label.setStyleSheet("""
@@ -292,6 +400,7 @@ class JobPanel(QWidget):
         # 레이아웃에 추가
         job_layout.addLayout(slot1_layout)
         job_layout.addLayout(slot2_layout)
+        job_layout.addLayout(slot3_layout)
         job_layout.addWidget(self.status_label)
         
         job_group.setLayout(job_layout)
@@ -302,193 +411,267 @@ class JobPanel(QWidget):
         # 이벤트 연결
         self.job_file_button.clicked.connect(self.select_job_file)
         self.execute_button_2.clicked.connect(self.get_current_job_file)
+        self.deploy_button.clicked.connect(self.open_deploy_dialog)
+        self.macro_run_button.clicked.connect(self.toggle_macro)
+        self.macro_params_edit.returnPressed.connect(self.toggle_macro)
+        self.macro_edit_button.clicked.connect(self.edit_macros)
         
         # 초기 상태 업데이트
-        from PyQt5.QtCore import QTimer
         QTimer.singleShot(0, self.update_ui_state)
         
         # 초기 현재 JOB 파일 조회
         QTimer.singleShot(100, self.get_current_job_file)
     
     def select_job_file(self):
-        """JOB 파일 선택 기능"""
+        """JOB 파일 선택 기능 (캐시된 목록을 바로 표시하고, 오래되었으면 백그라운드 갱신)"""
         # 연결 상태 확인
-        if not self.telnet_manager or not self.telnet_manager.connected:
+        if not self.telnet_worker or not self.telnet_manager.connected:
             self.add_log("[오류] Telnet 연결이 필요합니다")
             QMessageBox.warning(self, "연결 오류", "Telnet 연결이 필요합니다.")
             return
         
-        # 버튼 비활성화 (JOB 파일 지정 버튼과 적용 JOB 파일 버튼 모두)
-        self.disable_buttons_for_5_seconds()
+        key = self._catalog_key()
+        job_files = self.job_catalog.files(key)
+        if job_files is None:
+            # 첫 조회: 목록을 받은 뒤 다이얼로그 표시
+            self.job_file_button.setEnabled(False)
+            self._refresh_catalog(key, show_dialog=True)
+            return
         
+        # 파일 선택 다이얼로그 표시
+        dialog = FileSelectionDialog(job_files, self)
+        if self.job_catalog.is_fresh(key):
+            dialog.set_status(f"{self.job_catalog.age(key):.0f}초 전 조회 (JOB 파일 {len(job_files)}개)")
+        else:
+            dialog.set_status("목록 갱신 중...")
+            self._refresh_catalog(key)
+        self._file_dialog = dialog
         try:
-            # 파일 목록 요청
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            self.add_log(f"[{timestamp}] TX: Get FileList")
-            
-            response = self.telnet_manager.send_command("Get FileList", wait_time=1.0)
-            
-            if not response:
-                self.add_log(f"[{timestamp}] RX: [응답 없음]")
-                QMessageBox.warning(self, "통신 오류", "파일 목록을 가져올 수 없습니다.")
-                return
-            
-            # 응답 파싱
-            response_clean = response.replace('\r', '').strip()
-            lines = [line.strip() for line in response_clean.split('\n') if line.strip()]
-            self.add_log(f"[{timestamp}] RX: {response.strip()}")
-            self.add_log(f"[디버그] 파싱된 라인 수: {len(lines)}")
-            
-            if not lines:
-                QMessageBox.warning(self, "응답 오류", "잘못된 응답 형식입니다.")
-                return
-            
-            # 첫 번째 줄: 성공/실패 여부
-            try:
-                result_code = int(lines[0].strip())
-                if result_code != 1:
-                    self.add_log(f"[오류] 파일 목록 가져오기 실패: 코드 {result_code}")
-                    QMessageBox.warning(self, "실행 오류", f"파일 목록 가져오기에 실패했습니다. (코드: {result_code})")
-                    return
-            except (ValueError, IndexError):
-                QMessageBox.warning(self, "응답 오류", "응답 형식이 올바르지 않습니다.")
-                return
-            
-            # 두 번째 줄: 파일 개수
-            try:
-                if len(lines) < 2:
-                    QMessageBox.warning(self, "응답 오류", "파일 개수 정보가 없습니다.")
-                    return
-                file_count = int(lines[1].strip())
-            except ValueError:
-                QMessageBox.warning(self, "응답 오류", "파일 개수를 읽을 수 없습니다.")
-                return
-            
-            # 파일 목록 추출 (.job, .jobx 파일만)
-            job_files = []
-            self.add_log(f"[디버그] 파일 개수: {file_count}, 전체 라인 수: {len(lines)}")
-            
-            for i in range(2, min(len(lines), 2 + file_count)):
-                filename = lines[i].strip()
-                self.add_log(f"[디버그] 파일 {i-1}: '{filename}' (길이: {len(filename)})")
-                
-                if filename.lower().endswith('.job') or filename.lower().endswith('.jobx'):
-                    job_files.append(filename)
-                    self.add_log(f"[디버그] JOB 파일 추가: '{filename}'")
-                else:
-                    self.add_log(f"[디버그] JOB 파일 아님: '{filename}' (확장자: '{filename.lower()[-4:] if len(filename) >= 4 else 'N/A'}')")
-            
-            self.add_log(f"[디버그] 최종 JOB 파일 목록: {job_files}")
-            
-            if not job_files:
-                QMessageBox.information(self, "파일 없음", "JOB 파일(.job, .jobx)이 없습니다.")
-                return
-            
-            # 파일 선택 다이얼로그 표시
-            dialog = FileSelectionDialog(job_files, self)
             if dialog.exec_() == QDialog.Accepted and dialog.selected_file:
                 self.load_job_file(dialog.selected_file)
-                
+        finally:
+            self._file_dialog = None
+    
+    def _catalog_key(self) -> str:
+        return f"{self.telnet_manager.host}:{self.telnet_manager.port}"
+    
+    def _refresh_catalog(self, key: str, show_dialog: bool = False):
+        """JOB 파일 목록을 작업자 스레드에서 다시 조회합니다. (같은 카메라 중복 조회 방지)"""
+        if key in self._catalog_refreshing:
+            return
+        self._catalog_refreshing.add(key)
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self.add_log(f"[{timestamp}] TX: Get FileList")
+        self.telnet_worker.submit(fetch_job_files, self.telnet_manager,
+                                  callback=lambda future: self._on_catalog_fetched(key, show_dialog, future))
+    
+    def _prefetch_catalog(self):
+        """로그인된 연결에서 목록이 없거나 오래되었으면 미리 조회합니다."""
+        if (self.telnet_worker and self.telnet_manager.connected
+                and getattr(self.telnet_manager, 'logged_in', False)):
+            key = self._catalog_key()
+            if not self.job_catalog.is_fresh(key):
+                self._refresh_catalog(key)
+    
+    def _on_catalog_fetched(self, key: str, show_dialog: bool, future: Future):
+        """Get FileList 응답 처리 (GUI 스레드)"""
+        self._catalog_refreshing.discard(key)
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        try:
+            job_files = future.result()
         except Exception as e:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            error_msg = f"[{timestamp}] [오류] 파일 목록 가져오기 실패: {str(e)}"
-            self.add_log(error_msg)
-            QMessageBox.critical(self, "오류", f"파일 목록 가져오기 중 오류가 발생했습니다:\n{str(e)}")
-            logging.error(f"JobPanel select_job_file error: {e}")
+            self.add_log(f"[{timestamp}] [오류] 파일 목록 가져오기 실패: {e}")
+            if self._file_dialog is not None:
+                self._file_dialog.set_status(f"목록 갱신 실패: {e}")
+            if show_dialog:
+                self.update_ui_state()
+                QMessageBox.warning(self, "통신 오류", f"파일 목록을 가져올 수 없습니다.\n{e}")
+            return
+        
+        changed = self.job_catalog.store(key, job_files)
+        self.add_log(f"[{timestamp}] RX: JOB 파일 {len(job_files)}개{' (변경됨)' if changed else ''}")
+        if self._file_dialog is not None and key == self._catalog_key():
+            if changed:
+                self._file_dialog.set_files(job_files)
+            self._file_dialog.set_status(f"방금 조회 (JOB 파일 {len(job_files)}개)")
+        if show_dialog:
+            self.update_ui_state()
+            if not job_files:
+                QMessageBox.information(self, "파일 없음", "JOB 파일(.job, .jobx)이 없습니다.")
+                return
+            self.select_job_file()
     
     def load_job_file(self, filename: str):
-        """선택된 JOB 파일 로드"""
+        """
+        선택된 JOB 파일로 전환합니다.
+        (오프라인 -> LF -> GF로 확인 -> 온라인, 완료되는 즉시 버튼 활성화)
+        """
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self.add_log(f"[{timestamp}] JOB 전환 시작: {filename}")
+        self._set_changeover_running(True)
+        self.telnet_worker.submit(run_changeover, self.telnet_manager, filename, self.changeover_options,
+                                  self.changeover_progress.emit,
+                                  callback=lambda future: self._on_changeover_done(filename, future))
+    
+    def _on_changeover_progress(self, phase: str):
+        """전환 단계 표시 (GUI 스레드)"""
+        self.status_label.setText(f"JOB 전환 중: {phase}...")
+    
+    def _on_changeover_done(self, filename: str, future: Future):
+        """JOB 전환 완료 처리 (GUI 스레드)"""
+        self._set_changeover_running(False)
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
         try:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            command = f"LF{filename}"
-            self.add_log(f"[{timestamp}] TX: {command}")
-            
-            response = self.telnet_manager.send_command(command, wait_time=1.0)
-            
-            if not response:
-                self.add_log(f"[{timestamp}] RX: [응답 없음]")
-                QMessageBox.warning(self, "통신 오류", "파일 로드 응답을 받을 수 없습니다.")
-                return
-            
-            # 응답 파싱
-            self.add_log(f"[{timestamp}] RX: {response.strip()}")
-            
-            try:
-                result_code = int(response.strip().split('\n')[0])
-                if result_code == 1:
-                    # 성공
-                    self.selected_job_file = filename
-                    self.job_file_display.setText(filename)
-                    
-                    # 파일 지정 성공 시 자동으로 적용 JOB 파일 텍스트박스 업데이트
-                    self.current_job_file = filename
-                    self.current_job_display.setText(filename)
-                    
-                    self.add_log(f"[성공] JOB 파일 로드 완료: {filename}")
-                    QMessageBox.information(self, "성공", f"JOB 파일이 성공적으로 로드되었습니다:\n{filename}")
-                else:
-                    # 실패
-                    self.add_log(f"[오류] JOB 파일 로드 실패: 코드 {result_code}")
-                    QMessageBox.warning(self, "로드 실패", f"JOB 파일 로드에 실패했습니다. (코드: {result_code})")
-            except (ValueError, IndexError):
-                QMessageBox.warning(self, "응답 오류", "파일 로드 응답 형식이 올바르지 않습니다.")
-                
+            report = future.result()
         except Exception as e:
-            timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            error_msg = f"[{timestamp}] [오류] JOB 파일 로드 실패: {str(e)}"
-            self.add_log(error_msg)
-            QMessageBox.critical(self, "오류", f"JOB 파일 로드 중 오류가 발생했습니다:\n{str(e)}")
+            self.add_log(f"[{timestamp}] [오류] JOB 전환 실패: {str(e)}")
+            QMessageBox.critical(self, "오류", f"JOB 전환 중 오류가 발생했습니다:\n{str(e)}")
             logging.error(f"JobPanel load_job_file error: {e}")
-
-    def disable_buttons_for_5_seconds(self):
-        """JOB 파일 지정 버튼과 적용 JOB 파일 버튼을 5초간 비활성화"""
-        # 버튼 비활성화
-        self.job_file_button.setEnabled(False)
-        self.execute_button_2.setEnabled(False)
-        
-        # 5초 후 활성화 타이머 시작
-        self.job_file_timer.start(5000)  # 5초
-        self.current_job_timer.start(5000)  # 5초
-        
-        self.add_log("[정보] 버튼이 5초간 비활성화됩니다")
-    
-    def enable_job_file_button(self):
-        """JOB 파일 지정 버튼 활성화"""
-        if self.telnet_manager and self.telnet_manager.connected:
-            self.job_file_button.setEnabled(True)
-            self.add_log("[정보] JOB 파일 지정 버튼이 활성화되었습니다")
-    
-    def enable_current_job_button(self):
-        """적용 JOB 파일 버튼 활성화"""
-        if self.telnet_manager and self.telnet_manager.connected:
-            self.execute_button_2.setEnabled(True)
-            self.add_log("[정보] 적용 JOB 파일 버튼이 활성화되었습니다")
+            return
+        
+        self.last_changeover = report
+        append_report(report)
+        # 파일 목록 캐시는 다음 조회 때 갱신
+        self.job_catalog.invalidate(self._catalog_key())
+        self.add_log(f"[{timestamp}] JOB 전환 {'완료' if report.ok else '실패'}: {report.summary()}")
+        if report.ok:
+            self.selected_job_file = filename
+            self.job_file_display.setText(filename)
+            self.current_job_file = filename
+            self.current_job_display.setText(filename)
+            self.add_log(f"[성공] JOB 파일 로드 완료: {filename}")
+            QMessageBox.information(self, "성공", f"JOB 파일이 성공적으로 로드되었습니다:\n{filename}\n"
+                                                  f"(전환 시간 {report.total_ms / 1000.0:.2f}초)")
+        else:
+            self.add_log(f"[오류] {report.error}")
+            QMessageBox.warning(self, "로드 실패", f"JOB 파일 로드에 실패했습니다.\n{report.error}")
+    
+    def open_deploy_dialog(self):
+        """[cameras] 설정의 카메라(및 현재 연결된 카메라)에 JOB을 동시에 배포합니다."""
+        extra_hosts = []
+        if self.telnet_manager and getattr(self.telnet_manager, 'connected', False):
+            extra_hosts.append(self._catalog_key())
+        dialog = JobDeployDialog(self.job_catalog, extra_hosts,
+                                 default_job=self.selected_job_file or "",
+                                 log_callback=self.add_log, parent=self)
+        dialog.exec_()
+        if dialog.reports and self.telnet_manager and getattr(self.telnet_manager, 'connected', False):
+            # 현재 연결된 카메라도 바뀌었을 수 있으므로 다시 조회
+            QTimer.singleShot(0, self.get_current_job_file)
+    
+    def _reload_macros(self, current: str = ""):
+        current = current or self.macro_combo.currentText()
+        self.macro_combo.clear()
+        self.macro_combo.addItems(self.macro_library.names())
+        index = self.macro_combo.findText(current)
+        if index >= 0:
+            self.macro_combo.setCurrentIndex(index)
+    
+    def edit_macros(self):
+        """매크로 편집 다이얼로그를 엽니다."""
+        dialog = MacroEditorDialog(self.macro_library, self.macro_combo.currentText(), self)
+        dialog.exec_()
+        self._reload_macros(dialog.selected_name())
+    
+    def toggle_macro(self):
+        """선택한 매크로를 실행합니다. (실행 중이면 중지 요청)"""
+        if self._macro_cancel is not None:
+            self._macro_cancel.set()
+            self.macro_run_button.setEnabled(False)
+            return
+        if not self.telnet_worker or not self.telnet_manager.connected:
+            self.add_log("[오류] Telnet 연결이 필요합니다")
+            QMessageBox.warning(self, "연결 오류", "Telnet 연결이 필요합니다.")
+            return
+        name = self.macro_combo.currentText()
+        plan = self.macro_library.plan(name)
+        if plan is None:
+            QMessageBox.warning(self, "매크로", "실행할 매크로를 선택하세요. (문법 오류가 있으면 편집에서 수정)")
+            return
+        try:
+            overrides = parse_param_overrides(self.macro_params_edit.text())
+            total = plan.count(plan.resolve(overrides))
+        except MacroError as e:
+            QMessageBox.warning(self, "매크로", str(e))
+            return
+        
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self.add_log(f"[{timestamp}] 매크로 시작: {name} (명령 {total}개)")
+        self._macro_cancel = threading.Event()
+        self.macro_run_button.setText("중지")
+        self.update_ui_state()
+        self.telnet_worker.submit(run_macro, self.telnet_manager, plan, overrides, DEFAULT_BATCH_WINDOW,
+                                  progress=self.macro_progress.emit, cancel=self._macro_cancel,
+                                  callback=self._on_macro_done)
+    
+    def _on_macro_progress(self, done: int, total: int):
+        """매크로 진행 표시 (GUI 스레드)"""
+        if self._macro_cancel is not None and not self.changeover_running:
+            self.status_label.setText(f"매크로 실행 중: {done}/{total}")
+    
+    def _on_macro_done(self, future: Future):
+        """매크로 완료 처리 (GUI 스레드)"""
+        self._macro_cancel = None
+        self.macro_run_button.setText("매크로 실행")
+        self.update_ui_state()
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        try:
+            result: MacroResult = future.result()
+        except Exception as e:
+            self.add_log(f"[{timestamp}] [오류] 매크로 실행 실패: {e}")
+            return
+        for failure in result.failures[:5]:
+            self.add_log(f"[불일치] {failure.line}번째 줄 {failure.command}: {failure.error}")
+        if len(result.failures) > 5:
+            self.add_log(f"[불일치] ... 외 {len(result.failures) - 5}건")
+        if result.steps:
+            last = result.steps[-1]
+            self.add_log(f"[{timestamp}] 마지막 응답: {last.command} -> {last.reply.value or last.reply.status}")
+        self.add_log(f"[{timestamp}] 매크로 {result.summary()}")
+    
+    def _set_changeover_running(self, running: bool):
+        """전환 중에는 JOB 파일 지정/적용 JOB 파일 버튼을 비활성화합니다."""
+        self.changeover_running = running
+        self.update_ui_state()
 
     def set_telnet_manager(self, telnet_manager):
         """TelnetManager 인스턴스를 설정합니다."""
         self.telnet_manager = telnet_manager
         self.update_ui_state()
     
+    def set_telnet_worker(self, telnet_worker):
+        """TelnetWorker 인스턴스와 그 TelnetManager를 설정합니다."""
+        self.telnet_worker = telnet_worker
+        self.set_telnet_manager(telnet_worker.telnet if telnet_worker else None)
+    
     def set_log_panel(self, log_panel):
         """LogPanel 인스턴스를 설정하고 시그널을 연결합니다."""
         self.log_panel = log_panel
         if self.log_panel:
-            self.log_message.connect(self.log_panel.add_log)
+            self.log_message.connect(self._forward_log)
     
     def update_ui_state(self):
         """Telnet 연결 상태에 따라 UI 상태를 업데이트합니다."""
         try:
             is_connected = self.telnet_manager and getattr(self.telnet_manager, 'connected', False)
             
-            # 버튼 활성화/비활성화 (타이머가 실행 중이 아닐 때만)
+            # 버튼 활성화/비활성화 (JOB 전환 중에는 비활성화)
+            enabled = bool(is_connected) and not self.changeover_running
             if hasattr(self, 'job_file_button') and self.job_file_button is not None:
-                if not self.job_file_timer.isActive():
-                    self.job_file_button.setEnabled(bool(is_connected))
+                self.job_file_button.setEnabled(enabled)
             if hasattr(self, 'execute_button_2') and self.execute_button_2 is not None:
-                if not self.current_job_timer.isActive():
-                    self.execute_button_2.setEnabled(bool(is_connected))
-        
-            # 상태 레이블 업데이트
+                self.execute_button_2.setEnabled(enabled)
+            if hasattr(self, 'deploy_button') and self.deploy_button is not None:
+                self.deploy_button.setEnabled(not self.changeover_running)
+            # 매크로 실행 중에는 중지 버튼으로 사용
+            if hasattr(self, 'macro_run_button') and self.macro_run_button is not None:
+                macro_running = self._macro_cancel is not None
+                self.macro_run_button.setEnabled(macro_running or enabled)
+                self.macro_edit_button.setEnabled(not macro_running)
+        
+            # 상태 레이블 업데이트 (전환 중에는 진행 단계 표시 유지)
+            if self.changeover_running:
+                return
             if hasattr(self, 'status_label') and self.status_label is not None:
                 if is_connected:
                     host = getattr(self.telnet_manager, 'host', 'Unknown')
@@ -518,15 +701,20 @@ class JobPanel(QWidget):
     def get_current_job_file(self):
         """현재 적용 중인 JOB 파일을 조회합니다."""
         # 연결 상태 확인
-        if not self.telnet_manager or not self.telnet_manager.connected:
+        if not self.telnet_worker or not self.telnet_manager.connected:
             self.add_log("[오류] Telnet 연결이 필요합니다")
             return
         
+        timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
+        self.add_log(f"[{timestamp}] TX: GF")
+        self.telnet_worker.request("send_command", "GF", wait_time=1.0,
+                                   callback=self._on_current_job_received)
+    
+    def _on_current_job_received(self, future: Future):
+        """GF 응답 처리 (GUI 스레드)"""
         try:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
-            self.add_log(f"[{timestamp}] TX: GF")
-            
-            response = self.telnet_manager.send_command("GF", wait_time=1.0)
+            response = future.result()
             
             if not response:
                 self.add_log(f"[{timestamp}] RX: [응답 없음]")
@@ -557,6 +745,8 @@ class JobPanel(QWidget):
                 self.current_job_file = current_filename
                 self.current_job_display.setText(current_filename)
                 self.add_log(f"[정보] 현재 적용 중인 JOB 파일: {current_filename}")
+                # 응답이 왔으면 로그인된 세션이므로 JOB 파일 목록을 미리 조회
+                self._prefetch_catalog()
             else:
                 self.add_log("[오류] 파일명 정보가 없습니다")
                 self.current_job_display.setText("파일명 없음")
@@ -586,6 +776,11 @@ class JobPanel(QWidget):
         except Exception as e:
             logging.error(f"JobPanel add_log error: {e}")
     
+    def _forward_log(self, message: str):
+        """로그 메시지를 출처(JOB)와 함께 LogPanel에 전달합니다."""
+        if self.log_panel:
+            self.log_panel.add_log(message, source="JOB")
+    
     def get_command_history(self) -> dict:
         """현재 상태 정보를 반환합니다."""
         return {
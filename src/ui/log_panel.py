@@ -1,40 +1,58 @@
-from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QTextEdit, QComboBox
-from PyQt5.QtCore import QDateTime
+from PyQt5.QtWidgets import QWidget, QLabel, QVBoxLayout, QHBoxLayout, QComboBox, QLineEdit
+from PyQt5.QtCore import QTimer
+from typing import Optional
+from .log_view import LogListView, DEFAULT_MAX_LINES, LEVEL_ALL, make_record
+
+# 검색어 입력 후 필터를 적용하기까지의 지연(ms)
+SEARCH_DEBOUNCE_MS = 150
 
 class LogPanel(QWidget):
-    def __init__(self):
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES):
         super().__init__()
         main_layout = QVBoxLayout()
         main_layout.addWidget(QLabel("로그 출력"))
-        self.log_edit = QTextEdit()
-        self.log_edit.setReadOnly(True)
+        # 최대 max_lines 줄만 보관하는 링 버퍼 기반 로그 뷰
+        self.log_edit = LogListView(max_lines)
         main_layout.addWidget(self.log_edit)
         main_layout.addWidget(QLabel("로그 레벨/필터"))
+        filter_layout = QHBoxLayout()
         self.level_combo = QComboBox()
-        self.level_combo.addItems(["ALL", "INFO", "WARNING", "ERROR"])
-        main_layout.addWidget(self.level_combo)
+        self.level_combo.addItems([LEVEL_ALL, "INFO", "WARNING", "ERROR"])
+        self.search_edit = QLineEdit()
+        self.search_edit.setPlaceholderText("검색 (명령어, 내용)")
+        self.search_edit.setClearButtonEnabled(True)
+        filter_layout.addWidget(self.level_combo)
+        filter_layout.addWidget(self.search_edit, 1)
+        main_layout.addLayout(filter_layout)
         self.setLayout(main_layout)
+
+        # 검색어는 입력이 잠시 멈춘 뒤 적용
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.timeout.connect(self.apply_filter)
+        self.level_combo.currentTextChanged.connect(self.apply_filter)
+        self.search_edit.textChanged.connect(lambda: self._search_timer.start(SEARCH_DEBOUNCE_MS))
     
-    def add_log(self, message: str):
+    def add_log(self, message: str, level: Optional[str] = None, source: str = "", direction: str = ""):
         """
-        로그 메시지를 추가합니다.
+        로그 메시지를 구조화된 레코드로 추가합니다.
         
         Args:
-            message (str): 추가할 로그 메시지
+            message (str): 추가할 로그 메시지 ([시각], TX:/RX:, [오류] 등은 자동 해석)
+            level (Optional[str]): 로그 레벨 (None이면 메시지 태그로 판단)
+            source (str): 출처 패널 이름
+            direction (str): 통신 방향 (TX/RX)
         """
-        # 타임스탬프가 이미 포함되어 있지 않은 경우에만 추가
-        if not message.startswith('['):
-            timestamp = QDateTime.currentDateTime().toString("HH:mm:ss.zzz")
-            formatted_message = f"[{timestamp}] {message}"
-        else:
-            formatted_message = message
-        
-        # 로그 텍스트에 추가
-        self.log_edit.append(formatted_message)
-        
-        # 자동 스크롤 (최신 로그가 보이도록)
-        scrollbar = self.log_edit.verticalScrollBar()
-        scrollbar.setValue(scrollbar.maximum())
+        # 로그 뷰에 추가 (프레임 단위로 모아서 반영, 맨 아래를 보고 있을 때만 자동 스크롤)
+        self.log_edit.append(make_record(message, level, source, direction))
+    
+    def apply_filter(self):
+        """레벨 필터와 검색어를 로그 뷰에 적용합니다."""
+        self.log_edit.log_model.set_filter(self.level_combo.currentText(), self.search_edit.text())
+    
+    def set_max_lines(self, max_lines: int):
+        """최대 보관 줄 수를 설정합니다."""
+        self.log_edit.log_model.set_max_lines(max_lines)
     
     def clear_log(self):
         """로그를 모두 지웁니다."""
@@ -42,4 +60,4 @@ class LogPanel(QWidget):
     
     def get_log_text(self) -> str:
         """현재 로그 텍스트를 반환합니다."""
-        return self.log_edit.toPlainText() 
\ No newline at end of file
+        return self.log_edit.toPlainText()
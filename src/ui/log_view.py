@@ -0,0 +1,216 @@
+"""
+로그 표시 모듈
+
+로그를 구조화된 레코드(시각, 레벨, 출처, TX/RX, 내용)로 고정 크기
+링 버퍼(utils.log_store)에 보관하고 QListView로 보이는 줄만 그립니다. 레벨별
+색인을 두어 레벨 필터 전환과 전문 검색이 대량의 로그에서도 즉시 동작합니다.
+추가된 줄은 한 프레임 동안 모았다가 한 번에 반영하며, 사용자가 맨
+아래를 보고 있을 때만 자동으로 스크롤합니다.
+"""
+
+from typing import List, Optional
+
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt, QTimer
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import QAbstractItemView, QListView
+
+from utils.log_store import LEVEL_ALL, LEVELS, LogRecord, LogStore, make_record
+
+# 기본 최대 보관 줄 수
+DEFAULT_MAX_LINES = 10000
+# 추가된 줄을 모아서 반영하는 주기(ms, 약 60fps)
+FLUSH_INTERVAL_MS = 16
+
+_LEVEL_COLORS = {
+    "DEBUG": QColor("#95a5a6"),
+    "WARNING": QColor("#e67e22"),
+    "ERROR": QColor("#e74c3c"),
+}
+
+
+class LogListModel(QAbstractListModel):
+    """
+    링 버퍼 기반 로그 모델 (프레임 단위 일괄 추가, 레벨 필터/검색)
+
+    필터가 없으면 버퍼를 그대로 표시하고, 필터가 있으면
+    조건에 맞는 일련번호 목록만 표시합니다.
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.store = LogStore(max_lines)
+        self._pending: List[LogRecord] = []
+        self._min_level = LEVEL_ALL
+        self._search = ""
+        self._view: Optional[List[int]] = None  # 필터 적용 시 표시할 일련번호
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self.flush)
+
+    @property
+    def max_lines(self) -> int:
+        return self.store.capacity
+
+    def set_max_lines(self, max_lines: int) -> None:
+        """최대 보관 줄 수를 바꿉니다. (최근 줄부터 유지)"""
+        self.flush()
+        records = list(self.store.records)[-max_lines:]
+        self.beginResetModel()
+        self.store = LogStore(max_lines)
+        self.store.extend(records)
+        self._view = self._build_view()
+        self.endResetModel()
+
+    # --- QAbstractListModel 인터페이스 ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self.store) if self._view is None else len(self._view)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        record = self.record(index.row())
+        if role == Qt.DisplayRole:
+            return record.display()
+        if role == Qt.ForegroundRole:
+            return _LEVEL_COLORS.get(record.level)
+        return None
+
+    def record(self, row: int) -> LogRecord:
+        """표시 중인 row번째 레코드를 반환합니다."""
+        if self._view is None:
+            return self.store.records[row]
+        return self.store.get(self._view[row])
+
+    # --- 추가 ---
+
+    def append(self, record) -> None:
+        """로그 레코드(또는 문자열)를 추가합니다. (다음 프레임에 한 번에 반영)"""
+        if not isinstance(record, LogRecord):
+            record = make_record(str(record))
+        self._pending.append(record)
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(FLUSH_INTERVAL_MS)
+
+    def flush(self) -> None:
+        """대기 중인 레코드를 모델에 반영합니다."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        if len(pending) > self.store.capacity:
+            pending = pending[-self.store.capacity:]
+        dropped = self.store.records.overflow(len(pending))
+        if self._view is None:
+            if dropped:
+                # 용량을 넘는 만큼 가장 오래된 줄을 먼저 제거
+                self.beginRemoveRows(QModelIndex(), 0, dropped - 1)
+                self.store.drop_front(dropped)
+                self.endRemoveRows()
+            start = len(self.store)
+            self.beginInsertRows(QModelIndex(), start, start + len(pending) - 1)
+            self.store.extend(pending)
+            self.endInsertRows()
+            return
+
+        # 필터 적용 중: 밀려난 레코드의 행을 제거하고 조건에 맞는 새 레코드만 추가
+        if dropped:
+            self.store.drop_front(dropped)
+            first = self.store.first_seq
+            stale = 0
+            while stale < len(self._view) and self._view[stale] < first:
+                stale += 1
+            if stale:
+                self.beginRemoveRows(QModelIndex(), 0, stale - 1)
+                del self._view[:stale]
+                self.endRemoveRows()
+        self.store.extend(pending)
+        matched = [record.seq for record in pending if self._matches(record)]
+        if matched:
+            start = len(self._view)
+            self.beginInsertRows(QModelIndex(), start, start + len(matched) - 1)
+            self._view.extend(matched)
+            self.endInsertRows()
+
+    # --- 필터/검색 ---
+
+    def set_filter(self, min_level: str = LEVEL_ALL, search: str = "") -> None:
+        """
+        레벨 필터와 검색어를 적용합니다.
+
+        Args:
+            min_level (str): 표시할 최소 레벨 (ALL이면 전체)
+            search (str): 포함되어야 할 문자열 (대소문자 무시)
+        """
+        self.flush()
+        self._min_level = min_level
+        self._search = search.strip().lower()
+        self.beginResetModel()
+        self._view = self._build_view()
+        self.endResetModel()
+
+    def _build_view(self) -> Optional[List[int]]:
+        if self._min_level == LEVEL_ALL and not self._search:
+            return None
+        if not self._search:
+            return list(self.store.seqs(self._min_level))
+        return self.store.search(self._search, self._min_level)
+
+    def _matches(self, record: LogRecord) -> bool:
+        if self._min_level != LEVEL_ALL and self._min_level in LEVELS:
+            if record.level not in LEVELS or LEVELS.index(record.level) < LEVELS.index(self._min_level):
+                return False
+        return not self._search or self._search in record.search_key
+
+    def lines(self) -> List[str]:
+        """표시 중인 모든 줄을 반환합니다."""
+        self.flush()
+        return [self.record(row).display() for row in range(self.rowCount())]
+
+    def clear(self) -> None:
+        """모든 줄을 지웁니다."""
+        self._pending = []
+        self.beginResetModel()
+        self.store.clear()
+        if self._view is not None:
+            self._view = []
+        self.endResetModel()
+
+
+class LogListView(QListView):
+    """
+    보이는 줄만 그리는 로그 뷰 (맨 아래를 보고 있을 때만 자동 스크롤)
+    """
+
+    def __init__(self, max_lines: int = DEFAULT_MAX_LINES, parent=None):
+        super().__init__(parent)
+        self.log_model = LogListModel(max_lines, self)
+        self.setModel(self.log_model)
+        self.setUniformItemSizes(True)
+        self.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.setSelectionMode(QAbstractItemView.ExtendedSelection)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self._follow = True
+        self.log_model.rowsAboutToBeInserted.connect(self._remember_follow)
+        self.log_model.rowsInserted.connect(self._scroll_if_following)
+
+    def append(self, record) -> None:
+        """로그 레코드(또는 문자열)를 추가합니다."""
+        self.log_model.append(record)
+
+    def clear(self) -> None:
+        """로그를 모두 지웁니다."""
+        self.log_model.clear()
+
+    def toPlainText(self) -> str:
+        """표시 중인 로그를 줄바꿈으로 이은 문자열로 반환합니다."""
+        return "\n".join(self.log_model.lines())
+
+    def _remember_follow(self, *args) -> None:
+        scrollbar = self.verticalScrollBar()
+        self._follow = scrollbar.value() >= scrollbar.maximum() - 2
+
+    def _scroll_if_following(self, *args) -> None:
+        if self._follow:
+            self.scrollToBottom()
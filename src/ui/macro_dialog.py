@@ -0,0 +1,148 @@
+"""
+매크로 편집 다이얼로그 모듈
+
+매크로 목록에서 선택하여 원문을 편집하고, 입력할 때마다 컴파일하여
+문법 오류(줄 번호)나 펼친 명령 수를 바로 보여 줍니다.
+"""
+
+from PyQt5.QtWidgets import (
+    QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit, QListWidget,
+    QPlainTextEdit, QMessageBox
+)
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+
+from utils.macro import MacroError, MacroLibrary, compile_macro
+
+EXAMPLE_MACRO = """# 트리거 후 결과 읽기
+param count = 10
+param cell = A003
+repeat {count}
+    SW8
+    GV{cell} => any
+end
+"""
+
+
+class MacroEditorDialog(QDialog):
+    """
+    매크로 작성/수정/삭제
+    """
+
+    def __init__(self, library: MacroLibrary, current: str = "", parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("매크로 편집")
+        self.resize(720, 460)
+        self.library = library
+        self.setup_ui()
+        self._reload_names(current)
+        if not library.names():
+            self.source_edit.setPlainText(EXAMPLE_MACRO)
+
+    def setup_ui(self):
+        layout = QHBoxLayout(self)
+
+        left = QVBoxLayout()
+        self.name_list = QListWidget()
+        self.new_button = QPushButton("새 매크로")
+        left.addWidget(self.name_list)
+        left.addWidget(self.new_button)
+        layout.addLayout(left, 1)
+
+        right = QVBoxLayout()
+        name_row = QHBoxLayout()
+        name_row.addWidget(QLabel("이름"))
+        self.name_edit = QLineEdit()
+        name_row.addWidget(self.name_edit)
+        right.addLayout(name_row)
+
+        self.source_edit = QPlainTextEdit()
+        self.source_edit.setFont(QFont("Consolas", 10))
+        self.source_edit.setPlaceholderText(EXAMPLE_MACRO)
+        self.source_edit.setLineWrapMode(QPlainTextEdit.NoWrap)
+        right.addWidget(self.source_edit, 1)
+
+        self.status_label = QLabel()
+        self.status_label.setWordWrap(True)
+        right.addWidget(self.status_label)
+
+        buttons = QHBoxLayout()
+        self.delete_button = QPushButton("삭제")
+        self.save_button = QPushButton("저장")
+        self.close_button = QPushButton("닫기")
+        buttons.addWidget(self.delete_button)
+        buttons.addStretch()
+        buttons.addWidget(self.save_button)
+        buttons.addWidget(self.close_button)
+        right.addLayout(buttons)
+        layout.addLayout(right, 3)
+
+        self.name_list.currentTextChanged.connect(self._on_name_selected)
+        self.new_button.clicked.connect(self._on_new)
+        self.source_edit.textChanged.connect(self._validate)
+        self.save_button.clicked.connect(self._on_save)
+        self.delete_button.clicked.connect(self._on_delete)
+        self.close_button.clicked.connect(self.accept)
+
+    def _reload_names(self, current: str = ""):
+        self.name_list.blockSignals(True)
+        self.name_list.clear()
+        self.name_list.addItems(self.library.names())
+        self.name_list.blockSignals(False)
+        matches = self.name_list.findItems(current, Qt.MatchExactly) if current else []
+        if matches:
+            self.name_list.setCurrentItem(matches[0])
+        elif self.name_list.count():
+            self.name_list.setCurrentRow(0)
+
+    def _on_name_selected(self, name: str):
+        if not name:
+            return
+        self.name_edit.setText(name)
+        self.source_edit.setPlainText(self.library.source(name))
+
+    def _on_new(self):
+        self.name_list.clearSelection()
+        self.name_edit.clear()
+        self.source_edit.setPlainText(EXAMPLE_MACRO)
+        self.name_edit.setFocus()
+
+    def _validate(self) -> bool:
+        """원문을 컴파일하여 결과를 표시합니다."""
+        try:
+            plan = compile_macro(self.name_edit.text().strip(), self.source_edit.toPlainText())
+            count = plan.count(plan.resolve())
+        except MacroError as e:
+            self.status_label.setText(f"오류: {e}")
+            self.status_label.setStyleSheet("color: #e74c3c;")
+            return False
+        params = ", ".join(f"{name}={value}" for name, value in plan.params.items())
+        self.status_label.setText(f"명령 {count}개 (기본값 기준)" + (f" | 파라미터: {params}" if params else ""))
+        self.status_label.setStyleSheet("color: #27ae60;")
+        return True
+
+    def _on_save(self):
+        name = self.name_edit.text().strip()
+        if not name:
+            QMessageBox.warning(self, "매크로", "이름을 입력하세요.")
+            return
+        try:
+            self.library.put(name, self.source_edit.toPlainText())
+        except MacroError as e:
+            QMessageBox.warning(self, "매크로", f"저장할 수 없습니다.\n{e}")
+            return
+        self._reload_names(name)
+
+    def _on_delete(self):
+        name = self.name_edit.text().strip()
+        if name not in self.library.names():
+            return
+        if QMessageBox.question(self, "매크로", f"'{name}' 매크로를 삭제할까요?") != QMessageBox.Yes:
+            return
+        self.library.remove(name)
+        self._reload_names()
+        if not self.library.names():
+            self._on_new()
+
+    def selected_name(self) -> str:
+        return self.name_edit.text().strip()
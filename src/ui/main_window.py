@@ -1,8 +1,22 @@
-from PyQt5.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QStatusBar, QLabel, QLineEdit, QTableWidget, QPushButton, QTextEdit, QTabWidget, QApplication
+from PyQt5.QtWidgets import QMainWindow, QWidget, QHBoxLayout, QVBoxLayout, QStatusBar, QLabel, QLineEdit, QTableView, QHeaderView, QSpinBox, QPushButton, QTabWidget
 from PyQt5.QtCore import Qt, QTimer, QDateTime, QUrl
 from PyQt5.QtGui import QFont
 from .browser_widget import BrowserWidget
 from .settings_page import SettingsPage
+from .log_view import LogListView
+from .traffic_view import TrafficJournalPanel
+from .result_search import ResultSearchPanel
+from .trigger_loop_panel import TriggerLoopPanel
+from .result_grid import (
+    ResultGridModel, JudgementDelegate, CycleStatsModel, parse_watched_cells, format_window_stats,
+    COL_ITEM, COL_JUDGE, DEFAULT_WATCHED_CELLS, DEFAULT_WINDOW
+)
+from utils.rolling_stats import CameraStats, DEFAULT_SHIFT_STARTS
+from utils.config import ConfigManager
+from utils.result_poller import ResultPoller, DEFAULT_RESULT_INTERVAL_MS
+from utils.traffic_journal import TrafficJournal
+from utils.result_store import ResultStore, INSPECTION_COUNTER_ITEM
+from utils.telnet_stats import StatsSnapshotWriter, DEFAULT_SNAPSHOT_INTERVAL
 
 class MainWindow(QMainWindow):
     """
@@ -14,7 +28,21 @@ class MainWindow(QMainWindow):
         self.setMinimumSize(1280, 720)
         # 시작 시 최대화 상태로 설정
         self.setWindowState(Qt.WindowMaximized)
+        self.config = ConfigManager()
+        # 카메라별 사이클 타임/NG율 롤링 통계
+        self.camera_stats = CameraStats(shift_starts=self.config.get("stats", "shift_starts",
+                                                                     fallback=DEFAULT_SHIFT_STARTS))
+        # TX/RX 통신 저널 (설정 탭의 Telnet 연결이 기록)
+        self.traffic_journal = TrafficJournal.from_config(self.config)
+        # 검사 결과 저장소 (설정 탭의 파라미터 폴링 결과를 저장)
+        self.result_store = ResultStore()
         self._init_ui()
+        # 통신 통계를 주기적으로 파일에 저장
+        self.telnet_stats_writer = StatsSnapshotWriter(
+            self.settings_tab.telnet_panel.telnet.stats,
+            interval=float(self.config.get("stats", "telnet_snapshot_interval",
+                                           fallback=DEFAULT_SNAPSHOT_INTERVAL)))
+        self.telnet_stats_writer.start()
 
     def _init_ui(self) -> None:
         # 중앙 위젯 및 전체 레이아웃
@@ -134,26 +162,23 @@ class MainWindow(QMainWindow):
         
         # 설정 탭
         self.settings_tab = SettingsPage()
+        self.settings_tab.telnet_panel.telnet.journal = self.traffic_journal
+        # 결과 저장소에는 한 곳만 기록: 메인 탭 모니터링 중에는 그리드, 아니면 파라미터 폴링
+        self.settings_tab.param_panel.set_result_store(
+            self.result_store, self.config.get("param_panel", "counter", fallback=INSPECTION_COUNTER_ITEM))
+        self.result_poller.set_telnet_worker(self.settings_tab.telnet_panel.worker)
         self.tab_widget.addTab(self.settings_tab, "설정")
         
-        # 데이터 검색 탭 (빈 위젯)
-        self.data_search_tab = QWidget()
-        data_search_layout = QVBoxLayout()
-        data_search_label = QLabel("데이터 검색 기능")
-        data_search_label.setAlignment(Qt.AlignCenter)
-        data_search_label.setStyleSheet("font-size: 24px; color: #666666;")
-        data_search_layout.addWidget(data_search_label)
-        self.data_search_tab.setLayout(data_search_layout)
+        # 트리거 시험 탭 (설정 탭의 Telnet 연결로 최대 처리 속도 측정)
+        self.trigger_loop_tab = TriggerLoopPanel(self.settings_tab.telnet_panel.worker)
+        self.tab_widget.addTab(self.trigger_loop_tab, "트리거 시험")
+        
+        # 데이터 검색 탭 (검사 결과 조회)
+        self.data_search_tab = ResultSearchPanel(self.result_store)
         self.tab_widget.addTab(self.data_search_tab, "데이터 검색")
         
-        # 로그 탭 (빈 위젯)
-        self.log_tab = QWidget()
-        log_layout = QVBoxLayout()
-        log_label = QLabel("로그 기능")
-        log_label.setAlignment(Qt.AlignCenter)
-        log_label.setStyleSheet("font-size: 24px; color: #666666;")
-        log_layout.addWidget(log_label)
-        self.log_tab.setLayout(log_layout)
+        # 로그 탭 (통신 저널 조회)
+        self.log_tab = TrafficJournalPanel(self.traffic_journal)
         self.tab_widget.addTab(self.log_tab, "로그")
         
         # 기본 탭을 메인으로 설정
@@ -165,6 +190,11 @@ class MainWindow(QMainWindow):
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
         self.status_bar.showMessage("시스템이 준비되었습니다.")
+        self.cycle_stats_label = QLabel("")
+        self.status_bar.addPermanentWidget(self.cycle_stats_label)
+        self.stats_timer = QTimer(self)
+        self.stats_timer.timeout.connect(self._refresh_cycle_stats)
+        self.stats_timer.start(1000)
 
     def _init_main_tab(self) -> None:
         """메인 탭의 기존 UI 구성"""
@@ -187,12 +217,56 @@ class MainWindow(QMainWindow):
         control_layout.addWidget(address_label)
         control_layout.addWidget(self.address_input)
         
-        # 그리드
+        # 그리드 (감시 셀별 최신 결과, 바뀐 칸만 갱신)
         grid_label = QLabel("검사 결과")
-        self.device_table = QTableWidget(3, 4)  # 예시: 3행 4열
-        self.device_table.setHorizontalHeaderLabels(["Cell", "항목", "결과", "판정"])
+        window = int(self.config.get("result_grid", "window", fallback=DEFAULT_WINDOW) or DEFAULT_WINDOW)
+        cells = parse_watched_cells(self.config.get("result_grid", "cells", fallback=DEFAULT_WATCHED_CELLS)
+                                    or DEFAULT_WATCHED_CELLS)
+        counter_item = self.config.get("result_grid", "counter", fallback=INSPECTION_COUNTER_ITEM) or ""
+        self.result_model = ResultGridModel(cells, window, counter_item.strip(), self)
+        self.result_model.inspection_added.connect(self._on_inspection_added)
+        self.device_table = QTableView()
+        self.device_table.setModel(self.result_model)
+        self.device_table.setItemDelegateForColumn(COL_JUDGE, JudgementDelegate(self.device_table))
+        self.device_table.verticalHeader().setVisible(False)
+        self.device_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.device_table.horizontalHeader().setSectionResizeMode(COL_ITEM, QHeaderView.ResizeToContents)
         control_layout.addWidget(grid_label)
         control_layout.addWidget(self.device_table)
+
+        # 구간별 사이클 타임/NG율 통계
+        self.cycle_stats_model = CycleStatsModel(self)
+        self.cycle_stats_table = QTableView()
+        self.cycle_stats_table.setModel(self.cycle_stats_model)
+        self.cycle_stats_table.verticalHeader().setVisible(False)
+        self.cycle_stats_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        self.cycle_stats_table.setFixedHeight(120)
+        control_layout.addWidget(self.cycle_stats_table)
+
+        # 결과 연속 조회 (설정 탭의 Telnet 연결 사용)
+        self.result_poller = ResultPoller(parent=self)
+        self.result_poller.set_commands(self.result_model.commands())
+        self.result_poller.values_ready.connect(self.result_model.update_values)
+        self.result_poller.failed.connect(lambda error: self.append_log_message(f"[오류] 결과 조회 실패: {error}"))
+        monitor_layout = QHBoxLayout()
+        self.result_interval_spin = QSpinBox()
+        self.result_interval_spin.setRange(10, 10000)
+        self.result_interval_spin.setValue(DEFAULT_RESULT_INTERVAL_MS)
+        self.result_interval_spin.setSuffix(" ms")
+        self.result_window_spin = QSpinBox()
+        self.result_window_spin.setRange(1, 100000)
+        self.result_window_spin.setValue(self.result_model.window)
+        self.result_window_spin.setPrefix("최근 ")
+        self.result_window_spin.setSuffix("회")
+        self.monitor_button = QPushButton("결과 모니터링")
+        self.monitor_button.setCheckable(True)
+        monitor_layout.addWidget(self.result_interval_spin)
+        monitor_layout.addWidget(self.result_window_spin)
+        monitor_layout.addWidget(self.monitor_button)
+        control_layout.addLayout(monitor_layout)
+        self.result_interval_spin.valueChanged.connect(self.result_poller.set_interval)
+        self.result_window_spin.valueChanged.connect(self.result_model.set_window)
+        self.monitor_button.toggled.connect(self._on_monitor_toggled)
         
         # 버튼
         button_layout = QHBoxLayout()
@@ -203,8 +277,7 @@ class MainWindow(QMainWindow):
         control_layout.addLayout(button_layout)
 
         # 로그 창
-        self.log_textedit = QTextEdit()
-        self.log_textedit.setReadOnly(True)
+        self.log_textedit = LogListView()
         self.log_textedit.setFixedHeight(100)
         control_layout.addWidget(QLabel("로그"))
         control_layout.addWidget(self.log_textedit)
@@ -227,9 +300,55 @@ class MainWindow(QMainWindow):
         self.date_label.setText(now.toString("yyyy-MM-dd"))
         self.time_label.setText(now.toString("HH:mm:ss"))
 
+    def _camera_key(self) -> str:
+        """현재 Telnet 연결 대상 카메라의 통계 키(host:port)"""
+        telnet = self.settings_tab.telnet_panel.telnet
+        return f"{telnet.host}:{telnet.port}"
+
+    def _on_inspection_added(self) -> None:
+        """새 검사 결과를 롤링 통계와 결과 저장소(데이터 검색 탭)에 추가"""
+        key = self._camera_key()
+        cycle_ms, ng = self.result_model.latest_sample()
+        self.camera_stats.add(key, cycle_ms, ng)
+        # 모니터링 정지 후 늦게 도착한 결과는 파라미터 폴링 쪽이 기록하므로 제외
+        if self.monitor_button.isChecked():
+            self.result_store.record_values(key, self.result_model.latest_values())
+
+    def _refresh_cycle_stats(self) -> None:
+        """통계 표와 상태바 요약을 갱신 (1초 주기)"""
+        stats = self.camera_stats.snapshot(self._camera_key())
+        self.cycle_stats_model.set_stats(stats)
+        if stats and stats[0].count:
+            name, count, mean, _, p95, _, ng_rate = format_window_stats(stats[0])
+            self.cycle_stats_label.setText(f"{name}: 평균 {mean} ms | p95 {p95} ms | NG {ng_rate}")
+
+    def _on_monitor_toggled(self, enabled: bool) -> None:
+        """검사 결과 연속 조회 시작/정지"""
+        # 모니터링 중에는 그리드가 결과 저장소를 맡고, 파라미터 폴링은 기록하지 않음 (중복 저장 방지)
+        self.settings_tab.param_panel.set_result_store(None if enabled else self.result_store)
+        if enabled:
+            self.result_poller.start(self.result_interval_spin.value())
+            self.status_bar.showMessage("검사 결과 모니터링을 시작했습니다.")
+        else:
+            self.result_poller.stop()
+            self.status_bar.showMessage("검사 결과 모니터링을 정지했습니다.")
+
     def _on_exit_clicked(self) -> None:
-        """출구 버튼 클릭 시 애플리케이션 종료"""
-        QApplication.quit()
+        """출구 버튼 클릭 시 애플리케이션 종료 (closeEvent에서 정리)"""
+        self.close()
+
+    def closeEvent(self, event) -> None:
+        """
+        창 종료 시 정리: 트리거 시험과 Telnet 작업자 스레드를 먼저 멈춘 뒤
+        통신 저널, 결과 저장소, 통신 통계 기록을 닫습니다.
+        """
+        self.result_poller.stop()
+        self.trigger_loop_tab.stop()
+        self.settings_tab.telnet_panel.worker.stop()
+        self.traffic_journal.close()
+        self.result_store.close()
+        self.telnet_stats_writer.stop()
+        super().closeEvent(event)
 
     def append_log_message(self, message: str) -> None:
         """
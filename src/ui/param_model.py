@@ -0,0 +1,274 @@
+"""
+파라미터 테이블 모델 모듈
+
+파라미터 목록을 열 단위 리스트(ParamStore)에 저장하고
+QAbstractTableModel로 QTableView에 표시합니다.
+No 열은 행 번호로 계산하므로 삭제 후 번호 재정렬이 필요 없습니다.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+
+# 열 번호
+COL_NO = 0
+COL_CELL = 1
+COL_ITEM = 2
+COL_VALUE = 3
+COL_STATUS = 4
+
+HEADERS = ["No", "Cell", "항목", "값", "상태"]
+
+# 열별 정렬
+_ALIGNMENTS = {
+    COL_NO: Qt.AlignCenter,
+    COL_CELL: Qt.AlignCenter,
+    COL_ITEM: Qt.AlignLeft | Qt.AlignVCenter,
+    COL_VALUE: Qt.AlignRight | Qt.AlignVCenter,
+    COL_STATUS: Qt.AlignCenter,
+}
+
+# 상태 색상 (None: 진행 중, True: 성공, False: 실패)
+_STATUS_COLORS = {
+    None: QColor("#7f8c8d"),
+    True: QColor("#27ae60"),
+    False: QColor("#e74c3c"),
+}
+
+# (cell, item, value, command) 한 행
+ParamRow = Tuple[str, str, str, str]
+
+
+class ParamStore:
+    """
+    파라미터 목록을 열 단위 리스트로 보관하는 저장소
+
+    Cell 주소 -> 행 번호 색인으로 O(1) 조회를 지원합니다.
+    같은 Cell이 여러 행에 있으면 첫 번째 행을 가리키며, 앞뒤 공백은 무시합니다.
+    행 삭제/Cell 변경 시에는 색인을 무효로만 표시하고 다음 조회 때 한 번 다시 만듭니다.
+    """
+
+    def __init__(self):
+        self.cells: List[str] = []
+        self.items: List[str] = []
+        self.values: List[str] = []
+        self.commands: List[str] = []
+        self.status_texts: List[str] = []
+        self.status_ok: List[Optional[bool]] = []
+        self.status_tips: List[str] = []
+        self.poll_tips: List[str] = []
+        self._index: Dict[str, int] = {}
+        self._index_valid = True
+
+    def __len__(self) -> int:
+        return len(self.cells)
+
+    def extend(self, rows: Iterable[ParamRow]) -> int:
+        """
+        행들을 끝에 추가합니다.
+
+        Returns:
+            int: 추가된 행 수
+        """
+        start = len(self.cells)
+        for cell, item, value, command in rows:
+            if self._index_valid:
+                self._index.setdefault(cell.strip(), len(self.cells))
+            self.cells.append(cell)
+            self.items.append(item)
+            self.values.append(value)
+            self.commands.append(command)
+        added = len(self.cells) - start
+        self.status_texts.extend([""] * added)
+        self.status_ok.extend([None] * added)
+        self.status_tips.extend([""] * added)
+        self.poll_tips.extend([""] * added)
+        return added
+
+    def remove(self, row: int) -> None:
+        """행 하나를 삭제합니다."""
+        for column in (self.cells, self.items, self.values, self.commands,
+                       self.status_texts, self.status_ok, self.status_tips, self.poll_tips):
+            del column[row]
+        self._index_valid = False
+
+    def clear(self) -> None:
+        """모든 행을 삭제합니다."""
+        for column in (self.cells, self.items, self.values, self.commands,
+                       self.status_texts, self.status_ok, self.status_tips, self.poll_tips):
+            column.clear()
+        self._index.clear()
+        self._index_valid = True
+
+    def row_of(self, cell: str) -> Optional[int]:
+        """Cell 주소에 해당하는 행 번호를 반환합니다."""
+        if not self._index_valid:
+            self._rebuild_index()
+        return self._index.get(cell.strip())
+
+    def set_cell(self, row: int, cell: str) -> None:
+        """행의 Cell 주소를 바꿉니다. (주소가 달라지면 색인 무효화)"""
+        if self.cells[row].strip() != cell.strip():
+            self._index_valid = False
+        self.cells[row] = cell
+
+    def _rebuild_index(self) -> None:
+        self._index = {}
+        for row, cell in enumerate(self.cells):
+            self._index.setdefault(cell.strip(), row)
+        self._index_valid = True
+
+
+class ParamTableModel(QAbstractTableModel):
+    """
+    ParamStore를 QTableView에 표시하는 모델
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.store = ParamStore()
+
+    # --- QAbstractTableModel 인터페이스 ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.store)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        store = self.store
+        if role in (Qt.DisplayRole, Qt.EditRole):
+            if col == COL_NO:
+                return str(row + 1)
+            if col == COL_CELL:
+                return store.cells[row]
+            if col == COL_ITEM:
+                return store.items[row]
+            if col == COL_VALUE:
+                return store.values[row]
+            if col == COL_STATUS:
+                return store.status_texts[row]
+        elif role == Qt.TextAlignmentRole:
+            return int(_ALIGNMENTS[col])
+        elif role == Qt.ForegroundRole and col == COL_STATUS:
+            return _STATUS_COLORS[store.status_ok[row]]
+        elif role == Qt.ToolTipRole:
+            if col == COL_STATUS:
+                return store.status_tips[row] or None
+            if col == COL_NO:
+                return store.poll_tips[row] or None
+        elif role == Qt.UserRole:
+            # 행에 저장된 명령어 (사용자에게는 보이지 않음)
+            return store.commands[row]
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+        if index.column() in (COL_CELL, COL_ITEM, COL_VALUE):
+            flags |= Qt.ItemIsEditable
+        return flags
+
+    def setData(self, index: QModelIndex, value, role: int = Qt.EditRole) -> bool:
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        row, col = index.row(), index.column()
+        text = str(value)
+        if col == COL_CELL:
+            self.store.set_cell(row, text)
+        elif col == COL_ITEM:
+            self.store.items[row] = text
+        elif col == COL_VALUE:
+            self.store.values[row] = text
+        else:
+            return False
+        self.dataChanged.emit(index, index)
+        return True
+
+    # --- 행 추가/삭제 ---
+
+    def append_rows(self, rows: List[ParamRow]) -> None:
+        """행들을 한 번에 끝에 추가합니다."""
+        if not rows:
+            return
+        start = len(self.store)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self.store.extend(rows)
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> None:
+        """행 하나를 삭제합니다. (No 열은 행 번호로 자동 갱신)"""
+        if not 0 <= row < len(self.store):
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.store.remove(row)
+        self.endRemoveRows()
+
+    def clear(self) -> None:
+        """모든 행을 삭제합니다."""
+        self.beginResetModel()
+        self.store.clear()
+        self.endResetModel()
+
+    # --- 값 갱신 (바뀐 행만 dataChanged) ---
+
+    def row_of(self, cell: str) -> Optional[int]:
+        """Cell 주소에 해당하는 행 번호를 반환합니다."""
+        return self.store.row_of(cell)
+
+    def command(self, row: int) -> str:
+        """행에 저장된 명령어를 반환합니다."""
+        return self.store.commands[row]
+
+    def set_value(self, row: int, value: str) -> bool:
+        """
+        값 열을 갱신합니다.
+
+        Returns:
+            bool: 값이 바뀌어 dataChanged를 보냈는지 여부
+        """
+        if self.store.values[row] == value:
+            return False
+        self.store.values[row] = value
+        index = self.index(row, COL_VALUE)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+        return True
+
+    def set_status(self, row: int, text: str, ok: Optional[bool], tooltip: str = "") -> None:
+        """상태 열에 결과 코드를 표시합니다. (ok가 None이면 진행 중)"""
+        store = self.store
+        if (store.status_texts[row], store.status_ok[row], store.status_tips[row]) == (text, ok, tooltip):
+            return
+        store.status_texts[row] = text
+        store.status_ok[row] = ok
+        store.status_tips[row] = tooltip
+        index = self.index(row, COL_STATUS)
+        self.dataChanged.emit(index, index)
+
+    def set_statuses(self, rows: List[int], text: str, ok: Optional[bool], tooltip: str = "") -> None:
+        """여러 행의 상태를 한 번에 바꾸고 변경 범위를 한 번만 알립니다."""
+        if not rows:
+            return
+        store = self.store
+        for row in rows:
+            store.status_texts[row] = text
+            store.status_ok[row] = ok
+            store.status_tips[row] = tooltip
+        self.dataChanged.emit(self.index(min(rows), COL_STATUS), self.index(max(rows), COL_STATUS))
+
+    def set_poll_tip(self, row: int, tooltip: str) -> None:
+        """No 열의 폴링 안내 툴팁을 설정합니다."""
+        self.store.poll_tips[row] = tooltip
+        index = self.index(row, COL_NO)
+        self.dataChanged.emit(index, index, [Qt.ToolTipRole])
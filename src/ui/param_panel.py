@@ -1,15 +1,49 @@
+"""
+파라미터 패널 모듈
+
+Cell 파라미터 목록의 편집/전송, CSV 입출력, 주기 조회(폴링)를 담당합니다.
+폴링 결과는 새 검사로 판단될 때마다 ResultStore에 1건으로 저장합니다.
+
+설정 (config/config.ini):
+
+    [param_panel]
+    ; 값이 바뀌면 새 검사로 보는 카운터 항목 (폴링 대상에 없으면 아무 값이나 바뀔 때 저장)
+    counter = Vision.InspectionCount
+"""
+
 from PyQt5.QtWidgets import (
-    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
-    QPushButton, QLineEdit, QFormLayout, QMessageBox, QHeaderView, QComboBox
+    QWidget, QLabel, QVBoxLayout, QHBoxLayout, QTableView, QAbstractItemView,
+    QPushButton, QLineEdit, QFormLayout, QMessageBox, QHeaderView, QComboBox, QSpinBox,
+    QProgressDialog
 )
-from PyQt5.QtCore import QTimer, QDateTime, Qt
-from utils.telnet_manager import TelnetManager
+from PyQt5.QtCore import QTimer, QDateTime, Qt, QModelIndex, QThread
+from .param_model import ParamTableModel
+from utils.telnet_manager import TelnetManager, DEFAULT_BATCH_WINDOW
+from utils.native_protocol import NativeReply, status_message, format_set_command
+from utils.param_csv_thread import CsvImportThread, CsvExportThread
+from utils.cell_poller import PollScheduler, PollEntry, DEFAULT_POLL_INTERVAL_MS, MIN_POLL_INTERVAL_MS
+from utils.result_store import ResultStore, INSPECTION_COUNTER_ITEM
+from concurrent.futures import Future
+from typing import List, Optional
 import json
+import logging
+import time
+
+# 폴링 스케줄러 확인 주기(ms)
+POLL_TICK_MS = 50
 
 class ParamPanel(QWidget):
     def __init__(self, telnet_manager: TelnetManager = None):
         super().__init__()
         self.telnet_manager = telnet_manager
+        self.telnet_worker = None  # 소켓 I/O를 수행하는 TelnetWorker
+        self.poll_scheduler = PollScheduler()
+        self._poll_in_flight = False
+        self.result_store: Optional[ResultStore] = None  # 폴링 결과 저장소
+        self.counter_item = INSPECTION_COUNTER_ITEM  # 새 검사 판단 카운터 항목
+        self._csv_thread = None  # 실행 중인 CSV 입출력 스레드
+        self.poll_timer = QTimer(self)
+        self.poll_timer.timeout.connect(self._on_poll_tick)
         self.init_ui()
         self.init_default_params()
 
@@ -18,8 +52,12 @@ class ParamPanel(QWidget):
         
         # 파라미터 목록 테이블
         main_layout.addWidget(QLabel("파라미터 목록"))
-        self.table = QTableWidget(0, 4)  # 4열로 변경 (No 열 다시 추가)
-        self.table.setHorizontalHeaderLabels(["No", "Cell", "항목", "값"])
+        # 열 단위 저장소 기반 모델/뷰 (No, Cell, 항목, 값, 상태)
+        self.model = ParamTableModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.verticalHeader().setDefaultSectionSize(24)
         
         # 테이블 열 너비 설정 - 지정된 열은 두 배로 넓히기
         header = self.table.horizontalHeader()
@@ -28,12 +66,14 @@ class ParamPanel(QWidget):
         self.table.setColumnWidth(0, 80)   # No 열 - 두 배 넓히기 (기본 40 -> 80)
         self.table.setColumnWidth(1, 160)  # Cell 열 - 두 배 넓히기 (기본 80 -> 160)
         self.table.setColumnWidth(3, 200)  # 값 열 - 두 배 넓히기 (기본 100 -> 200)
+        self.table.setColumnWidth(4, 100)  # 상태 열 - 전송 결과 코드
         
         # 항목 열은 나머지 공간 사용
         header.setSectionResizeMode(0, QHeaderView.Fixed)        # No 열 - 고정 크기
         header.setSectionResizeMode(1, QHeaderView.Fixed)        # Cell 열 - 고정 크기  
         header.setSectionResizeMode(2, QHeaderView.Stretch)      # 항목 열 - 확장
         header.setSectionResizeMode(3, QHeaderView.Fixed)        # 값 열 - 고정 크기
+        header.setSectionResizeMode(4, QHeaderView.Fixed)        # 상태 열 - 고정 크기
         
         main_layout.addWidget(self.table)
 
@@ -44,13 +84,38 @@ class ParamPanel(QWidget):
         self.save_csv_btn = QPushButton("CSV 저장")
         self.load_csv_btn = QPushButton("CSV 불러오기")
         self.send_params_btn = QPushButton("파라메터 전송")
+        # 응답을 기다리지 않고 연속 전송할 명령 수
+        self.batch_window_spin = QSpinBox()
+        self.batch_window_spin.setRange(1, 64)
+        self.batch_window_spin.setValue(DEFAULT_BATCH_WINDOW)
+        self.batch_window_spin.setPrefix("동시 ")
+        self.batch_window_spin.setToolTip("응답 대기 없이 연속 전송할 최대 명령 수")
         btn_layout.addWidget(self.add_param_btn)
         btn_layout.addWidget(self.remove_param_btn)
         btn_layout.addWidget(self.save_csv_btn)
         btn_layout.addWidget(self.load_csv_btn)
+        btn_layout.addWidget(self.batch_window_spin)
         btn_layout.addWidget(self.send_params_btn)
         main_layout.addLayout(btn_layout)
 
+        # 주기 조회(폴링) 제어
+        poll_layout = QHBoxLayout()
+        self.poll_interval_spin = QSpinBox()
+        self.poll_interval_spin.setRange(MIN_POLL_INTERVAL_MS, 60000)
+        self.poll_interval_spin.setSingleStep(100)
+        self.poll_interval_spin.setValue(DEFAULT_POLL_INTERVAL_MS)
+        self.poll_interval_spin.setSuffix(" ms")
+        self.poll_add_btn = QPushButton("폴링 등록")
+        self.poll_remove_btn = QPushButton("폴링 해제")
+        self.poll_toggle_btn = QPushButton("모니터링 시작")
+        self.poll_toggle_btn.setCheckable(True)
+        poll_layout.addWidget(QLabel("조회 주기"))
+        poll_layout.addWidget(self.poll_interval_spin)
+        poll_layout.addWidget(self.poll_add_btn)
+        poll_layout.addWidget(self.poll_remove_btn)
+        poll_layout.addWidget(self.poll_toggle_btn)
+        main_layout.addLayout(poll_layout)
+
         # 파라미터 상세 입력
         main_layout.addWidget(QLabel("파라미터 상세 입력"))
         form = QFormLayout()
@@ -74,7 +139,10 @@ class ParamPanel(QWidget):
         self.send_params_btn.clicked.connect(self.send_parameters)
         self.add_param_btn.clicked.connect(self.add_parameter)
         self.remove_param_btn.clicked.connect(self.remove_parameter)
-        self.table.cellClicked.connect(self.on_cell_clicked)
+        self.table.clicked.connect(self.on_cell_clicked)
+        self.poll_add_btn.clicked.connect(self.add_selected_to_polling)
+        self.poll_remove_btn.clicked.connect(self.remove_selected_from_polling)
+        self.poll_toggle_btn.toggled.connect(self.set_polling_enabled)
 
     def init_default_params(self):
         """기본 파라미터 항목들을 추가한다."""
@@ -90,48 +158,20 @@ class ParamPanel(QWidget):
             self.add_param_to_table(i, param["cell"], param["item"], "", param["command"])
 
     def add_param_to_table(self, no: int, cell: str, item: str, value: str, command: str = ""):
-        """테이블에 파라미터 행을 추가한다."""
-        row = self.table.rowCount()
-        self.table.insertRow(row)
-        
-        # 4열 구조로 복원: No(0), Cell(1), 항목(2), 값(3)
-        no_item = QTableWidgetItem(str(no))
-        no_item.setTextAlignment(Qt.AlignCenter)  # No 열 중간 맞춤
-        self.table.setItem(row, 0, no_item)
-        
-        cell_item = QTableWidgetItem(cell)
-        cell_item.setTextAlignment(Qt.AlignCenter)  # Cell 열 중간 맞춤
-        self.table.setItem(row, 1, cell_item)
-        
-        item_item = QTableWidgetItem(item)
-        item_item.setTextAlignment(Qt.AlignLeft | Qt.AlignVCenter)  # 항목 열 왼쪽 맞춤
-        self.table.setItem(row, 2, item_item)
-        
-        value_item = QTableWidgetItem(value)
-        value_item.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)  # 값 열 오른쪽 맞춤
-        self.table.setItem(row, 3, value_item)
-        
-        # 명령어를 항목 열에 저장 (사용자에게는 보이지 않음)
-        if item_item:
-            item_item.setData(0x0100, command)  # UserRole에 명령어 저장
+        """테이블에 파라미터 행을 추가한다. (No는 행 번호로 자동 표시)"""
+        self.model.append_rows([(cell, item, value, command)])
 
-    def on_cell_clicked(self, row: int, col: int):
+    def on_cell_clicked(self, index: QModelIndex):
         """테이블 셀 클릭 시 상세 입력창에 정보를 로드한다."""
-        if row < self.table.rowCount():
-            cell_item = self.table.item(row, 1)  # Cell 열
-            item_item = self.table.item(row, 2)  # 항목 열
-            value_item = self.table.item(row, 3) # 값 열
-            
-            if cell_item:
-                self.cell_edit.setText(cell_item.text())
-            if item_item:
-                self.item_edit.setText(item_item.text())
-                # 저장된 명령어 로드
-                command = item_item.data(0x0100)
-                if command:
-                    self.value_edit.setText(command)
-            if value_item:
-                pass  # 값은 읽기 전용
+        row = index.row()
+        if 0 <= row < self.model.rowCount():
+            store = self.model.store
+            self.cell_edit.setText(store.cells[row])
+            self.item_edit.setText(store.items[row])
+            # 저장된 명령어 로드 (값은 읽기 전용)
+            command = store.commands[row]
+            if command:
+                self.value_edit.setText(command)
 
     def add_parameter(self):
         """새 파라미터를 추가한다."""
@@ -143,9 +183,7 @@ class ParamPanel(QWidget):
             QMessageBox.warning(self, "경고", "Cell과 항목을 입력해 주세요.")
             return
         
-        # No는 현재 행 개수 + 1로 자동 설정
-        no = self.table.rowCount() + 1
-        self.add_param_to_table(no, cell, item, value, value)
+        self.add_param_to_table(self.model.rowCount() + 1, cell, item, value, value)
         
         # 입력창 초기화
         self.cell_edit.clear()
@@ -154,25 +192,17 @@ class ParamPanel(QWidget):
 
     def remove_parameter(self):
         """선택된 파라미터를 삭제한다."""
-        current_row = self.table.currentRow()
+        current_row = self.table.currentIndex().row()
         if current_row >= 0:
-            self.table.removeRow(current_row)
-            # No 열 재정렬
-            self.renumber_rows()
+            self.poll_scheduler.remove(self.model.store.cells[current_row].strip())
+            # No 열은 행 번호로 계산되므로 재정렬 불필요
+            self.model.remove_row(current_row)
         else:
             QMessageBox.warning(self, "경고", "삭제할 행을 선택해 주세요.")
 
-    def renumber_rows(self):
-        """행 삭제 후 No 열을 다시 번호매김한다."""
-        for row in range(self.table.rowCount()):
-            no_item = QTableWidgetItem(str(row + 1))
-            no_item.setTextAlignment(Qt.AlignCenter)  # No 열 중간 맞춤
-            self.table.setItem(row, 0, no_item)
-
     def save_to_csv(self):
-        """현재 파라미터 데이터를 CSV로 저장한다."""
+        """현재 파라미터 데이터를 작업자 스레드에서 CSV로 저장한다."""
         try:
-            import csv
             from PyQt5.QtWidgets import QFileDialog
             
             filename, _ = QFileDialog.getSaveFileName(
@@ -180,27 +210,28 @@ class ParamPanel(QWidget):
                 "CSV files (*.csv)")
             
             if filename:
-                with open(filename, 'w', newline='', encoding='utf-8-sig') as csvfile:
-                    writer = csv.writer(csvfile)
-                    # 헤더 작성 (No, Cell, 항목, 값만)
-                    writer.writerow(["No", "Cell", "항목", "값"])
-                    
-                    # 데이터 작성 (4개 열만)
-                    for row in range(self.table.rowCount()):
-                        row_data = []
-                        for col in range(4):  # No, Cell, 항목, 값 (4열만)
-                            item = self.table.item(row, col)
-                            row_data.append(item.text() if item else "")
-                        writer.writerow(row_data)
-                
-                QMessageBox.information(self, "저장 완료", f"CSV 파일이 저장되었습니다:\n{filename}")
+                # 열 스냅샷을 넘겨 저장 중 테이블 변경과 분리
+                store = self.model.store
+                thread = CsvExportThread(filename, list(store.cells), list(store.items),
+                                         list(store.values), self)
+                progress = self._create_csv_progress("CSV 저장 중...", thread)
+                thread.progress_changed.connect(progress.setValue)
+                thread.failed.connect(lambda msg: QMessageBox.critical(self, "저장 오류", f"CSV 저장 중 오류 발생:\n{msg}"))
+                thread.finished.connect(lambda: self._on_csv_saved(thread, progress, filename))
+                self._start_csv_thread(thread)
         except Exception as e:
             QMessageBox.critical(self, "저장 오류", f"CSV 저장 중 오류 발생:\n{e}")
 
+    def _on_csv_saved(self, thread: CsvExportThread, progress: QProgressDialog, filename: str):
+        """CSV 저장 완료 처리 (GUI 스레드)"""
+        progress.close()
+        self._finish_csv_thread()
+        if thread.completed:
+            QMessageBox.information(self, "저장 완료", f"CSV 파일이 저장되었습니다:\n{filename}")
+
     def load_from_csv(self):
-        """CSV 파일에서 파라미터 데이터를 불러온다."""
+        """CSV 파일을 작업자 스레드에서 읽어 청크 단위로 테이블에 추가한다."""
         try:
-            import csv
             from PyQt5.QtWidgets import QFileDialog
             
             filename, _ = QFileDialog.getOpenFileName(
@@ -208,60 +239,90 @@ class ParamPanel(QWidget):
             
             if filename:
                 # 기존 테이블 내용 삭제
-                self.table.setRowCount(0)
-                
-                with open(filename, 'r', encoding='utf-8') as csvfile:
-                    reader = csv.reader(csvfile)
-                    header = next(reader, None)  # 헤더 행 건너뛰기
-                    
-                    for row_idx, row_data in enumerate(reader, 1):
-                        if len(row_data) >= 4:  # 최소 4개 열이 있어야 함
-                            no = row_idx
-                            cell = row_data[1] if len(row_data) > 1 else f"Cell{row_idx-1}"
-                            item = row_data[2] if len(row_data) > 2 else f"Item{row_idx-1}"
-                            value = row_data[3] if len(row_data) > 3 else ""
-                            
-                            # 명령어는 기본값으로 설정 (CSV에서 복원하기 어려우므로)
-                            command = f"GET {item}"
-                            
-                            self.add_param_to_table(no, cell, item, value, command)
+                self.model.clear()
+                self.poll_scheduler.clear()
                 
-                QMessageBox.information(self, "불러오기 완료", f"CSV 파일이 불러와졌습니다:\n{filename}")
+                thread = CsvImportThread(filename, parent=self)
+                progress = self._create_csv_progress("CSV 불러오는 중...", thread)
+                # 청크마다 한 번의 행 삽입 알림으로 추가
+                thread.chunk_ready.connect(self.model.append_rows)
+                thread.progress_changed.connect(progress.setValue)
+                thread.failed.connect(lambda msg: QMessageBox.critical(self, "불러오기 오류", f"CSV 불러오기 중 오류 발생:\n{msg}"))
+                thread.finished.connect(lambda: self._on_csv_loaded(thread, progress, filename))
+                self._start_csv_thread(thread)
         except Exception as e:
             QMessageBox.critical(self, "불러오기 오류", f"CSV 불러오기 중 오류 발생:\n{e}")
 
+    def _on_csv_loaded(self, thread: CsvImportThread, progress: QProgressDialog, filename: str):
+        """CSV 불러오기 완료 처리 (GUI 스레드)"""
+        canceled = progress.wasCanceled()
+        progress.close()
+        self._finish_csv_thread()
+        if canceled:
+            QMessageBox.information(self, "불러오기 취소", f"{thread.row_count}개 행까지 불러왔습니다:\n{filename}")
+        else:
+            QMessageBox.information(self, "불러오기 완료", f"CSV 파일이 불러와졌습니다:\n{filename}")
+
+    def _create_csv_progress(self, label: str, thread: QThread) -> QProgressDialog:
+        """취소 버튼이 있는 CSV 진행률 대화상자를 만든다."""
+        progress = QProgressDialog(label, "취소", 0, 100, self)
+        progress.setWindowModality(Qt.WindowModal)
+        progress.setMinimumDuration(300)
+        progress.canceled.connect(thread.requestInterruption)
+        return progress
+
+    def _start_csv_thread(self, thread: QThread):
+        """CSV 작업 중에는 CSV 버튼을 비활성화하고 스레드를 시작한다."""
+        self._csv_thread = thread
+        self.save_csv_btn.setEnabled(False)
+        self.load_csv_btn.setEnabled(False)
+        thread.start()
+
+    def _finish_csv_thread(self):
+        """CSV 버튼을 다시 활성화한다."""
+        self._csv_thread = None
+        self.save_csv_btn.setEnabled(True)
+        self.load_csv_btn.setEnabled(True)
+
     def send_parameters(self):
-        """파라미터 목록을 Telnet으로 전송한다."""
-        if not self.telnet_manager or not self.telnet_manager.connected:
+        """파라미터 목록을 Telnet으로 일괄(파이프라인) 전송한다."""
+        if not self.telnet_worker or not self.telnet_manager.connected:
             QMessageBox.warning(self, "경고", "Telnet에 연결되어 있지 않습니다.")
             return
         
+        rows = []
+        commands = []
+        store = self.model.store
+        for row, (cell, value) in enumerate(zip(store.cells, store.values)):
+            cell = cell.strip()
+            value = value.strip()
+            
+            if cell and value:
+                # 명령어 생성: 명령유형(값의 타입으로 판단) + Cell + 공백 + 값
+                rows.append(row)
+                commands.append(format_set_command(cell, value))
+        self.model.set_statuses(rows, "전송 중", None)
+        
+        # 전송은 작업자 스레드에서 수행
+        self.send_params_btn.setEnabled(False)
+        self.telnet_worker.request("send_batch", commands, self.batch_window_spin.value(),
+                                   callback=lambda future: self._on_parameters_sent(rows, future))
+
+    def _on_parameters_sent(self, rows: List[int], future: Future):
+        """행별 전송 결과를 표시한다. (GUI 스레드)"""
+        self.send_params_btn.setEnabled(True)
         try:
+            replies: List[NativeReply] = future.result()
             sent_count = 0
             error_count = 0
-            
-            for row in range(self.table.rowCount()):
-                cell_item = self.table.item(row, 1)  # Cell 열
-                value_item = self.table.item(row, 3)  # 값 열
-                
-                if cell_item and value_item:
-                    cell = cell_item.text().strip()
-                    value = value_item.text().strip()
-                    
-                    if cell and value:
-                        # 명령 유형 결정 (값의 타입에 따라 자동 판단)
-                        command_type = self.determine_command_type(value)
-                        
-                        # 명령어 생성: 명령유형 + Cell + 값
-                        command = f"{command_type}{cell}{value}"
-                        
-                        try:
-                            response = self.telnet_manager.send_command(command)
-                            sent_count += 1
-                            print(f"전송 성공: {command} -> {response}")
-                        except Exception as e:
-                            error_count += 1
-                            print(f"전송 실패: {command} -> {e}")
+            for row, reply in zip(rows, replies):
+                if reply.ok:
+                    sent_count += 1
+                    self.set_row_status(row, "1", True)
+                else:
+                    error_count += 1
+                    code = "-" if reply.status is None else str(reply.status)
+                    self.set_row_status(row, code, False, status_message(reply.status))
             
             # 결과 메시지
             if error_count == 0:
@@ -272,23 +333,118 @@ class ParamPanel(QWidget):
                     f"파라미터 전송이 완료되었습니다.\n성공: {sent_count}개, 실패: {error_count}개")
                     
         except Exception as e:
+            self.model.set_statuses(rows, "-", False, str(e))
             QMessageBox.critical(self, "전송 오류", f"파라미터 전송 중 오류 발생:\n{e}")
 
-    def determine_command_type(self, value: str) -> str:
-        """값의 타입에 따라 명령 유형을 자동 판단한다."""
+    def set_row_status(self, row: int, text: str, ok, tooltip: str = ""):
+        """상태 열에 전송 결과 코드를 표시한다. (ok가 None이면 진행 중)"""
+        self.model.set_status(row, text, ok, tooltip)
+
+    def add_selected_to_polling(self):
+        """선택된 행을 현재 조회 주기로 폴링 대상에 등록한다."""
+        interval_ms = self.poll_interval_spin.value()
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        if not rows:
+            QMessageBox.warning(self, "경고", "폴링에 등록할 행을 선택해 주세요.")
+            return
+        store = self.model.store
+        for row in rows:
+            cell = store.cells[row].strip()
+            command = store.commands[row]
+            if not cell or not command:
+                continue
+            self.poll_scheduler.add(cell, command, interval_ms)
+            self.model.set_poll_tip(row, f"폴링 {interval_ms} ms: {command}")
+
+    def remove_selected_from_polling(self):
+        """선택된 행을 폴링 대상에서 해제한다."""
+        rows = sorted({index.row() for index in self.table.selectionModel().selectedRows()})
+        for row in rows:
+            self.poll_scheduler.remove(self.model.store.cells[row].strip())
+            self.model.set_poll_tip(row, "")
+
+    def set_polling_enabled(self, enabled: bool):
+        """주기 조회를 시작하거나 정지한다."""
+        if enabled:
+            self.poll_toggle_btn.setText("모니터링 정지")
+            self.poll_timer.start(POLL_TICK_MS)
+        else:
+            self.poll_toggle_btn.setText("모니터링 시작")
+            self.poll_timer.stop()
+
+    def _on_poll_tick(self):
+        """조회 시점이 된 항목을 하나의 일괄 요청으로 보낸다."""
+        if self._poll_in_flight or not self.telnet_worker or not self.telnet_manager.connected:
+            return
+        entries = self.poll_scheduler.due()
+        if not entries:
+            return
+        self._poll_in_flight = True
+        commands = [entry.command for entry in entries]
+        started = time.monotonic()
+        self.telnet_worker.request(
+            "send_batch", commands, self.batch_window_spin.value(),
+            callback=lambda future: self._on_poll_done(entries, started, future))
+
+    def _on_poll_done(self, entries: List[PollEntry], started: float, future: Future):
+        """일괄 조회 결과 중 값이 바뀐 셀만 갱신한다. (GUI 스레드)"""
+        self._poll_in_flight = False
+        self.poll_scheduler.complete(entries, time.monotonic() - started)
         try:
-            # 정수인지 확인
-            int(value)
-            return "SI"  # Set Integer
-        except ValueError:
-            try:
-                # 실수인지 확인
-                float(value)
-                return "SF"  # Set Float
-            except ValueError:
-                # 문자열
-                return "SS"  # Set String
+            replies: List[NativeReply] = future.result()
+        except Exception as e:
+            logging.error(f"[ParamPanel] 폴링 실패: {e}")
+            return
+        values = {}
+        changed = False
+        counter_changed = False
+        counter_polled = self._counter_polled()
+        for entry, reply in zip(entries, replies):
+            row = self.find_row(entry.key)
+            if row is None:
+                continue
+            if not reply.ok:
+                code = "-" if reply.status is None else str(reply.status)
+                self.set_row_status(row, code, False, status_message(reply.status))
+                continue
+            item = self.model.store.items[row]
+            values[item or entry.key] = reply.value
+            # 값이 그대로여도 이전 폴링 실패 표시는 해제
+            self.set_row_status(row, "", True)
+            if self.poll_scheduler.update_value(entry.key, reply.value):
+                changed = True
+                counter_changed = counter_changed or item == self.counter_item
+                self.model.set_value(row, reply.value)
+        # 새 검사만 1건으로 저장: 카운터를 폴링하면 카운터 변화로, 아니면 값 변화로 판단
+        # (카운터 기준이면 결과 값이 직전 검사와 같아도 저장됨)
+        is_new = counter_changed if counter_polled else changed
+        if is_new and self.result_store is not None:
+            host = f"{self.telnet_manager.host}:{self.telnet_manager.port}"
+            self.result_store.record_values(host, values)
+
+    def _counter_polled(self) -> bool:
+        """카운터 항목 행이 폴링 대상인지 여부"""
+        if not self.counter_item:
+            return False
+        store = self.model.store
+        return any(item == self.counter_item and cell.strip() in self.poll_scheduler
+                   for cell, item in zip(store.cells, store.items))
+
+    def find_row(self, cell: str) -> Optional[int]:
+        """Cell 주소로 행 번호를 찾는다. (색인으로 O(1) 조회)"""
+        return self.model.row_of(cell)
 
     def set_telnet_manager(self, telnet_manager: TelnetManager):
         """TelnetManager를 설정한다."""
-        self.telnet_manager = telnet_manager 
\ No newline at end of file
+        self.telnet_manager = telnet_manager
+
+    def set_result_store(self, result_store: Optional[ResultStore], counter_item: Optional[str] = None):
+        """폴링 결과를 저장할 ResultStore와 새 검사 판단 카운터 항목을 설정한다."""
+        self.result_store = result_store
+        if counter_item is not None:
+            self.counter_item = counter_item.strip()
+
+    def set_telnet_worker(self, telnet_worker):
+        """TelnetWorker와 그 TelnetManager를 설정한다."""
+        self.telnet_worker = telnet_worker
+        self.set_telnet_manager(telnet_worker.telnet if telnet_worker else None) 
\ No newline at end of file
@@ -0,0 +1,341 @@
+"""
+메인 탭 검사 결과 그리드 모듈
+
+감시 셀별 최신 결과와 판정, 최근 N회 검사 중 NG 횟수를 표시합니다.
+값이 바뀐 칸만 dataChanged를 보내므로 20~30 fps로 갱신해도 바뀐 칸만 다시 그립니다.
+판정 색상은 항목별 스타일 대신 JudgementDelegate가 그립니다.
+
+감시 셀 설정 (config/config.ini):
+
+    [result_grid]
+    ; Cell=항목[:하한:상한]  (세미콜론 구분, 하한/상한이 있으면 범위로 판정)
+    cells = A003=Vision.Result; A004=Vision.ExecutionTime:0:50; -=Vision.InspectionCount
+    window = 100
+    ; 값이 바뀌면 새 검사로 보는 항목 (비우면 아무 값이나 바뀌면 새 검사)
+    counter = Vision.InspectionCount
+"""
+
+import math
+from collections import deque
+from typing import Deque, Dict, List, Optional, Tuple
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QBrush, QColor
+from PyQt5.QtWidgets import QStyledItemDelegate
+
+from utils.result_store import (
+    EXEC_TIME_ITEM, INSPECTION_COUNTER_ITEM, JUDGE_NG, JUDGE_OK, RESULT_ITEM, judge
+)
+from utils.rolling_stats import WindowStats
+
+# 기본 감시 셀
+DEFAULT_WATCHED_CELLS = "-=Vision.Result; -=Vision.ExecutionTime; -=Job.Name; -=Vision.InspectionCount"
+# 기본 롤링 창 크기 (최근 N회 검사)
+DEFAULT_WINDOW = 100
+
+COL_CELL = 0
+COL_ITEM = 1
+COL_VALUE = 2
+COL_JUDGE = 3
+COL_NG = 4
+
+HEADERS = ["Cell", "항목", "결과", "판정", "NG(최근)"]
+
+# 판정 -> (배경, 글자) 색상
+_JUDGE_COLORS = {
+    JUDGE_OK: (QColor("#27ae60"), QColor("white")),
+    JUDGE_NG: (QColor("#e74c3c"), QColor("white")),
+}
+
+
+class WatchedCell:
+    """
+    그리드에 표시할 감시 셀 하나
+    """
+    __slots__ = ("cell", "item", "low", "high")
+
+    def __init__(self, cell: str, item: str, low: Optional[float] = None, high: Optional[float] = None):
+        self.cell = cell
+        self.item = item
+        self.low = low
+        self.high = high
+
+    @property
+    def command(self) -> str:
+        return f"GET {self.item}"
+
+    def judge(self, value: Optional[str]) -> str:
+        """값을 판정합니다. (판정 기준이 없으면 빈 문자열)"""
+        if value is None:
+            return ""
+        if self.item == RESULT_ITEM:
+            return judge(value)
+        if self.low is None and self.high is None:
+            return ""
+        try:
+            number = float(value)
+        except ValueError:
+            return JUDGE_NG
+        if (self.low is not None and number < self.low) or (self.high is not None and number > self.high):
+            return JUDGE_NG
+        return JUDGE_OK
+
+
+def parse_watched_cells(text: str) -> List[WatchedCell]:
+    """
+    "Cell=항목[:하한:상한]; ..." 형식의 설정 문자열을 감시 셀 목록으로 변환합니다.
+    """
+    cells = []
+    for entry in text.split(";"):
+        entry = entry.strip()
+        if not entry:
+            continue
+        cell, _, spec = entry.rpartition("=")
+        item, *limits = spec.split(":")
+        bounds: List[Optional[float]] = []
+        for limit in (limits + ["", ""])[:2]:
+            try:
+                bounds.append(float(limit) if limit.strip() else None)
+            except ValueError:
+                bounds.append(None)
+        cells.append(WatchedCell(cell.strip() or "-", item.strip(), *bounds))
+    return cells
+
+
+class ResultGridModel(QAbstractTableModel):
+    """
+    감시 셀별 최신 결과 모델
+
+    update_values()는 바뀐 칸에 대해서만 dataChanged를 보냅니다.
+    같은 검사 결과를 여러 번 조회해도 한 번만 집계하도록, counter_item 값이
+    바뀌었을 때(없으면 아무 값이나 바뀌었을 때)만 새 검사로 보고 inspection_added를 보냅니다.
+    """
+
+    inspection_added = pyqtSignal()
+
+    def __init__(self, cells: Optional[List[WatchedCell]] = None, window: int = DEFAULT_WINDOW,
+                 counter_item: str = INSPECTION_COUNTER_ITEM, parent=None):
+        super().__init__(parent)
+        self.window = max(1, window)
+        self.counter_item = counter_item
+        self.cells: List[WatchedCell] = []
+        self.values: List[str] = []
+        self.judgements: List[str] = []
+        self.ng_counts: List[int] = []
+        self._history: List[Deque[bool]] = []   # 셀별 최근 N회 NG 여부
+        self.inspection_count = 0
+        self.set_cells(cells or [])
+
+    def set_cells(self, cells: List[WatchedCell]) -> None:
+        """감시 셀 목록을 바꾸고 기록을 초기화합니다."""
+        self.beginResetModel()
+        self.cells = list(cells)
+        self.values = [""] * len(cells)
+        self.judgements = [""] * len(cells)
+        self.ng_counts = [0] * len(cells)
+        self._history = [deque(maxlen=self.window) for _ in cells]
+        self.inspection_count = 0
+        self.endResetModel()
+
+    def commands(self) -> List[str]:
+        return [cell.command for cell in self.cells]
+
+    def _row_of_item(self, item: str) -> Optional[int]:
+        for row, cell in enumerate(self.cells):
+            if cell.item == item:
+                return row
+        return None
+
+    def _is_new_inspection(self, values: List[Optional[str]]) -> bool:
+        counter_row = self._row_of_item(self.counter_item) if self.counter_item else None
+        if counter_row is not None:
+            rows = [counter_row]
+        else:
+            rows = range(min(len(values), len(self.cells)))
+        return any(values[row] is not None and values[row] != self.values[row] for row in rows)
+
+    def latest_sample(self) -> Tuple[Optional[float], Optional[bool]]:
+        """
+        최신 검사의 (사이클 타임 ms, NG 여부)를 반환합니다. (감시하지 않는 항목은 None)
+        """
+        cycle_ms = None
+        exec_row = self._row_of_item(EXEC_TIME_ITEM)
+        if exec_row is not None:
+            try:
+                cycle_ms = float(self.values[exec_row])
+            except ValueError:
+                pass
+        ng = None
+        result_row = self._row_of_item(RESULT_ITEM)
+        if result_row is not None and self.judgements[result_row]:
+            ng = self.judgements[result_row] == JUDGE_NG
+        return cycle_ms, ng
+
+    def latest_values(self) -> Dict[str, str]:
+        """최신 검사의 항목 -> 값 (아직 읽지 못한 셀은 제외)"""
+        return {cell.item or cell.cell: value for cell, value in zip(self.cells, self.values) if value}
+
+    def set_window(self, window: int) -> None:
+        """롤링 창 크기를 바꿉니다. (최근 기록은 유지)"""
+        self.window = max(1, window)
+        for row, history in enumerate(self._history):
+            self._history[row] = deque(history, maxlen=self.window)
+            self.ng_counts[row] = sum(self._history[row])
+        if self.cells:
+            self.dataChanged.emit(self.index(0, COL_NG), self.index(len(self.cells) - 1, COL_NG))
+        self.headerDataChanged.emit(Qt.Horizontal, COL_NG, COL_NG)
+
+    def update_values(self, values: List[Optional[str]]) -> int:
+        """
+        검사 1회의 결과를 반영합니다.
+
+        Args:
+            values (List[Optional[str]]): 감시 셀 순서의 값 (조회 실패는 None)
+
+        Returns:
+            int: 다시 그리도록 알린 칸 수
+        """
+        is_new = self._is_new_inspection(values)
+        if is_new:
+            self.inspection_count += 1
+        changed = 0
+        for row, value in enumerate(values[:len(self.cells)]):
+            if value is None:
+                continue
+            if value != self.values[row]:
+                self.values[row] = value
+                self._emit_cell(row, COL_VALUE)
+                changed += 1
+            judgement = self.cells[row].judge(value)
+            if judgement != self.judgements[row]:
+                self.judgements[row] = judgement
+                self._emit_cell(row, COL_JUDGE)
+                changed += 1
+            if judgement and is_new:
+                history = self._history[row]
+                ng_count = self.ng_counts[row]
+                if len(history) == history.maxlen and history[0]:
+                    ng_count -= 1
+                is_ng = judgement == JUDGE_NG
+                history.append(is_ng)
+                ng_count += is_ng
+                if ng_count != self.ng_counts[row]:
+                    self.ng_counts[row] = ng_count
+                    self._emit_cell(row, COL_NG)
+                    changed += 1
+        if is_new:
+            self.inspection_added.emit()
+        return changed
+
+    def _emit_cell(self, row: int, col: int) -> None:
+        index = self.index(row, col)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    # --- QAbstractTableModel 인터페이스 ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.cells)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.DisplayRole:
+            if col == COL_CELL:
+                return self.cells[row].cell
+            if col == COL_ITEM:
+                return self.cells[row].item
+            if col == COL_VALUE:
+                return self.values[row]
+            if col == COL_JUDGE:
+                return self.judgements[row]
+            if col == COL_NG:
+                return str(self.ng_counts[row]) if self._history[row] else ""
+        elif role == Qt.TextAlignmentRole:
+            return int(Qt.AlignLeft | Qt.AlignVCenter) if col == COL_ITEM else int(Qt.AlignCenter)
+        elif role == Qt.ToolTipRole and col == COL_NG and self._history[row]:
+            return f"최근 {len(self._history[row])}회 중 NG {self.ng_counts[row]}회"
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            if section == COL_NG:
+                return f"NG(최근 {self.window})"
+            return HEADERS[section]
+        return None
+
+
+class JudgementDelegate(QStyledItemDelegate):
+    """
+    판정 열(OK/NG)의 배경과 글자 색을 그리는 델리게이트
+    """
+
+    def initStyleOption(self, option, index: QModelIndex) -> None:
+        super().initStyleOption(option, index)
+        colors = _JUDGE_COLORS.get(index.data(Qt.DisplayRole))
+        if colors:
+            background, foreground = colors
+            option.backgroundBrush = QBrush(background)
+            option.palette.setColor(option.palette.Text, foreground)
+            option.palette.setColor(option.palette.HighlightedText, foreground)
+
+
+STATS_HEADERS = ["구간", "건수", "평균(ms)", "p50", "p95", "p99", "NG율"]
+
+
+def _format_ms(value: float) -> str:
+    return "-" if math.isnan(value) else f"{value:.1f}"
+
+
+def format_window_stats(stats: WindowStats) -> List[str]:
+    """통계 한 구간을 표시용 문자열 목록으로 변환합니다."""
+    ng_rate = "-" if math.isnan(stats.ng_rate) else f"{stats.ng_rate * 100:.2f}%"
+    return [stats.name, f"{stats.count:,}", _format_ms(stats.mean), _format_ms(stats.p50),
+            _format_ms(stats.p95), _format_ms(stats.p99), ng_rate]
+
+
+class CycleStatsModel(QAbstractTableModel):
+    """
+    구간별 사이클 타임/NG율 통계 표 모델 (바뀐 칸만 갱신)
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._texts: List[List[str]] = []
+
+    def set_stats(self, stats: List[WindowStats]) -> None:
+        texts = [format_window_stats(window) for window in stats]
+        if len(texts) != len(self._texts):
+            self.beginResetModel()
+            self._texts = texts
+            self.endResetModel()
+            return
+        for row, (old, new) in enumerate(zip(self._texts, texts)):
+            for col, (old_text, new_text) in enumerate(zip(old, new)):
+                if old_text != new_text:
+                    old[col] = new_text
+                    index = self.index(row, col)
+                    self.dataChanged.emit(index, index, [Qt.DisplayRole])
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._texts)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(STATS_HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        if role == Qt.DisplayRole:
+            return self._texts[index.row()][index.column()]
+        if role == Qt.TextAlignmentRole:
+            return int(Qt.AlignCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return STATS_HEADERS[section]
+        return None
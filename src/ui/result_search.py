@@ -0,0 +1,218 @@
+"""
+데이터 검색 화면 모듈
+
+ResultStore에 저장된 검사 결과를 JOB/판정/기간으로 조회합니다.
+페이지 이동은 이전 페이지 마지막 행의 (시각, id)를 기준으로 하므로(keyset)
+결과가 수백만 건이어도 각 페이지 조회 시간이 일정합니다.
+"""
+
+import datetime
+from typing import List, Optional, Tuple
+
+from PyQt5.QtCore import QAbstractTableModel, QDateTime, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QComboBox, QDateTimeEdit, QHBoxLayout, QHeaderView, QLabel,
+    QPushButton, QSplitter, QTableView, QTableWidget, QTableWidgetItem, QVBoxLayout, QWidget
+)
+
+from utils.result_store import JUDGE_NG, JUDGE_OK, InspectionRow, ResultStore
+
+# 페이지당 행 수
+PAGE_SIZE = 100
+
+HEADERS = ["시각", "장비", "JOB", "판정", "실행 시간(ms)"]
+
+_JUDGE_COLORS = {
+    JUDGE_OK: QColor("#27ae60"),
+    JUDGE_NG: QColor("#e74c3c"),
+}
+
+
+class InspectionPageModel(QAbstractTableModel):
+    """
+    검사 결과 한 페이지를 표시하는 모델
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.rows: List[InspectionRow] = []
+
+    def set_rows(self, rows: List[InspectionRow]) -> None:
+        self.beginResetModel()
+        self.rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, ts, host, job, judgement, exec_ms = self.rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            if col == 1:
+                return host
+            if col == 2:
+                return job
+            if col == 3:
+                return judgement
+            if col == 4:
+                return "" if exec_ms is None else f"{exec_ms:.1f}"
+        elif role == Qt.ForegroundRole and col == 3:
+            return _JUDGE_COLORS.get(judgement)
+        elif role == Qt.TextAlignmentRole and col in (3, 4):
+            return int(Qt.AlignCenter if col == 3 else Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+
+class ResultSearchPanel(QWidget):
+    """
+    데이터 검색 탭: 검사 결과 조회 및 셀 값 상세 보기
+    """
+
+    def __init__(self, store: Optional[ResultStore] = None, parent=None):
+        super().__init__(parent)
+        self.store = store
+        # 페이지별 시작 기준 (첫 페이지는 None)
+        self._page_cursors: List[Optional[Tuple[float, int]]] = [None]
+        self._filter = (None, None, "", "")
+
+        main_layout = QVBoxLayout()
+        filter_layout = QHBoxLayout()
+        now = QDateTime.currentDateTime()
+        self.start_edit = QDateTimeEdit(now.addDays(-1))
+        self.end_edit = QDateTimeEdit(now.addSecs(60))
+        for edit in (self.start_edit, self.end_edit):
+            edit.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
+            edit.setCalendarPopup(True)
+        self.job_combo = QComboBox()
+        self.job_combo.setEditable(True)
+        self.job_combo.setMinimumWidth(200)
+        self.job_combo.lineEdit().setPlaceholderText("JOB (비우면 전체)")
+        self.judge_combo = QComboBox()
+        self.judge_combo.addItems(["전체", JUDGE_OK, JUDGE_NG])
+        self.search_btn = QPushButton("검색")
+
+        filter_layout.addWidget(QLabel("기간"))
+        filter_layout.addWidget(self.start_edit)
+        filter_layout.addWidget(QLabel("~"))
+        filter_layout.addWidget(self.end_edit)
+        filter_layout.addWidget(self.job_combo)
+        filter_layout.addWidget(self.judge_combo)
+        filter_layout.addWidget(self.search_btn)
+        filter_layout.addStretch()
+        main_layout.addLayout(filter_layout)
+
+        self.summary_label = QLabel("")
+        main_layout.addWidget(self.summary_label)
+
+        splitter = QSplitter(Qt.Horizontal)
+        self.model = InspectionPageModel(self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setSelectionMode(QAbstractItemView.SingleSelection)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        splitter.addWidget(self.table)
+
+        self.detail_table = QTableWidget(0, 2)
+        self.detail_table.setHorizontalHeaderLabels(["항목", "값"])
+        self.detail_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.detail_table.verticalHeader().setVisible(False)
+        self.detail_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        splitter.addWidget(self.detail_table)
+        splitter.setSizes([700, 300])
+        main_layout.addWidget(splitter, 1)
+
+        page_layout = QHBoxLayout()
+        self.prev_btn = QPushButton("◀ 이전")
+        self.next_btn = QPushButton("다음 ▶")
+        self.page_label = QLabel("")
+        page_layout.addStretch()
+        page_layout.addWidget(self.prev_btn)
+        page_layout.addWidget(self.page_label)
+        page_layout.addWidget(self.next_btn)
+        page_layout.addStretch()
+        main_layout.addLayout(page_layout)
+        self.setLayout(main_layout)
+        self._update_page_buttons(False)
+
+        self.search_btn.clicked.connect(self.search)
+        self.job_combo.lineEdit().returnPressed.connect(self.search)
+        self.prev_btn.clicked.connect(self.previous_page)
+        self.next_btn.clicked.connect(self.next_page)
+        self.table.selectionModel().currentRowChanged.connect(self._on_row_changed)
+
+    def search(self) -> None:
+        """현재 조건으로 첫 페이지를 조회합니다."""
+        if self.store is None:
+            self.summary_label.setText("결과 저장소가 설정되지 않았습니다.")
+            return
+        start = self.start_edit.dateTime().toMSecsSinceEpoch() / 1000.0
+        end = self.end_edit.dateTime().toMSecsSinceEpoch() / 1000.0
+        job = self.job_combo.currentText().strip()
+        judgement = "" if self.judge_combo.currentIndex() == 0 else self.judge_combo.currentText()
+        self._filter = (start, end, job, judgement)
+        total, ng = self.store.summary(start, end, job, judgement)
+        rate = ng * 100.0 / total if total else 0.0
+        self.summary_label.setText(f"{total:,}건  |  NG {ng:,}건 ({rate:.2f}%)")
+        self._page_cursors = [None]
+        self._load_page()
+        self._refresh_jobs(job)
+
+    def next_page(self) -> None:
+        rows = self.model.rows
+        if len(rows) < PAGE_SIZE:
+            return
+        self._page_cursors.append((rows[-1][1], rows[-1][0]))
+        self._load_page()
+
+    def previous_page(self) -> None:
+        if len(self._page_cursors) <= 1:
+            return
+        self._page_cursors.pop()
+        self._load_page()
+
+    def _load_page(self) -> None:
+        rows = self.store.query(*self._filter, before=self._page_cursors[-1], limit=PAGE_SIZE)
+        self.model.set_rows(rows)
+        self.detail_table.setRowCount(0)
+        self.page_label.setText(f"{len(self._page_cursors)} 페이지")
+        self._update_page_buttons(len(rows) == PAGE_SIZE)
+
+    def _update_page_buttons(self, has_next: bool) -> None:
+        self.prev_btn.setEnabled(len(self._page_cursors) > 1)
+        self.next_btn.setEnabled(has_next)
+
+    def _on_row_changed(self, current: QModelIndex, previous: QModelIndex) -> None:
+        """선택한 검사의 셀 값을 상세 표에 표시합니다."""
+        if not current.isValid():
+            return
+        values = self.store.values(self.model.rows[current.row()][0])
+        self.detail_table.setRowCount(len(values))
+        for row, (item, value) in enumerate(values):
+            self.detail_table.setItem(row, 0, QTableWidgetItem(item))
+            self.detail_table.setItem(row, 1, QTableWidgetItem(value))
+
+    def _refresh_jobs(self, current: str) -> None:
+        """JOB 목록 콤보박스를 저장소 기록으로 갱신합니다."""
+        self.job_combo.blockSignals(True)
+        self.job_combo.clear()
+        self.job_combo.addItem("")
+        self.job_combo.addItems(self.store.jobs())
+        self.job_combo.setEditText(current)
+        self.job_combo.blockSignals(False)
@@ -47,11 +47,11 @@ class SettingsPage(QWidget):
     
     def setup_connections(self):
         """컴포넌트 간 연결을 설정합니다."""
-        # TelnetManager를 ParamPanel에 전달
-        self.param_panel.set_telnet_manager(self.telnet_panel.telnet)
+        # TelnetWorker(및 TelnetManager)를 ParamPanel에 전달
+        self.param_panel.set_telnet_worker(self.telnet_panel.worker)
         
-        # TelnetManager를 JobPanel에 전달
-        self.job_panel.set_telnet_manager(self.telnet_panel.telnet)
+        # TelnetWorker(및 TelnetManager)를 JobPanel에 전달
+        self.job_panel.set_telnet_worker(self.telnet_panel.worker)
         
         # LogPanel을 JobPanel에 전달
         self.job_panel.set_log_panel(self.log_panel)
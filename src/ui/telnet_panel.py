@@ -1,19 +1,30 @@
+import logging
 from PyQt5.QtWidgets import (
     QWidget, QLabel, QVBoxLayout, QHBoxLayout, QFormLayout, QLineEdit, QPushButton, QTextEdit
 )
-from PyQt5.QtCore import Qt, QDateTime, QThread, pyqtSignal
+from PyQt5.QtCore import Qt, QDateTime, pyqtSignal
+from concurrent.futures import Future
 from utils.telnet_manager import TelnetManager
-import threading
-import time
+from utils.telnet_worker import TelnetWorker
+from utils.connection_supervisor import ConnectionSupervisor
+from utils.config import ConfigManager
+from .log_view import LogListView
+from .telnet_stats_view import TelnetStatsView
 
 class TelnetPanel(QWidget):
     # 연결 상태 변경 시그널
     connection_changed = pyqtSignal(bool)
     def __init__(self):
         super().__init__()
+        self.config = ConfigManager()
         self.telnet = TelnetManager()
-        self._rx_thread = None
-        self._rx_stop = threading.Event()
+        # 배너/로그인 제한 시간 (초)
+        self.telnet.banner_timeout = self._timeout_option("banner_timeout", self.telnet.banner_timeout)
+        self.telnet.login_timeout = self._timeout_option("login_timeout", self.telnet.login_timeout)
+        # 소켓 I/O는 작업자 스레드에서만 수행
+        self.worker = TelnetWorker(self.telnet, self)
+        # 끊김 감지, 하트비트, 자동 재연결/재로그인
+        self.supervisor = ConnectionSupervisor(self.worker, self.config, self)
         main_layout = QVBoxLayout()
         
         # 연결 설정
@@ -60,10 +71,13 @@ class TelnetPanel(QWidget):
 
         # 통신 로그
         main_layout.addWidget(QLabel("통신 로그"))
-        self.log_edit = QTextEdit()
-        self.log_edit.setReadOnly(True)
+        self.log_edit = LogListView()
         main_layout.addWidget(self.log_edit)
 
+        # 통신 통계 (명령 유형별 지연/횟수)
+        self.stats_view = TelnetStatsView(self.telnet.stats)
+        main_layout.addWidget(self.stats_view)
+
         self.setLayout(main_layout)
 
         # 이벤트 연결
@@ -72,6 +86,16 @@ class TelnetPanel(QWidget):
         self.test_btn.clicked.connect(self._on_test)
         self.login_btn.clicked.connect(self._on_login)
         self.send_btn.clicked.connect(self._on_send)
+        self.supervisor.connection_changed.connect(self._on_auto_connection_changed)
+        self.supervisor.state_changed.connect(self._on_supervisor_state)
+
+    def _timeout_option(self, option: str, fallback: float) -> float:
+        """[telnet] 제한 시간 설정을 읽는다. (잘못된 값이면 기본값)"""
+        try:
+            return float(self.config.get("telnet", option, fallback=fallback) or fallback)
+        except ValueError:
+            logging.warning(f"[TelnetPanel] 잘못된 설정값: {option}")
+            return fallback
 
     def _log(self, msg: str):
         self.log_edit.append(msg)
@@ -87,15 +111,26 @@ class TelnetPanel(QWidget):
             self._log(f"[{self._now()}] [에러] 포트 번호가 올바르지 않습니다.")
             return
         self._log(f"[{self._now()}] 연결 시도: {host}:{port}")
+        self.connect_btn.setEnabled(False)
+        self.status_label.setText("연결 중...")
         
-        # 동기식 telnetlib으로 연결 및 초기 수신 (연결 상태 유지)
-        msg = self.telnet.connect_and_receive_initial(host, port)
+        # 연결 및 초기 수신은 작업자 스레드에서 수행 (연결 상태 유지)
+        self.worker.request("connect_and_receive_initial", host, port, callback=self._on_connect_done)
+
+    def _on_connect_done(self, future: Future):
+        self.connect_btn.setEnabled(True)
+        try:
+            msg = future.result()
+        except Exception as e:
+            msg = f"[오류: {e}]"
         if msg and 'Welcome to In-Sight' in msg:
             self.status_label.setText("연결됨")
             self._log(f"[{self._now()}] 연결 성공")
             # Welcome 메시지를 깔끔하게 표시
             clean_msg = msg.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ').strip()
             self._log(f"[{self._now()}] {clean_msg}")
+            # 끊김 감시 시작
+            self.supervisor.session_established()
             # 연결 상태 변경 시그널 발생
             self.connection_changed.emit(True)
         else:
@@ -113,18 +148,29 @@ class TelnetPanel(QWidget):
         password = self.password_edit.text().strip()
         
         self._log(f"[{self._now()}] 자동 로그인 시작: {username}")
-        success = self.telnet.login(username, password)
+        self.login_btn.setEnabled(False)
+        self.worker.request("login", username, password, callback=self._on_login_done)
+
+    def _on_login_done(self, future: Future):
+        self.login_btn.setEnabled(True)
+        try:
+            success = future.result()
+        except Exception:
+            success = False
         
         if success:
             self._log(f"[{self._now()}] 로그인 성공")
         else:
-            self._log(f"[{self._now()}] [에러] 로그인 실패")
+            self._log(f"[{self._now()}] [에러] 로그인 실패: {self.telnet.last_login_error}")
 
     def _on_disconnect(self):
-        self.telnet.disconnect()
+        # 사용자가 해제한 연결은 자동 재연결하지 않음
+        self.supervisor.stop()
+        self.worker.request("disconnect", callback=self._on_disconnect_done)
+
+    def _on_disconnect_done(self, future: Future):
         self.status_label.setText("연결 안됨")
         self._log(f"[{self._now()}] 연결 해제")
-        self._stop_rx_thread()
         # 연결 해제 시그널 발생
         self.connection_changed.emit(False)
 
@@ -133,12 +179,7 @@ class TelnetPanel(QWidget):
             self._log(f"[{self._now()}] [에러] 연결되어 있지 않습니다.")
             return
         self._log(f"[{self._now()}] 테스트: GET 명령 전송")
-        response = self.telnet.send_command("GET")
-        if response and response.strip():
-            clean_response = response.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ').strip()
-            self._log(f"[{self._now()}] 응답: {clean_response}")
-        else:
-            self._log(f"[{self._now()}] (응답 없음)")
+        self.worker.request("send_command", "GET", callback=self._on_response)
 
     def _on_send(self):
         if not self.telnet.connected:
@@ -151,7 +192,13 @@ class TelnetPanel(QWidget):
             return
         
         self._log(f"[{self._now()}] 명령 전송: {data}")
-        response = self.telnet.send_command(data)
+        self.worker.request("send_command", data, callback=self._on_response)
+
+    def _on_response(self, future: Future):
+        try:
+            response = future.result()
+        except Exception as e:
+            response = f"[오류: {e}]"
         
         if response and response.strip():
             clean_response = response.replace('\r\n', ' ').replace('\r', ' ').replace('\n', ' ').strip()
@@ -159,14 +206,15 @@ class TelnetPanel(QWidget):
         else:
             self._log(f"[{self._now()}] (응답 없음)")
 
-    def _start_rx_thread(self):
-        # 현재는 사용하지 않음 (동기식 처리)
-        pass
-
-    def _stop_rx_thread(self):
-        # 현재는 사용하지 않음 (동기식 처리)
-        pass
+    def _on_auto_connection_changed(self, connected: bool):
+        if connected:
+            self._log(f"[{self._now()}] 자동 재연결 성공 ({self.supervisor.attempts}회 시도, "
+                      f"{self.supervisor.last_recovery:.1f}초)")
+        else:
+            self._log(f"[{self._now()}] [에러] 연결 끊김 - 자동 재연결을 시작합니다.")
+        self.connection_changed.emit(connected)
 
-    def _rx_loop(self):
-        # 현재는 사용하지 않음 (동기식 처리)
-        pass 
\ No newline at end of file
+    def _on_supervisor_state(self, state: str, detail: str):
+        self.status_label.setText(state)
+        if detail:
+            self._log(f"[{self._now()}] {state}: {detail}")
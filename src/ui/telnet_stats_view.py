@@ -0,0 +1,90 @@
+from PyQt5.QtWidgets import (
+    QGroupBox, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QTableWidget, QTableWidgetItem,
+    QHeaderView, QAbstractItemView
+)
+from PyQt5.QtCore import Qt, QTimer
+from utils.telnet_stats import TelnetStats
+
+# 표 갱신 주기(ms)
+REFRESH_INTERVAL_MS = 1000
+
+COLUMNS = ["유형", "횟수", "오류", "시간초과", "p50 (ms)", "p99 (ms)", "최대 (ms)", "TX", "RX"]
+
+
+def format_bytes(count: int) -> str:
+    """바이트 수를 읽기 쉬운 단위로 변환합니다."""
+    for unit in ("B", "KB", "MB"):
+        if count < 1024:
+            return f"{count:.0f} {unit}" if unit == "B" else f"{count:.1f} {unit}"
+        count /= 1024.0
+    return f"{count:.1f} GB"
+
+
+class TelnetStatsView(QGroupBox):
+    """
+    TelnetStats 실시간 표시 (명령 유형별 횟수/지연, 전체 송수신/연결 요약)
+    """
+
+    def __init__(self, stats: TelnetStats, parent=None):
+        super().__init__("통신 통계", parent)
+        self.stats = stats
+        layout = QVBoxLayout(self)
+
+        self.table = QTableWidget(0, len(COLUMNS))
+        self.table.setHorizontalHeaderLabels(COLUMNS)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.setSelectionMode(QAbstractItemView.NoSelection)
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        layout.addWidget(self.table)
+
+        bottom = QHBoxLayout()
+        self.summary_label = QLabel()
+        self.reset_btn = QPushButton("초기화")
+        bottom.addWidget(self.summary_label, 1)
+        bottom.addWidget(self.reset_btn)
+        layout.addLayout(bottom)
+
+        self.reset_btn.clicked.connect(self._on_reset)
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+        self.timer.start(REFRESH_INTERVAL_MS)
+
+    def refresh(self) -> None:
+        """계측 값을 다시 읽어 표시합니다. (보이지 않으면 건너뜀)"""
+        if not self.isVisible():
+            return
+        snapshot = self.stats.snapshot()
+        commands = snapshot["commands"]
+        self.table.setRowCount(len(commands))
+        for row, (kind, entry) in enumerate(commands.items()):
+            latency = entry["latency"]
+            values = [
+                kind,
+                str(entry["count"]),
+                str(entry["errors"]),
+                str(entry["timeouts"]),
+                f"{latency['p50_ms']:.2f}",
+                f"{latency['p99_ms']:.2f}",
+                f"{latency['max_ms']:.2f}",
+                format_bytes(entry["tx_bytes"]),
+                format_bytes(entry["rx_bytes"]),
+            ]
+            for column, value in enumerate(values):
+                item = self.table.item(row, column)
+                if item is None:
+                    item = QTableWidgetItem()
+                    item.setTextAlignment(Qt.AlignCenter)
+                    self.table.setItem(row, column, item)
+                if item.text() != value:
+                    item.setText(value)
+        self.summary_label.setText(
+            f"TX {format_bytes(snapshot['tx_bytes'])} | RX {format_bytes(snapshot['rx_bytes'])} | "
+            f"시간초과 {snapshot['timeouts']} | 연결 {snapshot['connects']} "
+            f"(재연결 {snapshot['reconnects']}, 실패 {snapshot['connect_failures']}) | "
+            f"해제 {snapshot['disconnects']}")
+
+    def _on_reset(self) -> None:
+        self.stats.reset()
+        self.table.setRowCount(0)
+        self.refresh()
@@ -0,0 +1,192 @@
+"""
+통신 저널 조회 화면 모듈
+
+TrafficJournal에 기록된 TX/RX 이력을 기간/명령/장비로 조회합니다.
+결과는 페이지 단위(fetchMore)로 읽어 오므로 기간이 길어도 첫 화면이 바로 표시됩니다.
+"""
+
+import datetime
+from typing import List, Optional
+
+from PyQt5.QtCore import QAbstractTableModel, QDateTime, QModelIndex, Qt
+from PyQt5.QtGui import QColor
+from PyQt5.QtWidgets import (
+    QAbstractItemView, QComboBox, QDateTimeEdit, QHBoxLayout, QHeaderView, QLabel,
+    QLineEdit, QPushButton, QTableView, QVBoxLayout, QWidget
+)
+
+from utils.native_protocol import STATUS_SUCCESS, status_message
+from utils.traffic_journal import TrafficJournal, TrafficRow
+
+# 한 번에 읽어 오는 행 수
+PAGE_SIZE = 2000
+
+HEADERS = ["시각", "장비", "명령", "상태", "응답(ms)", "응답 원문"]
+
+_FAIL_COLOR = QColor("#e74c3c")
+
+
+class TrafficQueryModel(QAbstractTableModel):
+    """
+    저널 조회 결과를 페이지 단위로 읽어 표시하는 모델
+    """
+
+    def __init__(self, journal: Optional[TrafficJournal] = None, parent=None):
+        super().__init__(parent)
+        self.journal = journal
+        self._rows: List[TrafficRow] = []
+        self._filter = (None, None, "", "")
+        self._exhausted = True
+
+    def set_query(self, start: Optional[float], end: Optional[float],
+                  command: str = "", host: str = "") -> None:
+        """조회 조건을 바꾸고 첫 페이지를 읽습니다."""
+        self.beginResetModel()
+        self._filter = (start, end, command, host)
+        self._rows = []
+        self._exhausted = self.journal is None
+        self.endResetModel()
+        if self.canFetchMore():
+            self.fetchMore()
+
+    # --- QAbstractTableModel 인터페이스 ---
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(HEADERS)
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        return not parent.isValid() and not self._exhausted
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        after_id = self._rows[-1][0] if self._rows else 0
+        rows = self.journal.query(*self._filter, after_id=after_id, limit=PAGE_SIZE)
+        self._exhausted = len(rows) < PAGE_SIZE
+        if not rows:
+            return
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        _, ts, _, host, command, status, latency_ms, raw = self._rows[index.row()]
+        col = index.column()
+        if role == Qt.DisplayRole:
+            if col == 0:
+                return datetime.datetime.fromtimestamp(ts).strftime("%Y-%m-%d %H:%M:%S.%f")[:-3]
+            if col == 1:
+                return host
+            if col == 2:
+                return command
+            if col == 3:
+                return "-" if status is None else str(status)
+            if col == 4:
+                return f"{latency_ms:.1f}"
+            if col == 5:
+                return raw.decode('utf-8', errors='replace').replace("\r\n", " | ").strip(" |")
+        elif role == Qt.ToolTipRole and col == 3:
+            return status_message(status)
+        elif role == Qt.ForegroundRole and col == 3 and status != STATUS_SUCCESS:
+            return _FAIL_COLOR
+        elif role == Qt.TextAlignmentRole and col in (3, 4):
+            return int(Qt.AlignRight | Qt.AlignVCenter)
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return HEADERS[section]
+        return None
+
+
+class TrafficJournalPanel(QWidget):
+    """
+    로그 탭의 통신 이력 조회 패널
+    """
+
+    def __init__(self, journal: Optional[TrafficJournal] = None, parent=None):
+        super().__init__(parent)
+        self.journal = journal
+
+        main_layout = QVBoxLayout()
+        filter_layout = QHBoxLayout()
+        now = QDateTime.currentDateTime()
+        self.start_edit = QDateTimeEdit(now.addDays(-1))
+        self.end_edit = QDateTimeEdit(now.addSecs(60))
+        for edit in (self.start_edit, self.end_edit):
+            edit.setDisplayFormat("yyyy-MM-dd HH:mm:ss")
+            edit.setCalendarPopup(True)
+        self.command_combo = QComboBox()
+        self.command_combo.setEditable(True)
+        self.command_combo.setMinimumWidth(180)
+        self.command_combo.lineEdit().setPlaceholderText("명령 (비우면 전체)")
+        self.host_edit = QLineEdit()
+        self.host_edit.setPlaceholderText("장비 (host:port)")
+        self.query_btn = QPushButton("조회")
+        self.week_btn = QPushButton("최근 7일")
+
+        filter_layout.addWidget(QLabel("기간"))
+        filter_layout.addWidget(self.start_edit)
+        filter_layout.addWidget(QLabel("~"))
+        filter_layout.addWidget(self.end_edit)
+        filter_layout.addWidget(self.command_combo)
+        filter_layout.addWidget(self.host_edit)
+        filter_layout.addWidget(self.week_btn)
+        filter_layout.addWidget(self.query_btn)
+        main_layout.addLayout(filter_layout)
+
+        self.summary_label = QLabel("")
+        main_layout.addWidget(self.summary_label)
+
+        self.model = TrafficQueryModel(journal, self)
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.setSelectionBehavior(QAbstractItemView.SelectRows)
+        self.table.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        header = self.table.horizontalHeader()
+        header.setSectionResizeMode(QHeaderView.Interactive)
+        header.setStretchLastSection(True)
+        for col, width in enumerate((180, 150, 200, 60, 80)):
+            self.table.setColumnWidth(col, width)
+        main_layout.addWidget(self.table)
+        self.setLayout(main_layout)
+
+        self.query_btn.clicked.connect(self.run_query)
+        self.week_btn.clicked.connect(self._on_last_week)
+        self.command_combo.lineEdit().returnPressed.connect(self.run_query)
+        self.host_edit.returnPressed.connect(self.run_query)
+
+    def _on_last_week(self) -> None:
+        now = QDateTime.currentDateTime()
+        self.start_edit.setDateTime(now.addDays(-7))
+        self.end_edit.setDateTime(now.addSecs(60))
+        self.run_query()
+
+    def run_query(self) -> None:
+        """현재 조건으로 저널을 조회합니다."""
+        if self.journal is None:
+            self.summary_label.setText("통신 저널이 설정되지 않았습니다.")
+            return
+        start = self.start_edit.dateTime().toMSecsSinceEpoch() / 1000.0
+        end = self.end_edit.dateTime().toMSecsSinceEpoch() / 1000.0
+        command = self.command_combo.currentText().strip()
+        host = self.host_edit.text().strip()
+        count, average, maximum = self.journal.latency_summary(start, end, command, host)
+        self.summary_label.setText(f"{count:,}건  |  평균 응답 {average:.1f} ms  |  최대 {maximum:.1f} ms")
+        self.model.set_query(start, end, command, host)
+        self._refresh_commands(command)
+
+    def _refresh_commands(self, current: str) -> None:
+        """명령 목록 콤보박스를 저널 기록으로 갱신합니다."""
+        self.command_combo.blockSignals(True)
+        self.command_combo.clear()
+        self.command_combo.addItem("")
+        self.command_combo.addItems(self.journal.commands())
+        self.command_combo.setEditText(current)
+        self.command_combo.blockSignals(False)
@@ -0,0 +1,255 @@
+"""
+트리거 반복 시험 패널 모듈
+
+설정 탭의 Telnet 연결로 소프트웨어 트리거를 반복하며(작업자 스레드),
+달성 속도, 누락 트리거, 사이클 타임 분포를 실시간 차트와 함께 표시합니다.
+"""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import List, Optional, Tuple
+
+from PyQt5.QtWidgets import (
+    QWidget, QGroupBox, QVBoxLayout, QHBoxLayout, QGridLayout, QLabel, QPushButton, QLineEdit,
+    QDoubleSpinBox, QSpinBox, QMessageBox
+)
+from PyQt5.QtCore import Qt, QTimer, QPointF, QRectF
+from PyQt5.QtGui import QPainter, QPen, QColor, QPolygonF
+
+from utils.config import ConfigManager
+from utils.trigger_loop import (
+    TriggerLoopOptions, TriggerLoopStats, append_result, parse_commands, run_trigger_loop
+)
+
+# 화면 갱신 주기(ms)
+REFRESH_INTERVAL_MS = 200
+# 차트에 그릴 최근 사이클 수
+CHART_POINTS = 500
+
+COLOR_CYCLE = QColor("#1976d2")
+COLOR_REJECTED = QColor("#e53935")
+COLOR_TARGET = QColor("#ff9800")
+COLOR_GRID = QColor("#e0e0e0")
+
+
+class CycleTimeChart(QWidget):
+    """
+    최근 사이클 타임 추이 (파란 선), 거부된 트리거 (빨간 점), 목표 주기 (주황 점선)
+    """
+
+    MARGIN_LEFT = 50
+    MARGIN = 10
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setMinimumHeight(220)
+        self.points: List[Tuple[float, float, bool]] = []
+        self.target_ms = 0.0
+
+    def set_data(self, points: List[Tuple[float, float, bool]], target_ms: float) -> None:
+        self.points = points[-CHART_POINTS:]
+        self.target_ms = target_ms
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.fillRect(self.rect(), Qt.white)
+        plot = QRectF(self.MARGIN_LEFT, self.MARGIN, self.width() - self.MARGIN_LEFT - self.MARGIN,
+                      self.height() - 2 * self.MARGIN - 15)
+        if plot.width() <= 0 or plot.height() <= 0:
+            return
+
+        values = [cycle_ms for _, cycle_ms, _ in self.points]
+        top = max(values + [self.target_ms, 1.0]) * 1.1
+
+        # 눈금 (y: 0 ~ top ms)
+        grid_pen = QPen(COLOR_GRID, 1)
+        for step in range(5):
+            y = plot.bottom() - plot.height() * step / 4
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(Qt.darkGray)
+            painter.drawText(QRectF(0, y - 8, self.MARGIN_LEFT - 5, 16), Qt.AlignRight | Qt.AlignVCenter,
+                             f"{top * step / 4:.1f}")
+        painter.drawText(QRectF(plot.left(), plot.bottom() + 2, plot.width(), 15), Qt.AlignLeft,
+                         f"사이클 타임 (ms), 최근 {len(self.points)}회")
+
+        if self.target_ms > 0:
+            y = plot.bottom() - plot.height() * self.target_ms / top
+            painter.setPen(QPen(COLOR_TARGET, 1.5, Qt.DashLine))
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+
+        if len(self.points) < 2:
+            return
+        x_step = plot.width() / (len(self.points) - 1)
+        polygon = QPolygonF()
+        rejected = []
+        for index, (_, cycle_ms, triggered) in enumerate(self.points):
+            point = QPointF(plot.left() + index * x_step, plot.bottom() - plot.height() * cycle_ms / top)
+            polygon.append(point)
+            if not triggered:
+                rejected.append(point)
+        painter.setPen(QPen(COLOR_CYCLE, 1.2))
+        painter.drawPolyline(polygon)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(COLOR_REJECTED)
+        for point in rejected:
+            painter.drawEllipse(point, 3, 3)
+
+
+class TriggerLoopPanel(QGroupBox):
+    """
+    트리거 반복 시험 (목표 속도 또는 최대 속도로 SW8 + 결과 읽기)
+    """
+
+    def __init__(self, telnet_worker=None, parent=None):
+        super().__init__("트리거 반복 시험", parent)
+        self.telnet_worker = telnet_worker
+        self.stats = TriggerLoopStats()
+        self.options = TriggerLoopOptions.from_config(ConfigManager())
+        self._stop: Optional[threading.Event] = None
+        self._future: Optional[Future] = None
+        self.setup_ui()
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.refresh)
+
+    def setup_ui(self):
+        layout = QVBoxLayout(self)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("목표 속도"))
+        self.rate_spin = QDoubleSpinBox()
+        self.rate_spin.setRange(0, 1000)
+        self.rate_spin.setDecimals(1)
+        self.rate_spin.setSuffix(" Hz")
+        self.rate_spin.setSpecialValueText("최대")
+        self.rate_spin.setValue(self.options.rate)
+        controls.addWidget(self.rate_spin)
+        controls.addWidget(QLabel("시험 시간"))
+        self.duration_spin = QSpinBox()
+        self.duration_spin.setRange(0, 86400)
+        self.duration_spin.setSuffix(" 초")
+        self.duration_spin.setSpecialValueText("계속")
+        controls.addWidget(self.duration_spin)
+        controls.addWidget(QLabel("결과 명령"))
+        self.commands_edit = QLineEdit(", ".join(self.options.result_commands))
+        self.commands_edit.setPlaceholderText("예: GET Vision.Result, GVA003")
+        controls.addWidget(self.commands_edit, 1)
+        self.start_button = QPushButton("시작")
+        self.start_button.setFixedWidth(80)
+        controls.addWidget(self.start_button)
+        layout.addLayout(controls)
+
+        self.chart = CycleTimeChart()
+        layout.addWidget(self.chart, 1)
+
+        # 요약 값
+        grid = QGridLayout()
+        self.value_labels = {}
+        fields = [("rate", "달성 속도"), ("recent_rate", "최근 1초"), ("accepted", "트리거"),
+                  ("dropped", "누락 (거부/지연)"), ("read_errors", "읽기 오류"),
+                  ("p50", "사이클 p50"), ("p90", "p90"), ("p99", "p99"), ("max", "최대")]
+        for index, (key, title) in enumerate(fields):
+            label = QLabel("-")
+            label.setStyleSheet("font-weight: bold;")
+            grid.addWidget(QLabel(title), index // 5 * 2, index % 5)
+            grid.addWidget(label, index // 5 * 2 + 1, index % 5)
+            self.value_labels[key] = label
+        layout.addLayout(grid)
+        self.values_label = QLabel("")
+        self.values_label.setWordWrap(True)
+        layout.addWidget(self.values_label)
+
+        self.start_button.clicked.connect(self.toggle)
+
+    def set_telnet_worker(self, telnet_worker) -> None:
+        self.telnet_worker = telnet_worker
+
+    @property
+    def running(self) -> bool:
+        return self._stop is not None
+
+    def toggle(self):
+        """시험을 시작합니다. (실행 중이면 중지)"""
+        if self.running:
+            self._stop.set()
+            self.start_button.setEnabled(False)
+            return
+        worker = self.telnet_worker
+        if worker is None or not worker.telnet.connected:
+            QMessageBox.warning(self, "연결 오류", "Telnet 연결이 필요합니다.")
+            return
+        self.options.rate = self.rate_spin.value()
+        self.options.duration = float(self.duration_spin.value())
+        self.options.result_commands = parse_commands(self.commands_edit.text())
+        self._stop = threading.Event()
+        self._set_running(True)
+        # 시험 동안 작업자 스레드를 점유하므로 다른 요청은 종료 후 실행됨
+        self._future = worker.submit(run_trigger_loop, worker.telnet, self.options, self.stats, self._stop,
+                                     callback=self._on_finished)
+        self.timer.start(REFRESH_INTERVAL_MS)
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """
+        실행 중인 시험을 중지하고 끝날 때까지 기다린 뒤 결과를 남깁니다. (창 종료 시)
+
+        이벤트 루프가 끝난 뒤에는 완료 콜백이 호출되지 않으므로 여기서 직접 처리합니다.
+        """
+        future = self._future
+        if self._stop is None or future is None:
+            return
+        self._stop.set()
+        try:
+            future.result(timeout)
+        except Exception as e:
+            logging.warning(f"[TriggerLoop] 종료 대기 중 오류: {e}")
+        self._on_finished(future)
+
+    def _on_finished(self, future: Future):
+        if future is not self._future:
+            # stop()에서 이미 처리한 시험
+            return
+        self._future = None
+        self.timer.stop()
+        self._stop = None
+        self._set_running(False)
+        self.refresh()
+        error = future.exception() if future.done() else TimeoutError("종료 대기 시간 초과")
+        if error is not None:
+            self.values_label.setText(f"시험 중단: {error}")
+            return
+        telnet = self.telnet_worker.telnet
+        append_result(self.stats, self.options, f"{telnet.host}:{telnet.port}")
+
+    def _set_running(self, running: bool):
+        self.start_button.setText("중지" if running else "시작")
+        self.start_button.setEnabled(True)
+        for widget in (self.rate_spin, self.duration_spin, self.commands_edit):
+            widget.setEnabled(not running)
+
+    def refresh(self):
+        """통계를 다시 읽어 차트와 요약을 갱신합니다."""
+        snapshot = self.stats.snapshot()
+        cycle = snapshot["cycle"]
+        target_rate = snapshot["target_rate"]
+        self.chart.set_data(snapshot["history"], 1000.0 / target_rate if target_rate else 0.0)
+        values = {
+            "rate": f"{snapshot['rate']:.1f} Hz",
+            "recent_rate": f"{snapshot['recent_rate']:.1f} Hz" if self.running else "-",
+            "accepted": str(snapshot["accepted"]),
+            "dropped": f"{snapshot['dropped']} ({snapshot['rejected']}/{snapshot['late']})",
+            "read_errors": str(snapshot["read_errors"]),
+            "p50": f"{cycle['p50_ms']:.2f} ms",
+            "p90": f"{cycle['p90_ms']:.2f} ms",
+            "p99": f"{cycle['p99_ms']:.2f} ms",
+            "max": f"{cycle['max_ms']:.2f} ms",
+        }
+        for key, text in values.items():
+            self.value_labels[key].setText(text)
+        parts = [f"{command} = {value}" for command, value in snapshot["last_values"].items()]
+        if snapshot["last_error"]:
+            parts.append(f"마지막 거부: {snapshot['last_error']}")
+        self.values_label.setText(" | ".join(parts))
@@ -0,0 +1,248 @@
+"""
+asyncio 기반 In-Sight Native Mode 클라이언트 모듈
+
+하나의 이벤트 루프에서 여러 카메라 세션을 동시에 구동하기 위한
+비동기 클라이언트입니다. 응답 파싱은 TelnetManager와 같은
+NativeFrameReader를 사용합니다.
+"""
+
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Optional
+
+from utils.native_protocol import LoginSession, NativeFrameReader, NativeReply
+from utils.telnet_manager import enable_keepalive
+
+# 한 번의 read 호출로 읽을 최대 바이트 수
+RECV_SIZE = 4096
+
+
+class AsyncTelnetClient:
+    """
+    단일 In-Sight 장비에 대한 비동기 Native Mode 세션
+    """
+
+    def __init__(self, host: str, port: int = 23):
+        self.host = host
+        self.port = port
+        self.connected = False
+        self._stream_reader: Optional[asyncio.StreamReader] = None
+        self._stream_writer: Optional[asyncio.StreamWriter] = None
+        self._reader = NativeFrameReader()
+        self._lock: Optional[asyncio.Lock] = None
+        self._login: Optional[LoginSession] = None
+        self.last_login_error = ""
+
+    @property
+    def key(self) -> str:
+        """세션 식별 키 (host:port)"""
+        return f"{self.host}:{self.port}"
+
+    async def connect(self, timeout: float = 5.0) -> str:
+        """
+        장비에 연결하고 초기 Welcome~User: 메시지를 수신합니다.
+
+        Args:
+            timeout (float): 연결 및 초기 메시지 수신 제한 시간(초)
+
+        Returns:
+            str: 수신한 초기 메시지
+        """
+        deadline = time.monotonic() + timeout
+        self._stream_reader, self._stream_writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), timeout)
+        sock = self._stream_writer.get_extra_info("socket")
+        if sock is not None:
+            enable_keepalive(sock)
+        self._lock = asyncio.Lock()
+        self._reader.clear()
+        self.connected = True
+        logging.info(f"[AsyncTelnet] 연결 성공: {self.key}")
+        self._login = LoginSession()
+        await self._run_login(deadline, banner_only=True)
+        if self._login.finished:
+            logging.warning(f"[AsyncTelnet] 초기 메시지 수신 실패: {self.key} ({self._login.error})")
+            return self._login.take_remaining().decode('utf-8', errors='replace')
+        return self._login.banner
+
+    async def login(self, username: str = "admin", password: str = "", timeout: float = 4.0) -> bool:
+        """
+        User:/Password: 프롬프트에 따라 로그인합니다.
+
+        Args:
+            username (str): 사용자명
+            password (str): 패스워드
+            timeout (float): 전체 로그인 제한 시간(초)
+
+        Returns:
+            bool: 로그인 성공 여부
+        """
+        if not self.connected:
+            raise ConnectionError(f"연결되지 않음: {self.key}")
+        deadline = time.monotonic() + timeout
+        self.last_login_error = ""
+        async with self._lock:
+            if self._login is None or self._login.finished:
+                # 배너를 이미 처리한 연결이면 사용자명을 바로 보냄
+                self._login = LoginSession(banner_received=True)
+            out = self._login.start(username, password)
+            if out:
+                await self._send_bytes(out)
+            await self._run_login(deadline)
+        if not self._login.logged_in:
+            self.last_login_error = self._login.error
+            logging.error(f"[AsyncTelnet] 로그인 실패: {self.key} ({self.last_login_error})")
+            return False
+        logging.info(f"[AsyncTelnet] 로그인 성공: {self.key}")
+        return True
+
+    async def send_command(self, command: str, timeout: float = 2.0,
+                           payload_lines: Optional[int] = None) -> NativeReply:
+        """
+        명령어를 송신하고 응답 프레임이 완성되면 반환합니다.
+
+        Args:
+            command (str): 송신할 명령어
+            timeout (float): 응답 프레임 완성까지의 제한 시간(초)
+            payload_lines (Optional[int]): 페이로드 줄 수 (None이면 명령으로 판단)
+
+        Returns:
+            NativeReply: 응답 프레임 (시간 초과 시 complete=False)
+        """
+        if not self.connected:
+            raise ConnectionError(f"연결되지 않음: {self.key}")
+        async with self._lock:
+            await self._discard_stale()
+            await self._write(command)
+            deadline = time.monotonic() + timeout
+            while True:
+                reply = self._reader.read_frame(command, payload_lines)
+                if reply is not None:
+                    return reply
+                if not await self._fill(deadline):
+                    logging.warning(f"[AsyncTelnet] 응답 시간 초과: {self.key} {command}")
+                    return self._reader.take_partial(command)
+
+    async def close(self) -> None:
+        """연결을 해제합니다."""
+        self.connected = False
+        if self._stream_writer is not None:
+            try:
+                self._stream_writer.close()
+                await self._stream_writer.wait_closed()
+            except Exception as e:
+                logging.error(f"[AsyncTelnet] 연결 해제 중 오류: {e}")
+            self._stream_writer = None
+            self._stream_reader = None
+            logging.info(f"[AsyncTelnet] 연결 해제: {self.key}")
+
+    async def _write(self, line: str) -> None:
+        """한 줄을 송신합니다."""
+        await self._send_bytes((line + "\r\n").encode('utf-8'))
+
+    async def _send_bytes(self, data: bytes) -> None:
+        self._stream_writer.write(data)
+        await self._stream_writer.drain()
+
+    async def _run_login(self, deadline: float, banner_only: bool = False) -> None:
+        """
+        로그인 상태 기계를 진행합니다. banner_only면 User: 프롬프트까지만 수신합니다.
+        (결과는 self._login 상태로 확인)
+        """
+        session = self._login
+        while not session.finished:
+            if banner_only and session.banner:
+                return
+            try:
+                received = await self._fill(deadline)
+            except ConnectionError as e:
+                session.fail(str(e))
+                return
+            if not received:
+                session.fail(f"{session.waiting_for} 대기 시간 초과")
+                return
+            out = session.feed(self._reader.take_all())
+            if out:
+                await self._send_bytes(out)
+        if session.logged_in:
+            session.take_remaining()
+
+    async def _discard_stale(self) -> None:
+        """
+        이전 명령의 늦은 응답 등 이미 도착해 대기 중인 데이터를 버린다.
+        """
+        self._reader.clear()
+        while True:
+            # 이벤트 루프를 한 번 돌려 도착한 데이터만 읽음 (기다리지 않음)
+            pending = asyncio.ensure_future(self._stream_reader.read(RECV_SIZE))
+            await asyncio.sleep(0)
+            if not pending.done():
+                pending.cancel()
+                try:
+                    await pending
+                except asyncio.CancelledError:
+                    pass
+                return
+            data = pending.result()
+            if not data:
+                self.connected = False
+                raise ConnectionError(f"원격 장비가 연결을 종료했습니다: {self.key}")
+            logging.debug(f"[AsyncTelnet] 이전 수신 데이터 폐기: {self.key} {data!r}")
+
+    async def _fill(self, deadline: float) -> bool:
+        """
+        deadline까지 한 번 수신하여 리더에 추가합니다.
+
+        Returns:
+            bool: 데이터를 수신했으면 True, 시간 초과면 False
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return False
+        try:
+            data = await asyncio.wait_for(self._stream_reader.read(RECV_SIZE), remaining)
+        except asyncio.TimeoutError:
+            return False
+        if not data:
+            self.connected = False
+            raise ConnectionError(f"원격 장비가 연결을 종료했습니다: {self.key}")
+        self._reader.feed(data)
+        return True
+
+
+class EventLoopThread:
+    """
+    asyncio 이벤트 루프를 전용 스레드에서 실행하는 브리지
+
+    Qt GUI 스레드 등 다른 스레드에서 코루틴을 제출하고
+    concurrent.futures.Future로 결과를 받습니다.
+    """
+
+    def __init__(self, name: str = "AsyncTelnetLoop"):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self.loop)
+        self.loop.run_forever()
+
+    def run(self, coro: Awaitable) -> Future:
+        """
+        코루틴을 루프 스레드에서 실행하도록 제출합니다.
+
+        Args:
+            coro (Awaitable): 실행할 코루틴
+
+        Returns:
+            Future: 코루틴 결과
+        """
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """루프를 멈추고 스레드를 종료합니다."""
+        self.loop.call_soon_threadsafe(self.loop.stop)
+        self._thread.join(timeout)
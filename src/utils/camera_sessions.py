@@ -0,0 +1,311 @@
+"""
+다중 카메라 세션 관리 모듈
+
+host:port로 식별되는 카메라별 로그인 세션을 유지하고,
+여러 카메라에 같은 작업을 병렬로 실행(fan-out)하여
+카메라별 결과를 돌려줍니다.
+
+라인 전체 JOB 배포(deploy_jobs)는 카메라별 JOB 매핑을 받아 각 카메라에서
+전환 절차(utils.changeover)를 동시에 실행하므로, 전체 소요 시간은 카메라 수의
+합이 아니라 가장 느린 카메라의 전환 시간에 가깝습니다.
+
+설정 (config/config.ini):
+
+    [job]
+    deploy_parallel = 16
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Future
+from typing import Awaitable, Callable, Dict, Iterable, List, Optional
+
+from utils.async_telnet_client import AsyncTelnetClient, EventLoopThread
+from utils.changeover import ChangeoverOptions, ChangeoverReport, run_changeover_async
+from utils.config import ConfigManager
+from utils.native_protocol import NativeReply, status_message
+
+# 동시에 작업을 실행할 최대 카메라 수 기본값
+DEFAULT_MAX_PARALLEL = 16
+
+# 카메라 세션 하나에 대해 실행할 비동기 작업
+SessionTask = Callable[[AsyncTelnetClient], Awaitable]
+# 배포 진행 콜백: (세션 키, 단계 이름) (이벤트 루프 스레드에서 호출)
+DeployProgressCallback = Callable[[str, str], None]
+
+# 배포 단계: 전환 절차 앞의 연결/로그인
+PHASE_CONNECT = "연결"
+
+
+def make_key(host: str, port: int = 23) -> str:
+    """세션 식별 키(host:port)를 만듭니다."""
+    return f"{host}:{port}"
+
+
+class DeviceResult:
+    """
+    fan-out 작업의 카메라별 결과
+    """
+    __slots__ = ("key", "ok", "value", "error", "elapsed")
+
+    def __init__(self, key: str, ok: bool, value=None, error: str = "", elapsed: float = 0.0):
+        self.key = key
+        self.ok = ok
+        self.value = value
+        self.error = error
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return (f"DeviceResult({self.key!r}, ok={self.ok}, value={self.value!r}, "
+                f"error={self.error!r}, elapsed={self.elapsed:.3f})")
+
+
+class CameraSession:
+    """
+    카메라 한 대의 연결 정보와 로그인된 비동기 클라이언트
+    """
+
+    def __init__(self, host: str, port: int = 23, username: str = "admin", password: str = ""):
+        self.client = AsyncTelnetClient(host, port)
+        self.username = username
+        self.password = password
+        self.logged_in = False
+
+    @property
+    def key(self) -> str:
+        return self.client.key
+
+    async def ensure_ready(self, timeout: float = 5.0) -> None:
+        """
+        연결 및 로그인이 되어 있지 않으면 수행합니다.
+
+        Raises:
+            ConnectionError: 연결 또는 로그인 실패 시
+        """
+        if self.client.connected and self.logged_in:
+            return
+        self.logged_in = False
+        await self.client.connect(timeout)
+        if not await self.client.login(self.username, self.password, timeout):
+            await self.client.close()
+            raise ConnectionError(f"로그인 실패: {self.key} ({self.client.last_login_error})")
+        self.logged_in = True
+
+    async def close(self) -> None:
+        self.logged_in = False
+        await self.client.close()
+
+
+class CameraSessionManager:
+    """
+    카메라 세션 레지스트리 및 병렬 fan-out 실행기
+
+    모든 세션은 하나의 EventLoopThread 위에서 구동되며,
+    공개 메서드는 어느 스레드에서든 호출할 수 있고 Future를 반환합니다.
+    """
+
+    def __init__(self, loop_thread: Optional[EventLoopThread] = None,
+                 max_parallel: int = DEFAULT_MAX_PARALLEL):
+        self.loop_thread = loop_thread or EventLoopThread()
+        self.max_parallel = max_parallel
+        self._sessions: Dict[str, CameraSession] = {}
+
+    def add_camera(self, host: str, port: int = 23, username: str = "admin", password: str = "") -> str:
+        """
+        카메라를 레지스트리에 등록합니다. (연결은 첫 작업 시 수행)
+
+        Returns:
+            str: 세션 키(host:port)
+        """
+        key = make_key(host, port)
+        if key not in self._sessions:
+            self._sessions[key] = CameraSession(host, port, username, password)
+            logging.info(f"[CameraSessions] 카메라 등록: {key}")
+        return key
+
+    def remove_camera(self, key: str) -> Optional[Future]:
+        """카메라를 레지스트리에서 제거하고 연결을 해제합니다."""
+        session = self._sessions.pop(key, None)
+        if session is None:
+            return None
+        logging.info(f"[CameraSessions] 카메라 제거: {key}")
+        return self.loop_thread.run(session.close())
+
+    def load_from_config(self, config: ConfigManager) -> List[str]:
+        """
+        설정 파일의 [cameras] 섹션에서 카메라 목록을 등록합니다.
+
+            [cameras]
+            hosts = 192.168.0.111, 192.168.0.112:23
+            username = admin
+            password =
+
+        Returns:
+            List[str]: 등록된 세션 키 목록
+        """
+        hosts = config.get("cameras", "hosts", fallback="") or ""
+        username = config.get("cameras", "username", fallback="admin")
+        password = config.get("cameras", "password", fallback="")
+        keys = []
+        for entry in hosts.split(","):
+            entry = entry.strip()
+            if not entry:
+                continue
+            host, _, port = entry.partition(":")
+            try:
+                keys.append(self.add_camera(host, int(port or 23), username, password))
+            except ValueError:
+                logging.error(f"[CameraSessions] 잘못된 카메라 주소: {entry}")
+        return keys
+
+    def keys(self) -> List[str]:
+        """등록된 세션 키 목록을 반환합니다."""
+        return list(self._sessions.keys())
+
+    def session(self, key: str) -> Optional[CameraSession]:
+        """세션 키에 해당하는 세션을 반환합니다."""
+        return self._sessions.get(key)
+
+    def fan_out(self, task: SessionTask, keys: Optional[Iterable[str]] = None,
+                timeout: float = 10.0) -> Future:
+        """
+        여러 카메라에서 같은 작업을 병렬로 실행합니다.
+
+        Args:
+            task (SessionTask): 로그인된 클라이언트를 받아 실행할 코루틴 함수
+            keys (Optional[Iterable[str]]): 대상 세션 키 (None이면 전체)
+            timeout (float): 카메라별 작업 제한 시간(초)
+
+        Returns:
+            Future: Dict[str, DeviceResult] (세션 키별 결과)
+        """
+        targets = list(keys) if keys is not None else self.keys()
+        return self.loop_thread.run(self._fan_out({key: task for key in targets}, timeout))
+
+    async def _fan_out(self, tasks: Dict[str, SessionTask], timeout: float,
+                       max_parallel: Optional[int] = None,
+                       on_start: Optional[Callable[[str], None]] = None) -> Dict[str, DeviceResult]:
+        semaphore = asyncio.Semaphore(max_parallel or self.max_parallel)
+
+        async def run_one(key: str, task: SessionTask) -> DeviceResult:
+            session = self._sessions.get(key)
+            if session is None:
+                return DeviceResult(key, False, error="등록되지 않은 카메라")
+            async with semaphore:
+                start = time.monotonic()
+                if on_start is not None:
+                    on_start(key)
+                try:
+                    await session.ensure_ready()
+                    value = await asyncio.wait_for(task(session.client), timeout)
+                    if isinstance(value, NativeReply):
+                        ok, error = value.ok, "" if value.ok else status_message(value.status)
+                    elif isinstance(value, ChangeoverReport):
+                        ok, error = value.ok, value.error
+                    else:
+                        ok, error = True, ""
+                    return DeviceResult(key, ok, value, error, time.monotonic() - start)
+                except Exception as e:
+                    logging.error(f"[CameraSessions] {key} 작업 실패: {e}")
+                    # 응답 동기가 어긋났을 수 있으므로 다음 작업 시 다시 연결
+                    await session.close()
+                    return DeviceResult(key, False, error=str(e) or type(e).__name__,
+                                        elapsed=time.monotonic() - start)
+
+        results = await asyncio.gather(*(run_one(key, task) for key, task in tasks.items()))
+        return {result.key: result for result in results}
+
+    def connect_all(self, keys: Optional[Iterable[str]] = None) -> Future:
+        """모든(또는 지정한) 카메라에 연결 및 로그인합니다."""
+        async def noop(client: AsyncTelnetClient) -> bool:
+            return True
+        return self.fan_out(noop, keys)
+
+    def disconnect_all(self) -> Future:
+        """모든 카메라 연결을 해제합니다."""
+        async def close_all():
+            await asyncio.gather(*(session.close() for session in self._sessions.values()))
+        return self.loop_thread.run(close_all())
+
+    def send_all(self, command: str, keys: Optional[Iterable[str]] = None,
+                 timeout: float = 10.0) -> Future:
+        """
+        모든(또는 지정한) 카메라에 같은 명령을 병렬로 전송합니다.
+
+        Returns:
+            Future: Dict[str, DeviceResult] (value는 NativeReply)
+        """
+        async def send(client: AsyncTelnetClient) -> NativeReply:
+            return await client.send_command(command, timeout)
+        return self.fan_out(send, keys, timeout)
+
+    def load_job_all(self, job_file: str, keys: Optional[Iterable[str]] = None,
+                     timeout: float = 30.0) -> Future:
+        """
+        모든(또는 지정한) 카메라에 같은 JOB 파일을 로드(LF)합니다.
+
+        Returns:
+            Future: Dict[str, DeviceResult] (value는 LF 응답 NativeReply)
+        """
+        return self.send_all(f"LF{job_file}", keys, timeout)
+
+    def read_cells_all(self, commands: List[str], keys: Optional[Iterable[str]] = None,
+                       timeout: float = 10.0) -> Future:
+        """
+        모든(또는 지정한) 카메라에서 같은 읽기 명령들을 실행합니다.
+
+        Args:
+            commands (List[str]): 읽기 명령 목록 (예: ["GET Vision.Result", "GVA003"])
+
+        Returns:
+            Future: Dict[str, DeviceResult] (value는 명령별 NativeReply 사전)
+        """
+        async def read(client: AsyncTelnetClient) -> Dict[str, NativeReply]:
+            replies = {}
+            for command in commands:
+                replies[command] = await client.send_command(command, timeout)
+            return replies
+        return self.fan_out(read, keys, timeout)
+
+    def deploy_jobs(self, mapping: Dict[str, str], options: Optional[ChangeoverOptions] = None,
+                    progress: Optional[DeployProgressCallback] = None,
+                    max_parallel: Optional[int] = None) -> Future:
+        """
+        카메라별로 지정한 JOB 파일로 동시에 전환합니다.
+
+        카메라마다 전환 절차(오프라인 -> LF -> GF로 확인 -> 온라인)를 실행하며,
+        동시에 전환하는 카메라 수는 max_parallel(None이면 self.max_parallel)로 제한합니다.
+
+        Args:
+            mapping (Dict[str, str]): 세션 키 -> JOB 파일
+            progress (Optional[DeployProgressCallback]): 카메라별 단계 알림
+
+        Returns:
+            Future: Dict[str, DeviceResult] (value는 ChangeoverReport, 연결 실패 시 None)
+        """
+        options = options or ChangeoverOptions()
+        # 절차 전체 제한 시간: 단계별 제한 시간의 합 + 여유
+        timeout = (options.load_timeout + options.verify_timeout
+                   + 4 * options.command_timeout + 5.0)
+
+        def task_for(key: str, job_file: str) -> SessionTask:
+            def phase(name: str) -> None:
+                progress(key, name)
+            return lambda client: run_changeover_async(client, job_file, options,
+                                                       phase if progress else None)
+
+        def on_start(key: str) -> None:
+            progress(key, PHASE_CONNECT)
+
+        tasks = {key: task_for(key, job_file) for key, job_file in mapping.items()}
+        return self.loop_thread.run(self._fan_out(tasks, timeout, max_parallel,
+                                                  on_start if progress else None))
+
+    def shutdown(self) -> None:
+        """모든 연결을 해제하고 이벤트 루프를 종료합니다."""
+        try:
+            self.disconnect_all().result(timeout=2.0)
+        except Exception as e:
+            logging.error(f"[CameraSessions] 종료 중 오류: {e}")
+        self.loop_thread.stop()
@@ -0,0 +1,123 @@
+"""
+셀 주기 조회(폴링) 스케줄러 모듈
+
+항목별 조회 주기를 관리하고, 같은 시점에 조회할 항목을 하나의
+일괄 요청으로 묶어 줍니다. 장비 응답이 느려지면 전체 주기를
+늘리고(backoff), 다시 빨라지면 원래 주기로 되돌립니다.
+"""
+
+import time
+from typing import Dict, List, Optional
+
+# 기본 조회 주기(ms)
+DEFAULT_POLL_INTERVAL_MS = 1000
+# 최소 조회 주기(ms)
+MIN_POLL_INTERVAL_MS = 50
+
+
+class PollEntry:
+    """
+    폴링 대상 항목 하나
+    """
+    __slots__ = ("key", "command", "interval", "next_due", "last_value")
+
+    def __init__(self, key: str, command: str, interval: float, next_due: float):
+        self.key = key
+        self.command = command
+        self.interval = interval
+        self.next_due = next_due
+        self.last_value: Optional[str] = None
+
+
+class PollScheduler:
+    """
+    항목별 주기에 따라 조회 시점을 결정하는 스케줄러
+
+    due()로 받은 항목을 한 번에 조회한 뒤 complete()로 소요 시간을
+    알려주면, 응답 시간이 가장 짧은 주기의 slow_ratio를 넘을 때마다
+    backoff 배율을 높여 장비 부하를 줄입니다.
+    """
+
+    def __init__(self, backoff_factor: float = 2.0, max_backoff: float = 8.0,
+                 slow_ratio: float = 0.5):
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.slow_ratio = slow_ratio
+        self.backoff = 1.0
+        self._entries: Dict[str, PollEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def add(self, key: str, command: str, interval_ms: int = DEFAULT_POLL_INTERVAL_MS) -> None:
+        """
+        폴링 항목을 등록합니다. (이미 있으면 명령과 주기를 갱신)
+
+        Args:
+            key (str): 항목 식별 키 (예: Cell 주소)
+            command (str): 조회 명령 (예: "GET Vision.Status")
+            interval_ms (int): 조회 주기(ms)
+        """
+        interval = max(interval_ms, MIN_POLL_INTERVAL_MS) / 1000.0
+        self._entries[key] = PollEntry(key, command, interval, time.monotonic())
+
+    def remove(self, key: str) -> None:
+        """폴링 항목을 제거합니다."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """모든 폴링 항목을 제거합니다."""
+        self._entries.clear()
+        self.backoff = 1.0
+
+    def entry(self, key: str) -> Optional[PollEntry]:
+        """키에 해당하는 폴링 항목을 반환합니다."""
+        return self._entries.get(key)
+
+    def due(self, now: Optional[float] = None) -> List[PollEntry]:
+        """
+        지금 조회할 항목 목록을 반환합니다.
+
+        Args:
+            now (Optional[float]): 기준 시각 (time.monotonic, None이면 현재)
+
+        Returns:
+            List[PollEntry]: 조회 시점이 된 항목 (하나의 일괄 요청으로 보냄)
+        """
+        if now is None:
+            now = time.monotonic()
+        return [entry for entry in self._entries.values() if entry.next_due <= now]
+
+    def complete(self, entries: List[PollEntry], elapsed: float, now: Optional[float] = None) -> None:
+        """
+        일괄 조회 완료를 알리고 다음 조회 시점과 backoff를 갱신합니다.
+
+        Args:
+            entries (List[PollEntry]): due()로 받아 조회한 항목
+            elapsed (float): 일괄 조회 소요 시간(초)
+            now (Optional[float]): 완료 시각 (time.monotonic, None이면 현재)
+        """
+        if now is None:
+            now = time.monotonic()
+        if entries:
+            fastest = min(entry.interval for entry in entries)
+            if elapsed > fastest * self.slow_ratio:
+                self.backoff = min(self.backoff * self.backoff_factor, self.max_backoff)
+            else:
+                self.backoff = max(1.0, self.backoff / self.backoff_factor)
+        for entry in entries:
+            entry.next_due = now + entry.interval * self.backoff
+
+    def update_value(self, key: str, value: str) -> bool:
+        """
+        조회 값을 기록하고 이전 값과 달라졌는지 반환합니다.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return False
+        changed = entry.last_value != value
+        entry.last_value = value
+        return changed
@@ -0,0 +1,296 @@
+"""
+JOB 전환(changeover) 절차 모듈
+
+    상태 확인(GO) -> 오프라인(SO0) -> JOB 로드(LF) -> 확인(GF 반복) -> 온라인(SO1)
+
+절차는 소켓과 무관한 제너레이터(changeover_steps)로 정의되어 있어,
+동기 클라이언트(run_changeover)와 비동기 클라이언트(run_changeover_async)가
+같은 절차를 공유합니다. 단계마다 시작 시각과 소요 시간을 기록하므로 버튼은
+카메라가 실제로 준비되는 즉시 풀리고, 카메라별 전환 시간 보고서를 남길 수 있습니다.
+
+전환 전에 온라인이었던 카메라는 로드가 실패해도 다시 온라인으로 되돌립니다.
+
+설정 (config/config.ini):
+
+    [job]
+    load_timeout = 60
+    verify_timeout = 10
+    poll_interval = 0.2
+"""
+
+import asyncio
+import json
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Callable, Dict, Generator, List, Optional, Union
+
+from utils.config import ConfigManager
+from utils.native_protocol import NativeReply, status_message
+
+# 단계 이름
+PHASE_CHECK = "상태 확인"
+PHASE_OFFLINE = "오프라인"
+PHASE_LOAD = "JOB 로드"
+PHASE_VERIFY = "로드 확인"
+PHASE_ONLINE = "온라인"
+
+# 전환 보고서 파일
+DEFAULT_REPORT_PATH = 'logs/changeover.jsonl'
+
+# 진행 콜백: 단계 이름을 받음 (드라이버가 실행되는 스레드에서 호출)
+ProgressCallback = Callable[[str], None]
+
+
+class ChangeoverOptions:
+    """
+    전환 절차 제한 시간 설정 (초)
+    """
+
+    def __init__(self, command_timeout: float = 2.0, load_timeout: float = 60.0,
+                 verify_timeout: float = 10.0, poll_interval: float = 0.2):
+        self.command_timeout = command_timeout  # SO0/SO1/GO/GF 응답 대기
+        self.load_timeout = load_timeout        # LF 응답 대기 (JOB 크기에 따라 다름)
+        self.verify_timeout = verify_timeout    # GF가 새 JOB을 보고할 때까지
+        self.poll_interval = poll_interval      # GF 재조회 간격
+
+    @classmethod
+    def from_config(cls, config: Optional[ConfigManager]) -> "ChangeoverOptions":
+        options = cls()
+        if config is None:
+            return options
+        for name in ("command_timeout", "load_timeout", "verify_timeout", "poll_interval"):
+            value = config.get("job", name, fallback=None)
+            if value:
+                try:
+                    setattr(options, name, float(value))
+                except ValueError:
+                    logging.warning(f"[Changeover] 잘못된 설정값: {name}={value}")
+        return options
+
+
+class Send:
+    """명령 송신 요청 (드라이버가 응답 NativeReply를 돌려줌)"""
+    __slots__ = ("command", "timeout")
+
+    def __init__(self, command: str, timeout: float):
+        self.command = command
+        self.timeout = timeout
+
+
+class Wait:
+    """대기 요청"""
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+
+class PhaseTiming:
+    """
+    단계 하나의 기록
+    """
+    __slots__ = ("name", "started", "elapsed_ms", "ok", "detail")
+
+    def __init__(self, name: str, started: float):
+        self.name = name
+        self.started = started      # epoch 초
+        self.elapsed_ms = 0.0
+        self.ok = False
+        self.detail = ""
+
+
+class ChangeoverReport:
+    """
+    카메라 한 대의 JOB 전환 결과와 단계별 소요 시간
+    """
+
+    def __init__(self, camera: str, job_file: str):
+        self.camera = camera
+        self.job_file = job_file
+        self.started = time.time()
+        self.phases: List[PhaseTiming] = []
+        self.ok = False
+        self.error = ""
+        self.was_online = False
+        self._phase_start = 0.0
+        self._phase_open = False
+        self._start = time.monotonic()
+        self.total_ms = 0.0
+
+    def begin(self, name: str, progress: Optional[ProgressCallback] = None) -> None:
+        self.phases.append(PhaseTiming(name, time.time()))
+        self._phase_start = time.monotonic()
+        self._phase_open = True
+        if progress is not None:
+            progress(name)
+
+    def end(self, ok: bool, detail: str = "") -> None:
+        phase = self.phases[-1]
+        phase.elapsed_ms = (time.monotonic() - self._phase_start) * 1000.0
+        phase.ok = ok
+        phase.detail = detail
+        self._phase_open = False
+
+    def finish(self, error: str = "") -> None:
+        """전환을 마칩니다. (error가 있으면 실패)"""
+        if error and not self.error:
+            self.error = error
+        self.ok = not self.error
+        self.total_ms = (time.monotonic() - self._start) * 1000.0
+
+    def abort(self, error: str) -> None:
+        """진행 중인 단계를 실패로 닫고 전환을 마칩니다. (통신 오류 등)"""
+        if self._phase_open:
+            self.end(False, error)
+        self.finish(error)
+
+    def phase_ms(self, name: str) -> float:
+        return sum(phase.elapsed_ms for phase in self.phases if phase.name == name)
+
+    def summary(self) -> str:
+        """한 줄 요약 (예: "합계 812 ms | 오프라인 3 ms | JOB 로드 790 ms | ...")"""
+        parts = [f"합계 {self.total_ms:.0f} ms"]
+        parts.extend(f"{phase.name} {phase.elapsed_ms:.0f} ms{'' if phase.ok else ' 실패'}"
+                     for phase in self.phases)
+        return " | ".join(parts)
+
+    def to_dict(self) -> Dict:
+        return {
+            "camera": self.camera,
+            "job_file": self.job_file,
+            "started": datetime.fromtimestamp(self.started).isoformat(timespec="milliseconds"),
+            "ok": self.ok,
+            "error": self.error,
+            "total_ms": round(self.total_ms, 1),
+            "phases": [
+                {"name": phase.name, "elapsed_ms": round(phase.elapsed_ms, 1), "ok": phase.ok,
+                 "detail": phase.detail}
+                for phase in self.phases
+            ],
+        }
+
+
+def append_report(report: ChangeoverReport, path: str = DEFAULT_REPORT_PATH) -> None:
+    """전환 보고서를 JSON Lines 파일에 덧붙입니다."""
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report.to_dict(), ensure_ascii=False) + "\n")
+    except OSError as e:
+        logging.error(f"[Changeover] 보고서 저장 실패: {e}")
+
+
+def _same_job(reported: str, job_file: str) -> bool:
+    """GF가 보고한 JOB이 job_file과 같은지 (경로, 대소문자 무시)"""
+    name = reported.replace('\\', '/').rsplit('/', 1)[-1]
+    return name.strip().lower() == job_file.replace('\\', '/').rsplit('/', 1)[-1].strip().lower()
+
+
+def _failure(reply: NativeReply) -> str:
+    if not reply.complete:
+        return "응답 시간 초과"
+    return f"{status_message(reply.status)} (코드 {reply.status})"
+
+
+def changeover_steps(job_file: str, report: ChangeoverReport, options: ChangeoverOptions,
+                     progress: Optional[ProgressCallback] = None
+                     ) -> Generator[Union[Send, Wait], Optional[NativeReply], None]:
+    """
+    JOB 전환 절차 (sans-IO)
+
+    Send를 내보내면 드라이버가 명령을 보내고 응답(NativeReply)을 send()로 돌려주며,
+    Wait를 내보내면 그만큼 기다린 뒤 None을 돌려줍니다. 결과는 report에 기록됩니다.
+    """
+    report.begin(PHASE_CHECK, progress)
+    reply = yield Send("GO", options.command_timeout)
+    report.was_online = reply.ok and reply.value.strip() == "1"
+    report.end(reply.ok, "온라인" if report.was_online else ("오프라인" if reply.ok else _failure(reply)))
+
+    error = ""
+    if report.was_online:
+        report.begin(PHASE_OFFLINE, progress)
+        reply = yield Send("SO0", options.command_timeout)
+        report.end(reply.ok, "" if reply.ok else _failure(reply))
+        if not reply.ok:
+            error = f"오프라인 전환 실패: {_failure(reply)}"
+
+    if not error:
+        report.begin(PHASE_LOAD, progress)
+        reply = yield Send(f"LF{job_file}", options.load_timeout)
+        report.end(reply.ok, "" if reply.ok else _failure(reply))
+        if not reply.ok:
+            error = f"JOB 로드 실패: {_failure(reply)}"
+
+    if not error:
+        report.begin(PHASE_VERIFY, progress)
+        deadline = time.monotonic() + options.verify_timeout
+        polls = 0
+        while True:
+            reply = yield Send("GF", options.command_timeout)
+            polls += 1
+            if reply.ok and _same_job(reply.value, job_file):
+                report.end(True, f"GF {polls}회")
+                break
+            if time.monotonic() >= deadline:
+                current = reply.value if reply.ok else _failure(reply)
+                report.end(False, f"GF {polls}회, 현재 JOB: {current}")
+                error = f"로드 확인 실패: 현재 JOB {current}"
+                break
+            yield Wait(options.poll_interval)
+
+    if report.was_online:
+        # 실패했더라도 전환 전 상태(온라인)로 복구
+        report.begin(PHASE_ONLINE, progress)
+        reply = yield Send("SO1", options.command_timeout)
+        report.end(reply.ok, "" if reply.ok else _failure(reply))
+        if not reply.ok and not error:
+            error = f"온라인 전환 실패: {_failure(reply)}"
+
+    report.finish(error)
+
+
+def run_changeover(telnet, job_file: str, options: Optional[ChangeoverOptions] = None,
+                   progress: Optional[ProgressCallback] = None) -> ChangeoverReport:
+    """
+    TelnetManager로 JOB 전환을 실행합니다. (작업자 스레드에서 호출)
+    """
+    report = ChangeoverReport(f"{telnet.host}:{telnet.port}", job_file)
+    steps = changeover_steps(job_file, report, options or ChangeoverOptions(), progress)
+    try:
+        request = next(steps)
+        while True:
+            if isinstance(request, Wait):
+                time.sleep(request.seconds)
+                request = steps.send(None)
+            else:
+                request = steps.send(telnet.send_native(request.command, timeout=request.timeout))
+    except StopIteration:
+        pass
+    except (ConnectionError, OSError) as e:
+        report.abort(f"통신 오류: {e}")
+    return report
+
+
+async def run_changeover_async(client, job_file: str, options: Optional[ChangeoverOptions] = None,
+                               progress: Optional[ProgressCallback] = None) -> ChangeoverReport:
+    """
+    AsyncTelnetClient로 JOB 전환을 실행합니다. (이벤트 루프에서 실행)
+    """
+    report = ChangeoverReport(client.key, job_file)
+    steps = changeover_steps(job_file, report, options or ChangeoverOptions(), progress)
+    try:
+        request = next(steps)
+        while True:
+            if isinstance(request, Wait):
+                await asyncio.sleep(request.seconds)
+                request = steps.send(None)
+            else:
+                reply = await client.send_command(request.command, timeout=request.timeout)
+                request = steps.send(reply)
+    except StopIteration:
+        pass
+    except (ConnectionError, OSError) as e:
+        report.abort(f"통신 오류: {e}")
+    return report
@@ -0,0 +1,164 @@
+"""
+Telnet 연결 감시 모듈
+
+TelnetWorker의 세션을 감시하여 끊김을 감지하면 지수 backoff로 재연결하고,
+저장된 로그인 정보로 다시 로그인합니다.
+
+끊김 감지:
+    - 송수신 중 소켓 오류/원격 종료 (TelnetManager가 즉시 알림)
+    - 유휴 상태에서 주기적인 하트비트(GO) 무응답 (반쯤 열린 연결)
+    - TCP keepalive (telnet_manager.enable_keepalive)
+
+끊긴 동안 큐에 들어온 요청은 소켓을 기다리지 않고 즉시 ConnectionError로 실패하며,
+재연결 후 폴링 등 주기 요청은 다음 주기부터 그대로 이어집니다.
+
+설정 (config/config.ini):
+
+    [telnet]
+    heartbeat_interval = 5
+    reconnect_initial_delay = 0.5
+    reconnect_max_delay = 8
+"""
+
+import logging
+import random
+import time
+from concurrent.futures import Future
+from typing import Optional
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+
+from utils.config import ConfigManager
+
+# 하트비트 주기(초): 이 시간 동안 수신이 없으면 하트비트 전송
+DEFAULT_HEARTBEAT_INTERVAL = 5.0
+# 재연결 대기 시간(초): 첫 시도, 최대값, 배율
+DEFAULT_RECONNECT_INITIAL_DELAY = 0.5
+DEFAULT_RECONNECT_MAX_DELAY = 8.0
+RECONNECT_BACKOFF_FACTOR = 2.0
+
+# 상태
+STATE_DISCONNECTED = "연결 안됨"
+STATE_CONNECTED = "연결됨"
+STATE_RECONNECTING = "재연결 중"
+
+
+class ConnectionSupervisor(QObject):
+    """
+    세션 감시 및 자동 재연결
+
+    session_established()로 감시를 시작하고, 사용자가 연결을 해제하면 stop()을 호출합니다.
+    connection_changed는 끊김/복구 전환마다 발생합니다.
+    """
+
+    connection_changed = pyqtSignal(bool)
+    # 상태 문자열과 설명 (예: "재연결 중", "재연결 실패 - 2.0초 후 3회째 시도")
+    state_changed = pyqtSignal(str, str)
+
+    def __init__(self, telnet_worker, config: Optional[ConfigManager] = None, parent=None):
+        super().__init__(parent)
+        self.telnet_worker = telnet_worker
+        self.heartbeat_interval = self._option(config, "heartbeat_interval", DEFAULT_HEARTBEAT_INTERVAL)
+        self.initial_delay = self._option(config, "reconnect_initial_delay", DEFAULT_RECONNECT_INITIAL_DELAY)
+        self.max_delay = self._option(config, "reconnect_max_delay", DEFAULT_RECONNECT_MAX_DELAY)
+        self.state = STATE_DISCONNECTED
+        self.attempts = 0           # 현재 끊김 이후 재연결 시도 횟수
+        self.lost_at = 0.0          # 끊김 감지 시각 (monotonic)
+        self.last_recovery = 0.0    # 마지막 복구에 걸린 시간(초)
+        self._delay = self.initial_delay
+        self._in_flight = False
+
+        self._heartbeat_timer = QTimer(self)
+        self._heartbeat_timer.timeout.connect(self._on_heartbeat_tick)
+        self._reconnect_timer = QTimer(self)
+        self._reconnect_timer.setSingleShot(True)
+        self._reconnect_timer.timeout.connect(self._attempt_reconnect)
+        telnet_worker.connection_lost.connect(self._on_connection_lost)
+
+    @staticmethod
+    def _option(config: Optional[ConfigManager], option: str, fallback: float) -> float:
+        if config is None:
+            return fallback
+        try:
+            return float(config.get("telnet", option, fallback=fallback) or fallback)
+        except ValueError:
+            logging.warning(f"[Supervisor] 잘못된 설정값: {option}")
+            return fallback
+
+    @property
+    def telnet(self):
+        return self.telnet_worker.telnet
+
+    # --- 외부 호출 ---
+
+    def session_established(self) -> None:
+        """수동 연결/로그인 성공 후 감시를 시작합니다."""
+        self._reconnect_timer.stop()
+        self._set_state(STATE_CONNECTED)
+        self._heartbeat_timer.start(int(self.heartbeat_interval * 1000))
+
+    def stop(self) -> None:
+        """사용자가 연결을 해제했을 때 감시와 재연결을 중지합니다."""
+        self._heartbeat_timer.stop()
+        self._reconnect_timer.stop()
+        self._set_state(STATE_DISCONNECTED)
+
+    # --- 하트비트 ---
+
+    def _on_heartbeat_tick(self) -> None:
+        telnet = self.telnet
+        # 대기 중인 요청이 있거나 최근에 수신이 있었으면 생략
+        if self._in_flight or self.telnet_worker.busy or not telnet.logged_in:
+            return
+        if time.monotonic() - telnet.last_rx < self.heartbeat_interval:
+            return
+        self._in_flight = True
+        self.telnet_worker.request("heartbeat", callback=self._on_heartbeat_done)
+
+    def _on_heartbeat_done(self, future: Future) -> None:
+        self._in_flight = False
+        # 실패는 TelnetManager가 connection_lost로 알리므로 여기서는 무시
+        if future.exception() is not None:
+            logging.debug(f"[Supervisor] 하트비트 실패: {future.exception()}")
+
+    # --- 재연결 ---
+
+    def _on_connection_lost(self, reason: str) -> None:
+        if self.state != STATE_CONNECTED:
+            return
+        self._heartbeat_timer.stop()
+        self.lost_at = time.monotonic()
+        self.attempts = 0
+        self._delay = self.initial_delay
+        logging.warning(f"[Supervisor] 연결 끊김 감지: {reason}")
+        self.connection_changed.emit(False)
+        self._schedule_reconnect(reason)
+
+    def _schedule_reconnect(self, detail: str) -> None:
+        # 여러 카메라/클라이언트가 동시에 재접속하지 않도록 ±20% 지터
+        delay = self._delay * random.uniform(0.8, 1.2)
+        self._set_state(STATE_RECONNECTING, f"{detail} - {delay:.1f}초 후 {self.attempts + 1}회째 시도")
+        self._reconnect_timer.start(int(delay * 1000))
+        self._delay = min(self._delay * RECONNECT_BACKOFF_FACTOR, self.max_delay)
+
+    def _attempt_reconnect(self) -> None:
+        if self.state != STATE_RECONNECTING:
+            return
+        self.attempts += 1
+        self.telnet_worker.request("resume_session", callback=self._on_reconnect_done)
+
+    def _on_reconnect_done(self, future: Future) -> None:
+        if self.state != STATE_RECONNECTING:
+            return
+        error = future.exception()
+        if error is None and future.result():
+            self.last_recovery = time.monotonic() - self.lost_at
+            logging.info(f"[Supervisor] 재연결 성공: {self.attempts}회 시도, {self.last_recovery:.1f}초")
+            self.session_established()
+            self.connection_changed.emit(True)
+            return
+        self._schedule_reconnect(f"재연결 실패{f' ({error})' if error else ''}")
+
+    def _set_state(self, state: str, detail: str = "") -> None:
+        self.state = state
+        self.state_changed.emit(state, detail)
@@ -0,0 +1,290 @@
+"""
+In-Sight Native Mode 시뮬레이터 모듈
+
+실제 카메라 없이 TelnetManager/AsyncTelnetClient의 파싱, 시간 초과, 로그인
+흐름을 시험하고 부하 테스트를 하기 위한 asyncio TCP 서버입니다.
+
+지원 동작:
+    - 접속 배너(Welcome to In-Sight), User:/Password: 로그인
+    - GF, LF<파일>, Get FileList, SO0/SO1, GO
+    - SI/SF/SS<셀> <값>, GV<셀>, GET <이름>, SW8(소프트웨어 트리거)
+    - 응답 지연/지터, 패킷 분할 송신, 다수 동시 세션
+
+    python run_insight_simulator.py --port 2323 --latency 5 --jitter 2 --fragment 3
+"""
+
+import asyncio
+import logging
+import random
+import re
+import threading
+from typing import Dict, List, Optional, Set
+
+from utils.native_protocol import (
+    STATUS_COMMAND_FAILED, STATUS_FILE_NOT_FOUND, STATUS_INVALID_PARAM, STATUS_NOT_OFFLINE, STATUS_SUCCESS,
+    STATUS_UNRECOGNIZED
+)
+
+# 기본 JOB 파일 목록
+DEFAULT_JOBS = ["default.job", "inspection_A.job", "inspection_B.job", "calibration.job"]
+
+BANNER = "Welcome to In-Sight(R) 2000 Session {session}\r\n"
+
+# SI/SF/SS<셀> <값> (셀 번호가 세 자리면 구분 공백 생략 가능: SIA0035)
+_SET_PATTERN = re.compile(r"^S([IFS])\s*([A-Z]+\d{3}|[A-Z]+\d+(?=\s))\s*(.*)$", re.IGNORECASE)
+
+
+class SimulatorConfig:
+    """
+    시뮬레이터 동작 설정
+    """
+
+    def __init__(self, latency_ms: float = 0.0, jitter_ms: float = 0.0, fragment_size: int = 0,
+                 fragment_delay_ms: float = 0.0, load_time_ms: float = 200.0,
+                 username: str = "admin", password: str = "", jobs: Optional[List[str]] = None,
+                 require_offline: bool = True, ng_rate: float = 0.05,
+                 exec_time_ms: float = 15.0, exec_jitter_ms: float = 3.0, max_sessions: int = 0):
+        self.latency_ms = latency_ms            # 명령 응답 지연
+        self.jitter_ms = jitter_ms              # 응답 지연 변동 (±)
+        self.fragment_size = fragment_size      # 0이 아니면 최대 이 바이트씩 나누어 송신
+        self.fragment_delay_ms = fragment_delay_ms
+        self.load_time_ms = load_time_ms        # LF 처리 시간
+        self.username = username
+        self.password = password
+        self.jobs = list(jobs or DEFAULT_JOBS)
+        self.require_offline = require_offline  # LF는 오프라인(SO0)에서만 허용
+        self.ng_rate = ng_rate                  # 트리거 결과 NG 확률
+        self.exec_time_ms = exec_time_ms        # 트리거 검사 시간 평균
+        self.exec_jitter_ms = exec_jitter_ms
+        self.max_sessions = max_sessions        # 0이면 제한 없음
+
+
+class SimulatedCamera:
+    """
+    세션들이 공유하는 카메라 상태 (JOB, 온라인 여부, 셀 값, 검사 결과)
+    """
+
+    def __init__(self, config: SimulatorConfig):
+        self.config = config
+        self.current_job = config.jobs[0] if config.jobs else ""
+        self.online = True
+        self.cells: Dict[str, str] = {}
+        self.inspection_count = 0
+        self.result = "1"
+        self.exec_time_ms = 0.0
+        self.command_count = 0
+
+    def trigger(self) -> None:
+        """소프트웨어 트리거 한 번의 검사 결과를 만듭니다."""
+        self.inspection_count += 1
+        self.result = "0" if random.random() < self.config.ng_rate else "1"
+        jitter = random.uniform(-self.config.exec_jitter_ms, self.config.exec_jitter_ms)
+        self.exec_time_ms = max(0.1, self.config.exec_time_ms + jitter)
+
+    def named_value(self, name: str) -> Optional[str]:
+        """GET <이름>에 대한 값을 반환합니다. (모르는 이름이면 None)"""
+        key = name.strip().lower()
+        if key == "vision.result":
+            return self.result
+        if key == "vision.executiontime":
+            return f"{self.exec_time_ms:.3f}"
+        if key == "vision.inspectioncount":
+            return str(self.inspection_count)
+        if key == "job.name":
+            return self.current_job
+        if key == "online":
+            return "1" if self.online else "0"
+        return self.cells.get(name.strip().upper())
+
+
+class InSightSimulator:
+    """
+    In-Sight Native Mode TCP 서버
+
+    start()/stop()은 별도 스레드에서 이벤트 루프를 돌리며,
+    이미 실행 중인 이벤트 루프에서는 serve()를 직접 await 할 수 있습니다.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0,
+                 config: Optional[SimulatorConfig] = None):
+        self.host = host
+        self.port = port
+        self.config = config or SimulatorConfig()
+        self.camera = SimulatedCamera(self.config)
+        self.session_count = 0
+        self.active_sessions = 0
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._sessions: Set[asyncio.Task] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._ready = threading.Event()
+
+    # --- 서버 구동 ---
+
+    async def serve(self) -> asyncio.AbstractServer:
+        """현재 이벤트 루프에서 서버를 시작합니다. (port=0이면 빈 포트를 사용)"""
+        self._server = await asyncio.start_server(self._handle_session, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logging.info(f"[Simulator] 시작: {self.host}:{self.port}")
+        return self._server
+
+    def start(self) -> int:
+        """
+        전용 스레드에서 서버를 시작합니다.
+
+        Returns:
+            int: 수신 대기 포트
+        """
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._run, name="InSightSimulator", daemon=True)
+        self._thread.start()
+        self._ready.wait()
+        return self.port
+
+    def _run(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_until_complete(self.serve())
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self.close())
+        self._loop.close()
+
+    async def close(self) -> None:
+        """수신을 멈추고 진행 중인 세션을 취소한 뒤 서버를 닫습니다. (serve()를 실행한 이벤트 루프에서 호출)"""
+        if self._server is None:
+            return
+        self._server.close()
+        sessions = list(self._sessions)
+        for task in sessions:
+            task.cancel()
+        await asyncio.gather(*sessions, return_exceptions=True)
+        await self._server.wait_closed()
+
+    def stop(self) -> None:
+        """서버 스레드를 종료합니다."""
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=5.0)
+            self._thread = None
+            logging.info(f"[Simulator] 종료: {self.host}:{self.port}")
+
+    # --- 세션 ---
+
+    async def _handle_session(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        if self.config.max_sessions and self.active_sessions >= self.config.max_sessions:
+            writer.close()
+            return
+        self.session_count += 1
+        self.active_sessions += 1
+        session = self.session_count
+        task = asyncio.current_task()
+        self._sessions.add(task)
+        try:
+            await self._send(writer, BANNER.format(session=session - 1) + "User: ")
+            if not await self._login(reader, writer):
+                return
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                command = line.decode('utf-8', errors='replace').strip()
+                if not command:
+                    continue
+                reply = await self.handle_command(command)
+                await self._delay()
+                await self._send(writer, reply)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self.active_sessions -= 1
+            self._sessions.discard(task)
+            writer.close()
+
+    async def _login(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> bool:
+        """User:/Password: 프롬프트로 로그인합니다. (실패 시 다시 User: 요청)"""
+        while True:
+            username = await reader.readline()
+            if not username:
+                return False
+            await self._send(writer, "Password: ")
+            password = await reader.readline()
+            if not password:
+                return False
+            if (username.decode(errors='replace').strip() == self.config.username
+                    and password.decode(errors='replace').strip() == self.config.password):
+                await self._send(writer, "User Logged In\r\n")
+                return True
+            await self._send(writer, "Invalid Password\r\nUser: ")
+
+    async def _delay(self) -> None:
+        latency = self.config.latency_ms + random.uniform(-self.config.jitter_ms, self.config.jitter_ms)
+        if latency > 0:
+            await asyncio.sleep(latency / 1000.0)
+
+    async def _send(self, writer: asyncio.StreamWriter, text: str) -> None:
+        data = text.encode('utf-8')
+        size = self.config.fragment_size
+        if size <= 0:
+            writer.write(data)
+            await writer.drain()
+            return
+        # 지정한 크기 이하로 나누어 송신 (수신측 프레임 조립 시험용)
+        for start in range(0, len(data), size):
+            writer.write(data[start:start + size])
+            await writer.drain()
+            await asyncio.sleep(self.config.fragment_delay_ms / 1000.0)
+
+    # --- 명령 처리 ---
+
+    async def handle_command(self, command: str) -> str:
+        """
+        Native Mode 명령 하나를 처리하고 응답 문자열을 반환합니다.
+        """
+        camera = self.camera
+        camera.command_count += 1
+        upper = command.upper()
+
+        def status(code: int, *lines: str) -> str:
+            return "".join(f"{part}\r\n" for part in (str(code),) + lines)
+
+        if upper == "GET FILELIST":
+            return status(STATUS_SUCCESS, str(len(self.config.jobs)), *self.config.jobs)
+        if upper.startswith("GET "):
+            value = camera.named_value(command[4:])
+            return status(STATUS_SUCCESS, value) if value is not None else status(STATUS_INVALID_PARAM)
+        if upper == "GF":
+            return status(STATUS_SUCCESS, camera.current_job)
+        if upper.startswith("LF"):
+            filename = command[2:].strip()
+            if self.config.require_offline and camera.online:
+                return status(STATUS_NOT_OFFLINE)
+            if filename not in self.config.jobs:
+                return status(STATUS_FILE_NOT_FOUND)
+            await asyncio.sleep(self.config.load_time_ms / 1000.0)
+            camera.current_job = filename
+            return status(STATUS_SUCCESS)
+        if upper in ("SO0", "SO1"):
+            camera.online = upper == "SO1"
+            return status(STATUS_SUCCESS)
+        if upper == "GO":
+            return status(STATUS_SUCCESS, "1" if camera.online else "0")
+        if upper == "SW8":
+            # 오프라인이면 트리거를 실행할 수 없음
+            if not camera.online:
+                return status(STATUS_COMMAND_FAILED)
+            camera.trigger()
+            return status(STATUS_SUCCESS)
+        if upper.startswith("GV"):
+            cell = command[2:].strip().upper()
+            return status(STATUS_SUCCESS, camera.cells.get(cell, "0"))
+        match = _SET_PATTERN.match(command)
+        if match:
+            kind, cell, value = match.groups()
+            if kind.upper() in ("I", "F"):
+                try:
+                    int(value) if kind.upper() == "I" else float(value)
+                except ValueError:
+                    return status(STATUS_INVALID_PARAM)
+            camera.cells[cell.upper()] = value.strip().strip('"')
+            return status(STATUS_SUCCESS)
+        return status(STATUS_UNRECOGNIZED)
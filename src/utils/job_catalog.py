@@ -0,0 +1,114 @@
+"""
+카메라별 JOB 파일 목록 캐시 모듈
+
+Get FileList 결과에서 JOB 파일(.job, .jobx)만 골라 카메라(host:port)별로
+보관합니다. 유효 시간(TTL)이 지나면 오래된 목록을 그대로 보여 주면서
+백그라운드에서 다시 조회하고, LF 등 파일을 바꾸는 작업 뒤에는 invalidate()로
+즉시 무효화합니다.
+
+설정 (config/config.ini):
+
+    [job]
+    catalog_ttl = 60
+"""
+
+import threading
+import time
+from typing import Dict, List, Optional
+
+from utils.native_protocol import NativeReply, status_message
+
+# JOB 파일 확장자
+JOB_EXTENSIONS = ('.job', '.jobx')
+# 목록 유효 시간(초)
+DEFAULT_CATALOG_TTL = 60.0
+# Get FileList 응답 대기 시간(초)
+FILE_LIST_TIMEOUT = 3.0
+FILE_LIST_COMMAND = "Get FileList"
+
+
+def parse_job_files(reply: NativeReply) -> List[str]:
+    """
+    Get FileList 응답에서 JOB 파일 이름만 추출합니다.
+
+    Raises:
+        ValueError: 실패 응답이거나 형식이 올바르지 않을 때
+    """
+    if not reply.ok:
+        raise ValueError(f"파일 목록 조회 실패: {status_message(reply.status)}")
+    if not reply.lines:
+        raise ValueError("파일 개수 정보가 없습니다")
+    try:
+        count = int(reply.lines[0])
+    except ValueError:
+        raise ValueError(f"파일 개수를 읽을 수 없습니다: {reply.lines[0]!r}")
+    return [name for name in reply.lines[1:1 + count] if name.lower().endswith(JOB_EXTENSIONS)]
+
+
+def fetch_job_files(telnet) -> List[str]:
+    """
+    TelnetManager로 JOB 파일 목록을 조회합니다. (작업자 스레드에서 호출)
+    """
+    return parse_job_files(telnet.send_native(FILE_LIST_COMMAND, timeout=FILE_LIST_TIMEOUT))
+
+
+class CatalogEntry:
+    """
+    카메라 한 대의 JOB 파일 목록
+    """
+    __slots__ = ("files", "fetched_at")
+
+    def __init__(self, files: List[str], fetched_at: float):
+        self.files = files
+        self.fetched_at = fetched_at    # time.monotonic() 기준
+
+
+class JobCatalog:
+    """
+    카메라별 JOB 파일 목록 캐시 (여러 스레드에서 호출 가능)
+    """
+
+    def __init__(self, ttl: float = DEFAULT_CATALOG_TTL):
+        self.ttl = ttl
+        self._entries: Dict[str, CatalogEntry] = {}
+        self._lock = threading.Lock()
+
+    def files(self, key: str) -> Optional[List[str]]:
+        """저장된 목록을 반환합니다. (유효 시간과 무관, 없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            return list(entry.files) if entry is not None else None
+
+    def is_fresh(self, key: str, now: Optional[float] = None) -> bool:
+        """목록이 있고 유효 시간 안인지 여부"""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return False
+        return (time.monotonic() if now is None else now) - entry.fetched_at < self.ttl
+
+    def age(self, key: str) -> Optional[float]:
+        """목록을 조회한 지 지난 시간(초) (없으면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+        return None if entry is None else time.monotonic() - entry.fetched_at
+
+    def store(self, key: str, files: List[str]) -> bool:
+        """
+        새로 조회한 목록을 저장합니다.
+
+        Returns:
+            bool: 이전 목록과 달라졌는지 여부
+        """
+        with self._lock:
+            previous = self._entries.get(key)
+            self._entries[key] = CatalogEntry(list(files), time.monotonic())
+        return previous is None or previous.files != list(files)
+
+    def invalidate(self, key: Optional[str] = None) -> None:
+        """목록을 만료시킵니다. (key가 None이면 전체) 목록은 다음 조회 전까지 그대로 보여 줍니다."""
+        with self._lock:
+            entries = self._entries.values() if key is None else [self._entries.get(key)]
+            for entry in entries:
+                if entry is not None:
+                    entry.fetched_at = float("-inf")
@@ -0,0 +1,222 @@
+"""
+로그 레코드 저장소 모듈
+
+로그 한 줄을 구조화된 레코드(시각, 레벨, 출처, TX/RX, 내용)로 변환하고,
+고정 크기 링 버퍼와 레벨별 색인에 보관합니다. 레코드마다 일련번호(seq)를
+부여하므로 레벨 필터 전환과 전문 검색이 대량의 로그에서도 즉시 동작합니다.
+화면 표시(QListView 모델)는 ui.log_view가 담당합니다.
+"""
+
+import heapq
+import re
+import time
+from collections import deque
+from datetime import datetime
+from typing import Deque, Dict, Generic, Iterator, List, Optional, Sequence, TypeVar
+
+# 로그 레벨 (심각도 순)
+LEVELS = ("DEBUG", "INFO", "WARNING", "ERROR")
+LEVEL_ALL = "ALL"
+
+# 메시지 앞부분 태그 -> 레벨
+_TAG_LEVELS = {
+    "오류": "ERROR", "에러": "ERROR", "ERROR": "ERROR",
+    "경고": "WARNING", "WARNING": "WARNING",
+    "디버그": "DEBUG", "DEBUG": "DEBUG",
+}
+# [HH:MM:SS(.fff)] 또는 [yyyy-MM-dd HH:MM:SS(.fff)] (TelnetPanel 형식)
+_TIMESTAMP_RE = re.compile(r"^\[(?:\d{4}-\d{2}-\d{2}[ T])?\d{2}:\d{2}:\d{2}(?:\.\d{1,6})?\]\s*")
+_DIRECTION_RE = re.compile(r"^(TX|RX):\s*")
+_TAG_RE = re.compile(r"^\[([^\]]+)\]")
+
+T = TypeVar("T")
+
+
+class RingBuffer(Generic[T]):
+    """
+    용량이 고정된 링 버퍼 (임의 위치 조회 O(1))
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = max(1, capacity)
+        self._items: List[Optional[T]] = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> T:
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        return self._items[(self._start + index) % self.capacity]
+
+    def __iter__(self) -> Iterator[T]:
+        for index in range(self._count):
+            yield self[index]
+
+    def overflow(self, incoming: int) -> int:
+        """incoming개를 추가할 때 앞에서 밀려날 항목 수를 반환합니다."""
+        return max(0, self._count + min(incoming, self.capacity) - self.capacity)
+
+    def drop_front(self, count: int) -> None:
+        """가장 오래된 항목 count개를 버립니다."""
+        count = min(count, self._count)
+        for offset in range(count):
+            self._items[(self._start + offset) % self.capacity] = None
+        self._start = (self._start + count) % self.capacity
+        self._count -= count
+
+    def extend(self, items: Sequence[T]) -> None:
+        """항목들을 추가합니다. 용량을 넘으면 가장 오래된 항목부터 덮어씁니다."""
+        if len(items) > self.capacity:
+            items = items[-self.capacity:]
+        for item in items:
+            self._items[(self._start + self._count) % self.capacity] = item
+            if self._count < self.capacity:
+                self._count += 1
+            else:
+                self._start = (self._start + 1) % self.capacity
+
+    def to_list(self) -> List[T]:
+        """오래된 순서의 목록으로 복사합니다."""
+        end = self._start + self._count
+        if end <= self.capacity:
+            return self._items[self._start:end]
+        return self._items[self._start:] + self._items[:end - self.capacity]
+
+    def clear(self) -> None:
+        self._items = [None] * self.capacity
+        self._start = 0
+        self._count = 0
+
+
+class LogRecord:
+    """
+    구조화된 로그 레코드 한 건
+    """
+    __slots__ = ("seq", "timestamp", "level", "source", "direction", "text", "_key")
+
+    def __init__(self, text: str, level: str = "INFO", source: str = "", direction: str = "",
+                 timestamp: Optional[float] = None):
+        self.seq = -1
+        self.timestamp = time.time() if timestamp is None else timestamp
+        self.level = level
+        self.source = source
+        self.direction = direction
+        self.text = text
+        self._key: Optional[str] = None
+
+    @property
+    def search_key(self) -> str:
+        """검색용 소문자 문자열"""
+        if self._key is None:
+            self._key = f"{self.source} {self.direction} {self.text}".lower()
+        return self._key
+
+    def display(self) -> str:
+        """화면 표시용 문자열"""
+        stamp = datetime.fromtimestamp(self.timestamp).strftime("%H:%M:%S.%f")[:-3]
+        parts = [f"[{stamp}]"]
+        if self.source:
+            parts.append(f"[{self.source}]")
+        if self.direction:
+            parts.append(f"{self.direction}:")
+        parts.append(self.text)
+        return " ".join(parts)
+
+
+def make_record(message: str, level: Optional[str] = None, source: str = "",
+                direction: str = "") -> LogRecord:
+    """
+    문자열 로그 메시지를 구조화된 레코드로 변환합니다.
+
+    메시지 앞의 [HH:MM:SS.zzz] 또는 [yyyy-MM-dd HH:MM:SS] 시각은 레코드 시각으로 대체하고,
+    TX:/RX: 접두어는 방향으로, [오류]/[경고]/[디버그] 태그는 레벨로 해석합니다.
+    """
+    text = _TIMESTAMP_RE.sub("", message.strip(), count=1)
+    if not direction:
+        match = _DIRECTION_RE.match(text)
+        if match:
+            direction = match.group(1)
+            text = text[match.end():]
+    if level is None:
+        match = _TAG_RE.match(text)
+        level = _TAG_LEVELS.get(match.group(1).strip(), "INFO") if match else "INFO"
+    return LogRecord(text, level, source, direction)
+
+
+class LogStore:
+    """
+    로그 레코드 링 버퍼와 레벨별 색인
+
+    레코드마다 증가하는 일련번호(seq)를 부여하므로
+    seq -> 버퍼 위치 계산이 O(1)입니다.
+    """
+
+    def __init__(self, capacity: int):
+        self.records: RingBuffer[LogRecord] = RingBuffer(capacity)
+        # 검색용 소문자 문자열 (records와 같은 순서)
+        self.keys: RingBuffer[str] = RingBuffer(capacity)
+        self.level_index: Dict[str, Deque[int]] = {level: deque() for level in LEVELS}
+        self._next_seq = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.records.capacity
+
+    @property
+    def first_seq(self) -> int:
+        return self.records[0].seq if len(self.records) else self._next_seq
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def get(self, seq: int) -> LogRecord:
+        """일련번호로 레코드를 조회합니다."""
+        return self.records[seq - self.first_seq]
+
+    def drop_front(self, count: int) -> None:
+        """가장 오래된 레코드 count개와 그 색인을 버립니다."""
+        self.records.drop_front(count)
+        self.keys.drop_front(count)
+        first = self.first_seq
+        for seqs in self.level_index.values():
+            while seqs and seqs[0] < first:
+                seqs.popleft()
+
+    def extend(self, records: Sequence[LogRecord]) -> None:
+        """레코드에 일련번호를 부여하고 추가합니다. (용량 여유가 있어야 함)"""
+        for record in records:
+            record.seq = self._next_seq
+            self._next_seq += 1
+            self.level_index.setdefault(record.level, deque()).append(record.seq)
+        self.records.extend(records)
+        self.keys.extend([record.search_key for record in records])
+
+    def seqs(self, min_level: str = LEVEL_ALL) -> Iterator[int]:
+        """min_level 이상 레코드의 일련번호를 순서대로 반환합니다."""
+        if min_level == LEVEL_ALL or min_level not in LEVELS:
+            return iter(range(self.first_seq, self._next_seq))
+        levels = LEVELS[LEVELS.index(min_level):]
+        return heapq.merge(*(self.level_index.get(level, ()) for level in levels))
+
+    def search(self, needle: str, min_level: str = LEVEL_ALL) -> List[int]:
+        """
+        검색어를 포함하는 min_level 이상 레코드의 일련번호를 반환합니다.
+
+        Args:
+            needle (str): 소문자 검색어
+            min_level (str): 최소 레벨 (ALL이면 전체)
+        """
+        keys = self.keys.to_list()
+        first = self.first_seq
+        if min_level == LEVEL_ALL or min_level not in LEVELS:
+            return [first + offset for offset, key in enumerate(keys) if needle in key]
+        return [seq for seq in self.seqs(min_level) if needle in keys[seq - first]]
+
+    def clear(self) -> None:
+        self.records.clear()
+        self.keys.clear()
+        for seqs in self.level_index.values():
+            seqs.clear()
@@ -0,0 +1,193 @@
+"""
+비동기 로그 파이프라인 모듈
+
+logging 호출은 QueueHandler가 큐에 넣기만 하고, 파일/콘솔 출력은
+QueueListener 스레드가 담당하여 GUI 스레드에서 디스크 I/O가 일어나지 않습니다.
+
+- 로그 파일은 크기 또는 날짜가 바뀔 때 회전(app.log.1, app.log.2 ...)
+- 회전된 파일은 선택적으로 gzip 압축(app.log.1.gz ...)
+- 큐가 일정 수준 이상 차면 DEBUG 레코드를 버리고, 가득 차면 잠시만 기다린 뒤 버림
+
+설정 (config/config.ini):
+
+    [logging]
+    level = INFO
+    file = logs/app.log
+    max_bytes = 5242880
+    backup_count = 10
+    daily = true
+    compress = true
+    queue_size = 10000
+"""
+
+import datetime
+import gzip
+import logging
+import logging.handlers
+import os
+import queue
+import shutil
+import time
+from typing import Optional
+
+from utils.config import ConfigManager
+
+LOG_FORMAT = '%(asctime)s [%(levelname)s] %(message)s'
+
+# 기본값
+DEFAULT_LOG_FILE = 'logs/app.log'
+DEFAULT_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 10
+DEFAULT_QUEUE_SIZE = 10000
+# 큐가 이 비율 이상 차면 DEBUG 레코드를 버림
+DEBUG_DROP_RATIO = 0.8
+# 큐가 가득 찼을 때 INFO 이상 레코드를 넣기 위해 기다리는 최대 시간(초)
+PUT_TIMEOUT = 0.05
+
+
+def _gzip_namer(name: str) -> str:
+    return name + ".gz"
+
+
+def _gzip_rotator(source: str, dest: str) -> None:
+    """회전된 로그 파일을 gzip으로 압축하고 원본을 삭제합니다."""
+    with open(source, 'rb') as src, gzip.open(dest, 'wb') as dst:
+        shutil.copyfileobj(src, dst)
+    os.remove(source)
+
+
+class SizeTimeRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    크기 초과 또는 날짜 변경 시 회전하는 파일 핸들러
+
+    번호 방식(app.log.1, app.log.2 ...)으로 회전하므로 같은 날 여러 번
+    회전해도 파일 이름이 겹치지 않습니다.
+    """
+
+    def __init__(self, filename: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, daily: bool = True,
+                 compress: bool = False, encoding: str = 'utf-8'):
+        super().__init__(filename, maxBytes=max_bytes, backupCount=backup_count,
+                         encoding=encoding, delay=True)
+        self.daily = daily
+        self.rollover_at = self._next_midnight()
+        if compress:
+            self.namer = _gzip_namer
+            self.rotator = _gzip_rotator
+
+    @staticmethod
+    def _next_midnight() -> float:
+        tomorrow = datetime.date.today() + datetime.timedelta(days=1)
+        return time.mktime(tomorrow.timetuple())
+
+    def shouldRollover(self, record: logging.LogRecord) -> int:
+        if self.daily and time.time() >= self.rollover_at:
+            return 1
+        return super().shouldRollover(record)
+
+    def doRollover(self) -> None:
+        super().doRollover()
+        self.rollover_at = self._next_midnight()
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    제한된 크기의 큐에 레코드를 넣는 핸들러
+
+    큐가 DEBUG_DROP_RATIO 이상 차 있으면 DEBUG 레코드를 버리고,
+    가득 찼으면 PUT_TIMEOUT만큼만 기다린 뒤 버려 호출 스레드를 멈추지 않습니다.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+        self._debug_limit = int(log_queue.maxsize * DEBUG_DROP_RATIO) if log_queue.maxsize > 0 else 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        if (self._debug_limit and record.levelno <= logging.DEBUG
+                and self.queue.qsize() >= self._debug_limit):
+            self.dropped += 1
+            return
+        try:
+            self.queue.put(record, timeout=PUT_TIMEOUT)
+        except queue.Full:
+            self.dropped += 1
+
+
+class LoggingPipeline:
+    """
+    QueueHandler/QueueListener 로그 파이프라인
+
+    install()로 루트 로거의 핸들러를 큐 핸들러 하나로 교체하고,
+    shutdown()으로 남은 레코드를 모두 기록한 뒤 리스너를 종료합니다.
+    """
+
+    def __init__(self, config: Optional[ConfigManager] = None):
+        self.config = config
+        self.queue_handler: Optional[DroppingQueueHandler] = None
+        self.listener: Optional[logging.handlers.QueueListener] = None
+
+    def _option(self, option: str, fallback):
+        if self.config is None:
+            return fallback
+        value = self.config.get("logging", option, fallback=None)
+        if value is None or value == "":
+            return fallback
+        try:
+            if isinstance(fallback, bool):
+                return str(value).strip().lower() in ("1", "true", "yes", "on")
+            return type(fallback)(value)
+        except ValueError:
+            logging.warning(f"[LoggingPipeline] 잘못된 설정값: {option}={value}")
+            return fallback
+
+    def install(self) -> None:
+        """루트 로거에 큐 핸들러를 설치하고 리스너 스레드를 시작합니다."""
+        if self.listener is not None:
+            return
+        level = logging.getLevelName(self._option("level", "INFO").upper())
+        if not isinstance(level, int):
+            level = logging.INFO
+        path = self._option("file", DEFAULT_LOG_FILE)
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+
+        formatter = logging.Formatter(LOG_FORMAT)
+        file_handler = SizeTimeRotatingFileHandler(
+            path,
+            max_bytes=self._option("max_bytes", DEFAULT_MAX_BYTES),
+            backup_count=self._option("backup_count", DEFAULT_BACKUP_COUNT),
+            daily=self._option("daily", True),
+            compress=self._option("compress", True),
+        )
+        console_handler = logging.StreamHandler()
+        for handler in (file_handler, console_handler):
+            handler.setFormatter(formatter)
+
+        log_queue = queue.Queue(maxsize=self._option("queue_size", DEFAULT_QUEUE_SIZE))
+        self.queue_handler = DroppingQueueHandler(log_queue)
+        self.listener = logging.handlers.QueueListener(
+            log_queue, file_handler, console_handler, respect_handler_level=True)
+
+        root = logging.getLogger()
+        for handler in root.handlers[:]:
+            root.removeHandler(handler)
+        root.addHandler(self.queue_handler)
+        root.setLevel(level)
+        self.listener.start()
+
+    @property
+    def dropped(self) -> int:
+        """큐 포화로 버려진 레코드 수"""
+        return self.queue_handler.dropped if self.queue_handler else 0
+
+    def shutdown(self) -> None:
+        """남은 레코드를 기록하고 리스너와 핸들러를 닫습니다."""
+        if self.listener is None:
+            return
+        if self.dropped:
+            logging.warning(f"[LoggingPipeline] 큐 포화로 버려진 로그: {self.dropped}건")
+        self.listener.stop()
+        for handler in self.listener.handlers:
+            handler.close()
+        logging.getLogger().removeHandler(self.queue_handler)
+        self.listener = None
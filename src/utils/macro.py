@@ -0,0 +1,560 @@
+"""
+Native Mode 명령 매크로 모듈
+
+이름 붙인 명령 시퀀스를 한 번 컴파일(MacroPlan)해 두고, 실행할 때는 파라미터만
+대입하여 TelnetManager.send_batch로 파이프라인 송신합니다. 명령 사이에 고정
+대기가 없으므로 반복 시퀀스(트리거 후 결과 읽기 등)가 카메라 속도로 실행됩니다.
+
+문법 (한 줄에 하나, #으로 시작하면 주석):
+
+    param count = 10            파라미터 선언 (기본값, 실행 시 덮어쓸 수 있음)
+    param cell = A003
+    timeout 5                   이후 명령의 응답 대기 시간(초), 기본 2
+    repeat {count} as i         반복 (i는 0부터, 중첩 가능)
+        SW8                     명령 (기본 기대값: 성공 응답)
+        GV{cell} => /^\\d+$/    값이 정규식과 일치해야 함
+        GET Vision.Result => "OK"   값이 정확히 일치해야 함
+        SO1 => status -6        특정 상태 코드 기대
+        GVB{i} => any           검사하지 않음
+        GV{cell} => "{i}"       기대값에도 파라미터/반복 변수 사용 가능
+    end
+    wait 100                    대기(ms) - 앞의 명령 응답을 모두 받은 뒤 대기
+
+파이프라인 특성상 기대값 불일치는 응답 단위로 판정되며, 중단(stop_on_failure)은
+이미 송신된 묶음(chunk)이 끝난 뒤에 적용됩니다.
+
+매크로는 config/macros.json에 이름 -> 원문으로 저장됩니다.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+from utils.native_protocol import NativeReply, status_message, STATUS_SUCCESS
+
+# 매크로 저장 파일
+DEFAULT_MACRO_PATH = 'config/macros.json'
+# 명령 응답 대기 기본값(초)
+DEFAULT_COMMAND_TIMEOUT = 2.0
+# 한 번의 send_batch로 보낼 최대 명령 수 (진행 표시/중지 단위)
+DEFAULT_CHUNK_SIZE = 64
+# 펼친 명령 수 상한 (잘못된 반복 횟수로 인한 폭주 방지)
+MAX_EXPANDED_STEPS = 100000
+
+# 진행 콜백: (완료 명령 수, 전체 명령 수) (작업자 스레드에서 호출)
+MacroProgressCallback = Callable[[int, int], None]
+
+_PARAM_PATTERN = re.compile(r"^param\s+([A-Za-z_]\w*)\s*=\s*(.*)$", re.IGNORECASE)
+_REPEAT_PATTERN = re.compile(r"^repeat\s+(\S+)(?:\s+as\s+([A-Za-z_]\w*))?$", re.IGNORECASE)
+_PLACEHOLDER_PATTERN = re.compile(r"\{([A-Za-z_]\w*)\}")
+_EXPECT_SEPARATOR = "=>"
+
+
+class MacroError(ValueError):
+    """매크로 문법 오류 (line은 1부터, 0이면 특정 줄 없음)"""
+
+    def __init__(self, message: str, line: int = 0):
+        super().__init__(f"{line}번째 줄: {message}" if line else message)
+        self.line = line
+
+
+class Template:
+    """
+    {이름} 자리표시자가 있는 문자열 (컴파일 시 조각으로 나누어 둠)
+    """
+    __slots__ = ("parts", "names")
+
+    def __init__(self, text: str):
+        # 짝수 인덱스는 문자열, 홀수 인덱스는 파라미터 이름
+        self.parts = _PLACEHOLDER_PATTERN.split(text)
+        self.names = self.parts[1::2]
+
+    def render(self, values: Dict[str, str]) -> str:
+        if not self.names:
+            return self.parts[0]
+        return "".join(part if index % 2 == 0 else values[part] for index, part in enumerate(self.parts))
+
+
+class Expectation:
+    """
+    응답 기대값: ok(성공), any(검사 안 함), status <코드>, "<값>", /<정규식>/
+
+    값/정규식에 자리표시자가 있으면 template에 보관하고 render()로 대입합니다.
+    """
+    __slots__ = ("kind", "status", "text", "pattern", "template")
+
+    def __init__(self, kind: str, status: Optional[int] = None, text: str = "",
+                 pattern: Optional["re.Pattern"] = None, template: Optional[Template] = None):
+        self.kind = kind
+        self.status = status
+        self.text = text
+        self.pattern = pattern
+        self.template = template
+
+    @classmethod
+    def parse(cls, source: str, line: int) -> "Expectation":
+        source = source.strip()
+        lowered = source.lower()
+        if lowered == "ok":
+            return cls("ok", STATUS_SUCCESS)
+        if lowered == "any":
+            return cls("any")
+        if lowered.startswith("status"):
+            try:
+                return cls("status", int(source[6:].strip()))
+            except ValueError:
+                raise MacroError(f"상태 코드가 올바르지 않습니다: {source}", line)
+        if len(source) >= 2 and source[0] == source[-1] == '"':
+            return cls("equals", STATUS_SUCCESS).render_text(source[1:-1], line)
+        if len(source) >= 2 and source[0] == source[-1] == '/':
+            return cls("regex", STATUS_SUCCESS).render_text(source[1:-1], line)
+        raise MacroError(f"알 수 없는 기대값: {source} (ok, any, status N, \"값\", /정규식/)", line)
+
+    def render_text(self, text: str, line: int) -> "Expectation":
+        """값/정규식 원문을 설정합니다. (자리표시자가 있으면 대입 전까지 보류)"""
+        template = Template(text)
+        if template.names:
+            self.template = template
+            return self
+        self.text = text
+        if self.kind == "regex":
+            try:
+                self.pattern = re.compile(text)
+            except re.error as e:
+                raise MacroError(f"정규식 오류: {e}", line)
+        return self
+
+    def render(self, values: Dict[str, str], line: int) -> "Expectation":
+        """자리표시자를 대입한 기대값 (자리표시자가 없으면 자기 자신)"""
+        if self.template is None:
+            return self
+        return Expectation(self.kind, self.status).render_text(self.template.render(values), line)
+
+    def check(self, reply: NativeReply) -> str:
+        """
+        응답을 검사합니다.
+
+        Returns:
+            str: 불일치 설명 (일치하면 빈 문자열)
+        """
+        if self.kind == "any":
+            return ""
+        if not reply.complete:
+            return "응답 시간 초과"
+        if reply.status != self.status:
+            return f"상태 {reply.status} ({status_message(reply.status)}), 기대 {self.status}"
+        if self.kind == "equals" and reply.value != self.text:
+            return f"값 {reply.value!r}, 기대 {self.text!r}"
+        if self.kind == "regex" and not self.pattern.search(reply.value):
+            return f"값 {reply.value!r}, 기대 /{self.pattern.pattern}/"
+        return ""
+
+
+EXPECT_OK = Expectation("ok", STATUS_SUCCESS)
+
+
+class CommandNode:
+    __slots__ = ("template", "expect", "timeout", "line")
+
+    def __init__(self, template: Template, expect: Expectation, timeout: float, line: int):
+        self.template = template
+        self.expect = expect
+        self.timeout = timeout
+        self.line = line
+
+
+class WaitNode:
+    __slots__ = ("template", "line")
+
+    def __init__(self, template: Template, line: int):
+        self.template = template
+        self.line = line
+
+
+class RepeatNode:
+    __slots__ = ("count", "variable", "body", "line")
+
+    def __init__(self, count: Template, variable: Optional[str], line: int):
+        self.count = count
+        self.variable = variable
+        self.body: List[Node] = []
+        self.line = line
+
+
+Node = Union[CommandNode, WaitNode, RepeatNode]
+
+
+class MacroStep:
+    """
+    파라미터를 대입한 실행 단위 명령
+    """
+    __slots__ = ("command", "expect", "timeout", "line")
+
+    def __init__(self, command: str, expect: Expectation, timeout: float, line: int):
+        self.command = command
+        self.expect = expect
+        self.timeout = timeout
+        self.line = line
+
+
+class MacroWait:
+    """파이프라인을 비운 뒤 대기 (초)"""
+    __slots__ = ("seconds",)
+
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+
+
+class MacroPlan:
+    """
+    컴파일된 매크로 (실행 시에는 파라미터 대입과 반복 펼치기만 수행)
+    """
+
+    def __init__(self, name: str, source: str, params: Dict[str, str], nodes: List[Node]):
+        self.name = name
+        self.source = source
+        self.params = params        # 파라미터 이름 -> 기본값
+        self.nodes = nodes
+
+    def resolve(self, overrides: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """기본값에 실행 시 값을 덮어쓴 파라미터 사전을 반환합니다."""
+        values = dict(self.params)
+        for name, value in (overrides or {}).items():
+            if name not in values:
+                raise MacroError(f"선언되지 않은 파라미터: {name}")
+            values[name] = str(value)
+        return values
+
+    def count(self, values: Dict[str, str]) -> int:
+        """펼쳤을 때의 명령 수"""
+        def count_nodes(nodes: List[Node], scope: Dict[str, str]) -> int:
+            total = 0
+            for node in nodes:
+                if isinstance(node, CommandNode):
+                    total += 1
+                elif isinstance(node, RepeatNode):
+                    times = _repeat_count(node, scope)
+                    if times > MAX_EXPANDED_STEPS:
+                        raise MacroError(f"반복 횟수가 너무 큽니다: {times}", node.line)
+                    if node.variable is None:
+                        total += times * count_nodes(node.body, scope)
+                    else:
+                        # 반복 변수가 반복 횟수에 쓰일 수 있으므로 회차별로 계산
+                        for index in range(times):
+                            total += count_nodes(node.body, dict(scope, **{node.variable: str(index)}))
+                if total > MAX_EXPANDED_STEPS:
+                    raise MacroError(f"명령이 너무 많습니다 (최대 {MAX_EXPANDED_STEPS}개)", node.line)
+            return total
+        return count_nodes(self.nodes, values)
+
+    def expand(self, values: Dict[str, str]) -> Iterator[Union[MacroStep, MacroWait]]:
+        """파라미터를 대입하고 반복을 펼친 실행 단위를 순서대로 생성합니다."""
+        def walk(nodes: List[Node], scope: Dict[str, str]) -> Iterator[Union[MacroStep, MacroWait]]:
+            for node in nodes:
+                if isinstance(node, CommandNode):
+                    yield MacroStep(node.template.render(scope), node.expect.render(scope, node.line),
+                                    node.timeout, node.line)
+                elif isinstance(node, WaitNode):
+                    yield MacroWait(_number(node.template.render(scope), node.line) / 1000.0)
+                else:
+                    for index in range(_repeat_count(node, scope)):
+                        inner = scope if node.variable is None else dict(scope, **{node.variable: str(index)})
+                        yield from walk(node.body, inner)
+        return walk(self.nodes, values)
+
+
+def _number(text: str, line: int) -> float:
+    try:
+        value = float(text)
+    except ValueError:
+        raise MacroError(f"숫자가 아닙니다: {text!r}", line)
+    if value < 0:
+        raise MacroError(f"음수는 사용할 수 없습니다: {text}", line)
+    return value
+
+
+def _repeat_count(node: RepeatNode, scope: Dict[str, str]) -> int:
+    text = node.count.render(scope)
+    try:
+        return max(0, int(text))
+    except ValueError:
+        raise MacroError(f"반복 횟수가 정수가 아닙니다: {text!r}", node.line)
+
+
+def compile_macro(name: str, source: str) -> MacroPlan:
+    """
+    매크로 원문을 파싱하여 MacroPlan으로 컴파일합니다.
+
+    Raises:
+        MacroError: 문법 오류 (줄 번호 포함)
+    """
+    params: Dict[str, str] = {}
+    root: List[Node] = []
+    stack: List[Tuple[RepeatNode, List[Node]]] = []
+    body = root
+    timeout = DEFAULT_COMMAND_TIMEOUT
+    loop_variables: List[str] = []
+
+    def check_names(names: List[str], line: int) -> None:
+        for placeholder in names:
+            if placeholder not in params and placeholder not in loop_variables:
+                raise MacroError(f"선언되지 않은 파라미터: {{{placeholder}}}", line)
+
+    def template(text: str, line: int) -> Template:
+        result = Template(text)
+        check_names(result.names, line)
+        return result
+
+    for number, raw in enumerate(source.splitlines(), start=1):
+        line = raw.strip()
+        if not line or line.startswith('#'):
+            continue
+        keyword = line.split(None, 1)[0].lower()
+
+        if keyword == "param":
+            match = _PARAM_PATTERN.match(line)
+            if not match:
+                raise MacroError("형식: param 이름 = 기본값", number)
+            if root or stack:
+                raise MacroError("param은 명령보다 먼저 선언해야 합니다", number)
+            params[match.group(1)] = match.group(2).strip()
+        elif keyword == "timeout":
+            value = line[len(keyword):].strip()
+            timeout = _number(value, number) if value else DEFAULT_COMMAND_TIMEOUT
+        elif keyword == "wait":
+            body.append(WaitNode(template(line[len(keyword):].strip() or "0", number), number))
+        elif keyword == "repeat":
+            match = _REPEAT_PATTERN.match(line)
+            if not match:
+                raise MacroError("형식: repeat 횟수 [as 변수]", number)
+            node = RepeatNode(template(match.group(1), number), match.group(2), number)
+            body.append(node)
+            stack.append((node, body))
+            if node.variable is not None:
+                loop_variables.append(node.variable)
+            body = node.body
+        elif keyword == "end":
+            if not stack:
+                raise MacroError("짝이 맞지 않는 end", number)
+            node, body = stack.pop()
+            if node.variable is not None:
+                loop_variables.remove(node.variable)
+        else:
+            command, separator, expect = line.partition(_EXPECT_SEPARATOR)
+            command = command.strip()
+            if not command:
+                raise MacroError("명령이 비어 있습니다", number)
+            expectation = Expectation.parse(expect, number) if separator else EXPECT_OK
+            if expectation.template is not None:
+                check_names(expectation.template.names, number)
+            body.append(CommandNode(template(command, number), expectation, timeout, number))
+
+    if stack:
+        raise MacroError("repeat에 대응하는 end가 없습니다", stack[-1][0].line)
+    if not root:
+        raise MacroError("실행할 명령이 없습니다")
+    return MacroPlan(name, source, params, root)
+
+
+def parse_param_overrides(text: str) -> Dict[str, str]:
+    """
+    "count=10, cell=A003" 형식의 실행 시 파라미터를 사전으로 변환합니다.
+
+    Raises:
+        MacroError: 형식 오류
+    """
+    values = {}
+    for entry in text.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        name, separator, value = entry.partition("=")
+        if not separator or not name.strip():
+            raise MacroError(f"파라미터 형식은 이름=값 입니다: {entry}")
+        values[name.strip()] = value.strip()
+    return values
+
+
+class StepResult:
+    """
+    명령 하나의 실행 결과
+    """
+    __slots__ = ("command", "reply", "error", "line")
+
+    def __init__(self, command: str, reply: NativeReply, error: str, line: int):
+        self.command = command
+        self.reply = reply
+        self.error = error      # 기대값 불일치 설명 (일치하면 빈 문자열)
+        self.line = line
+
+    @property
+    def ok(self) -> bool:
+        return not self.error
+
+
+class MacroResult:
+    """
+    매크로 실행 결과 및 처리량
+    """
+
+    def __init__(self, name: str, total: int):
+        self.name = name
+        self.total = total
+        self.steps: List[StepResult] = []
+        self.failures: List[StepResult] = []
+        self.cancelled = False
+        self.stopped = False        # 기대값 불일치로 중단
+        self.error = ""             # 통신 오류
+        self.elapsed = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return not (self.failures or self.cancelled or self.error) and len(self.steps) == self.total
+
+    @property
+    def rate(self) -> float:
+        """초당 명령 수"""
+        return len(self.steps) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def summary(self) -> str:
+        state = ("성공" if self.ok else "취소" if self.cancelled else
+                 f"통신 오류: {self.error}" if self.error else
+                 f"중단 (불일치 {len(self.failures)}건)" if self.stopped else
+                 f"불일치 {len(self.failures)}건")
+        return (f"{self.name}: {state} | 명령 {len(self.steps)}/{self.total}개, "
+                f"{self.elapsed * 1000.0:.0f} ms ({self.rate:.0f} 명령/초)")
+
+
+def run_macro(telnet, plan: MacroPlan, overrides: Optional[Dict[str, str]] = None,
+              window: int = 8, chunk_size: int = DEFAULT_CHUNK_SIZE, stop_on_failure: bool = True,
+              progress: Optional[MacroProgressCallback] = None,
+              cancel: Optional[threading.Event] = None) -> MacroResult:
+    """
+    컴파일된 매크로를 TelnetManager로 실행합니다. (작업자 스레드에서 호출)
+
+    응답 대기 시간이 같은 연속 명령을 chunk_size개까지 묶어 send_batch로
+    파이프라인 송신하며, wait가 나오면 그때까지의 응답을 모두 받은 뒤 대기합니다.
+
+    wait 대기 중에도 cancel이 설정되면 즉시 중지합니다.
+
+    Raises:
+        MacroError: 파라미터 값 오류 (반복 횟수가 정수가 아님 등)
+    """
+    values = plan.resolve(overrides)
+    result = MacroResult(plan.name, plan.count(values))
+    start = time.monotonic()
+    pending: List[MacroStep] = []
+
+    def flush() -> bool:
+        """묶음을 송신하고 검사합니다. 계속 진행하면 True"""
+        if not pending:
+            return True
+        replies = telnet.send_batch([step.command for step in pending], window, pending[0].timeout)
+        for step, reply in zip(pending, replies):
+            step_result = StepResult(step.command, reply, step.expect.check(reply), step.line)
+            result.steps.append(step_result)
+            if step_result.error:
+                result.failures.append(step_result)
+        pending.clear()
+        if progress is not None:
+            progress(len(result.steps), result.total)
+        if result.failures and stop_on_failure:
+            result.stopped = True
+            return False
+        if cancel is not None and cancel.is_set():
+            result.cancelled = True
+            return False
+        return True
+
+    try:
+        for item in plan.expand(values):
+            if isinstance(item, MacroWait):
+                if not flush():
+                    break
+                if cancel is None:
+                    time.sleep(item.seconds)
+                elif cancel.wait(item.seconds):
+                    result.cancelled = True
+                    break
+                continue
+            if pending and (len(pending) >= chunk_size or item.timeout != pending[0].timeout):
+                if not flush():
+                    break
+            pending.append(item)
+        else:
+            flush()
+    except (ConnectionError, OSError) as e:
+        result.error = str(e)
+    result.elapsed = time.monotonic() - start
+    logging.info(f"[Macro] {result.summary()}")
+    return result
+
+
+class MacroLibrary:
+    """
+    이름 -> 매크로 원문 저장소 (컴파일된 계획을 함께 보관)
+    """
+
+    def __init__(self, path: str = DEFAULT_MACRO_PATH):
+        self.path = path
+        self._sources: Dict[str, str] = {}
+        self._plans: Dict[str, MacroPlan] = {}
+        self.load()
+
+    def load(self) -> None:
+        self._sources.clear()
+        self._plans.clear()
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logging.error(f"[Macro] 매크로 파일 로드 실패: {e}")
+            return
+        for name, source in data.items():
+            self._sources[name] = source
+            try:
+                self._plans[name] = compile_macro(name, source)
+            except MacroError as e:
+                logging.warning(f"[Macro] '{name}' 컴파일 실패: {e}")
+
+    def save(self) -> None:
+        try:
+            os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump(self._sources, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            logging.error(f"[Macro] 매크로 파일 저장 실패: {e}")
+
+    def names(self) -> List[str]:
+        return sorted(self._sources)
+
+    def source(self, name: str) -> str:
+        return self._sources.get(name, "")
+
+    def plan(self, name: str) -> Optional[MacroPlan]:
+        """컴파일된 계획 (없거나 문법 오류면 None)"""
+        return self._plans.get(name)
+
+    def put(self, name: str, source: str) -> MacroPlan:
+        """
+        매크로를 컴파일하여 저장합니다.
+
+        Raises:
+            MacroError: 문법 오류 (저장하지 않음)
+        """
+        plan = compile_macro(name, source)
+        self._sources[name] = source
+        self._plans[name] = plan
+        self.save()
+        return plan
+
+    def remove(self, name: str) -> None:
+        self._sources.pop(name, None)
+        self._plans.pop(name, None)
+        self.save()
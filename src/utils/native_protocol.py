@@ -0,0 +1,366 @@
+"""
+In-Sight Native Mode 응답 프레임 파서 모듈
+
+Native Mode 응답은 상태 코드 한 줄과, 명령에 따라 정해지는 개수의
+페이로드 줄로 구성됩니다. 소켓과 무관하게 동작하므로 동기/비동기
+클라이언트가 같은 파서를 공유합니다.
+
+    GF            -> 1\\r\\n<파일명>\\r\\n
+    Get FileList  -> 1\\r\\n<개수>\\r\\n<파일명1>\\r\\n...<파일명N>\\r\\n
+    LF<파일명>    -> 1\\r\\n
+
+LoginSession은 접속 배너와 User:/Password: 프롬프트를 처리하는 로그인
+상태 기계이며, 역시 소켓 없이 수신 바이트만으로 다음 송신 내용을 결정합니다.
+"""
+
+from typing import List, Optional
+
+# 상태 코드
+STATUS_SUCCESS = 1
+STATUS_UNRECOGNIZED = 0
+STATUS_INVALID_PARAM = -1
+STATUS_ACCESS_DENIED = -2
+STATUS_FILE_NOT_FOUND = -3
+STATUS_FILE_ERROR = -4
+STATUS_COMMAND_FAILED = -5
+STATUS_NOT_OFFLINE = -6
+
+STATUS_MESSAGES = {
+    STATUS_SUCCESS: "성공",
+    STATUS_UNRECOGNIZED: "인식할 수 없는 명령",
+    STATUS_INVALID_PARAM: "잘못된 파라미터",
+    STATUS_ACCESS_DENIED: "권한 없음",
+    STATUS_FILE_NOT_FOUND: "파일 없음",
+    STATUS_FILE_ERROR: "파일 처리 실패",
+    STATUS_COMMAND_FAILED: "명령 실행 실패",
+    STATUS_NOT_OFFLINE: "오프라인 상태가 아님",
+}
+
+# 페이로드 줄 수가 두 번째 줄(개수)로 결정되는 명령
+COUNTED = -1
+
+# 명령별 페이로드 줄 수 (대문자, 앞부분 일치)
+_PAYLOAD_LINES = (
+    ("GET FILELIST", COUNTED),
+    ("GET ", 1),
+    ("GF", 1),
+    ("GO", 1),
+    ("GV", 1),
+    ("GETRESULTS", 1),
+)
+
+
+def expected_payload_lines(command: str) -> int:
+    """
+    명령 성공 시 상태 코드 뒤에 따라오는 페이로드 줄 수를 반환합니다.
+
+    Args:
+        command (str): 송신한 Native Mode 명령
+
+    Returns:
+        int: 페이로드 줄 수 (COUNTED이면 두 번째 줄이 개수)
+    """
+    key = command.strip().upper()
+    for prefix, count in _PAYLOAD_LINES:
+        if key.startswith(prefix):
+            return count
+    return 0
+
+
+def set_command_type(value: str) -> str:
+    """값의 타입에 따라 셀 쓰기 명령 유형(SI/SF/SS)을 판단합니다."""
+    try:
+        int(value)
+        return "SI"
+    except ValueError:
+        pass
+    try:
+        float(value)
+        return "SF"
+    except ValueError:
+        return "SS"
+
+
+def format_set_command(cell: str, value: str) -> str:
+    """
+    셀 쓰기 명령을 만듭니다. 셀과 값 사이는 공백으로 구분합니다.
+
+    예) ("A003", "5") -> "SIA003 5", ("B012", "1.5") -> "SFB012 1.5"
+    """
+    cell = cell.strip()
+    value = value.strip()
+    return f"{set_command_type(value)}{cell} {value}"
+
+
+def status_message(status: Optional[int]) -> str:
+    """상태 코드에 대한 설명을 반환합니다."""
+    if status is None:
+        return "응답 없음"
+    return STATUS_MESSAGES.get(status, f"알 수 없는 코드 {status}")
+
+
+class NativeReply:
+    """
+    Native Mode 명령 하나에 대한 응답 프레임
+    """
+    __slots__ = ("command", "status", "lines", "raw", "complete")
+
+    def __init__(self, command: str, status: Optional[int], lines: List[str],
+                 raw: bytes, complete: bool = True):
+        self.command = command
+        self.status = status
+        self.lines = lines
+        self.raw = raw
+        self.complete = complete
+
+    @property
+    def ok(self) -> bool:
+        """상태 코드가 성공(1)이고 프레임이 완전한지 여부"""
+        return self.complete and self.status == STATUS_SUCCESS
+
+    @property
+    def value(self) -> str:
+        """첫 번째 페이로드 줄 (없으면 빈 문자열)"""
+        return self.lines[0] if self.lines else ""
+
+    def text(self) -> str:
+        """수신한 원문을 문자열로 반환합니다."""
+        return self.raw.decode('utf-8', errors='replace')
+
+    def __repr__(self) -> str:
+        return (f"NativeReply({self.command!r}, status={self.status}, "
+                f"lines={self.lines!r}, complete={self.complete})")
+
+
+class NativeFrameReader:
+    """
+    수신 바이트를 누적하다가 응답 프레임이 완성되면 꺼내 주는 버퍼형 리더
+    """
+
+    def __init__(self):
+        self._buffer = bytearray()
+
+    def feed(self, data: bytes) -> None:
+        """수신한 바이트를 버퍼에 추가합니다."""
+        self._buffer.extend(data)
+
+    def clear(self) -> None:
+        """버퍼를 비웁니다."""
+        self._buffer.clear()
+
+    def contains(self, marker: bytes) -> bool:
+        """버퍼에 marker가 포함되어 있는지 확인합니다."""
+        return marker in self._buffer
+
+    def take_all(self) -> bytes:
+        """버퍼 전체를 꺼내고 비웁니다."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def read_frame(self, command: str, payload_lines: Optional[int] = None) -> Optional[NativeReply]:
+        """
+        command에 대한 완전한 응답 프레임이 버퍼에 있으면 꺼내서 반환합니다.
+
+        Args:
+            command (str): 응답을 기다리는 명령
+            payload_lines (Optional[int]): 페이로드 줄 수 (None이면 명령으로 판단)
+
+        Returns:
+            Optional[NativeReply]: 완성된 프레임, 아직 미완성이면 None
+        """
+        if payload_lines is None:
+            payload_lines = expected_payload_lines(command)
+
+        lines: List[str] = []
+        status: Optional[int] = None
+        needed = 1
+        pos = 0
+        while len(lines) < needed:
+            end = self._buffer.find(b"\n", pos)
+            if end < 0:
+                return None
+            line = self._buffer[pos:end].decode('utf-8', errors='replace').strip()
+            pos = end + 1
+            if status is None and not lines and not line:
+                # 프레임 앞의 빈 줄은 무시
+                continue
+            lines.append(line)
+
+            if len(lines) == 1:
+                try:
+                    status = int(line)
+                except ValueError:
+                    # 상태 코드가 아닌 줄은 그 자체로 하나의 프레임으로 취급
+                    break
+                if status == STATUS_SUCCESS:
+                    needed = 1 + (1 if payload_lines == COUNTED else payload_lines)
+            elif len(lines) == 2 and payload_lines == COUNTED:
+                try:
+                    needed = 2 + max(int(line), 0)
+                except ValueError:
+                    break
+
+        raw = bytes(self._buffer[:pos])
+        del self._buffer[:pos]
+        if status is None:
+            return NativeReply(command, None, lines, raw)
+        return NativeReply(command, status, lines[1:], raw)
+
+    def take_partial(self, command: str) -> NativeReply:
+        """미완성 프레임을 비우고 불완전 응답으로 반환합니다."""
+        raw = self.take_all()
+        lines = [line.strip() for line in raw.decode('utf-8', errors='replace').split('\n') if line.strip()]
+        status: Optional[int] = None
+        if lines:
+            try:
+                status = int(lines[0])
+                lines = lines[1:]
+            except ValueError:
+                pass
+        return NativeReply(command, status, lines, raw, complete=False)
+
+
+# 로그인 프롬프트/결과 표시 (대소문자 무시)
+USER_PROMPT = b"user:"
+PASSWORD_PROMPT = b"password:"
+LOGIN_OK = b"logged in"
+LOGIN_REJECTED = (b"invalid", b"denied", b"failed")
+
+# 로그인 상태
+LOGIN_WAIT_BANNER = "wait_banner"          # 배너와 User: 대기
+LOGIN_WAIT_CREDENTIALS = "wait_credentials"  # User: 수신, 사용자명 입력 전
+LOGIN_WAIT_PASSWORD = "wait_password"      # 사용자명 송신, Password: 대기
+LOGIN_WAIT_RESULT = "wait_result"          # 패스워드 송신, 결과 대기
+LOGIN_DONE = "done"
+LOGIN_FAILED = "failed"
+
+_WAITING_FOR = {
+    LOGIN_WAIT_BANNER: "접속 배너(User:)",
+    LOGIN_WAIT_CREDENTIALS: "사용자명 입력",
+    LOGIN_WAIT_PASSWORD: "Password: 프롬프트",
+    LOGIN_WAIT_RESULT: "로그인 결과",
+}
+
+
+class LoginSession:
+    """
+    접속 배너 ~ 로그인 완료까지의 상태 기계 (sans-IO)
+
+    feed()에 수신 바이트를 넣으면 송신해야 할 바이트를 돌려줍니다.
+    프롬프트가 도착하는 즉시 다음 단계로 넘어가므로 고정 대기 시간이 없습니다.
+
+        session = LoginSession()
+        session.feed(b"Welcome ... User: ")     -> b""   (state: wait_credentials)
+        session.start("admin", "")              -> b"admin\\r\\n"
+        session.feed(b"Password: ")             -> b"\\r\\n"
+        session.feed(b"User Logged In\\r\\n")   -> b""   (state: done)
+    """
+
+    def __init__(self, banner_received: bool = False):
+        # banner_received: 배너를 이미 처리한 연결에서 다시 로그인하는 경우
+        self.state = LOGIN_WAIT_CREDENTIALS if banner_received else LOGIN_WAIT_BANNER
+        self.banner = ""
+        self.error = ""
+        self._buffer = bytearray()
+        self._credentials: Optional[tuple] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.state in (LOGIN_DONE, LOGIN_FAILED)
+
+    @property
+    def logged_in(self) -> bool:
+        return self.state == LOGIN_DONE
+
+    @property
+    def has_credentials(self) -> bool:
+        return self._credentials is not None
+
+    @property
+    def waiting_for(self) -> str:
+        """현재 기다리는 대상 (시간 초과 사유 표시용)"""
+        return _WAITING_FOR.get(self.state, "")
+
+    def start(self, username: str, password: str) -> bytes:
+        """
+        로그인 정보를 지정합니다. User: 프롬프트를 이미 받았으면 사용자명을 바로
+        돌려주고, 아직이면 프롬프트가 도착할 때 feed()가 돌려줍니다.
+        """
+        self._credentials = (username, password)
+        if self.state == LOGIN_WAIT_CREDENTIALS:
+            return self._send_username()
+        return b""
+
+    def feed(self, data: bytes) -> bytes:
+        """수신 바이트를 처리하고 송신할 바이트를 반환합니다. (없으면 b"")"""
+        self._buffer.extend(data)
+        out = b""
+        while not self.finished:
+            lower = bytes(self._buffer).lower()
+            if self.state == LOGIN_WAIT_BANNER:
+                end = self._consume(lower, USER_PROMPT)
+                if end is None:
+                    break
+                self.banner = end.decode('utf-8', errors='replace')
+                self.state = LOGIN_WAIT_CREDENTIALS
+                if self._credentials is not None:
+                    out += self._send_username()
+            elif self.state == LOGIN_WAIT_PASSWORD:
+                if self._consume(lower, PASSWORD_PROMPT) is None:
+                    break
+                self.state = LOGIN_WAIT_RESULT
+                out += (self._credentials[1] + "\r\n").encode('utf-8')
+            elif self.state == LOGIN_WAIT_RESULT:
+                if self._consume(lower, LOGIN_OK) is not None:
+                    self.state = LOGIN_DONE
+                elif USER_PROMPT in lower or any(marker in lower and b"\n" in lower[lower.index(marker):]
+                                                 for marker in LOGIN_REJECTED):
+                    # 거부 메시지는 줄이 끝나거나 User: 재요청이 올 때까지 기다린 뒤 판정
+                    self.fail(self._rejection(bytes(self._buffer)))
+                else:
+                    break
+            else:
+                break
+        return out
+
+    def fail(self, reason: str) -> None:
+        """실패로 끝냅니다. (시간 초과, 연결 종료 등 I/O 측 사유)"""
+        if not self.finished:
+            self.state = LOGIN_FAILED
+            self.error = reason
+
+    def take_remaining(self) -> bytes:
+        """로그인 이후에 함께 수신된 바이트를 꺼냅니다."""
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    def _send_username(self) -> bytes:
+        self.state = LOGIN_WAIT_PASSWORD
+        return (self._credentials[0] + "\r\n").encode('utf-8')
+
+    def _consume(self, lower: bytes, marker: bytes) -> Optional[bytes]:
+        """marker까지(줄 끝 포함)를 버퍼에서 꺼내 반환합니다. 없으면 None"""
+        index = lower.find(marker)
+        if index < 0:
+            return None
+        end = index + len(marker)
+        while end < len(lower) and lower[end:end + 1] in (b"\r", b"\n", b" "):
+            end += 1
+        consumed = bytes(self._buffer[:end])
+        del self._buffer[:end]
+        return consumed
+
+    @staticmethod
+    def _rejection(data: bytes) -> str:
+        text = data.decode('utf-8', errors='replace')
+        for line in text.replace('\r', '\n').split('\n'):
+            line = line.strip()
+            if line and not line.lower().endswith("user:"):
+                return f"로그인 거부: {line}"
+        return "로그인 거부: 사용자명 또는 패스워드가 올바르지 않습니다"
+
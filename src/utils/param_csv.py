@@ -0,0 +1,139 @@
+"""
+파라미터 CSV 스트리밍 입출력 모듈
+
+파라미터 레시피 CSV를 청크 단위로 읽고 씁니다. 작업자 스레드(QThread) 래퍼는
+utils.param_csv_thread에 있으며, 대용량 파일도 GUI를 멈추지 않고 처리합니다.
+
+지원하는 헤더 형식 (BOM 유무 무관):
+    No,Cell,항목,값
+    No,Cell,항목,값,명령유형,시간
+"""
+
+import csv
+import io
+import os
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+# 한 번에 UI로 전달할 행 수
+DEFAULT_CHUNK_SIZE = 2000
+
+# 저장 시 헤더
+CSV_HEADER = ["No", "Cell", "항목", "값"]
+
+# 헤더 이름 -> 필드 이름
+_HEADER_FIELDS = {
+    "no": "no",
+    "cell": "cell",
+    "항목": "item",
+    "값": "value",
+    "명령유형": "command_type",
+    "시간": "time",
+}
+
+# 헤더가 없을 때의 기본 열 위치
+_DEFAULT_COLUMNS = {"no": 0, "cell": 1, "item": 2, "value": 3, "command_type": 4, "time": 5}
+
+# (cell, item, value, command) 한 행
+ParamRow = Tuple[str, str, str, str]
+
+
+def detect_columns(first_row: Sequence[str]) -> Tuple[Dict[str, int], bool]:
+    """
+    첫 행이 헤더인지 판단하고 필드별 열 위치를 반환합니다.
+
+    Returns:
+        Tuple[Dict[str, int], bool]: (필드 -> 열 위치, 첫 행이 헤더인지 여부)
+    """
+    columns = {}
+    for index, name in enumerate(first_row):
+        field = _HEADER_FIELDS.get(name.strip().lstrip("\ufeff").lower())
+        if field:
+            columns[field] = index
+    if "cell" in columns:
+        return columns, True
+    return dict(_DEFAULT_COLUMNS), False
+
+
+def _to_param_row(row: Sequence[str], columns: Dict[str, int]) -> Optional[ParamRow]:
+    """CSV 한 행을 (cell, item, value, command)로 변환합니다."""
+    def field(name: str) -> str:
+        index = columns.get(name)
+        return row[index].strip() if index is not None and index < len(row) else ""
+
+    cell = field("cell")
+    if not cell:
+        return None
+    item = field("item")
+    # 명령어는 조회 명령으로 복원 (명령유형 열은 GET 여부만 기록됨)
+    return cell, item, field("value"), f"GET {item}"
+
+
+def iter_param_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      progress: Optional[Callable[[int, int], None]] = None,
+                      should_stop: Optional[Callable[[], bool]] = None) -> Iterator[List[ParamRow]]:
+    """
+    파라미터 CSV를 청크 단위로 읽어 반환합니다.
+
+    Args:
+        path (str): CSV 파일 경로
+        chunk_size (int): 청크당 행 수
+        progress (Optional[Callable]): (읽은 바이트, 전체 바이트) 진행 콜백
+        should_stop (Optional[Callable]): True를 반환하면 읽기를 중단
+
+    Yields:
+        List[ParamRow]: 변환된 행 청크
+    """
+    total = os.path.getsize(path)
+    with open(path, 'rb') as raw:
+        # utf-8-sig: BOM 유무와 관계없이 읽기
+        text = io.TextIOWrapper(raw, encoding='utf-8-sig', newline='')
+        reader = csv.reader(text)
+        first = next(reader, None)
+        if first is None:
+            return
+        columns, has_header = detect_columns(first)
+        chunk: List[ParamRow] = []
+        if not has_header:
+            param_row = _to_param_row(first, columns)
+            if param_row:
+                chunk.append(param_row)
+        for row in reader:
+            param_row = _to_param_row(row, columns)
+            if param_row:
+                chunk.append(param_row)
+            if len(chunk) >= chunk_size:
+                if should_stop and should_stop():
+                    return
+                yield chunk
+                chunk = []
+                if progress:
+                    progress(raw.tell(), total)
+        if chunk and not (should_stop and should_stop()):
+            yield chunk
+        if progress:
+            progress(total, total)
+
+
+def write_param_csv(path: str, cells: Sequence[str], items: Sequence[str], values: Sequence[str],
+                    chunk_size: int = DEFAULT_CHUNK_SIZE,
+                    progress: Optional[Callable[[int, int], None]] = None,
+                    should_stop: Optional[Callable[[], bool]] = None) -> bool:
+    """
+    파라미터 열 목록을 CSV로 저장합니다. (BOM 포함 UTF-8)
+
+    Returns:
+        bool: 끝까지 저장했으면 True, 중단되었으면 False
+    """
+    total = len(cells)
+    with open(path, 'w', newline='', encoding='utf-8-sig') as csvfile:
+        writer = csv.writer(csvfile)
+        writer.writerow(CSV_HEADER)
+        for start in range(0, total, chunk_size):
+            if should_stop and should_stop():
+                return False
+            end = min(start + chunk_size, total)
+            writer.writerows(zip(range(start + 1, end + 1), cells[start:end],
+                                 items[start:end], values[start:end]))
+            if progress:
+                progress(end, total)
+    return True
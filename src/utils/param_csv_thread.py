@@ -0,0 +1,68 @@
+"""
+파라미터 CSV 입출력 작업자 스레드 모듈
+
+utils.param_csv의 청크 읽기/쓰기를 QThread에서 실행하고
+진행률과 결과를 시그널로 전달합니다.
+"""
+
+import logging
+from typing import List
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from utils.param_csv import DEFAULT_CHUNK_SIZE, iter_param_chunks, write_param_csv
+
+
+class CsvImportThread(QThread):
+    """
+    파라미터 CSV를 읽어 청크 단위로 전달하는 작업자 스레드
+    """
+
+    chunk_ready = pyqtSignal(list)        # List[ParamRow]
+    progress_changed = pyqtSignal(int)    # 0~100
+    failed = pyqtSignal(str)
+
+    def __init__(self, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.chunk_size = chunk_size
+        self.row_count = 0
+
+    def run(self) -> None:
+        try:
+            for chunk in iter_param_chunks(self.path, self.chunk_size, self._report,
+                                           self.isInterruptionRequested):
+                self.row_count += len(chunk)
+                self.chunk_ready.emit(chunk)
+        except Exception as e:
+            logging.error(f"[ParamCsv] 불러오기 오류: {e}")
+            self.failed.emit(str(e))
+
+    def _report(self, done: int, total: int) -> None:
+        self.progress_changed.emit(int(done * 100 / total) if total else 100)
+
+
+class CsvExportThread(QThread):
+    """
+    파라미터 열 스냅샷을 CSV로 저장하는 작업자 스레드
+    """
+
+    progress_changed = pyqtSignal(int)    # 0~100
+    failed = pyqtSignal(str)
+
+    def __init__(self, path: str, cells: List[str], items: List[str], values: List[str], parent=None):
+        super().__init__(parent)
+        self.path = path
+        self._columns = (cells, items, values)
+        self.completed = False
+
+    def run(self) -> None:
+        try:
+            self.completed = write_param_csv(self.path, *self._columns, progress=self._report,
+                                             should_stop=self.isInterruptionRequested)
+        except Exception as e:
+            logging.error(f"[ParamCsv] 저장 오류: {e}")
+            self.failed.emit(str(e))
+
+    def _report(self, done: int, total: int) -> None:
+        self.progress_changed.emit(int(done * 100 / total) if total else 100)
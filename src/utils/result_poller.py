@@ -0,0 +1,81 @@
+"""
+검사 결과 연속 조회 모듈
+
+정해진 주기(트리거 속도에 맞춰 20~30 fps 등)로 결과 셀들을 한 번의
+파이프라인 일괄 요청(send_batch)으로 읽고, 결과를 GUI 스레드로 전달합니다.
+이전 조회가 끝나지 않았으면 그 주기는 건너뛰어 요청이 쌓이지 않게 합니다.
+"""
+
+import time
+from concurrent.futures import Future
+from typing import List, Optional
+
+from PyQt5.QtCore import QObject, Qt, QTimer, pyqtSignal
+
+# 기본 조회 주기(ms) (약 30 fps)
+DEFAULT_RESULT_INTERVAL_MS = 33
+
+
+class ResultPoller(QObject):
+    """
+    결과 셀 주기 조회기
+
+    values_ready는 명령 순서대로 값 목록을 전달하며, 실패한 명령의 값은 None입니다.
+    """
+
+    values_ready = pyqtSignal(list)     # List[Optional[str]]
+    failed = pyqtSignal(str)
+
+    def __init__(self, telnet_worker=None, parent=None):
+        super().__init__(parent)
+        self.telnet_worker = telnet_worker
+        self.commands: List[str] = []
+        self.skipped_ticks = 0      # 이전 조회가 끝나지 않아 건너뛴 주기 수
+        self.last_elapsed = 0.0     # 마지막 일괄 조회 소요 시간(초)
+        self._in_flight = False
+        self._timer = QTimer(self)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self._on_tick)
+
+    def set_telnet_worker(self, telnet_worker) -> None:
+        self.telnet_worker = telnet_worker
+
+    def set_commands(self, commands: List[str]) -> None:
+        """조회할 명령 목록을 설정합니다."""
+        self.commands = list(commands)
+
+    def start(self, interval_ms: int = DEFAULT_RESULT_INTERVAL_MS) -> None:
+        self.skipped_ticks = 0
+        self._timer.start(max(1, interval_ms))
+
+    def stop(self) -> None:
+        self._timer.stop()
+
+    def set_interval(self, interval_ms: int) -> None:
+        self._timer.setInterval(max(1, interval_ms))
+
+    def is_running(self) -> bool:
+        return self._timer.isActive()
+
+    def _on_tick(self) -> None:
+        worker = self.telnet_worker
+        if not self.commands or worker is None or not worker.telnet.connected:
+            return
+        if self._in_flight:
+            self.skipped_ticks += 1
+            return
+        self._in_flight = True
+        started = time.monotonic()
+        worker.request("send_batch", self.commands,
+                       callback=lambda future: self._on_done(started, future))
+
+    def _on_done(self, started: float, future: Future) -> None:
+        self._in_flight = False
+        self.last_elapsed = time.monotonic() - started
+        try:
+            replies = future.result()
+        except Exception as e:
+            self.failed.emit(str(e))
+            return
+        values: List[Optional[str]] = [reply.value if reply.ok else None for reply in replies]
+        self.values_ready.emit(values)
@@ -0,0 +1,250 @@
+"""
+검사 결과 저장소 모듈
+
+폴링으로 읽은 검사 결과(Vision.Result, Vision.ExecutionTime, Job.Name 및
+사용자 셀 값)를 SQLite(WAL)에 저장하고, JOB/판정/기간 조건으로 페이지 단위 조회합니다.
+
+테이블:
+    inspections        검사 1회 (id, ts, host, job, judgement, exec_ms)
+    inspection_values  검사별 셀 값 (inspection_id, item, value)
+
+inspections의 색인은 목록 조회에 필요한 모든 열을 포함(covering index)하므로
+"JOB X의 02:00~04:00 NG 결과"처럼 자주 쓰는 조회가 테이블을 읽지 않고 색인만으로 끝납니다.
+"""
+
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from utils.sqlite_writer import (
+    DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, SqliteBatchWriter, open_database
+)
+
+# 기본 저장 파일
+DEFAULT_RESULT_PATH = 'logs/results.db'
+
+# 결과 해석에 쓰는 항목 이름
+RESULT_ITEM = "Vision.Result"
+EXEC_TIME_ITEM = "Vision.ExecutionTime"
+JOB_ITEM = "Job.Name"
+# 검사마다 증가하는 카운터 항목 (값이 바뀌면 새 검사)
+INSPECTION_COUNTER_ITEM = "Vision.InspectionCount"
+
+# 판정 값
+JUDGE_OK = "OK"
+JUDGE_NG = "NG"
+
+_OK_VALUES = {"1", "ok", "pass", "true", "good"}
+_NG_VALUES = {"0", "ng", "fail", "false", "bad"}
+
+# (id, ts, host, job, judgement, exec_ms)
+InspectionRow = Tuple[int, float, str, str, str, Optional[float]]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS inspections (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    host TEXT NOT NULL,
+    job TEXT NOT NULL,
+    judgement TEXT NOT NULL,
+    exec_ms REAL
+);
+CREATE TABLE IF NOT EXISTS inspection_values (
+    inspection_id INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    value TEXT NOT NULL,
+    PRIMARY KEY (inspection_id, item)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_inspections_job_judgement_ts
+    ON inspections (job, judgement, ts, host, exec_ms);
+CREATE INDEX IF NOT EXISTS idx_inspections_job_ts
+    ON inspections (job, ts, judgement, host, exec_ms);
+CREATE INDEX IF NOT EXISTS idx_inspections_judgement_ts
+    ON inspections (judgement, ts, job, host, exec_ms);
+CREATE INDEX IF NOT EXISTS idx_inspections_ts
+    ON inspections (ts, job, judgement, host, exec_ms);
+"""
+
+_COLUMNS = "id, ts, host, job, judgement, exec_ms"
+
+
+def judge(value: str) -> str:
+    """
+    Vision.Result 값을 판정(OK/NG)으로 변환합니다.
+
+    Returns:
+        str: OK, NG 또는 해석할 수 없으면 원래 값(대문자)
+    """
+    key = value.strip().lower()
+    if key in _OK_VALUES:
+        return JUDGE_OK
+    if key in _NG_VALUES:
+        return JUDGE_NG
+    return value.strip().upper()
+
+
+def _parse_ms(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value not in (None, "") else None
+    except ValueError:
+        return None
+
+
+def _insert_inspections(connection: sqlite3.Connection, batch: List[tuple]) -> None:
+    for ts, host, job, judgement, exec_ms, values in batch:
+        cursor = connection.execute(
+            "INSERT INTO inspections (ts, host, job, judgement, exec_ms) VALUES (?, ?, ?, ?, ?)",
+            (ts, host, job, judgement, exec_ms))
+        if values:
+            inspection_id = cursor.lastrowid
+            connection.executemany(
+                "INSERT OR REPLACE INTO inspection_values (inspection_id, item, value) VALUES (?, ?, ?)",
+                [(inspection_id, item, value) for item, value in values.items()])
+
+
+class ResultStore:
+    """
+    검사 결과 저장 및 조회
+
+    record()/record_values()는 어느 스레드에서든 호출할 수 있으며 디스크 I/O를 하지 않습니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_RESULT_PATH, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.path = path
+        self._writer = SqliteBatchWriter(open_database(path, _SCHEMA), _insert_inspections,
+                                         "ResultStore", batch_size, flush_interval)
+        self._reader = open_database(path)
+        self._read_lock = threading.Lock()
+        # 장비별 마지막 JOB 이름 (Job.Name을 폴링하지 않는 경우에 사용)
+        self._current_jobs: Dict[str, str] = {}
+
+    # --- 기록 ---
+
+    def set_current_job(self, host: str, job: str) -> None:
+        """장비의 현재 JOB 이름을 기억합니다. (이후 기록에 사용)"""
+        self._current_jobs[host] = job
+
+    def record(self, host: str, job: str, judgement: str, exec_ms: Optional[float] = None,
+               values: Optional[Dict[str, str]] = None, ts: Optional[float] = None) -> None:
+        """
+        검사 결과 1건을 기록 큐에 넣습니다.
+
+        Args:
+            host (str): 장비 주소 (host:port)
+            job (str): JOB 이름
+            judgement (str): 판정 (OK/NG 등)
+            exec_ms (Optional[float]): 검사 실행 시간(ms)
+            values (Optional[Dict[str, str]]): 항목 -> 값
+            ts (Optional[float]): 검사 시각 (epoch 초, None이면 현재)
+        """
+        self._writer.put((time.time() if ts is None else ts, host, job, judgement,
+                          exec_ms, dict(values or {})))
+
+    def record_values(self, host: str, values: Dict[str, str], ts: Optional[float] = None) -> None:
+        """
+        폴링으로 읽은 항목 값들을 검사 결과 1건으로 기록합니다.
+
+        Vision.Result는 판정, Vision.ExecutionTime은 실행 시간, Job.Name은 JOB 이름으로
+        해석하고, 나머지를 포함한 모든 값은 셀 값으로 함께 저장합니다.
+        """
+        job = values.get(JOB_ITEM)
+        if job:
+            self._current_jobs[host] = job
+        else:
+            job = self._current_jobs.get(host, "")
+        result = values.get(RESULT_ITEM)
+        judgement = judge(result) if result is not None else ""
+        self.record(host, job, judgement, _parse_ms(values.get(EXEC_TIME_ITEM)), values, ts)
+
+    def close(self) -> None:
+        """남은 레코드를 모두 기록하고 저장소를 닫습니다."""
+        if not self._writer.running:
+            return
+        self._writer.close()
+        with self._read_lock:
+            self._reader.close()
+
+    # --- 조회 ---
+
+    @staticmethod
+    def _where(start: Optional[float], end: Optional[float], job: str, judgement: str,
+               host: str) -> Tuple[List[str], list]:
+        clauses, params = [], []
+        if job:
+            clauses.append("job = ?")
+            params.append(job)
+        if judgement:
+            clauses.append("judgement = ?")
+            params.append(judgement)
+        if host:
+            clauses.append("host = ?")
+            params.append(host)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        return clauses, params
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              job: str = "", judgement: str = "", host: str = "",
+              before: Optional[Tuple[float, int]] = None, limit: int = 100) -> List[InspectionRow]:
+        """
+        조건에 맞는 검사 결과를 최신순으로 한 페이지 반환합니다.
+
+        Args:
+            start (Optional[float]): 시작 시각 (epoch 초, 포함)
+            end (Optional[float]): 종료 시각 (epoch 초, 제외)
+            job (str): JOB 이름 (빈 문자열이면 전체)
+            judgement (str): 판정 (빈 문자열이면 전체)
+            host (str): 장비 주소 (빈 문자열이면 전체)
+            before (Optional[Tuple[float, int]]): 이전 페이지 마지막 행의 (ts, id)
+            limit (int): 페이지 크기
+
+        Returns:
+            List[InspectionRow]: (id, ts, host, job, judgement, exec_ms)
+        """
+        clauses, params = self._where(start, end, job, judgement, host)
+        if before is not None:
+            clauses.append("(ts, id) < (?, ?)")
+            params.extend(before)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = f"SELECT {_COLUMNS} FROM inspections{where} ORDER BY ts DESC, id DESC LIMIT ?"
+        with self._read_lock:
+            return self._reader.execute(sql, params + [limit]).fetchall()
+
+    def summary(self, start: Optional[float] = None, end: Optional[float] = None,
+                job: str = "", judgement: str = "", host: str = "") -> Tuple[int, int]:
+        """
+        조건에 맞는 검사 결과의 (전체 건수, NG 건수)를 반환합니다.
+        """
+        clauses, params = self._where(start, end, job, judgement, host)
+        where = (" WHERE " + " AND ".join(clauses)) if clauses else ""
+        sql = (f"SELECT COUNT(*), COALESCE(SUM(judgement = '{JUDGE_NG}'), 0) "
+               f"FROM inspections{where}")
+        with self._read_lock:
+            total, ng = self._reader.execute(sql, params).fetchone()
+        return total, ng
+
+    def values(self, inspection_id: int) -> List[Tuple[str, str]]:
+        """검사 1건의 (항목, 값) 목록을 반환합니다."""
+        with self._read_lock:
+            return self._reader.execute(
+                "SELECT item, value FROM inspection_values WHERE inspection_id = ? ORDER BY item",
+                (inspection_id,)).fetchall()
+
+    def jobs(self) -> List[str]:
+        """기록된 JOB 이름 목록을 반환합니다."""
+        # JOB 종류는 적으므로 색인에서 다음 JOB으로 건너뛰며 읽음 (전체 스캔 방지)
+        jobs: List[str] = []
+        with self._read_lock:
+            while True:
+                row = self._reader.execute(
+                    "SELECT job FROM inspections WHERE job > ? ORDER BY job LIMIT 1",
+                    (jobs[-1] if jobs else "",)).fetchone()
+                if row is None:
+                    return jobs
+                jobs.append(row[0])
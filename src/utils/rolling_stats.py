@@ -0,0 +1,249 @@
+"""
+롤링 사이클 타임/수율 통계 모듈
+
+카메라별로 고정 크기 NumPy 링 버퍼에 (시각, 사이클 타임, NG 여부)를 저장합니다.
+샘플 추가는 배열 한 칸 쓰기(O(1))이고, 통계는 화면 갱신 시에만 창(window) 구간을
+벡터 연산으로 계산합니다.
+
+링 버퍼가 한 바퀴 돈 뒤에도 구간을 (뒷부분, 앞부분) 두 조각의 뷰로 다루므로
+전체 배열을 이어 붙이지 않습니다. 수십만 샘플의 백분위 계산은 수십 ms가 걸리므로
+긴 구간(refresh가 있는 구간)은 CameraStats가 결과를 보관했다가 refresh초마다 다시 계산합니다.
+
+창 종류:
+    - 최근 N회 (count)
+    - 최근 T초 (seconds)
+    - 현재 근무조 시작 이후 (shift)
+"""
+
+import datetime
+import math
+import time
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# 카메라당 기본 보관 샘플 수 (30 fps 기준 약 8시간)
+DEFAULT_CAPACITY = 1 << 20
+# 기본 근무조 시작 시각
+DEFAULT_SHIFT_STARTS = "06:00, 14:00, 22:00"
+
+PERCENTILES = (50, 95, 99)
+# 긴 구간 통계의 재계산 주기(초)
+LONG_WINDOW_REFRESH = 10.0
+
+
+class StatsWindow:
+    """
+    통계 구간 정의
+    """
+    __slots__ = ("name", "count", "seconds", "shift", "refresh")
+
+    def __init__(self, name: str, count: Optional[int] = None, seconds: Optional[float] = None,
+                 shift: bool = False, refresh: float = 0.0):
+        self.name = name
+        self.count = count
+        self.seconds = seconds
+        self.shift = shift
+        self.refresh = refresh      # 결과 재사용 시간(초), 0이면 매번 계산
+
+
+# 기본 통계 구간
+DEFAULT_WINDOWS = (
+    StatsWindow("최근 100회", count=100),
+    StatsWindow("최근 1시간", seconds=3600, refresh=LONG_WINDOW_REFRESH),
+    StatsWindow("근무조", shift=True, refresh=LONG_WINDOW_REFRESH),
+)
+
+
+class WindowStats:
+    """
+    구간 하나의 통계 결과 (샘플이 없으면 값은 nan)
+    """
+    __slots__ = ("name", "count", "mean", "p50", "p95", "p99", "ng_rate")
+
+    def __init__(self, name: str, count: int = 0, mean: float = math.nan, p50: float = math.nan,
+                 p95: float = math.nan, p99: float = math.nan, ng_rate: float = math.nan):
+        self.name = name
+        self.count = count
+        self.mean = mean
+        self.p50 = p50
+        self.p95 = p95
+        self.p99 = p99
+        self.ng_rate = ng_rate
+
+    def __repr__(self) -> str:
+        return (f"WindowStats({self.name!r}, n={self.count}, mean={self.mean:.2f}, p50={self.p50:.2f}, "
+                f"p95={self.p95:.2f}, p99={self.p99:.2f}, ng={self.ng_rate:.4f})")
+
+
+def parse_shift_starts(text: str) -> List[Tuple[int, int]]:
+    """"06:00, 14:00" 형식을 (시, 분) 목록으로 변환합니다."""
+    starts = []
+    for entry in text.split(","):
+        hour, _, minute = entry.strip().partition(":")
+        try:
+            starts.append((int(hour), int(minute or 0)))
+        except ValueError:
+            continue
+    return sorted(starts) or [(0, 0)]
+
+
+def shift_start(now: float, starts: Sequence[Tuple[int, int]]) -> float:
+    """now가 속한 근무조의 시작 시각(epoch 초)을 반환합니다."""
+    current = datetime.datetime.fromtimestamp(now)
+    candidates = []
+    for day_offset in (0, -1):
+        day = current.date() + datetime.timedelta(days=day_offset)
+        for hour, minute in starts:
+            start = datetime.datetime.combine(day, datetime.time(hour % 24, minute % 60))
+            if start <= current:
+                candidates.append(start)
+    return max(candidates).timestamp()
+
+
+class RollingStats:
+    """
+    카메라 한 대의 고정 크기 샘플 링 버퍼
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = capacity
+        self._times = np.zeros(capacity, dtype=np.float64)
+        self._cycle = np.full(capacity, np.nan, dtype=np.float32)
+        self._ng = np.zeros(capacity, dtype=np.int8)
+        self._judged = np.zeros(capacity, dtype=np.int8)
+        self._next = 0      # 다음에 쓸 위치
+        self._count = 0     # 보관 중인 샘플 수
+
+    def __len__(self) -> int:
+        return self._count
+
+    def add(self, cycle_ms: Optional[float], ng: Optional[bool], ts: Optional[float] = None) -> None:
+        """
+        샘플 하나를 추가합니다. (O(1))
+
+        Args:
+            cycle_ms (Optional[float]): 사이클 타임(ms), 모르면 None
+            ng (Optional[bool]): NG 여부, 판정이 없으면 None
+            ts (Optional[float]): 검사 시각 (epoch 초, None이면 현재)
+        """
+        i = self._next
+        self._times[i] = time.time() if ts is None else ts
+        self._cycle[i] = math.nan if cycle_ms is None else cycle_ms
+        self._judged[i] = ng is not None
+        self._ng[i] = bool(ng)
+        self._next = (i + 1) % self.capacity
+        if self._count < self.capacity:
+            self._count += 1
+
+    def clear(self) -> None:
+        self._next = 0
+        self._count = 0
+
+    def _segments(self, array: np.ndarray, start: int) -> Tuple[np.ndarray, ...]:
+        """
+        오래된 순서 기준 start번째부터 끝까지의 값을 복사 없이 반환합니다.
+        (링이 한 바퀴 돌았으면 뒷부분, 앞부분 두 조각의 뷰)
+        """
+        first = (self._next - self._count) % self.capacity
+        begin = first + start
+        end = first + self._count
+        if end <= self.capacity:
+            return (array[begin:end],)
+        if begin >= self.capacity:
+            return (array[begin - self.capacity:end - self.capacity],)
+        return (array[begin:], array[:end - self.capacity])
+
+    def _start_for(self, window: StatsWindow, now: float,
+                   shift_starts: Sequence[Tuple[int, int]]) -> int:
+        """구간의 첫 샘플이 오래된 순서로 몇 번째인지 반환합니다."""
+        if window.count is not None:
+            return max(0, self._count - window.count)
+        since = shift_start(now, shift_starts) if window.shift else now - (window.seconds or 0.0)
+        # 시각은 추가 순서대로 증가하므로 조각별로 이분 탐색
+        offset = 0
+        for times in self._segments(self._times, 0):
+            index = int(np.searchsorted(times, since, side='left'))
+            if index < len(times):
+                return offset + index
+            offset += len(times)
+        return offset
+
+    def window_stats(self, window: StatsWindow, now: Optional[float] = None,
+                     shift_starts: Sequence[Tuple[int, int]] = ((0, 0),)) -> WindowStats:
+        """구간 하나의 평균/백분위 사이클 타임과 NG율을 계산합니다."""
+        if now is None:
+            now = time.time()
+        start = self._start_for(window, now, shift_starts)
+        stats = WindowStats(window.name, self._count - start)
+        # 유효 값만 골라낸 복사본 (백분위 계산이 제자리 정렬에 사용)
+        parts = [cycle[~np.isnan(cycle)] for cycle in self._segments(self._cycle, start)]
+        valid = parts[0] if len(parts) == 1 else np.concatenate(parts)
+        if valid.size:
+            stats.mean = float(valid.mean(dtype=np.float64))
+            stats.p50, stats.p95, stats.p99 = (
+                float(p) for p in np.percentile(valid, PERCENTILES, overwrite_input=True))
+        judged_count = sum(int(part.sum(dtype=np.int64)) for part in self._segments(self._judged, start))
+        if judged_count:
+            ng_count = sum(int(part.sum(dtype=np.int64)) for part in self._segments(self._ng, start))
+            stats.ng_rate = ng_count / judged_count
+        return stats
+
+    def snapshot(self, windows: Sequence[StatsWindow] = DEFAULT_WINDOWS, now: Optional[float] = None,
+                 shift_starts: Sequence[Tuple[int, int]] = ((0, 0),)) -> List[WindowStats]:
+        """여러 구간의 통계를 한 번에 계산합니다."""
+        if now is None:
+            now = time.time()
+        return [self.window_stats(window, now, shift_starts) for window in windows]
+
+
+class CameraStats:
+    """
+    카메라(host:port)별 RollingStats 레지스트리
+
+    refresh가 있는 구간은 마지막 계산 결과를 refresh초 동안 재사용하며,
+    한 번의 snapshot()에서는 만료된 긴 구간을 하나만 다시 계산합니다. (화면 갱신 지연 분산)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, windows: Sequence[StatsWindow] = DEFAULT_WINDOWS,
+                 shift_starts: str = DEFAULT_SHIFT_STARTS):
+        self.capacity = capacity
+        self.windows = list(windows)
+        self.shift_starts = parse_shift_starts(shift_starts)
+        self._cameras: Dict[str, RollingStats] = {}
+        # (카메라, 구간 순번) -> (계산 시각, 결과)
+        self._cached: Dict[Tuple[str, int], Tuple[float, WindowStats]] = {}
+
+    def camera(self, key: str) -> RollingStats:
+        """카메라의 링 버퍼를 반환합니다. (없으면 생성)"""
+        stats = self._cameras.get(key)
+        if stats is None:
+            stats = self._cameras[key] = RollingStats(self.capacity)
+        return stats
+
+    def add(self, key: str, cycle_ms: Optional[float], ng: Optional[bool], ts: Optional[float] = None) -> None:
+        self.camera(key).add(cycle_ms, ng, ts)
+
+    def keys(self) -> List[str]:
+        return list(self._cameras.keys())
+
+    def snapshot(self, key: str, now: Optional[float] = None) -> List[WindowStats]:
+        """카메라의 구간별 통계를 계산합니다. (기록이 없으면 빈 통계)"""
+        stats = self._cameras.get(key)
+        if stats is None:
+            return [WindowStats(window.name) for window in self.windows]
+        if now is None:
+            now = time.time()
+        result = []
+        refreshed = False
+        for index, window in enumerate(self.windows):
+            cached = self._cached.get((key, index)) if window.refresh > 0 else None
+            if cached is not None and (refreshed or 0 <= now - cached[0] < window.refresh):
+                result.append(cached[1])
+                continue
+            window_stats = stats.window_stats(window, now, self.shift_starts)
+            if window.refresh > 0:
+                self._cached[(key, index)] = (now, window_stats)
+                refreshed = True
+            result.append(window_stats)
+        return result
@@ -0,0 +1,101 @@
+"""
+SQLite 일괄 기록 스레드 모듈
+
+여러 스레드에서 put()으로 넣은 레코드를 전용 스레드가 모아서
+한 트랜잭션으로 기록합니다. 통신 저널, 검사 결과 저장소가 공유합니다.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+from typing import Callable, List, Optional
+
+# 한 트랜잭션에 쓰는 최대 레코드 수
+DEFAULT_BATCH_SIZE = 500
+# 레코드가 적을 때 기록을 미루는 최대 시간(초)
+DEFAULT_FLUSH_INTERVAL = 0.5
+
+# (연결, 레코드 목록)을 받아 기록하는 함수 (트랜잭션 안에서 호출됨)
+BatchWriteFn = Callable[[sqlite3.Connection, List[tuple]], None]
+
+
+def open_database(path: str, schema: str = "") -> sqlite3.Connection:
+    """
+    WAL 모드로 SQLite 파일을 열고 스키마를 적용합니다.
+
+    Args:
+        path (str): 데이터베이스 파일 경로
+        schema (str): 실행할 CREATE 문 (빈 문자열이면 생략)
+    """
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    connection = sqlite3.connect(path, check_same_thread=False)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    if schema:
+        connection.executescript(schema)
+    return connection
+
+
+class SqliteBatchWriter:
+    """
+    레코드를 모아 한 트랜잭션으로 기록하는 작업자 스레드
+    """
+
+    def __init__(self, connection: sqlite3.Connection, write: BatchWriteFn, name: str,
+                 batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL):
+        self.connection = connection
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._write_fn = write
+        self._queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def put(self, item: tuple) -> None:
+        """레코드를 기록 큐에 넣습니다. (디스크 I/O 없음)"""
+        self._queue.put(item)
+
+    def _run(self) -> None:
+        batch: List[tuple] = []
+        running = True
+        while running:
+            try:
+                item = self._queue.get(timeout=self.flush_interval)
+                if item is None:
+                    running = False
+                else:
+                    batch.append(item)
+                # 이미 쌓인 레코드를 최대 batch_size까지 함께 기록
+                while running and len(batch) < self.batch_size:
+                    item = self._queue.get_nowait()
+                    if item is None:
+                        running = False
+                    else:
+                        batch.append(item)
+            except queue.Empty:
+                pass
+            if batch:
+                self._write(batch)
+                batch = []
+
+    def _write(self, batch: List[tuple]) -> None:
+        try:
+            with self.connection:
+                self._write_fn(self.connection, batch)
+        except sqlite3.Error as e:
+            logging.error(f"[SqliteWriter] {self._thread.name} 기록 실패 ({len(batch)}건): {e}")
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive()
+
+    def close(self) -> None:
+        """남은 레코드를 모두 기록하고 연결을 닫습니다."""
+        if not self._thread.is_alive():
+            return
+        self._queue.put(None)
+        self._thread.join()
+        self.connection.close()
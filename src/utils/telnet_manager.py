@@ -1,7 +1,45 @@
 import socket
+import sys
 import time
-from typing import Optional
+from typing import Callable, List, Optional, Tuple
 import logging
+from utils.native_protocol import LoginSession, NativeFrameReader, NativeReply
+from utils.telnet_stats import TelnetStats
+from utils.traffic_journal import TrafficJournal
+
+# 한 번의 recv 호출로 읽을 최대 바이트 수
+RECV_SIZE = 4096
+# 일괄 전송 시 응답을 기다리지 않고 미리 보낼 수 있는 명령 수 기본값
+DEFAULT_BATCH_WINDOW = 8
+# TCP keepalive: 유휴 후 첫 탐침까지(초), 탐침 간격(초), 끊김 판정 탐침 수
+KEEPALIVE_IDLE = 10
+KEEPALIVE_INTERVAL = 3
+KEEPALIVE_COUNT = 3
+# 하트비트 명령 (온라인 상태 조회, 장비 상태를 바꾸지 않음)
+HEARTBEAT_COMMAND = "GO"
+# 기본 제한 시간(초): 접속 배너(User:) 수신, 로그인 전체
+DEFAULT_BANNER_TIMEOUT = 3.0
+DEFAULT_LOGIN_TIMEOUT = 3.0
+
+
+def enable_keepalive(sock: socket.socket, idle: int = KEEPALIVE_IDLE,
+                     interval: int = KEEPALIVE_INTERVAL, count: int = KEEPALIVE_COUNT) -> None:
+    """
+    소켓에 TCP keepalive를 설정한다. (OS 기본값은 2시간이라 짧게 조정)
+    스위치 재부팅처럼 FIN 없이 끊긴 연결도 idle + interval * count 초 안에 감지된다.
+    """
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if sys.platform == "win32" and hasattr(sock, "ioctl"):
+            sock.ioctl(socket.SIO_KEEPALIVE_VALS, (1, idle * 1000, interval * 1000))
+            return
+        for name, value in (("TCP_KEEPIDLE", idle), ("TCP_KEEPALIVE", idle),
+                            ("TCP_KEEPINTVL", interval), ("TCP_KEEPCNT", count)):
+            if hasattr(socket, name):
+                sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+    except OSError as e:
+        logging.warning(f"[Telnet] keepalive 설정 실패: {e}")
+
 
 class TelnetManager:
     def __init__(self):
@@ -9,6 +47,23 @@ class TelnetManager:
         self.connected = False
         self.host = ""
         self.port = 23
+        self._reader = NativeFrameReader()
+        # 명령/응답 기록 저널 (None이면 기록하지 않음)
+        self.journal: Optional[TrafficJournal] = None
+        # 통신 계측 (명령 유형별 지연/횟수, 송수신 바이트, 연결 횟수)
+        self.stats = TelnetStats()
+        self._last_endpoint: Optional[tuple] = None
+        # 세션 복구용 로그인 정보 (로그인 성공 시 저장)
+        self.logged_in = False
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._login: Optional[LoginSession] = None
+        self.banner_timeout = DEFAULT_BANNER_TIMEOUT
+        self.login_timeout = DEFAULT_LOGIN_TIMEOUT
+        self.last_login_error = ""
+        # 마지막 수신 시각 (하트비트 생략 판단용)
+        self.last_rx = 0.0
+        # 연결이 예기치 않게 끊겼을 때 호출 (인자: 사유, 호출 스레드는 I/O 스레드)
+        self.on_connection_lost: Optional[Callable[[str], None]] = None
 
     def connect(self, host: str, port: int = 23) -> bool:
         """
@@ -18,13 +73,20 @@ class TelnetManager:
             self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             self.sock.settimeout(5)
             self.sock.connect((host, port))
+            enable_keepalive(self.sock)
             self.connected = True
+            self.logged_in = False
+            self._login = None
             self.host = host
             self.port = port
+            # 같은 장비에 다시 연결하면 재연결로 집계
+            self.stats.record_connect(True, reconnect=self._last_endpoint == (host, port))
+            self._last_endpoint = (host, port)
             logging.info(f"[Telnet] 연결 성공: {host}:{port}")
             return True
         except Exception as e:
             logging.error(f"[Telnet] 연결 실패: {e}")
+            self.stats.record_connect(False)
             self.connected = False
             if self.sock:
                 self.sock.close()
@@ -38,11 +100,34 @@ class TelnetManager:
         if self.sock:
             try:
                 self.sock.close()
+                self.stats.record_disconnect()
                 logging.info("[Telnet] 연결 해제")
             except Exception as e:
                 logging.error(f"[Telnet] 연결 해제 중 오류: {e}")
             self.sock = None
         self.connected = False
+        self.logged_in = False
+        self._reader.clear()
+
+    def _connection_lost(self, reason: str) -> None:
+        """
+        예기치 않은 연결 끊김을 처리한다. (소켓 정리 후 on_connection_lost 호출)
+        """
+        if not self.connected:
+            return
+        logging.warning(f"[Telnet] 연결 끊김: {self.host}:{self.port} ({reason})")
+        if self.sock:
+            try:
+                self.sock.close()
+            except OSError:
+                pass
+            self.sock = None
+        self.connected = False
+        self.logged_in = False
+        self._reader.clear()
+        self.stats.record_disconnect()
+        if self.on_connection_lost is not None:
+            self.on_connection_lost(reason)
 
     def send(self, data: str) -> bool:
         """
@@ -52,7 +137,9 @@ class TelnetManager:
             logging.warning("[Telnet] 연결되지 않음")
             return False
         try:
-            self.sock.send(data.encode('utf-8'))
+            encoded = data.encode('utf-8')
+            self.sock.send(encoded)
+            self.stats.add_tx(len(encoded))
             return True
         except Exception as e:
             logging.error(f"[Telnet] 송신 오류: {e}")
@@ -68,6 +155,7 @@ class TelnetManager:
             self.sock.settimeout(timeout)
             data = self.sock.recv(size)
             if data:
+                self.stats.add_rx(len(data))
                 msg = data.decode('utf-8', errors='replace')
                 return msg
             return None
@@ -77,128 +165,282 @@ class TelnetManager:
             logging.error(f"[Telnet] 수신 오류: {e}")
             return None
 
-    def connect_and_receive_initial(self, ip: str, port: int = 23) -> str:
+    def connect_and_receive_initial(self, ip: str, port: int = 23, timeout: Optional[float] = None) -> str:
         """
         연결 후 초기 Welcome~User: 메시지를 수신한다. (연결 상태 유지)
+        :param timeout: User: 프롬프트까지의 최대 대기 시간(초) (None이면 banner_timeout)
+        :return: 수신한 배너 (실패 시 "[...]" 형식의 메시지 또는 수신된 부분)
         """
         try:
-            if self.connect(ip, port):
-                # 초기 메시지 수신 (최대 3초 대기)
-                received_data = b""
-                start_time = time.time()
-                while time.time() - start_time < 3:
-                    try:
-                        self.sock.settimeout(0.5)
-                        data = self.sock.recv(1024)
-                        if data:
-                            received_data += data
-                            if b'User:' in received_data:
-                                break
-                    except socket.timeout:
-                        continue
-                    except Exception:
-                        break
-                
-                if received_data:
-                    msg = received_data.decode('utf-8', errors='replace')
-                    return msg
-            return "[연결 실패]"
+            if not self.connect(ip, port):
+                return "[연결 실패]"
+            self._login = LoginSession()
+            deadline = time.monotonic() + (self.banner_timeout if timeout is None else timeout)
+            if self._run_login(deadline, banner_only=True):
+                return self._login.banner
+            logging.warning(f"[Telnet] 초기 메시지 수신 실패: {self._login.error}")
+            return self._login.take_remaining().decode('utf-8', errors='replace') or "[연결 실패]"
         except Exception as e:
             logging.error(f"[Telnet] 초기 수신 오류: {e}")
             return f"[오류: {e}]"
 
-    def login(self, username: str = "admin", password: str = "") -> bool:
+    def login(self, username: str = "admin", password: str = "", timeout: Optional[float] = None) -> bool:
         """
-        자동 로그인을 수행한다.
+        User:/Password: 프롬프트에 따라 로그인한다. 각 프롬프트가 도착하는 즉시 진행한다.
         :param username: 사용자명 (기본값: admin)
         :param password: 패스워드 (기본값: 빈 문자열)
-        :return: 로그인 성공 여부
+        :param timeout: 전체 로그인 제한 시간(초) (None이면 login_timeout)
+        :return: 로그인 성공 여부 (실패 사유는 last_login_error)
         """
+        self.last_login_error = ""
         if not self.connected or not self.sock:
+            self.last_login_error = "연결되지 않음"
             logging.error("[Telnet] 연결되지 않음")
             return False
-        
+        if self._login is None or self._login.finished:
+            # 배너를 이미 처리한 연결이면 사용자명을 바로 보냄
+            self._login = LoginSession(banner_received=True)
+        deadline = time.monotonic() + (self.login_timeout if timeout is None else timeout)
         try:
-            # 1. 사용자명 입력
-            self.sock.send((username + "\r\n").encode('utf-8'))
-            time.sleep(0.5)
-            
-            # 2. Password: 프롬프트 대기
-            received_data = b""
-            start_time = time.time()
-            while time.time() - start_time < 3:
-                try:
-                    self.sock.settimeout(0.5)
-                    data = self.sock.recv(1024)
-                    if data:
-                        received_data += data
-                        if b'Password:' in received_data:
-                            break
-                except socket.timeout:
-                    continue
-                except Exception:
-                    break
-            
-            if b'Password:' not in received_data:
-                logging.error("[Telnet] Password 프롬프트 수신 실패")
-                return False
-            
-            # 3. 패스워드 입력
-            self.sock.send((password + "\r\n").encode('utf-8'))
-            time.sleep(1)
-            
-            # 4. 로그인 성공 확인
-            try:
-                self.sock.settimeout(2)
-                final_response = self.sock.recv(1024)
-                if final_response:
-                    response_str = final_response.decode('utf-8', errors='replace')
-                    # 로그인 성공 시 나타나는 패턴 확인
-                    if any(keyword in response_str.lower() for keyword in ['>', 'ready', 'logged']):
-                        logging.info("[Telnet] 로그인 성공")
-                        return True
-            except socket.timeout:
-                pass
-            
-            logging.info("[Telnet] 로그인 완료 (응답 확인)")
-            return True
-            
-        except Exception as e:
-            logging.error(f"[Telnet] 로그인 실패: {e}")
+            out = self._login.start(username, password)
+            if out:
+                self._sendall(out)
+            if self._run_login(deadline):
+                logging.info("[Telnet] 로그인 성공")
+                self._logged_in(username, password)
+                return True
+        except ConnectionError as e:
+            self._login.fail(str(e))
+        self.last_login_error = self._login.error
+        logging.error(f"[Telnet] 로그인 실패: {self.last_login_error}")
+        return False
+
+    def _run_login(self, deadline: float, banner_only: bool = False) -> bool:
+        """
+        로그인 상태 기계를 진행한다. banner_only면 User: 프롬프트까지만 수신한다.
+        :return: 실패하지 않았으면 True
+        """
+        session = self._login
+        while not session.finished:
+            if banner_only and session.banner:
+                return True
+            data = self._recv(deadline)
+            if not data:
+                session.fail(f"{session.waiting_for} 대기 시간 초과")
+                break
+            out = session.feed(data)
+            if out:
+                self._sendall(out)
+        if session.logged_in:
+            session.take_remaining()
+        return session.logged_in
+
+    def _logged_in(self, username: str, password: str) -> None:
+        self.logged_in = True
+        self._credentials = (username, password)
+
+    def can_resume(self) -> bool:
+        """resume_session()으로 복구할 세션 정보가 있는지 여부"""
+        return self._last_endpoint is not None
+
+    def resume_session(self) -> bool:
+        """
+        마지막 연결 대상에 다시 연결하고, 저장된 로그인 정보로 다시 로그인한다.
+        :return: 연결(및 로그인) 성공 여부
+        """
+        if self._last_endpoint is None:
+            return False
+        host, port = self._last_endpoint
+        credentials = self._credentials
+        self.disconnect()
+        banner = self.connect_and_receive_initial(host, port)
+        if not self.connected or 'User:' not in banner:
+            self.disconnect()
+            return False
+        if credentials is not None and not self.login(*credentials):
+            self.disconnect()
+            return False
+        logging.info(f"[Telnet] 세션 복구: {host}:{port}")
+        return True
+
+    def heartbeat(self, timeout: float = 2.0) -> bool:
+        """
+        가벼운 명령으로 세션이 살아 있는지 확인한다.
+        응답이 없으면 반쯤 열린(half-open) 연결로 보고 끊김 처리한다.
+        :return: 응답 수신 여부
+        """
+        if not self.connected or not self.logged_in:
             return False
+        reply = self.send_native(HEARTBEAT_COMMAND, timeout=timeout)
+        if not reply.complete:
+            self._connection_lost("하트비트 응답 없음")
+            return False
+        return True
 
     def send_command(self, command: str, wait_time: float = 0.5) -> str:
         """
-        명령어를 송신하고 응답을 수신한다.
+        명령어를 송신하고 응답 프레임이 완성되는 즉시 반환한다.
         :param command: 송신할 명령어
-        :param wait_time: 응답 대기 시간(초)
-        :return: 수신된 응답
+        :param wait_time: 응답 대기 기준 시간(초). 최대 wait_time * 2 + 1초까지 기다린다.
+        :return: 수신된 응답 원문 (미완성 프레임이면 수신된 부분까지)
         """
         if not self.connected or not self.sock:
             return "[연결되지 않음]"
         
         try:
-            # 명령어 송신
-            self.sock.send((command + "\r\n").encode('utf-8'))
-            time.sleep(wait_time)
-            
-            # 응답 수신
-            try:
-                self.sock.settimeout(wait_time + 1)
-                response = self.sock.recv(4096)
-                if response:
-                    return response.decode('utf-8', errors='replace')
-                return ""
-            except socket.timeout:
-                return ""
-            
+            reply = self.send_native(command, timeout=wait_time * 2 + 1)
+            return reply.text()
         except Exception as e:
             logging.error(f"[Telnet] 명령어 실행 오류: {e}")
             return f"[오류: {e}]"
 
-    # 기존 telnetlib3 관련 메서드들 (사용하지 않음)
-    """
-    async def connect_async(self, host: str, port: int = 23):
-        # telnetlib3 기반 - 사용하지 않음
-        pass
-    """ 
\ No newline at end of file
+    def send_native(self, command: str, timeout: float = 2.0,
+                    payload_lines: Optional[int] = None) -> NativeReply:
+        """
+        명령어를 송신하고 파싱된 응답 프레임을 반환한다.
+        :param command: 송신할 명령어
+        :param timeout: 응답 프레임 완성까지의 최대 대기 시간(초)
+        :param payload_lines: 페이로드 줄 수 (None이면 명령으로 판단)
+        :return: 응답 프레임 (시간 초과 시 complete=False)
+        """
+        if not self.connected or not self.sock:
+            raise ConnectionError("연결되지 않음")
+        self._discard_stale()
+        sent_at = time.monotonic()
+        encoded = (command + "\r\n").encode('utf-8')
+        self._sendall(encoded)
+        reply = self._read_frame(command, sent_at + timeout, payload_lines)
+        self._record(reply, sent_at)
+        return reply
+
+    def send_batch(self, commands: List[str], window: int = DEFAULT_BATCH_WINDOW,
+                   timeout: float = 2.0) -> List[NativeReply]:
+        """
+        여러 명령을 파이프라인으로 송신하고 응답을 순서대로 매칭한다.
+        :param commands: 송신할 명령어 목록
+        :param window: 응답을 기다리지 않고 미리 보낼 수 있는 최대 명령 수
+        :param timeout: 명령별 응답 프레임 대기 시간(초)
+        :return: 명령과 같은 순서의 응답 프레임 목록
+        """
+        if not self.connected or not self.sock:
+            raise ConnectionError("연결되지 않음")
+        window = max(1, window)
+        self._discard_stale()
+        replies: List[NativeReply] = []
+        sent_times: List[float] = []
+        sent = 0
+        while len(replies) < len(commands):
+            # 창이 허용하는 만큼 한 번에 송신
+            if sent < len(commands) and sent - len(replies) < window:
+                end = min(len(commands), len(replies) + window)
+                payload = "".join(command + "\r\n" for command in commands[sent:end])
+                encoded = payload.encode('utf-8')
+                sent_at = time.monotonic()
+                self._sendall(encoded)
+                sent_times.extend([sent_at] * (end - sent))
+                sent = end
+            command = commands[len(replies)]
+            reply = self._read_frame(command, time.monotonic() + timeout)
+            self._record(reply, sent_times[len(replies)])
+            replies.append(reply)
+            if not reply.complete:
+                # 응답 순서를 더 이상 신뢰할 수 없으므로 나머지는 실패 처리
+                logging.warning(f"[Telnet] 일괄 전송 중단: {command} 응답 미완성, "
+                                f"남은 명령 {len(commands) - len(replies)}개")
+                replies.extend(NativeReply(rest, None, [], b"", complete=False)
+                               for rest in commands[len(replies):])
+                break
+        return replies
+
+    def _sendall(self, data: bytes) -> None:
+        """
+        전부 송신한다. 소켓 오류는 연결 끊김으로 처리하고 ConnectionError를 발생시킨다.
+        """
+        try:
+            self.sock.sendall(data)
+        except OSError as e:
+            self._connection_lost(f"송신 오류: {e}")
+            raise ConnectionError(f"송신 오류: {e}") from e
+        self.stats.add_tx(len(data))
+
+    def _record(self, reply: NativeReply, sent_at: float) -> None:
+        """
+        응답 프레임을 통신 계측과 저널(있으면)에 기록한다.
+        """
+        latency = time.monotonic() - sent_at
+        self.stats.record_command(reply.command, latency, reply.status, reply.complete,
+                                  len(reply.command) + 2, len(reply.raw))
+        if self.journal is not None:
+            self.journal.record(f"{self.host}:{self.port}", reply.command, reply.raw,
+                                reply.status, latency, sent_at)
+
+    def _read_frame(self, command: str, deadline: float,
+                    payload_lines: Optional[int] = None) -> NativeReply:
+        """
+        deadline까지 수신하며 command의 응답 프레임이 완성되면 반환한다.
+        """
+        while True:
+            reply = self._reader.read_frame(command, payload_lines)
+            if reply is not None:
+                return reply
+            if not self._fill(deadline):
+                logging.warning(f"[Telnet] 응답 시간 초과: {command}")
+                return self._reader.take_partial(command)
+
+    def _fill(self, deadline: float) -> bool:
+        """
+        deadline까지 한 번 수신하여 리더에 추가한다.
+        :return: 데이터를 수신했으면 True, 시간 초과면 False
+        """
+        data = self._recv(deadline)
+        if not data:
+            return False
+        self._reader.feed(data)
+        return True
+
+    def _recv(self, deadline: float) -> bytes:
+        """
+        deadline까지 한 번 수신한다. 연결이 끊기면 ConnectionError를 발생시킨다.
+        :return: 수신한 바이트 (시간 초과면 b"")
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return b""
+        self.sock.settimeout(remaining)
+        try:
+            data = self.sock.recv(RECV_SIZE)
+        except socket.timeout:
+            return b""
+        except OSError as e:
+            self._connection_lost(f"수신 오류: {e}")
+            raise ConnectionError(f"수신 오류: {e}") from e
+        if not data:
+            self._connection_lost("원격 장비가 연결을 종료했습니다")
+            raise ConnectionError("원격 장비가 연결을 종료했습니다")
+        self.last_rx = time.monotonic()
+        self.stats.add_rx(len(data))
+        return data
+
+    def _discard_stale(self) -> None:
+        """
+        이전 명령의 늦은 응답 등 대기 중인 데이터를 버린다.
+        """
+        self._reader.clear()
+        self.sock.setblocking(False)
+        try:
+            while True:
+                try:
+                    data = self.sock.recv(RECV_SIZE)
+                except (BlockingIOError, socket.timeout):
+                    return
+                except OSError as e:
+                    self._connection_lost(f"수신 오류: {e}")
+                    raise ConnectionError(f"수신 오류: {e}") from e
+                if not data:
+                    self._connection_lost("원격 장비가 연결을 종료했습니다")
+                    raise ConnectionError("원격 장비가 연결을 종료했습니다")
+                self.stats.add_rx(len(data))
+                logging.debug(f"[Telnet] 이전 수신 데이터 폐기: {data!r}")
+        finally:
+            if self.sock is not None:
+                self.sock.setblocking(True)
@@ -0,0 +1,272 @@
+"""
+Telnet 통신 계측 모듈
+
+명령 유형별 횟수/오류/시간 초과, HDR 방식(로그-선형 버킷) 지연 히스토그램,
+송수신 바이트, 연결/재연결 횟수를 기록합니다. 기록 한 건은 정수 연산 몇 번과
+리스트 칸 증가뿐이므로 운영 중에도 항상 켜 둘 수 있습니다.
+
+StatsSnapshotWriter는 주기적으로 snapshot()을 JSON Lines 파일에 덧붙입니다.
+
+설정 (config/config.ini):
+
+    [stats]
+    telnet_snapshot_interval = 60
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+from typing import Dict, List, Optional
+
+# 2의 거듭제곱 구간마다 나누는 버킷 수 (2^5 = 32, 상대 오차 약 3%)
+SUB_BUCKET_BITS = 5
+SUB_BUCKET_COUNT = 1 << SUB_BUCKET_BITS
+# 기록할 최대 지연(us) (이보다 크면 마지막 버킷)
+MAX_TRACKABLE_US = 120 * 1000 * 1000
+
+# 기본 스냅샷 파일 및 주기(초)
+DEFAULT_SNAPSHOT_PATH = 'logs/telnet_stats.jsonl'
+DEFAULT_SNAPSHOT_INTERVAL = 60.0
+
+# 공백으로 구분되는 단어형 명령 (앞부분 일치, 긴 것부터)
+_WORD_COMMANDS = ("GET FILELIST", "GETRESULTS", "GET", "SET", "PUT")
+
+REPORT_PERCENTILES = (50, 90, 99, 99.9)
+
+
+def _bucket_index(value_us: int) -> int:
+    """지연(us)을 로그-선형 버킷 번호로 변환합니다."""
+    if value_us < SUB_BUCKET_COUNT:
+        return max(0, value_us)
+    shift = value_us.bit_length() - SUB_BUCKET_BITS - 1
+    return (shift + 1) * SUB_BUCKET_COUNT + (value_us >> shift) - SUB_BUCKET_COUNT
+
+
+def _bucket_upper_us(index: int) -> int:
+    """버킷이 나타내는 값 구간의 상한(us)을 반환합니다."""
+    if index < SUB_BUCKET_COUNT:
+        return index
+    shift = index // SUB_BUCKET_COUNT - 1
+    base = index - (shift + 1) * SUB_BUCKET_COUNT + SUB_BUCKET_COUNT
+    return ((base + 1) << shift) - 1
+
+
+_BUCKETS = _bucket_index(MAX_TRACKABLE_US) + 1
+
+
+def command_type(command: str) -> str:
+    """
+    명령의 유형을 반환합니다.
+
+    예) "GET Vision.Result" -> "GET", "LFjob.job" -> "LF", "SIA003 5" -> "SI"
+    """
+    upper = command.strip().upper()
+    for word in _WORD_COMMANDS:
+        if upper.startswith(word) and (len(upper) == len(word) or not upper[len(word)].isalnum()):
+            return word
+    return upper[:2]
+
+
+class LatencyHistogram:
+    """
+    HDR 방식 지연 히스토그램 (us 단위, 고정 크기)
+    """
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * _BUCKETS
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float) -> None:
+        value = int(seconds * 1e6)
+        self.counts[min(_bucket_index(value), _BUCKETS - 1)] += 1
+        if self.count == 0 or value < self.min_us:
+            self.min_us = value
+        if value > self.max_us:
+            self.max_us = value
+        self.count += 1
+        self.total_us += value
+
+    def percentile_ms(self, pct: float) -> float:
+        """백분위 지연(ms)을 반환합니다. (버킷 상한 기준)"""
+        if self.count == 0:
+            return 0.0
+        target = max(1, int(self.count * pct / 100.0 + 0.5))
+        seen = 0
+        for index, bucket in enumerate(self.counts):
+            seen += bucket
+            if seen >= target:
+                return min(_bucket_upper_us(index), self.max_us) / 1000.0
+        return self.max_us / 1000.0
+
+    def summary(self) -> Dict[str, float]:
+        summary = {
+            "count": self.count,
+            "mean_ms": self.total_us / self.count / 1000.0 if self.count else 0.0,
+            "min_ms": self.min_us / 1000.0,
+            "max_ms": self.max_us / 1000.0,
+        }
+        for pct in REPORT_PERCENTILES:
+            summary[f"p{pct:g}_ms"] = self.percentile_ms(pct)
+        return summary
+
+
+class CommandStats:
+    """
+    명령 유형 하나의 계측 값
+    """
+    __slots__ = ("count", "errors", "timeouts", "tx_bytes", "rx_bytes", "latency")
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.timeouts = 0
+        self.tx_bytes = 0
+        self.rx_bytes = 0
+        self.latency = LatencyHistogram()
+
+
+class TelnetStats:
+    """
+    TelnetManager 통신 계측기 (여러 스레드에서 호출 가능)
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        """모든 계측 값을 초기화합니다."""
+        with self._lock:
+            self.started = time.time()
+            self.commands: Dict[str, CommandStats] = {}
+            self.tx_bytes = 0
+            self.rx_bytes = 0
+            self.timeouts = 0
+            self.connects = 0
+            self.connect_failures = 0
+            self.reconnects = 0
+            self.disconnects = 0
+
+    # --- 기록 ---
+
+    def record_command(self, command: str, latency: float, status: Optional[int], complete: bool,
+                       tx_bytes: int, rx_bytes: int) -> None:
+        """
+        명령/응답 한 건을 기록합니다.
+
+        Args:
+            command (str): 송신 명령
+            latency (float): 송신부터 응답 완성(또는 시간 초과)까지의 시간(초)
+            status (Optional[int]): 응답 상태 코드
+            complete (bool): 응답 프레임이 완성되었는지 여부 (False면 시간 초과)
+            tx_bytes (int): 송신 바이트 수
+            rx_bytes (int): 응답 바이트 수
+        """
+        kind = command_type(command)
+        with self._lock:
+            stats = self.commands.get(kind)
+            if stats is None:
+                stats = self.commands[kind] = CommandStats()
+            stats.count += 1
+            stats.tx_bytes += tx_bytes
+            stats.rx_bytes += rx_bytes
+            stats.latency.record(latency)
+            if not complete:
+                stats.timeouts += 1
+                self.timeouts += 1
+            elif status != 1:
+                stats.errors += 1
+
+    def add_tx(self, count: int) -> None:
+        with self._lock:
+            self.tx_bytes += count
+
+    def add_rx(self, count: int) -> None:
+        with self._lock:
+            self.rx_bytes += count
+
+    def record_connect(self, success: bool, reconnect: bool = False) -> None:
+        with self._lock:
+            if not success:
+                self.connect_failures += 1
+                return
+            self.connects += 1
+            if reconnect:
+                self.reconnects += 1
+
+    def record_disconnect(self) -> None:
+        with self._lock:
+            self.disconnects += 1
+
+    # --- 조회 ---
+
+    def snapshot(self) -> Dict:
+        """
+        현재 계측 값을 JSON으로 저장할 수 있는 사전으로 반환합니다.
+        """
+        with self._lock:
+            return {
+                "time": time.time(),
+                "since": self.started,
+                "tx_bytes": self.tx_bytes,
+                "rx_bytes": self.rx_bytes,
+                "timeouts": self.timeouts,
+                "connects": self.connects,
+                "connect_failures": self.connect_failures,
+                "reconnects": self.reconnects,
+                "disconnects": self.disconnects,
+                "commands": {
+                    kind: {
+                        "count": stats.count,
+                        "errors": stats.errors,
+                        "timeouts": stats.timeouts,
+                        "tx_bytes": stats.tx_bytes,
+                        "rx_bytes": stats.rx_bytes,
+                        "latency": stats.latency.summary(),
+                    }
+                    for kind, stats in sorted(self.commands.items())
+                },
+            }
+
+
+class StatsSnapshotWriter:
+    """
+    TelnetStats 스냅샷을 주기적으로 JSON Lines 파일에 덧붙이는 스레드
+    """
+
+    def __init__(self, stats: TelnetStats, path: str = DEFAULT_SNAPSHOT_PATH,
+                 interval: float = DEFAULT_SNAPSHOT_INTERVAL):
+        self.stats = stats
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="TelnetStatsWriter", daemon=True)
+
+    def start(self) -> None:
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.write()
+
+    def write(self) -> None:
+        """현재 스냅샷을 한 줄 기록합니다."""
+        try:
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(self.stats.snapshot(), ensure_ascii=False) + "\n")
+        except OSError as e:
+            logging.error(f"[TelnetStats] 스냅샷 저장 실패: {e}")
+
+    def stop(self) -> None:
+        """마지막 스냅샷을 기록하고 스레드를 종료합니다."""
+        if self._thread.is_alive():
+            self._stop.set()
+            self._thread.join()
+            self.write()
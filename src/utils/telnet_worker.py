@@ -0,0 +1,119 @@
+"""
+Telnet 백그라운드 작업자 모듈
+
+TelnetManager의 소켓 I/O를 전용 스레드에서 순서대로 실행하고,
+결과를 Future와 Qt 시그널로 GUI 스레드에 전달합니다.
+"""
+
+import logging
+import queue
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Optional
+
+from PyQt5.QtCore import QObject, pyqtSignal, pyqtSlot
+
+from utils.telnet_manager import TelnetManager
+
+# 완료 콜백 타입: Future를 인자로 받아 GUI 스레드에서 실행
+DoneCallback = Callable[[Future], None]
+
+
+class TelnetWorker(QObject):
+    """
+    TelnetManager를 소유하고 요청 큐를 처리하는 작업자 클래스
+
+    모든 요청은 큐에 들어간 순서대로 작업자 스레드에서 실행되며,
+    완료 콜백은 항상 GUI 스레드에서 호출됩니다.
+    """
+
+    # 대기/실행 중인 요청 유무 변경 시그널
+    busy_changed = pyqtSignal(bool)
+    # 예기치 않은 연결 끊김 시그널 (인자: 사유)
+    connection_lost = pyqtSignal(str)
+    # 내부용: 작업자 스레드 -> GUI 스레드 완료 전달
+    _completed = pyqtSignal(object, object)
+
+    def __init__(self, telnet_manager: Optional[TelnetManager] = None, parent: Optional[QObject] = None):
+        super().__init__(parent)
+        self.telnet = telnet_manager or TelnetManager()
+        # 작업자 스레드에서 감지한 끊김을 GUI 스레드로 전달
+        self.telnet.on_connection_lost = self.connection_lost.emit
+        self._queue: "queue.Queue" = queue.Queue()
+        self._pending = 0
+        self._pending_lock = threading.Lock()
+        self._completed.connect(self._on_completed)
+        self._thread = threading.Thread(target=self._run, name="TelnetWorker", daemon=True)
+        self._thread.start()
+
+    @property
+    def busy(self) -> bool:
+        """처리 대기 또는 실행 중인 요청이 있는지 여부"""
+        return self._pending > 0
+
+    def submit(self, fn: Callable[..., Any], *args, callback: Optional[DoneCallback] = None, **kwargs) -> Future:
+        """
+        임의의 함수를 작업자 스레드에서 실행하도록 예약합니다.
+
+        Args:
+            fn (Callable): 작업자 스레드에서 실행할 함수
+            callback (Optional[DoneCallback]): 완료 시 GUI 스레드에서 호출할 콜백
+
+        Returns:
+            Future: 실행 결과
+        """
+        future: Future = Future()
+        with self._pending_lock:
+            self._pending += 1
+            became_busy = self._pending == 1
+        if became_busy:
+            self.busy_changed.emit(True)
+        self._queue.put((future, fn, args, kwargs, callback))
+        return future
+
+    def request(self, method: str, *args, callback: Optional[DoneCallback] = None, **kwargs) -> Future:
+        """
+        TelnetManager 메서드 호출을 작업자 스레드에 예약합니다.
+
+        Args:
+            method (str): TelnetManager 메서드 이름 (예: "send_command")
+            callback (Optional[DoneCallback]): 완료 시 GUI 스레드에서 호출할 콜백
+
+        Returns:
+            Future: 메서드 반환값
+        """
+        return self.submit(getattr(self.telnet, method), *args, callback=callback, **kwargs)
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """큐를 닫고 작업자 스레드를 종료합니다."""
+        self._queue.put(None)
+        self._thread.join(timeout)
+
+    def _run(self) -> None:
+        """작업자 스레드 루프"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            future, fn, args, kwargs, callback = item
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(fn(*args, **kwargs))
+                except Exception as e:
+                    logging.error(f"[TelnetWorker] 요청 실행 오류: {e}")
+                    future.set_exception(e)
+            self._completed.emit(future, callback)
+
+    @pyqtSlot(object, object)
+    def _on_completed(self, future: Future, callback: Optional[DoneCallback]) -> None:
+        """GUI 스레드에서 완료 콜백을 호출합니다."""
+        with self._pending_lock:
+            self._pending -= 1
+            became_idle = self._pending == 0
+        if callback is not None and not future.cancelled():
+            try:
+                callback(future)
+            except Exception as e:
+                logging.error(f"[TelnetWorker] 완료 콜백 오류: {e}")
+        if became_idle:
+            self.busy_changed.emit(False)
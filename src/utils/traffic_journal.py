@@ -0,0 +1,237 @@
+"""
+TX/RX 통신 저널 모듈
+
+TelnetManager가 주고받은 명령/응답을 SQLite 파일에 추가 전용으로 기록합니다.
+기록은 큐에 넣기만 하고 SqliteBatchWriter 스레드가 모아서 한 트랜잭션으로 씁니다.
+시각(ts)과 명령(command, ts) 색인으로 기간/명령별 조회가 빠릅니다.
+
+테이블 traffic:
+    id          INTEGER  일련번호
+    ts          REAL     송신 시각 (epoch 초)
+    mono        REAL     송신 시각 (time.monotonic, 같은 세션 내 간격 계산용)
+    host        TEXT     장비 주소 (host:port)
+    command     TEXT     송신 명령
+    status      INTEGER  응답 상태 코드 (응답 없음이면 NULL)
+    latency_ms  REAL     송신부터 응답 프레임 완성까지의 시간(ms)
+    raw         BLOB     수신 원문
+
+보관 기간(retention_days)이나 최대 행 수(max_rows)를 넘은 오래된 기록은 기록 스레드가
+prune_interval초마다 지웁니다. 지운 페이지는 SQLite가 재사용하므로 파일이 계속
+커지지 않습니다. (0이면 해당 제한 없음)
+
+설정 (config/config.ini):
+
+    [journal]
+    retention_days = 7
+    max_rows = 2000000
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from typing import Iterator, List, Optional, Tuple
+
+from utils.config import ConfigManager
+from utils.sqlite_writer import (
+    DEFAULT_BATCH_SIZE, DEFAULT_FLUSH_INTERVAL, SqliteBatchWriter, open_database
+)
+
+# 기본 저널 파일
+DEFAULT_JOURNAL_PATH = 'logs/traffic.db'
+# 기본 보관 기간(일)과 최대 행 수 (0이면 제한 없음)
+DEFAULT_RETENTION_DAYS = 7.0
+DEFAULT_MAX_ROWS = 2000000
+# 오래된 기록 정리 주기(초)
+DEFAULT_PRUNE_INTERVAL = 60.0
+
+# (id, ts, mono, host, command, status, latency_ms, raw)
+TrafficRow = Tuple[int, float, float, str, str, Optional[int], float, bytes]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS traffic (
+    id INTEGER PRIMARY KEY,
+    ts REAL NOT NULL,
+    mono REAL NOT NULL,
+    host TEXT NOT NULL,
+    command TEXT NOT NULL,
+    status INTEGER,
+    latency_ms REAL NOT NULL,
+    raw BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_traffic_ts ON traffic (ts);
+CREATE INDEX IF NOT EXISTS idx_traffic_command_ts ON traffic (command, ts);
+"""
+
+_INSERT = ("INSERT INTO traffic (ts, mono, host, command, status, latency_ms, raw) "
+           "VALUES (?, ?, ?, ?, ?, ?, ?)")
+
+_COLUMNS = "id, ts, mono, host, command, status, latency_ms, raw"
+
+
+class TrafficJournal:
+    """
+    통신 저널 기록기 및 조회기
+
+    record()는 어느 스레드에서든 호출할 수 있으며 디스크 I/O를 하지 않습니다.
+    조회는 별도 읽기 연결을 사용하므로 기록과 동시에 수행할 수 있습니다.
+    """
+
+    def __init__(self, path: str = DEFAULT_JOURNAL_PATH, batch_size: int = DEFAULT_BATCH_SIZE,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 retention_days: float = DEFAULT_RETENTION_DAYS, max_rows: int = DEFAULT_MAX_ROWS,
+                 prune_interval: float = DEFAULT_PRUNE_INTERVAL):
+        self.path = path
+        self.retention_days = retention_days
+        self.max_rows = max_rows
+        self.prune_interval = prune_interval
+        self._next_prune = 0.0      # 기록 스레드 전용
+        self._writer = SqliteBatchWriter(open_database(path, _SCHEMA), self._write_rows,
+                                         "TrafficJournal", batch_size, flush_interval)
+        self._reader = open_database(path)
+        self._read_lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Optional[ConfigManager], path: str = DEFAULT_JOURNAL_PATH) -> "TrafficJournal":
+        """[journal] 설정의 보관 기간/최대 행 수로 저널을 엽니다."""
+        return cls(path, retention_days=cls._option(config, "retention_days", DEFAULT_RETENTION_DAYS),
+                   max_rows=int(cls._option(config, "max_rows", DEFAULT_MAX_ROWS)))
+
+    @staticmethod
+    def _option(config: Optional[ConfigManager], option: str, fallback: float) -> float:
+        if config is None:
+            return fallback
+        value = config.get("journal", option, fallback=None)
+        if value is None or not str(value).strip():
+            return fallback
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            logging.warning(f"[TrafficJournal] 잘못된 설정값: {option}")
+            return fallback
+
+    # --- 기록 ---
+
+    def _write_rows(self, connection: sqlite3.Connection, batch: List[tuple]) -> None:
+        """기록 스레드에서 호출: 레코드를 추가하고 주기적으로 오래된 기록을 정리합니다."""
+        connection.executemany(_INSERT, batch)
+        now = time.monotonic()
+        if now >= self._next_prune:
+            self._next_prune = now + self.prune_interval
+            self._prune(connection)
+
+    def _prune(self, connection: sqlite3.Connection) -> None:
+        """보관 기간과 최대 행 수를 넘은 오래된 기록을 지웁니다. (기록 트랜잭션 안에서 실행)"""
+        removed = 0
+        if self.retention_days > 0:
+            cutoff = time.time() - self.retention_days * 86400.0
+            removed += connection.execute("DELETE FROM traffic WHERE ts < ?", (cutoff,)).rowcount
+        if self.max_rows > 0:
+            # 앞에서부터만 지우므로 id는 연속: 최신 id 기준으로 max_rows개만 남김
+            removed += connection.execute(
+                "DELETE FROM traffic WHERE id <= (SELECT MAX(id) FROM traffic) - ?", (self.max_rows,)).rowcount
+        if removed:
+            logging.info(f"[TrafficJournal] 오래된 기록 {removed}건 정리")
+
+    def record(self, host: str, command: str, raw: bytes, status: Optional[int],
+               latency: float, sent_mono: float) -> None:
+        """
+        명령/응답 한 건을 기록 큐에 넣습니다.
+
+        Args:
+            host (str): 장비 주소 (host:port)
+            command (str): 송신 명령
+            raw (bytes): 수신 원문
+            status (Optional[int]): 응답 상태 코드 (응답 없음이면 None)
+            latency (float): 응답 시간(초)
+            sent_mono (float): 송신 시각 (time.monotonic)
+        """
+        sent_wall = time.time() - (time.monotonic() - sent_mono)
+        self._writer.put((sent_wall, sent_mono, host, command, status, latency * 1000.0, bytes(raw)))
+
+    def close(self) -> None:
+        """남은 레코드를 모두 기록하고 저널을 닫습니다."""
+        if not self._writer.running:
+            return
+        self._writer.close()
+        with self._read_lock:
+            self._reader.close()
+
+    # --- 조회 ---
+
+    @staticmethod
+    def _where(start: Optional[float], end: Optional[float], command: str,
+               host: str) -> Tuple[str, list]:
+        clauses, params = [], []
+        if command:
+            clauses.append("command = ?")
+            params.append(command)
+        if host:
+            clauses.append("host = ?")
+            params.append(host)
+        if start is not None:
+            clauses.append("ts >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("ts < ?")
+            params.append(end)
+        return (" WHERE " + " AND ".join(clauses)) if clauses else "", params
+
+    def query(self, start: Optional[float] = None, end: Optional[float] = None,
+              command: str = "", host: str = "", after_id: int = 0,
+              limit: int = 1000) -> List[TrafficRow]:
+        """
+        조건에 맞는 기록을 id 순으로 반환합니다.
+
+        Args:
+            start (Optional[float]): 시작 시각 (epoch 초, 포함)
+            end (Optional[float]): 종료 시각 (epoch 초, 제외)
+            command (str): 명령 (빈 문자열이면 전체)
+            host (str): 장비 주소 (빈 문자열이면 전체)
+            after_id (int): 이 id 다음부터 조회 (페이지 이어 읽기)
+            limit (int): 최대 행 수
+
+        Returns:
+            List[TrafficRow]: (id, ts, mono, host, command, status, latency_ms, raw)
+        """
+        where, params = self._where(start, end, command, host)
+        where += (" AND " if where else " WHERE ") + "id > ?"
+        params.append(after_id)
+        sql = f"SELECT {_COLUMNS} FROM traffic{where} ORDER BY id LIMIT ?"
+        with self._read_lock:
+            return self._reader.execute(sql, params + [limit]).fetchall()
+
+    def iter_query(self, start: Optional[float] = None, end: Optional[float] = None,
+                   command: str = "", host: str = "", page_size: int = 5000) -> Iterator[TrafficRow]:
+        """조건에 맞는 모든 기록을 페이지 단위로 읽어 순서대로 반환합니다. (세션 재생용)"""
+        after_id = 0
+        while True:
+            rows = self.query(start, end, command, host, after_id, page_size)
+            yield from rows
+            if len(rows) < page_size:
+                return
+            after_id = rows[-1][0]
+
+    def count(self, start: Optional[float] = None, end: Optional[float] = None,
+              command: str = "", host: str = "") -> int:
+        """조건에 맞는 기록 수를 반환합니다."""
+        where, params = self._where(start, end, command, host)
+        with self._read_lock:
+            return self._reader.execute(f"SELECT COUNT(*) FROM traffic{where}", params).fetchone()[0]
+
+    def latency_summary(self, start: Optional[float] = None, end: Optional[float] = None,
+                        command: str = "", host: str = "") -> Tuple[int, float, float]:
+        """
+        조건에 맞는 기록의 (건수, 평균 응답 시간 ms, 최대 응답 시간 ms)를 반환합니다.
+        """
+        where, params = self._where(start, end, command, host)
+        sql = f"SELECT COUNT(*), AVG(latency_ms), MAX(latency_ms) FROM traffic{where}"
+        with self._read_lock:
+            count, average, maximum = self._reader.execute(sql, params).fetchone()
+        return count, average or 0.0, maximum or 0.0
+
+    def commands(self) -> List[str]:
+        """기록된 명령 목록을 반환합니다."""
+        with self._read_lock:
+            rows = self._reader.execute("SELECT DISTINCT command FROM traffic ORDER BY command").fetchall()
+        return [row[0] for row in rows]
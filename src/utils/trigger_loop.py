@@ -0,0 +1,233 @@
+"""
+트리거 반복 시험 모듈
+
+소프트웨어 트리거(SW8)를 목표 속도(또는 최대 속도)로 반복하고, 매 사이클마다
+결과 셀을 읽어 카메라가 낼 수 있는 처리량을 측정합니다. 한 사이클은
+[SW8, 결과 명령...]을 send_batch로 한 번에 파이프라인 송신하며, 사이클 타임은
+SW8 송신부터 마지막 응답 수신까지입니다.
+
+누락(dropped) 트리거:
+    - 거부: SW8 응답이 성공이 아니거나 시간 초과 (예: 오프라인, 검사 중)
+    - 지연: 이전 사이클이 길어져 목표 속도의 예정 시점을 놓친 트리거
+
+시험 결과는 logs/trigger_loop.jsonl에 한 줄씩 남깁니다.
+
+설정 (config/config.ini):
+
+    [trigger_loop]
+    rate = 0
+    result_commands = GET Vision.Result, GET Vision.ExecutionTime
+"""
+
+import collections
+import json
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Deque, Dict, List, Optional, Tuple
+
+from utils.config import ConfigManager
+from utils.native_protocol import status_message
+from utils.telnet_stats import LatencyHistogram
+
+TRIGGER_COMMAND = "SW8"
+# 차트에 보관할 최근 사이클 수
+DEFAULT_HISTORY = 2000
+# 처리량 계산 구간(초)
+RATE_WINDOW = 1.0
+DEFAULT_RESULT_COMMANDS = "GET Vision.Result"
+# 시험 결과 파일
+DEFAULT_RESULT_PATH = 'logs/trigger_loop.jsonl'
+
+
+class TriggerLoopOptions:
+    """
+    반복 시험 설정
+    """
+
+    def __init__(self, rate: float = 0.0, duration: float = 0.0, max_cycles: int = 0,
+                 result_commands: Optional[List[str]] = None, timeout: float = 2.0):
+        self.rate = rate                    # 목표 트리거 속도(Hz), 0이면 최대 속도
+        self.duration = duration            # 시험 시간(초), 0이면 중지할 때까지
+        self.max_cycles = max_cycles        # 최대 사이클 수, 0이면 제한 없음
+        self.result_commands = list(result_commands or [])
+        self.timeout = timeout              # 명령별 응답 대기(초)
+
+    @classmethod
+    def from_config(cls, config: Optional[ConfigManager]) -> "TriggerLoopOptions":
+        options = cls(result_commands=parse_commands(DEFAULT_RESULT_COMMANDS))
+        if config is None:
+            return options
+        try:
+            options.rate = float(config.get("trigger_loop", "rate", fallback=0) or 0)
+        except ValueError:
+            logging.warning("[TriggerLoop] 잘못된 설정값: rate")
+        commands = config.get("trigger_loop", "result_commands", fallback=None)
+        if commands:
+            options.result_commands = parse_commands(commands)
+        return options
+
+
+def parse_commands(text: str) -> List[str]:
+    """쉼표로 구분한 결과 명령 목록을 분리합니다."""
+    return [command.strip() for command in text.split(",") if command.strip()]
+
+
+class TriggerLoopStats:
+    """
+    반복 시험 누적 통계 (작업자 스레드가 기록, GUI 스레드가 snapshot()으로 읽음)
+    """
+
+    def __init__(self, history: int = DEFAULT_HISTORY):
+        self._lock = threading.Lock()
+        self._history_size = history
+        self.reset()
+
+    def reset(self, target_rate: float = 0.0) -> None:
+        with self._lock:
+            self.target_rate = target_rate
+            self.started = time.monotonic()
+            self.finished = 0.0
+            self.cycles = 0                 # 완료한 사이클 수 (거부 포함)
+            self.rejected = 0               # SW8 거부/시간 초과
+            self.late = 0                   # 예정 시점을 놓친 트리거
+            self.read_errors = 0            # 결과 명령 실패
+            self.histogram = LatencyHistogram()
+            self.history: Deque[Tuple[float, float, bool]] = collections.deque(maxlen=self._history_size)
+            self.last_values: Dict[str, str] = {}
+            self.last_error = ""
+            self._rate_marks: Deque[float] = collections.deque()
+
+    def record_cycle(self, at: float, cycle_time: float, triggered: bool, values: Dict[str, Optional[str]],
+                     error: str = "") -> None:
+        with self._lock:
+            self.cycles += 1
+            if not triggered:
+                self.rejected += 1
+                self.last_error = error
+            self.histogram.record(cycle_time)
+            self.history.append((at - self.started, cycle_time * 1000.0, triggered))
+            for command, value in values.items():
+                if value is None:
+                    self.read_errors += 1
+                else:
+                    self.last_values[command] = value
+            self._rate_marks.append(at)
+            while self._rate_marks and at - self._rate_marks[0] > RATE_WINDOW:
+                self._rate_marks.popleft()
+
+    def record_late(self, count: int) -> None:
+        with self._lock:
+            self.late += count
+
+    def finish(self) -> None:
+        with self._lock:
+            self.finished = time.monotonic()
+
+    @property
+    def dropped(self) -> int:
+        return self.rejected + self.late
+
+    def snapshot(self) -> Dict:
+        """현재 통계의 복사본 (history는 (경과 초, 사이클 ms, 성공 여부) 목록)"""
+        with self._lock:
+            end = self.finished or time.monotonic()
+            elapsed = max(end - self.started, 1e-9)
+            accepted = self.cycles - self.rejected
+            recent = len(self._rate_marks) / RATE_WINDOW if not self.finished else 0.0
+            return {
+                "target_rate": self.target_rate,
+                "elapsed": elapsed,
+                "cycles": self.cycles,
+                "accepted": accepted,
+                "rejected": self.rejected,
+                "late": self.late,
+                "dropped": self.rejected + self.late,
+                "read_errors": self.read_errors,
+                "rate": accepted / elapsed,
+                "recent_rate": recent,
+                "cycle": self.histogram.summary(),
+                "history": list(self.history),
+                "last_values": dict(self.last_values),
+                "last_error": self.last_error,
+            }
+
+    def summary(self) -> str:
+        snapshot = self.snapshot()
+        cycle = snapshot["cycle"]
+        target = f"{snapshot['target_rate']:g} Hz" if snapshot["target_rate"] else "최대"
+        return (f"목표 {target} | 달성 {snapshot['rate']:.1f} Hz | 트리거 {snapshot['accepted']}회, "
+                f"누락 {snapshot['dropped']} (거부 {snapshot['rejected']}, 지연 {snapshot['late']}) | "
+                f"사이클 p50 {cycle['p50_ms']:.2f} ms, p99 {cycle['p99_ms']:.2f} ms, "
+                f"최대 {cycle['max_ms']:.2f} ms")
+
+
+def append_result(stats: TriggerLoopStats, options: TriggerLoopOptions, camera: str = "",
+                  path: str = DEFAULT_RESULT_PATH) -> None:
+    """시험 결과를 JSON Lines 파일에 덧붙입니다."""
+    snapshot = stats.snapshot()
+    record = {
+        "time": datetime.now().isoformat(timespec="seconds"),
+        "camera": camera,
+        "target_rate": options.rate,
+        "result_commands": options.result_commands,
+        "elapsed": round(snapshot["elapsed"], 3),
+        "rate": round(snapshot["rate"], 2),
+        "accepted": snapshot["accepted"],
+        "rejected": snapshot["rejected"],
+        "late": snapshot["late"],
+        "read_errors": snapshot["read_errors"],
+        "cycle": {key: round(value, 3) for key, value in snapshot["cycle"].items()},
+    }
+    try:
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    except OSError as e:
+        logging.error(f"[TriggerLoop] 결과 저장 실패: {e}")
+
+
+def run_trigger_loop(telnet, options: TriggerLoopOptions, stats: TriggerLoopStats,
+                     stop: threading.Event) -> TriggerLoopStats:
+    """
+    트리거 반복 시험을 실행합니다. (작업자 스레드에서 호출, stop이 설정되면 종료)
+    """
+    stats.reset(options.rate)
+    commands = [TRIGGER_COMMAND] + options.result_commands
+    period = 1.0 / options.rate if options.rate > 0 else 0.0
+    start = time.monotonic()
+    deadline = start + options.duration if options.duration > 0 else None
+    next_slot = start
+    logging.info(f"[TriggerLoop] 시작: 목표 {options.rate or '최대'} Hz, 결과 명령 {options.result_commands}")
+    try:
+        while not stop.is_set():
+            if options.max_cycles and stats.cycles >= options.max_cycles:
+                break
+            if period:
+                now = time.monotonic()
+                if next_slot > now:
+                    if stop.wait(next_slot - now):
+                        break
+                else:
+                    # 이전 사이클이 길어져 놓친 예정 시점은 누락으로 집계하고 다음 시점에 맞춤
+                    missed = int((now - next_slot) / period)
+                    if missed:
+                        stats.record_late(missed)
+                        next_slot += missed * period
+                next_slot += period
+            sent_at = time.monotonic()
+            if deadline is not None and sent_at >= deadline:
+                break
+            replies = telnet.send_batch(commands, len(commands), options.timeout)
+            done_at = time.monotonic()
+            trigger = replies[0]
+            error = "" if trigger.ok else ("응답 시간 초과" if not trigger.complete
+                                           else status_message(trigger.status))
+            values = {reply.command: (reply.value if reply.ok else None) for reply in replies[1:]}
+            stats.record_cycle(done_at, done_at - sent_at, trigger.ok, values, error)
+    finally:
+        stats.finish()
+        logging.info(f"[TriggerLoop] 종료: {stats.summary()}")
+    return stats